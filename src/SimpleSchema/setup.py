@@ -79,8 +79,10 @@ include_files: list[Tuple[str, str]] = []
 for child in Path("src/Plugins").iterdir():
     if (
         not child.is_file()
-        or child.suffix != ".py"
-        or child.stem == "__init__"
+        or (
+            (child.suffix != ".py" or child.stem == "__init__")
+            and child.name != "PluginManifest.json"
+        )
     ):
         continue
 
@@ -16,18 +16,40 @@
 """Generates code based on a plugin and SimpleSchema files."""
 
 import itertools
+import json
+import multiprocessing
 import os
 import sys
 import textwrap
+import threading
 import traceback
 
+from contextlib import nullcontext
 from enum import auto, Enum
 from pathlib import Path
-from typing import Any, Callable, cast, Generator, Optional, Tuple
+from typing import Any, Callable, cast, Generator, Optional, Tuple, TYPE_CHECKING, TypeVar
 
+
+# ----------------------------------------------------------------------
+# `Generate` is forwarded to a daemon (see the `Daemon` command) before the expensive imports below;
+# content is generated by this process when a daemon isn't running.
+if __name__ == "__main__" and sys.argv[1:2] == ["Generate"]:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    try:
+        from SimpleSchema import Daemon as _Daemon                                                  # pylint: disable=import-error
+    finally:
+        sys.path.pop(0)
+
+    _daemon_result = _Daemon.ExecuteInDaemon(sys.argv[1:], _Daemon.CreateInstanceId(Path(__file__).parent.parent))
+    if _daemon_result is not None:
+        sys.exit(_daemon_result)
+
+
+# ----------------------------------------------------------------------
+# pylint: disable=wrong-import-position
 from Common_Foundation.ContextlibEx import ExitStack
 from Common_Foundation import PathEx
-from Common_Foundation.Streams.DoneManager import DoneManager
+from Common_Foundation.Streams.DoneManager import DoneManager, DoneManagerFlags
 from Common_Foundation import TextwrapEx
 from Common_Foundation.Types import DoesNotExist, overridemethod
 
@@ -60,16 +82,33 @@ with ExitStack(lambda: sys.path.pop(0)):
     #       - This file as 'EntryPoint/__main__.py' rather than '../EntryPoint.py'
     #       - Build.py/setup.py located outside of 'src'
 
+    # Modules that are only used by some commands or options (for example, the `Validate` and
+    # `Daemon` commands, multiple processes, and IR) are imported where they are used so that they
+    # don't contribute to the time required to start the other commands.
+
+    from SimpleSchema.Common import Inflect                                                         # pylint: disable=import-error
     from SimpleSchema.Common.ExecuteInParallel import ExecuteInParallel as ExecuteInParallelImpl    # pylint: disable=import-error
 
     from SimpleSchema.Plugin import Plugin                                                          # pylint: disable=import-error
+    from SimpleSchema.PluginManifest import PluginManifest                                          # pylint: disable=import-error
 
     from SimpleSchema.Schema.Elements.Statements.RootStatement import RootStatement                 # pylint: disable=import-error
 
+    from SimpleSchema.Schema.MetadataAttributes.ElementAttributes import (                          # pylint: disable=import-error
+        DefaultMetadataAttribute,
+        DescriptionMetadataAttribute,
+        NameMetadataAttribute,
+    )
+    from SimpleSchema.Schema.MetadataAttributes.ContainerAttributes import PluralNameMetadataAttribute  # pylint: disable=import-error
+
     from SimpleSchema.Schema.Parse.ANTLR.Parse import Parse                                         # pylint: disable=import-error
     from SimpleSchema.Schema.Parse.Normalize.Normalize import Normalize, Flag as NormalizeFlag      # pylint: disable=import-error
     from SimpleSchema.Schema.Parse.TypeResolver.Resolve import Resolve                              # pylint: disable=import-error
 
+    if TYPE_CHECKING:
+        from SimpleSchema.Daemon import FileRecorder, ModelCache                                    # pylint: disable=import-error
+        from SimpleSchema.PluginProcessPool import PluginProcessPool                                # pylint: disable=import-error
+
 
 # ----------------------------------------------------------------------
 # |
@@ -111,7 +150,25 @@ class CodeGenerator(
             # Frozen
             plugin_host_init_args = Path(__file__).parent.parent / "Plugins"
 
-        CodeGeneratorPluginHostMixin.__init__(self, plugin_host_init_args)
+        # Importing and creating plugins is expensive, so plugins listed in the manifest are only
+        # imported when they are used; the plugin host (which imports all plugins) is initialized on
+        # demand for everything else.
+        if isinstance(plugin_host_init_args, Path):
+            plugin_manifest = PluginManifest.Load(plugin_host_init_args)
+        else:
+            plugin_manifest = None
+
+        self.plugin_manifest                = plugin_manifest
+
+        self._plugin_host_init_args         = plugin_host_init_args
+        self._is_plugin_host_initialized    = False
+
+        self._manifest_plugins: dict[str, Plugin]       = {}
+        self._plugins_lock                  = threading.Lock()
+
+        # Parsed, resolved and normalized roots are only reused across invocations when running as a
+        # daemon (see the `Daemon` command).
+        self.model_cache: Optional["ModelCache"]        = None
 
     # ----------------------------------------------------------------------
     @overridemethod
@@ -132,6 +189,8 @@ class CodeGenerator(
 
         assert default_metadata["preserve_dir_structure"] is True
 
+        assert default_metadata["emit_ir"] is False
+
         return {
             "plugin": (str, typer.Option(default_metadata["plugin"], help="Name of a plugin to use for generation (or a fullpath to a python file containing a Plugin class).")),
 
@@ -144,6 +203,10 @@ class CodeGenerator(
 
             "preserve_dir_structure": (bool, typer.Option(default_metadata["preserve_dir_structure"], "--no-preserve-dir-structure", help="Output all files to the output directory, rather than creating a hierarchy based on the input files encountered.")),
 
+            "num_processes": (int, typer.Option(default_metadata["num_processes"], "--num-processes", min=0, help="Number of processes used to validate and generate content for plugins that support it; 0 uses a process for each core. Content is validated and generated in this process (using threads) when the value is 1 or when the plugin doesn't support other processes.")),
+
+            "emit_ir": (bool, typer.Option(default_metadata["emit_ir"], "--emit-ir", help="Write a flat, index-based intermediate representation of each input file as JSON ('<name>.ir.json') in addition to the content generated by the plugin; the representation can be consumed by generators that don't import this package.")),
+
             ConditionalInvocationQueryMixin.OUTPUT_DATA_FILENAME_PREFIX_ATTRIBUTE_NAME: (str, typer.Option(default_metadata[ConditionalInvocationQueryMixin.OUTPUT_DATA_FILENAME_PREFIX_ATTRIBUTE_NAME], "--output-data-filename-prefix", help="Prefix to apply to information used to determine if recompilation is necessary; this can be useful when multiple plugins generate output content into the same directory.")),
         }
 
@@ -163,8 +226,29 @@ class CodeGenerator(
         self,
         metadata_or_context: dict[str, Any],
     ) -> Plugin:
+        plugin_name = metadata_or_context.get("plugin", None)
+
+        if self.plugin_manifest is not None and isinstance(plugin_name, str):
+            manifest_item = self.plugin_manifest.GetItem(plugin_name)
+
+            if manifest_item is not None:
+                with self._plugins_lock:
+                    plugin = self._manifest_plugins.get(plugin_name, None)
+
+                    if plugin is None:
+                        plugin = manifest_item.CreatePlugin()
+                        self._manifest_plugins[plugin_name] = plugin
+
+                return plugin
+
+        self._InitializePluginHost()
         return cast(Plugin, super(CodeGenerator, self).GetPlugin(metadata_or_context))
 
+    # ----------------------------------------------------------------------
+    def EnumPlugins(self) -> Generator[Plugin, None, None]:
+        self._InitializePluginHost()
+        yield from super(CodeGenerator, self).EnumPlugins()
+
     # ----------------------------------------------------------------------
     @overridemethod
     def ValidateMetadata(
@@ -249,6 +333,7 @@ class CodeGenerator(
 
     # ----------------------------------------------------------------------
     _FILENAME_MAP_ATTRIBUTE_NAME            = "_filename_map"
+    _IR_FILENAME_MAP_ATTRIBUTE_NAME         = "_ir_filename_map"
 
     # ----------------------------------------------------------------------
     # |
@@ -266,8 +351,21 @@ class CodeGenerator(
 
         yield "preserve_dir_structure", True
 
+        yield "num_processes", 1
+
+        yield "emit_ir", False
+
         yield from super(CodeGenerator, self)._EnumerateOptionalMetadata()
 
+    # ----------------------------------------------------------------------
+    def _InitializePluginHost(self) -> None:
+        with self._plugins_lock:
+            if self._is_plugin_host_initialized:
+                return
+
+            CodeGeneratorPluginHostMixin.__init__(self, self._plugin_host_init_args)
+            self._is_plugin_host_initialized = True
+
     # ----------------------------------------------------------------------
     @overridemethod
     def _GetNumStepsImpl(
@@ -286,15 +384,31 @@ class CodeGenerator(
     ) -> dict[str, Any]:
         plugin = self.GetPlugin(metadata)
 
+        preserve_dir_structure = metadata.pop("preserve_dir_structure")
+
         metadata[self.__class__._FILENAME_MAP_ATTRIBUTE_NAME] = plugin.GenerateOutputFilenames(  # pylint: disable=protected-access
             metadata[AtomicInputProcessorMixin.INPUT_ROOT_ATTRIBUTE_NAME],
             metadata[AtomicInputProcessorMixin.ATTRIBUTE_NAME],
             metadata[ConditionalInvocationQueryMixin.OUTPUT_DIR_ATTRIBUTE_NAME],
-            preserve_dir_structure=metadata.pop("preserve_dir_structure"),
+            preserve_dir_structure=preserve_dir_structure,
         )
 
+        if metadata["emit_ir"]:
+            metadata[self.__class__._IR_FILENAME_MAP_ATTRIBUTE_NAME] = Plugin._InputFilenameToOutputFilenames(  # pylint: disable=protected-access
+                metadata[AtomicInputProcessorMixin.INPUT_ROOT_ATTRIBUTE_NAME],
+                metadata[AtomicInputProcessorMixin.ATTRIBUTE_NAME],
+                metadata[ConditionalInvocationQueryMixin.OUTPUT_DIR_ATTRIBUTE_NAME],
+                lambda input_filename, default_output_filename: [default_output_filename.with_suffix(".ir.json"), ],
+                preserve_dir_structure=preserve_dir_structure,
+            )
+        else:
+            metadata[self.__class__._IR_FILENAME_MAP_ATTRIBUTE_NAME] = {}  # pylint: disable=protected-access
+
         metadata[MultipleOutputProcessorMixin.ATTRIBUTE_NAME] = list(
-            itertools.chain(*metadata[self.__class__._FILENAME_MAP_ATTRIBUTE_NAME].values()),  # pylint: disable=protected-access
+            itertools.chain(
+                *metadata[self.__class__._FILENAME_MAP_ATTRIBUTE_NAME].values(),  # pylint: disable=protected-access
+                *metadata[self.__class__._IR_FILENAME_MAP_ATTRIBUTE_NAME].values(),  # pylint: disable=protected-access
+            ),
         )
 
         return super(CodeGenerator, self)._CreateContext(dm, metadata)
@@ -320,13 +434,201 @@ class CodeGenerator(
         on_progress_func(CodeGenerator._Steps.Parsing.value, "Parsing...")
 
         input_root = context[AtomicInputProcessorMixin.INPUT_ROOT_ATTRIBUTE_NAME]
+        input_filenames = context[AtomicInputProcessorMixin.ATTRIBUTE_NAME]
+
+        flags = plugin.flags
 
+        for context_name, flag in [
+            ("filter_unsupported_extensions", NormalizeFlag.DisableUnsupportedExtensions),
+            ("filter_unsupported_metadata", NormalizeFlag.DisableUnsupportedMetadata),
+            ("filter_unsupported_root_elements", NormalizeFlag.DisableUnsupportedRootElements),
+            ("filter_unsupported_nested_elements", NormalizeFlag.DisableUnsupportedNestedElements),
+        ]:
+            if context.get(context_name, False):
+                flags |= flag
+
+        if self.model_cache is None:
+            roots = self._CreateRoots(dm, plugin, flags, input_root, input_filenames)
+        else:
+            model_cache_key = (plugin.name, flags, input_root, tuple(input_filenames))
+
+            roots = self.model_cache.Get(model_cache_key)
+
+            if roots is not None:
+                dm.WriteVerbose("The files are unchanged; using the cached models.\n")
+            else:
+                from SimpleSchema.Daemon import FileRecorder  # pylint: disable=import-error
+
+                # The state of the files is recorded as they are read, so that files modified while
+                # they are being parsed aren't cached with their new state.
+                recorder = FileRecorder()
+
+                roots = self._CreateRoots(dm, plugin, flags, input_root, input_filenames, recorder)
+
+                if roots is not None:
+                    # The recorded files include the included files
+                    self.model_cache.Set(model_cache_key, recorder.filenames, roots, recorder=recorder)
+
+        if roots is None:
+            return None
+
+        # Extract the context info requested by the plugin
+        plugin_context: dict[str, Any] = {}
+
+        for attribute_name in plugin.GetCommandLineArgs().keys():
+            context_value = context.get(attribute_name, DoesNotExist.instance)
+            if context_value is DoesNotExist.instance:
+                continue
+
+            plugin_context[attribute_name] = context_value
+
+        # Validate and generate in other processes when requested (and supported by the plugin)
+        num_processes = context["num_processes"]
+
+        if num_processes != 1 and plugin.IsProcessSafe(plugin_context):
+            from SimpleSchema.PluginProcessPool import PluginProcessPool  # pylint: disable=import-error
+
+            process_pool: Optional["PluginProcessPool"] = PluginProcessPool(plugin, roots, num_processes or None)
+            max_num_threads = num_processes or None
+        else:
+            process_pool = None
+            max_num_threads = None
+
+        with process_pool or nullcontext():
+            # Validate
+            on_progress_func(CodeGenerator._Steps.Validating.value, "Validating...")
+
+            # ----------------------------------------------------------------------
+            def Validate(
+                filename: Path,
+                root: RootStatement,
+                on_status_func: Callable[[str], None],      # pylint: disable=unused-argument
+            ) -> None:
+                if process_pool is not None:
+                    process_pool.Validate(filename)
+                else:
+                    plugin.Validate(root)
+
+            # ----------------------------------------------------------------------
+
+            _ExecuteInParallel(
+                dm,
+                "Validating",
+                roots,
+                Validate,
+                max_num_threads=max_num_threads,
+            )
+
+            if dm.result < 0:
+                return None
+
+            # Generate
+            on_progress_func(CodeGenerator._Steps.Generating.value, "Generating...")
+
+            initial_output_counts = plugin.GetOutputCounts()
+
+            filename_map: dict[Path, list[Path]] = {}
+
+            for filename in roots.keys():
+                key = input_root / filename
+                assert key in context[self.__class__._FILENAME_MAP_ATTRIBUTE_NAME], key  # pylint: disable=protected-access
+
+                filename_map[filename] = context[self.__class__._FILENAME_MAP_ATTRIBUTE_NAME][key]  # pylint: disable=protected-access
+
+            if process_pool is None and plugin.UsesGenerateAll(plugin_context):
+                # The plugin generates the content for all of the roots in a single invocation
+                with dm.Nested("Generating...") as generate_dm:
+                    try:
+                        plugin.GenerateAll(
+                            plugin_context,
+                            roots,
+                            filename_map,
+                            generate_dm.WriteStatus,
+                        )
+                    except Exception as ex:  # pylint: disable=broad-exception-caught
+                        _PrintExceptions(generate_dm, {input_root: ex})
+            else:
+                # ----------------------------------------------------------------------
+                def GenerateCode(
+                    filename: Path,
+                    root: RootStatement,
+                    on_status_func: Callable[[str], None],
+                ) -> None:
+                    if process_pool is not None:
+                        on_status_func("Generating in another process...")
+                        process_pool.Generate(plugin_context, filename, filename_map[filename])
+                    else:
+                        plugin.Generate(plugin_context, root, filename_map[filename], on_status_func)
+
+                # ----------------------------------------------------------------------
+
+                _ExecuteInParallel(
+                    dm,
+                    "Generating",
+                    roots,
+                    GenerateCode,
+                    max_num_threads=max_num_threads,
+                )
+
+            if dm.result < 0:
+                return None
+
+            if context["emit_ir"]:
+                from SimpleSchema.Schema.IR.Lower import Lower as LowerIR  # pylint: disable=import-error
+
+                # ----------------------------------------------------------------------
+                def EmitIR(
+                    filename: Path,
+                    root: RootStatement,
+                    on_status_func: Callable[[str], None],  # pylint: disable=unused-argument
+                ) -> None:
+                    ir_filenames = context[self.__class__._IR_FILENAME_MAP_ATTRIBUTE_NAME][input_root / filename]  # pylint: disable=protected-access
+                    assert len(ir_filenames) == 1, ir_filenames
+
+                    # Written via the plugin so that the file is only modified when its content has
+                    # changed and is included in the output counts.
+                    with plugin._YieldOutputFile(ir_filenames[0]) as f:  # pylint: disable=protected-access
+                        json.dump(LowerIR(root), f, separators=(",", ":"))
+
+                # ----------------------------------------------------------------------
+
+                _ExecuteInParallel(
+                    dm,
+                    "Emitting IR",
+                    roots,
+                    EmitIR,
+                )
+
+                if dm.result < 0:
+                    return None
+
+        output_counts = plugin.GetOutputCounts()
+        inflect = Inflect.Get()
+
+        return "{} written, {} unchanged".format(
+            inflect.no("file", output_counts.num_written - initial_output_counts.num_written),
+            inflect.no("file", output_counts.num_unchanged - initial_output_counts.num_unchanged),
+        )
+
+    # ----------------------------------------------------------------------
+    def _CreateRoots(
+        self,
+        dm: DoneManager,
+        plugin: Plugin,
+        flags: NormalizeFlag,
+        input_root: Path,
+        input_filenames: list[Path],
+        recorder: Optional["FileRecorder"]=None,
+    ) -> Optional[dict[Path, RootStatement]]:
         # ----------------------------------------------------------------------
         def CreateReadFunc(
             input_filename: Path,
         ) -> Callable[[], str]:
             # ----------------------------------------------------------------------
             def Impl() -> str:
+                if recorder is not None:
+                    return recorder.Read(input_filename)
+
                 with input_filename.open() as f:
                     return f.read()
 
@@ -338,7 +640,7 @@ class CodeGenerator(
 
         workspace_files: dict[Path, Callable[[], str]] = {
             cast(Path, PathEx.CreateRelativePath(input_root, input_filename)): CreateReadFunc(input_filename)
-            for input_filename in context[AtomicInputProcessorMixin.ATTRIBUTE_NAME]
+            for input_filename in input_filenames
         }
 
         # Parse
@@ -350,6 +652,7 @@ class CodeGenerator(
             single_threaded=False,
             quiet=False,
             raise_if_single_exception=False,
+            read_included_file_func=None if recorder is None else lambda filename: recorder.Read(filename, encoding="UTF-8"),
         )
 
         assert len(results) == 1
@@ -388,17 +691,6 @@ class CodeGenerator(
             return None
 
         # Normalize
-        flags = plugin.flags
-
-        for context_name, flag in [
-            ("filter_unsupported_extensions", NormalizeFlag.DisableUnsupportedExtensions),
-            ("filter_unsupported_metadata", NormalizeFlag.DisableUnsupportedMetadata),
-            ("filter_unsupported_root_elements", NormalizeFlag.DisableUnsupportedRootElements),
-            ("filter_unsupported_nested_elements", NormalizeFlag.DisableUnsupportedNestedElements),
-        ]:
-            if context.get(context_name, False):
-                flags |= flag
-
         results = Normalize(
             dm,
             roots,
@@ -418,71 +710,7 @@ class CodeGenerator(
 
             return None
 
-        # Validate
-        on_progress_func(CodeGenerator._Steps.Validating.value, "Validating...")
-
-        # ----------------------------------------------------------------------
-        def Validate(
-            filename: Path,                             # pylint: disable=unused-argument
-            root: RootStatement,
-            on_status_func: Callable[[str], None],      # pylint: disable=unused-argument
-        ) -> None:
-            plugin.Validate(root)
-
-        # ----------------------------------------------------------------------
-
-        _ExecuteInParallel(
-            dm,
-            "Validating",
-            roots,
-            Validate,
-        )
-
-        if dm.result < 0:
-            return None
-
-        # Extract the context info requested by the plugin
-        plugin_context: dict[str, Any] = {}
-
-        for attribute_name in plugin.GetCommandLineArgs().keys():
-            context_value = context.get(attribute_name, DoesNotExist.instance)
-            if context_value is DoesNotExist.instance:
-                continue
-
-            plugin_context[attribute_name] = context_value
-
-        # Generate
-        on_progress_func(CodeGenerator._Steps.Generating.value, "Generating...")
-
-        # ----------------------------------------------------------------------
-        def GenerateCode(
-            filename: Path,
-            root: RootStatement,
-            on_status_func: Callable[[str], None],
-        ) -> None:
-            key = context[AtomicInputProcessorMixin.INPUT_ROOT_ATTRIBUTE_NAME] / filename
-            assert key in context[self.__class__._FILENAME_MAP_ATTRIBUTE_NAME], key  # pylint: disable=protected-access
-
-            plugin.Generate(
-                plugin_context,
-                root,
-                context[self.__class__._FILENAME_MAP_ATTRIBUTE_NAME][key],  # pylint: disable=protected-access
-                on_status_func,
-            )
-
-        # ----------------------------------------------------------------------
-
-        _ExecuteInParallel(
-            dm,
-            "Generating",
-            roots,
-            GenerateCode,
-        )
-
-        if dm.result < 0:
-            return None
-
-        return None
+        return roots
 
 
 # ----------------------------------------------------------------------
@@ -507,15 +735,28 @@ def _HelpEpilog() -> str:
             ],
             [
                 [
-                    "{}) {}".format(index + 1, plugin.name),
-                    plugin.description
+                    "{}) {}".format(index + 1, name),
+                    description,
                 ]
-                for index, plugin in enumerate(_code_generator.EnumPlugins())
+                for index, (name, description) in enumerate(_EnumPluginInfo())
             ],
         ),
     ).replace("\n", "\n\n")
 
 
+# ----------------------------------------------------------------------
+def _EnumPluginInfo() -> Generator[Tuple[str, str], None, None]:
+    if _code_generator.plugin_manifest is not None:
+        # The plugins don't need to be imported to display their names and descriptions
+        for item in _code_generator.plugin_manifest.items:
+            yield item.name, item.description
+
+        return
+
+    for plugin in _code_generator.EnumPlugins():
+        yield plugin.name, plugin.description
+
+
 # ----------------------------------------------------------------------
 class NaturalOrderGrouper(TyperGroup):
     # pylint: disable=missing-class-docstring
@@ -523,6 +764,19 @@ class NaturalOrderGrouper(TyperGroup):
     def list_commands(self, *args, **kwargs):  # pylint: disable=unused-argument
         return self.commands.keys()
 
+    # ----------------------------------------------------------------------
+    # The epilog describes the available plugins, so it is only created when help is displayed
+    @property
+    def epilog(self) -> Optional[str]:
+        if self._epilog is None:
+            self._epilog = _HelpEpilog()
+
+        return self._epilog
+
+    @epilog.setter
+    def epilog(self, value: Optional[str]) -> None:
+        self._epilog = value
+
 
 # ----------------------------------------------------------------------
 app                                         = typer.Typer(
@@ -530,7 +784,6 @@ app                                         = typer.Typer(
     help=__doc__,
     no_args_is_help=True,
     rich_markup_mode="rich",
-    epilog=_HelpEpilog(),
 )
 
 
@@ -544,6 +797,197 @@ Clean                                       = CreateCleanCommandLineFunc(app, _c
 List                                        = CreateListCommandLineFunc(app, _code_generator, process_plugin_args=True)
 
 
+# ----------------------------------------------------------------------
+class DataFormat(str, Enum):
+    """Format of the records processed by `Validate`"""
+
+    auto                                    = "auto"
+    jsonl                                   = "jsonl"
+    yaml                                    = "yaml"
+
+
+# ----------------------------------------------------------------------
+@app.command("Validate", no_args_is_help=True)
+def Validate(
+    schema_filename: Path=typer.Argument(..., exists=True, dir_okay=False, resolve_path=True, help="SimpleSchema file that defines the structure."),
+    data_filename: Path=typer.Argument(..., exists=True, dir_okay=False, resolve_path=True, help="JSON Lines or multi-document YAML file that contains the records to validate."),
+    structure_name: str=typer.Option(..., "--structure", help="Name of the structure used to validate each record (use '.' to delimit the names of nested structures)."),
+    data_format: DataFormat=typer.Option(DataFormat.auto, "--format", case_sensitive=False, help="Format of the records; 'auto' determines the format based on the data file's extension ('.yaml' and '.yml' are YAML, everything else is JSON Lines)."),
+    max_num_errors: Optional[int]=typer.Option(None, "--max-num-errors", min=1, help="Stop after this many invalid records have been encountered."),
+    num_processes: int=typer.Option(1, "--num-processes", min=0, help="Number of processes used to validate JSON Lines content; 0 uses a process for each core. Errors are written once all records have been validated when more than 1 process is used."),
+    chunk_size: int=typer.Option(16 * 1024 * 1024, "--chunk-size", min=1, help="Approximate number of bytes validated by a process at a time when more than 1 process is used."),
+    verbose: bool=typer.Option(False, "--verbose", help="Write verbose information to the terminal."),
+    debug: bool=typer.Option(False, "--debug", help="Write debug information to the terminal."),
+) -> None:
+    """Validates records in a JSON Lines or multi-document YAML file against a structure, writing errors as they are encountered."""
+
+    from SimpleSchema.Schema.Validate.Validate import (  # pylint: disable=import-error
+        FindStructure,
+        RecordError,
+        ValidateJsonLines,
+        ValidateJsonLinesInParallel,
+        ValidateRecordsResult,
+        ValidateYamlDocuments,
+    )
+
+    with DoneManager.CreateCommandLine(
+        output_flags=DoneManagerFlags.Create(verbose=verbose, debug=debug),
+    ) as dm:
+        root = _ParseSchemaFile(dm, schema_filename)
+        if root is None:
+            return
+
+        try:
+            structure = FindStructure(root, structure_name)
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            dm.result = -1
+            _PrintExceptions(dm, {schema_filename: ex})
+
+            return
+
+        if data_format == DataFormat.auto:
+            data_format = DataFormat.yaml if data_filename.suffix.lower() in [".yaml", ".yml"] else DataFormat.jsonl
+
+        if data_format == DataFormat.yaml:
+            if num_processes != 1:
+                dm.WriteWarning("YAML content is validated using a single process.\n")
+
+            num_processes = 1
+
+        # ----------------------------------------------------------------------
+        def ValidateSingleProcess(
+            on_error_func: Callable[[RecordError], None],
+        ) -> ValidateRecordsResult:
+            with data_filename.open(encoding="utf-8") as f:
+                if data_format == DataFormat.yaml:
+                    return ValidateYamlDocuments(structure, f, on_error_func)
+
+                return ValidateJsonLines(structure, f, on_error_func)
+
+        # ----------------------------------------------------------------------
+
+        num_errors = 0
+
+        with dm.Nested(
+            "Validating '{}'...".format(data_filename),
+            lambda: "{} {} found".format(num_errors, "error" if num_errors == 1 else "errors"),
+        ) as validate_dm:
+            # ----------------------------------------------------------------------
+            class MaxNumErrorsReached(Exception):
+                pass
+
+            # ----------------------------------------------------------------------
+            def OnError(
+                error: RecordError,
+            ) -> None:
+                nonlocal num_errors
+
+                num_errors += 1
+
+                validate_dm.WriteError(
+                    "Record {}{}: {}\n".format(
+                        error.record_index + 1,
+                        " [{}]".format(error.path) if error.path else "",
+                        error.message,
+                    ),
+                )
+
+                if max_num_errors is not None and num_errors >= max_num_errors:
+                    raise MaxNumErrorsReached()
+
+            # ----------------------------------------------------------------------
+
+            try:
+                if num_processes == 1:
+                    result = ValidateSingleProcess(OnError)
+                else:
+                    result = ValidateJsonLinesInParallel(
+                        validate_dm,
+                        structure,
+                        data_filename,
+                        OnError,
+                        chunk_size=chunk_size,
+                        max_num_processes=num_processes or None,
+                    )
+
+                validate_dm.WriteVerbose("{} records validated.\n".format(result.num_records))
+
+            except MaxNumErrorsReached:
+                validate_dm.WriteInfo("Validation stopped after {} errors.\n".format(num_errors))
+
+
+# ----------------------------------------------------------------------
+@app.command("Daemon", no_args_is_help=False)
+def Daemon(
+    socket_filename: Optional[Path]=typer.Option(None, "--socket", dir_okay=False, resolve_path=True, help="Unix socket used to communicate with other processes (the socket's directory is created if necessary and must only be accessible by the current user). The default is the socket defined by the 'SIMPLE_SCHEMA_DAEMON_SOCKET' environment variable or, when the environment variable isn't defined, a socket in a directory for the current user within the runtime (or temporary) directory; other processes look for the socket in the same way."),
+    max_num_cached_models: int=typer.Option(16, "--max-num-cached-models", min=1, help="Maximum number of 'Generate' invocations whose parsed, resolved and normalized content is kept in memory."),
+    verbose: bool=typer.Option(False, "--verbose", help="Write verbose information to the terminal."),
+    debug: bool=typer.Option(False, "--debug", help="Write debug information to the terminal."),
+) -> None:
+    """Runs a daemon that executes 'Generate' on behalf of other invocations of this executable, keeping plugins and the content of unchanged files in memory between invocations; 'Generate' is executed by the invoking process when a daemon isn't running."""
+
+    from SimpleSchema.Daemon import (  # pylint: disable=import-error
+        CreateInstanceId as CreateDaemonInstanceId,
+        GetSocketFilename as GetDaemonSocketFilename,
+        ModelCache,
+        Server as DaemonServer,
+    )
+    from SimpleSchema.Common.SourceTable import SOURCE_TABLE  # pylint: disable=import-error
+
+    if socket_filename is None:
+        socket_filename = GetDaemonSocketFilename().resolve()
+
+    with DoneManager.CreateCommandLine(
+        output_flags=DoneManagerFlags.Create(verbose=verbose, debug=debug),
+    ) as dm:
+        if not DaemonServer.IsSupported():
+            dm.result = -1
+            dm.WriteError("Daemons are not supported on this platform.\n")
+            return
+
+        # ----------------------------------------------------------------------
+        def Execute(
+            args: list[str],
+        ) -> int:
+            assert args and args[0] == "Generate", args
+
+            try:
+                app(args, prog_name=Path(sys.argv[0]).name)
+            except SystemExit as ex:
+                if ex.code is None:
+                    return 0
+                if isinstance(ex.code, int):
+                    return ex.code
+
+                return -1
+
+            return 0
+
+        # ----------------------------------------------------------------------
+
+        try:
+            server = DaemonServer(
+                socket_filename,
+                CreateDaemonInstanceId(Path(__file__).parent.parent),
+                Execute,
+            )
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            dm.result = -1
+            dm.WriteError("{}\n".format(ex))
+            return
+
+        # Requests are executed one at a time, so the Ranges within models that are no longer
+        # cached aren't in use when their files are released.
+        _code_generator.model_cache = ModelCache(max_num_cached_models, SOURCE_TABLE.Release)
+
+        dm.WriteLine("Listening on '{}' (press Ctrl+C to stop)...\n".format(socket_filename))
+
+        try:
+            server.Serve()
+        except KeyboardInterrupt:
+            pass
+
+
 # ----------------------------------------------------------------------
 # |
 # |  Private Functions
@@ -577,23 +1021,112 @@ def _PrintExceptions(
 
 
 # ----------------------------------------------------------------------
+def _ParseSchemaFile(
+    dm: DoneManager,
+    filename: Path,
+) -> Optional[RootStatement]:
+    # ----------------------------------------------------------------------
+    def ReadFile() -> str:
+        with filename.open() as f:
+            return f.read()
+
+    # ----------------------------------------------------------------------
+
+    results = Parse(
+        dm,
+        {
+            filename.parent: {
+                Path(filename.name): ReadFile,
+            },
+        },
+        single_threaded=True,
+        quiet=True,
+        raise_if_single_exception=False,
+    )
+
+    assert len(results) == 1
+    results = next(iter(results.values()))
+
+    if dm.result != 0:
+        _PrintExceptions(dm, cast(dict[Path, Exception], results))
+        return None
+
+    roots = cast(dict[Path, RootStatement], results)
+
+    # Resolve
+    results = Resolve(
+        dm,
+        roots,
+        single_threaded=True,
+        quiet=True,
+        raise_if_single_exception=False,
+    )
+
+    if dm.result != 0:
+        assert results is not None
+
+        _PrintExceptions(dm, cast(dict[Path, Exception], results))
+        return None
+
+    # Normalize; the schema isn't associated with a plugin, so all elements are allowed and
+    # only the standard metadata attributes are recognized.
+    results = Normalize(
+        dm,
+        roots,
+        [
+            NameMetadataAttribute(),                    # pylint: disable=no-value-for-parameter
+            DescriptionMetadataAttribute(),             # pylint: disable=no-value-for-parameter
+            DefaultMetadataAttribute(),                 # pylint: disable=no-value-for-parameter
+            PluralNameMetadataAttribute(),              # pylint: disable=no-value-for-parameter
+        ],
+        set(),
+        (
+            NormalizeFlag.AllowRootItems
+            | NormalizeFlag.AllowRootStructures
+            | NormalizeFlag.AllowRootTypes
+            | NormalizeFlag.AllowNestedItems
+            | NormalizeFlag.AllowNestedStructures
+            | NormalizeFlag.AllowNestedTypes
+            | NormalizeFlag.DisableUnsupportedExtensions
+            | NormalizeFlag.DisableUnsupportedMetadata
+        ),
+        single_threaded=True,
+        quiet=True,
+        raise_if_single_exception=False,
+    )
+
+    if dm.result != 0:
+        assert results is not None
+
+        _PrintExceptions(dm, cast(dict[Path, Exception], results))
+        return None
+
+    return roots[Path(filename.name)]
+
+
+# ----------------------------------------------------------------------
+_ExecuteInParallelItemT                     = TypeVar("_ExecuteInParallelItemT")
+
+
 def _ExecuteInParallel(
     dm: DoneManager,
     heading: str,
-    roots: dict[Path, RootStatement],
-    func: Callable[[Path, RootStatement, Callable[[str], None]], None],
+    items: dict[Path, _ExecuteInParallelItemT],
+    func: Callable[[Path, _ExecuteInParallelItemT, Callable[[str], None]], None],
+    *,
+    max_num_threads: Optional[int]=None,
 ) -> None:
     # ----------------------------------------------------------------------
     def Execute(
-        context: tuple[Path, RootStatement],
+        context: tuple[Path, _ExecuteInParallelItemT],
         status: ExecuteTasks.Status,
     ) -> None:
-        filename, root = context
+        filename, item = context
         del context
 
         func(
             filename,
-            root,
+            item,
             lambda value: cast(None, status.OnProgress(None, value)),
         )
 
@@ -603,12 +1136,12 @@ def _ExecuteInParallel(
         dm,
         heading,
         {
-            filename: (filename, root)
-            for filename, root in roots.items()
+            filename: (filename, item)
+            for filename, item in items.items()
         },
         Execute,
         quiet=False,
-        max_num_threads=None,
+        max_num_threads=max_num_threads,
         raise_if_single_exception=False,
     )
 
@@ -620,4 +1153,8 @@ def _ExecuteInParallel(
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
 if __name__ == "__main__":
+    # Required when frozen, as other processes are not created by forking this one (see
+    # `SimpleSchema.Common.MultiprocessingContext`)
+    multiprocessing.freeze_support()
+
     app()
@@ -29,7 +29,7 @@ from Common_FoundationEx import TyperEx
 # ----------------------------------------------------------------------
 # pylint: disable=import-error
 from SimpleSchema.Common.Range import Range
-from SimpleSchema.Common.SafeYaml import ToYamlString
+from SimpleSchema.Common.SafeYaml import YamlEmitter
 
 from SimpleSchema.Plugin import Plugin as PluginBase
 
@@ -117,6 +117,14 @@ class Plugin(PluginBase):  # pylint: disable=missing-class-docstring
     def GetCommandLineArgs(self) -> TyperEx.TypeDefinitionsType:
         return {}
 
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def IsProcessSafe(
+        self,
+        command_line_args: dict[str, Any],  # pylint: disable=unused-argument
+    ) -> bool:
+        return True
+
     # ----------------------------------------------------------------------
     @overridemethod
     def GetNumAdditionalSteps(
@@ -158,19 +166,12 @@ class Plugin(PluginBase):  # pylint: disable=missing-class-docstring
 
         on_status_update_func("Generating content...")
 
-        visitor = _Visitor(self)
-
-        root.Accept(
-            visitor,
-            include_disabled=True,
-        )
-
-        on_status_update_func("Writing content...")
-
-        output_filename.parent.mkdir(parents=True, exist_ok=True)
-
-        with output_filename.open("w") as f:
-            f.write(ToYamlString(visitor.content))
+        with self._YieldOutputFile(output_filename) as f:
+            # Content is written as it is generated
+            root.Accept(
+                _Visitor(self, YamlEmitter(f.write)),
+                include_disabled=True,
+            )
 
 
 # ----------------------------------------------------------------------
@@ -181,15 +182,21 @@ class _Visitor(Visitor):
     def __init__(
         self,
         plugin: Plugin,
+        emitter: Optional[YamlEmitter]=None,
     ):
         super(_Visitor, self).__init__()
 
         self._plugin                                                        = plugin
+        self._emitter                                                       = emitter
 
         self._content: list[dict[str, Any]]                                 = []
         self._content_stack: list[list[dict[str, Any]]]                     = [self._content, ]
 
         self._display_type_as_reference: bool                               = False
+        self._num_active_elements                                           = 0
+
+        # Writes the root's statements as they are generated (when an emitter was provided)
+        self._statements_writer: Optional[YamlEmitter.SequenceWriter]       = None
 
     # ----------------------------------------------------------------------
     @property
@@ -214,7 +221,13 @@ class _Visitor(Visitor):
 
             d["unique_name"] = element.unique_name
 
+        self._num_active_elements += 1
         yield
+        self._num_active_elements -= 1
+
+        if self._statements_writer is not None and self._num_active_elements == 1:
+            # This is a statement within the root; write it now that it is complete
+            self._statements_writer.Write(self._content_stack[-1].pop())
 
     # ----------------------------------------------------------------------
     @contextmanager
@@ -370,9 +383,26 @@ class _Visitor(Visitor):
     # ----------------------------------------------------------------------
     @contextmanager
     @overridemethod
-    def OnRootStatement(self, element: RootStatement) -> Iterator[Optional[VisitResult]]:  # pylint: disable=unused-argument
+    def OnRootStatement(self, element: RootStatement) -> Iterator[Optional[VisitResult]]:
         with ExitStack(self._content_stack.pop):
-            yield
+            if self._emitter is None:
+                yield
+                return
+
+            with self._emitter.YieldSequence() as sequence_writer:
+                with sequence_writer.YieldMapping() as mapping_writer:
+                    for key, value in self._content_stack[-1][-1].items():
+                        mapping_writer.Write(key, value)
+
+                    # The statements are only included in the content when they exist
+                    if not element.statements:
+                        yield
+                        return
+
+                    with mapping_writer.YieldSequence(element.CHILDREN_NAME) as self._statements_writer:
+                        yield
+
+                    self._statements_writer = None
 
     # ----------------------------------------------------------------------
     @contextmanager
@@ -15,13 +15,14 @@
 # ----------------------------------------------------------------------
 """Contains the Plugin object"""
 
+import itertools
 import json
 
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import cached_property
 from pathlib import Path
-from typing import Any, Callable, ClassVar, Iterator, Optional
+from typing import Any, Callable, ClassVar, Iterator, Optional, TextIO
 
 from Common_Foundation import RegularExpression
 from Common_Foundation.Types import overridemethod
@@ -30,6 +31,7 @@ from Common_FoundationEx import TyperEx
 
 # ----------------------------------------------------------------------
 # pylint: disable=import-error
+from SimpleSchema.Common import Errors
 from SimpleSchema.Common.Range import Range
 
 from SimpleSchema.Plugin import Plugin as PluginBase
@@ -180,8 +182,34 @@ class Plugin(PluginBase):
                     help="If True, unrecognized data in all structures will not cause validation errors.",
                 ),
             ),
+            "shared_definitions": TyperEx.TypeDefinitionItem(
+                bool,
+                TyperEx.typer.Option(
+                    False,
+                    "--shared-definitions",
+                    help="If True, definitions from included files are generated once into a shared '<included file>.definitions.json' file in the output directory and referenced with relative URIs.",
+                ),
+            ),
         }
 
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def IsProcessSafe(
+        self,
+        command_line_args: dict[str, Any],
+    ) -> bool:
+        # Shared definitions are shared by the files generated in a single invocation
+        return not command_line_args["shared_definitions"]
+
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def UsesGenerateAll(
+        self,
+        command_line_args: dict[str, Any],
+    ) -> bool:
+        # Shared definitions are written once after all of the files have been generated
+        return command_line_args["shared_definitions"]
+
     # ----------------------------------------------------------------------
     @overridemethod
     def GetNumAdditionalSteps(
@@ -218,8 +246,73 @@ class Plugin(PluginBase):
         on_status_update_func: Callable[[str], None],
     ) -> None:
         assert len(output_filenames) == 1
-        output_filename = output_filenames[0]
-        del output_filenames
+
+        if not command_line_args["shared_definitions"]:
+            self._GenerateSchema(command_line_args, root, output_filenames[0], on_status_update_func, None)
+            return
+
+        shared_definitions_map: dict[Path, _SharedDefinitions] = {}
+
+        self._GenerateSchema(
+            command_line_args,
+            root,
+            output_filenames[0],
+            on_status_update_func,
+            shared_definitions_map,
+        )
+
+        on_status_update_func("Writing shared definitions...")
+
+        self._WriteSharedDefinitions(command_line_args["schema_version"], shared_definitions_map)
+
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def GenerateAll(
+        self,
+        command_line_args: dict[str, Any],
+        roots: dict[Path, RootStatement],
+        filename_map: dict[Path, list[Path]],
+        on_status_update_func: Callable[[str], None],
+    ) -> None:
+        if not command_line_args["shared_definitions"]:
+            super(Plugin, self).GenerateAll(command_line_args, roots, filename_map, on_status_update_func)
+            return
+
+        # The shared definitions are populated by all of the files and then written once (rather than
+        # after each file). They are created for each invocation, as the included files may have
+        # changed since the last one (this is common when running as a daemon).
+        shared_definitions_map: dict[Path, _SharedDefinitions] = {}
+
+        for filename, root in roots.items():
+            output_filenames = filename_map[filename]
+            assert len(output_filenames) == 1
+
+            self._GenerateSchema(
+                command_line_args,
+                root,
+                output_filenames[0],
+                on_status_update_func,
+                shared_definitions_map,
+            )
+
+        on_status_update_func("Writing shared definitions...")
+
+        self._WriteSharedDefinitions(command_line_args["schema_version"], shared_definitions_map)
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    def _GenerateSchema(
+        self,
+        command_line_args: dict[str, Any],
+        root: RootStatement,
+        output_filename: Path,
+        on_status_update_func: Callable[[str], None],
+        shared_definitions_map: Optional[dict[Path, "_SharedDefinitions"]],
+    ) -> None:
+        """Writes the schema for the root (shared definitions are populated, but not written)"""
 
         on_status_update_func("Creating schema...")
 
@@ -238,9 +331,20 @@ class Plugin(PluginBase):
 
             schema[dest_attribute_name] = command_line_value
 
+        if shared_definitions_map is not None:
+            shared_definitions_context = _SharedDefinitionsContext(
+                shared_definitions_map,
+                root.range.filename,
+                output_filename.parent,
+                None,
+            )
+        else:
+            shared_definitions_context = None
+
         visitor = _Visitor(
             self,
             allow_additional_data=command_line_args["allow_additional_data"],
+            shared_definitions_context=shared_definitions_context,
         )
 
         root.Accept(visitor)
@@ -252,23 +356,114 @@ class Plugin(PluginBase):
         # Write the schema file
         on_status_update_func("Writing schema...")
 
-        with output_filename.open("w") as f:
-            content = json.dumps(
-                schema,
-                indent=2,
-                separators=(", ", " : "),
+        with self._YieldOutputFile(output_filename, buffering=_WRITE_BUFFER_SIZE) as f:
+            _WriteSchema(f, schema)
+
+    # ----------------------------------------------------------------------
+    def _GetSharedDefinitionUri(
+        self,
+        shared_definitions_map: dict[Path, "_SharedDefinitions"],
+        element: ReferenceType,
+        output_dir: Path,
+        *,
+        allow_additional_data: bool,
+    ) -> str:
+        """Returns the URI of the element's definition within the shared definitions for its file (generating the definition if necessary)"""
+
+        source_filename = element.range.filename
+        shared_filename = output_dir / "{}.definitions.json".format(source_filename.stem)
+
+        shared_definitions = shared_definitions_map.get(shared_filename, None)
+
+        if shared_definitions is None:
+            shared_definitions = _SharedDefinitions(source_filename, shared_filename)
+            shared_definitions_map[shared_filename] = shared_definitions
+
+        elif shared_definitions.source_filename != source_filename:
+            raise Exception(
+                Errors.plugin_duplicate_filename.format(
+                    output_filename=shared_filename,
+                    existing_input_filename=shared_definitions.source_filename,
+                    input_filename=source_filename,
+                ),
             )
 
-            for line in content.splitlines(keepends=False):
-                if line.isspace():
-                    line = ""
+        if element.unique_name not in shared_definitions.definitions:
+            # Add a placeholder before generating the definition, as the element may (directly or
+            # indirectly) reference itself.
+            shared_definitions.definitions[element.unique_name] = None
+            shared_definitions.is_modified = True
+
+            visitor = _Visitor(
+                self,
+                allow_additional_data=allow_additional_data,
+                shared_definitions_context=_SharedDefinitionsContext(
+                    shared_definitions_map,
+                    source_filename,
+                    output_dir,
+                    shared_definitions,
+                ),
+            )
+
+            element.Accept(visitor)
+
+            shared_definitions.definitions[element.unique_name] = visitor.GetDefinition(element)
+
+        return "{}#/$defs/{}".format(shared_filename.name, element.unique_name)
+
+    # ----------------------------------------------------------------------
+    def _WriteSharedDefinitions(
+        self,
+        schema_version: str,
+        shared_definitions_map: dict[Path, "_SharedDefinitions"],
+    ) -> None:
+        for shared_definitions in shared_definitions_map.values():
+            if not shared_definitions.is_modified:
+                continue
+
+            schema: dict[str, Any] = {}
+
+            if schema_version:
+                schema["$schema"] = schema_version
 
-                f.write(line.rstrip())
-                f.write("\n")
+            schema["$defs"] = shared_definitions.definitions
+
+            with self._YieldOutputFile(shared_definitions.filename, buffering=_WRITE_BUFFER_SIZE) as f:
+                _WriteSchema(f, schema)
+
+            shared_definitions.is_modified = False
 
 
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+@dataclass
+class _SharedDefinitions(object):
+    """Definitions generated for elements within an included file"""
+
+    source_filename: Path
+    filename: Path
+
+    definitions: dict[str, Any]             = field(init=False, default_factory=dict)
+    is_modified: bool                       = field(init=False, default=False)
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class _SharedDefinitionsContext(object):
+    """Information used by a _Visitor when generating shared definitions"""
+
+    # All of the shared definitions generated during the current invocation of `Generate` or
+    # `GenerateAll`, keyed by output filename.
+    shared_definitions_map: dict[Path, _SharedDefinitions]
+
+    source_filename: Path                   # File associated with the elements being visited
+    output_dir: Path
+
+    # The shared definitions being generated (or None when generating the schema for a root)
+    shared_definitions: Optional[_SharedDefinitions]
+
+
 # ----------------------------------------------------------------------
 class _Visitor(Visitor):
     # ----------------------------------------------------------------------
@@ -280,11 +475,13 @@ class _Visitor(Visitor):
         plugin: Plugin,
         *,
         allow_additional_data: bool,
+        shared_definitions_context: Optional[_SharedDefinitionsContext]=None,
     ):
         super(_Visitor, self).__init__()
 
         self._plugin                                    = plugin
         self._allow_additional_data                     = allow_additional_data
+        self._shared_definitions_context                = shared_definitions_context
 
         self._schema_stack: list[dict[str, Any]]        = [
             {
@@ -313,6 +510,13 @@ class _Visitor(Visitor):
 
         return schema
 
+    # ----------------------------------------------------------------------
+    def GetDefinition(
+        self,
+        element: Element,
+    ) -> dict[str, Any]:
+        return self._definitions[element.unique_name]
+
     # ----------------------------------------------------------------------
     # |
     # |  Common
@@ -601,7 +805,7 @@ class _Visitor(Visitor):
             d = self._definitions.pop(element.type.unique_name)
         else:
             d = {
-                "$ref": "#/$defs/{}".format(element.type.unique_name),
+                "$ref": self._GetReferenceUri(element.type),
             }
 
         if (
@@ -758,3 +962,64 @@ class _Visitor(Visitor):
         self._definitions[element.unique_name] = {
             "oneOf": schemas,
         }
+
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _GetReferenceUri(
+        self,
+        element: ReferenceType,
+    ) -> str:
+        context = self._shared_definitions_context
+
+        if context is not None:
+            if element.range.filename != context.source_filename:
+                return self._plugin._GetSharedDefinitionUri(  # pylint: disable=protected-access
+                    context.shared_definitions_map,
+                    element,
+                    context.output_dir,
+                    allow_additional_data=self._allow_additional_data,
+                )
+
+            if context.shared_definitions is not None:
+                # Definitions referenced by shared definitions must be a part of the same file
+                self._plugin._GetSharedDefinitionUri(  # pylint: disable=protected-access
+                    context.shared_definitions_map,
+                    element,
+                    context.output_dir,
+                    allow_additional_data=self._allow_additional_data,
+                )
+
+        return "#/$defs/{}".format(element.unique_name)
+
+# ----------------------------------------------------------------------
+_WRITE_BUFFER_SIZE                          = 1024 * 1024
+_CHUNKS_PER_WRITE                           = 16 * 1024
+
+
+# ----------------------------------------------------------------------
+def _WriteSchema(
+    f: TextIO,
+    schema: dict[str, Any],
+) -> None:
+    """\
+    Writes the schema as it is encoded rather than creating the entire content in memory first.
+
+    The output is the same as the content produced by
+    `json.dumps(schema, indent=2, separators=(", ", " : "))` with trailing whitespace removed from
+    each line; when indenting, the item separator only appears at the end of a line, so the
+    whitespace is never generated.
+    """
+
+    encoder = json.JSONEncoder(
+        indent=2,
+        separators=(",", " : "),
+    )
+
+    chunks = encoder.iterencode(schema)
+
+    # The encoder generates many small chunks; joining them in batches is significantly faster than
+    # writing them individually.
+    f.writelines(iter(lambda: "".join(itertools.islice(chunks, _CHUNKS_PER_WRITE)), ""))
+    f.write("\n")
@@ -0,0 +1,221 @@
+# ----------------------------------------------------------------------
+# |
+# |  Daemon_PerformanceTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-26 14:31:06
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""\
+Compares the work done by a process that generates content itself with the work done by a process that
+forwards its command line to a daemon.
+"""
+
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+
+from pathlib import Path
+from typing import Any, Callable, cast
+
+import pytest
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+from Common_Foundation.Streams.DoneManager import DoneManager
+from Common_Foundation.TestHelpers.StreamTestHelpers import GenerateDoneManagerAndSink
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from SimpleSchema.Daemon import ModelCache, Server
+
+    from SimpleSchema.Schema.Elements.Statements.RootStatement import RootStatement
+
+    from SimpleSchema.Schema.MetadataAttributes.ElementAttributes import DefaultMetadataAttribute
+
+    from SimpleSchema.Schema.Parse.ANTLR.Parse import Parse
+    from SimpleSchema.Schema.Parse.Normalize.Normalize import Normalize, Flag as NormalizeFlag
+    from SimpleSchema.Schema.Parse.TypeResolver.Resolve import Resolve
+
+
+# ----------------------------------------------------------------------
+NUM_ITERATIONS                              = 5
+
+NUM_FILES                                   = 20
+NUM_STRUCTURES_PER_FILE                     = 20
+NUM_ITEMS_PER_STRUCTURE                     = 10
+
+_src_dir                                    = PathEx.EnsureDir(Path(__file__).parent.parent.parent)
+
+
+# ----------------------------------------------------------------------
+pytestmark = pytest.mark.skipif(not Server.IsSupported(), reason="Daemons are not supported on this platform")
+
+
+# ----------------------------------------------------------------------
+def test_Startup(tmp_path):
+    socket_filename = tmp_path / "Daemon" / "Daemon.sock"
+
+    server = Server(socket_filename, "instance", lambda args: 0)
+
+    thread = threading.Thread(target=server.Serve)
+    thread.start()
+
+    try:
+        in_process = _MeasureProcess(
+            "Import the modules used to generate content",
+            """\
+            from SimpleSchema.Plugin import Plugin
+            from SimpleSchema.Schema.Parse.ANTLR.Parse import Parse
+            from SimpleSchema.Schema.Parse.Normalize.Normalize import Normalize
+            from SimpleSchema.Schema.Parse.TypeResolver.Resolve import Resolve
+            """,
+        )
+
+        forwarded = _MeasureProcess(
+            "Forward the command line to a daemon",
+            """\
+            from SimpleSchema.Daemon import ExecuteInDaemon
+
+            assert ExecuteInDaemon(["Generate"], "instance", socket_filename=Path({})) == 0
+            """.format(repr(str(socket_filename))),
+        )
+
+    finally:
+        server.Shutdown()
+        thread.join()
+
+    sys.stdout.write("\nForwarding: {:.2f}x faster than importing\n".format(in_process / forwarded))
+
+
+# ----------------------------------------------------------------------
+def test_ModelCache(tmp_path):
+    filenames = _CreateFiles(tmp_path)
+
+    roots = _Measure("Parse, resolve and normalize", lambda: _CreateRoots(tmp_path, filenames))
+
+    cache = ModelCache()
+
+    _Measure("Cache the models", lambda: cache.Set("key", (tmp_path / filename for filename in roots), roots))
+
+    assert _Measure("Get the cached models", lambda: cache.Get("key")) is roots
+
+    # Touched files are hashed to determine if they have changed
+    for filename in filenames:
+        stat = (tmp_path / filename).stat()
+        os.utime(tmp_path / filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+
+    assert _Measure("Get the cached models (touched files)", lambda: cache.Get("key")) is roots
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _CreateFiles(
+    tmp_path: Path,
+) -> list[Path]:
+    filenames: list[Path] = []
+
+    for file_index in range(NUM_FILES):
+        content: list[str] = []
+
+        for structure_index in range(NUM_STRUCTURES_PER_FILE):
+            content.append("Structure{}_{} ->\n".format(file_index, structure_index))
+
+            for item_index in range(NUM_ITEMS_PER_STRUCTURE):
+                if item_index % 2 == 0:
+                    content.append("    item{}: String {{ min_length: 2 }}\n".format(item_index))
+                else:
+                    content.append("    item{}: Integer? {{ default: 10 }}\n".format(item_index))
+
+            content.append("\n")
+
+        filename = Path("File{}.SimpleSchema".format(file_index))
+
+        (tmp_path / filename).write_text("".join(content))
+        filenames.append(filename)
+
+    return filenames
+
+
+# ----------------------------------------------------------------------
+def _CreateRoots(
+    tmp_path: Path,
+    filenames: list[Path],
+) -> dict[Path, RootStatement]:
+    dm_and_sink = iter(GenerateDoneManagerAndSink())
+    dm = cast(DoneManager, next(dm_and_sink))
+
+    results = Parse(
+        dm,
+        {
+            tmp_path: {
+                filename: (tmp_path / filename).read_text
+                for filename in filenames
+            },
+        },
+        single_threaded=True,
+    )
+
+    roots = cast(dict[Path, RootStatement], results[tmp_path])
+
+    assert Resolve(dm, roots, single_threaded=True) is None
+    assert Normalize(
+        dm,
+        roots,
+        [DefaultMetadataAttribute()],  # pylint: disable=no-value-for-parameter
+        set(),
+        NormalizeFlag.AllowRootStructures | NormalizeFlag.AllowNestedItems | NormalizeFlag.AllowNestedTypes,
+        single_threaded=True,
+    ) is None
+
+    assert dm.result == 0, next(dm_and_sink)
+
+    return roots
+
+
+# ----------------------------------------------------------------------
+def _Measure(
+    desc: str,
+    func: Callable[[], Any],
+) -> Any:
+    start = time.perf_counter()
+    result = func()
+    duration = time.perf_counter() - start
+
+    sys.stdout.write("{}: {:.4f}s\n".format(desc, duration))
+
+    return result
+
+
+# ----------------------------------------------------------------------
+def _MeasureProcess(
+    desc: str,
+    code: str,
+) -> float:
+    code = "from pathlib import Path\n{}".format(textwrap.dedent(code))
+
+    durations: list[float] = []
+
+    for _ in range(NUM_ITERATIONS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=_src_dir, check=True)
+        durations.append(time.perf_counter() - start)
+
+    duration = min(durations)
+
+    sys.stdout.write("{}: {:.4f}s (best of {})\n".format(desc, duration, NUM_ITERATIONS))
+
+    return duration
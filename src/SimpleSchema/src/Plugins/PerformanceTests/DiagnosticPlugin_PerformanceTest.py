@@ -0,0 +1,164 @@
+# ----------------------------------------------------------------------
+# |
+# |  DiagnosticPlugin_PerformanceTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-19 09:12:44
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Measures the time and memory required to write large diagnostic files"""
+
+import gc
+import sys
+import time
+import tracemalloc
+
+from pathlib import Path
+from typing import Callable, cast
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+from Common_Foundation.Streams.DoneManager import DoneManager
+from Common_Foundation.TestHelpers.StreamTestHelpers import GenerateDoneManagerAndSink
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from Plugins import DiagnosticPlugin
+
+    from SimpleSchema.Common.SafeYaml import ToYamlString
+    from SimpleSchema.Schema.Elements.Statements.RootStatement import RootStatement
+    from SimpleSchema.Schema.Parse.ANTLR.Parse import Parse
+    from SimpleSchema.Schema.Parse.Normalize.Normalize import Normalize
+    from SimpleSchema.Schema.Parse.TypeResolver.Resolve import Resolve
+
+
+# ----------------------------------------------------------------------
+NUM_STRUCTURES                              = 200
+NUM_ITEMS_PER_STRUCTURE                     = 10
+
+
+# ----------------------------------------------------------------------
+def test_Write(tmp_path):
+    plugin = DiagnosticPlugin.Plugin()
+    root = _CreateRoot(tmp_path, plugin)
+
+    previous_filename = tmp_path / "previous.yaml"
+    streaming_filename = tmp_path / "streaming.yaml"
+
+    # ----------------------------------------------------------------------
+    def WritePrevious():
+        # The implementation before the streaming emitter
+        visitor = DiagnosticPlugin._Visitor(plugin)  # pylint: disable=protected-access
+
+        root.Accept(
+            visitor,
+            include_disabled=True,
+        )
+
+        with previous_filename.open("w") as f:
+            f.write(ToYamlString(visitor.content))
+
+    # ----------------------------------------------------------------------
+    def WriteStreaming():
+        plugin.Generate({}, root, [streaming_filename], lambda status: None)
+
+    # ----------------------------------------------------------------------
+
+    _Measure("ToYamlString", WritePrevious)
+    _Measure("Streaming", WriteStreaming)
+
+    assert streaming_filename.read_bytes() == previous_filename.read_bytes()
+
+    sys.stdout.write("Output size: {:,} bytes\n".format(streaming_filename.stat().st_size))
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _CreateRoot(
+    tmp_path: Path,
+    plugin: DiagnosticPlugin.Plugin,
+) -> RootStatement:
+    content: list[str] = []
+
+    for structure_index in range(NUM_STRUCTURES):
+        content.append("Structure{} ->\n".format(structure_index))
+
+        for item_index in range(NUM_ITEMS_PER_STRUCTURE):
+            if item_index % 3 == 0:
+                content.append("    item{}: String {{ min_length: 2 }}\n".format(item_index))
+            elif item_index % 3 == 1:
+                content.append("    item{}: Integer?\n".format(item_index))
+            else:
+                content.append("    item{}: Structure{}*\n".format(item_index, max(structure_index - 1, 0)))
+
+        content.append("\n")
+
+    filename = tmp_path / "Large.SimpleSchema"
+    filename.write_text("".join(content))
+
+    dm_and_sink = iter(GenerateDoneManagerAndSink())
+    dm = cast(DoneManager, next(dm_and_sink))
+
+    results = Parse(
+        dm,
+        {
+            tmp_path: {
+                Path(filename.name): filename.read_text,
+            },
+        },
+        single_threaded=True,
+    )
+
+    roots = cast(dict[Path, RootStatement], results[tmp_path])
+
+    assert Resolve(dm, roots, single_threaded=True) is None
+    assert Normalize(
+        dm,
+        roots,
+        plugin.metadata_attributes,
+        plugin.extension_names,
+        plugin.flags,
+        single_threaded=True,
+    ) is None
+
+    assert dm.result == 0, next(dm_and_sink)
+
+    return roots[Path(filename.name)]
+
+
+# ----------------------------------------------------------------------
+def _Measure(
+    desc: str,
+    func: Callable[[], None],
+    num_iterations: int=3,
+) -> None:
+    best = None
+
+    for _ in range(num_iterations):
+        start = time.perf_counter()
+        func()
+        duration = time.perf_counter() - start
+
+        if best is None or duration < best:
+            best = duration
+
+    assert best is not None
+
+    gc.collect()
+
+    tracemalloc.start()
+    with ExitStack(tracemalloc.stop):
+        func()
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+
+    sys.stdout.write("{}: {:.4f}s, {:,} peak bytes allocated\n".format(desc, best, peak_bytes))
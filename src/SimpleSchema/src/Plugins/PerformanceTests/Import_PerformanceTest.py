@@ -0,0 +1,121 @@
+# ----------------------------------------------------------------------
+# |
+# |  Import_PerformanceTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-25 08:47:19
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""\
+Measures the time required to import the modules used by the command line (via `python -X importtime`
+in a new process) and ensures that modules that are expensive to import aren't imported eagerly.
+"""
+
+import re
+import subprocess
+import sys
+import textwrap
+
+from pathlib import Path
+
+from Common_Foundation import PathEx
+
+
+# ----------------------------------------------------------------------
+# The modules imported when EntryPoint/__main__.py is imported (modules used by specific commands
+# are imported by those commands)
+MODULES                                     = [
+    "SimpleSchema.Common.ExecuteInParallel",
+    "SimpleSchema.Common.Inflect",
+    "SimpleSchema.Plugin",
+    "SimpleSchema.PluginManifest",
+    "SimpleSchema.Schema.Elements.Statements.RootStatement",
+    "SimpleSchema.Schema.MetadataAttributes.ContainerAttributes",
+    "SimpleSchema.Schema.MetadataAttributes.ElementAttributes",
+    "SimpleSchema.Schema.Parse.ANTLR.Parse",
+    "SimpleSchema.Schema.Parse.Normalize.Normalize",
+    "SimpleSchema.Schema.Parse.TypeResolver.Resolve",
+]
+
+# Modules that should only be imported when they are used
+LAZY_MODULES                                = [
+    "inflect",                              # Only used when generating messages
+    "typeguard",                            # Imported by inflect
+    "SimpleSchema.Daemon",                  # Only used by the `Daemon` command
+    "SimpleSchema.PluginProcessPool",       # Only used with multiple processes
+    "SimpleSchema.Schema.IR.Lower",         # Only used when emitting IR
+    "SimpleSchema.Schema.Validate.Validate",    # Only used by the `Validate` command
+]
+
+# Generous, as this test runs on a variety of machines; the imports take ~0.3s on a development
+# machine (they took ~2.5s when inflect was imported eagerly).
+MAX_IMPORT_SECONDS                          = 1.5
+
+_src_dir                                    = PathEx.EnsureDir(Path(__file__).parent.parent.parent)
+
+
+# ----------------------------------------------------------------------
+def test_ImportTime():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "\n".join("import {}".format(module) for module in MODULES),
+        ],
+        cwd=_src_dir,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    # Each line is "import time: <self us> | <cumulative us> | <indentation><module name>"
+    regex = re.compile(r"^import time:\s+(?P<self>\d+) \|\s+(?P<cumulative>\d+) \|(?P<indentation> +)(?P<name>\S+)$")
+
+    imported: dict[str, int] = {}
+    total_microseconds = 0
+
+    for line in result.stderr.splitlines():
+        match = regex.match(line)
+        if match is None:
+            continue
+
+        cumulative = int(match.group("cumulative"))
+
+        imported[match.group("name")] = cumulative
+
+        # Modules at the top level (indented by a single space) aren't included in the cumulative
+        # time of any other module.
+        if len(match.group("indentation")) == 1:
+            total_microseconds += cumulative
+
+    sys.stdout.write(
+        textwrap.dedent(
+            """\
+
+            Total: {:.4f}s
+
+            {}
+            """,
+        ).format(
+            total_microseconds / 1000000,
+            "\n".join(
+                "{:<70} {:.4f}s".format(module, imported[module] / 1000000)
+                for module in MODULES
+                if module in imported
+            ),
+        ),
+    )
+
+    for module in LAZY_MODULES:
+        assert module not in imported, module
+
+    assert total_microseconds / 1000000 < MAX_IMPORT_SECONDS, total_microseconds
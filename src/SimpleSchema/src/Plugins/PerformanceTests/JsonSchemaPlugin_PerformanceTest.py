@@ -0,0 +1,461 @@
+# ----------------------------------------------------------------------
+# |
+# |  JsonSchemaPlugin_PerformanceTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-18 14:37:02
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Measures the time and memory required to write large JSON schemas"""
+
+import gc
+import json
+import shutil
+import sys
+import time
+import tracemalloc
+
+from pathlib import Path
+from typing import Any, Callable, cast
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+from Common_Foundation.Streams.DoneManager import DoneManager
+from Common_Foundation.TestHelpers.StreamTestHelpers import GenerateDoneManagerAndSink
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from Plugins import JsonSchemaPlugin
+
+    from SimpleSchema.Schema.Elements.Statements.RootStatement import RootStatement
+    from SimpleSchema.Schema.Parse.ANTLR.Parse import Parse
+    from SimpleSchema.Schema.Parse.Normalize.Normalize import Normalize
+    from SimpleSchema.Schema.Parse.TypeResolver.Resolve import Resolve
+
+
+# ----------------------------------------------------------------------
+NUM_DEFINITIONS                             = 5000
+NUM_PROPERTIES_PER_DEFINITION               = 10
+
+NUM_COMMON_STRUCTURES                       = 50
+NUM_INCLUDING_FILES                         = 200
+
+
+# ----------------------------------------------------------------------
+def test_Write(tmp_path):
+    schema = _CreateSchema()
+
+    previous_filename = tmp_path / "previous.json"
+    streaming_filename = tmp_path / "streaming.json"
+
+    # ----------------------------------------------------------------------
+    def WritePrevious():
+        # The implementation before the streaming writer
+        with previous_filename.open("w") as f:
+            content = json.dumps(
+                schema,
+                indent=2,
+                separators=(", ", " : "),
+            )
+
+            for line in content.splitlines(keepends=False):
+                if line.isspace():
+                    line = ""
+
+                f.write(line.rstrip())
+                f.write("\n")
+
+    # ----------------------------------------------------------------------
+    def WriteStreaming():
+        with streaming_filename.open(
+            "w",
+            buffering=JsonSchemaPlugin._WRITE_BUFFER_SIZE,  # pylint: disable=protected-access
+        ) as f:
+            JsonSchemaPlugin._WriteSchema(f, schema)  # pylint: disable=protected-access
+
+    # ----------------------------------------------------------------------
+
+    _Measure("Previous", WritePrevious)
+    _Measure("Streaming", WriteStreaming)
+
+    assert streaming_filename.read_bytes() == previous_filename.read_bytes()
+
+    sys.stdout.write("Output size: {:,} bytes\n".format(streaming_filename.stat().st_size))
+
+
+# ----------------------------------------------------------------------
+def test_SharedDefinitions(tmp_path):
+    # Every output file includes the definitions in Common.SimpleSchema
+    common_content: list[str] = []
+
+    for structure_index in range(NUM_COMMON_STRUCTURES):
+        common_content.append("Common{} ->\n".format(structure_index))
+
+        for item_index in range(NUM_PROPERTIES_PER_DEFINITION):
+            common_content.append("    item{}: String {{ min_length: 2 }}\n".format(item_index))
+
+        common_content.append("\n")
+
+    main_content = "from Common import *\n\nMain ->\n{}\nmain: Main\n".format(
+        "".join(
+            "    item{}: Common{}\n".format(structure_index, structure_index)
+            for structure_index in range(NUM_COMMON_STRUCTURES)
+        ),
+    )
+
+    plugin = JsonSchemaPlugin.Plugin()
+
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+
+    (workspace / "Common.SimpleSchema").write_text("".join(common_content))
+    (workspace / "Main.SimpleSchema").write_text(main_content)
+
+    dm_and_sink = iter(GenerateDoneManagerAndSink())
+    dm = cast(DoneManager, next(dm_and_sink))
+
+    results = Parse(
+        dm,
+        {
+            workspace: {
+                Path("Common.SimpleSchema"): lambda: (workspace / "Common.SimpleSchema").read_text(),
+                Path("Main.SimpleSchema"): lambda: (workspace / "Main.SimpleSchema").read_text(),
+            },
+        },
+        single_threaded=True,
+    )
+
+    roots = {
+        workspace / relative_path: cast(RootStatement, root)
+        for relative_path, root in results[workspace].items()
+    }
+
+    assert Resolve(dm, roots, single_threaded=True) is None
+
+    # The included elements are normalized as a part of the root that includes them
+    main_filename = workspace / "Main.SimpleSchema"
+    main_root = roots[main_filename]
+
+    assert Normalize(
+        dm,
+        {main_filename: main_root},
+        plugin.metadata_attributes,
+        plugin.extension_names,
+        plugin.flags,
+        single_threaded=True,
+    ) is None
+
+    assert dm.result == 0, next(dm_and_sink)
+
+    # ----------------------------------------------------------------------
+    def Generate(
+        output_dir: Path,
+        shared_definitions: bool,
+    ) -> None:
+        output_dir.mkdir()
+
+        command_line_args = {
+            "id": "",
+            "title": "",
+            "description": "",
+            "schema_version": "https://json-schema.org/draft/2020-12/schema#",
+            "allow_additional_data": False,
+            "shared_definitions": shared_definitions,
+        }
+
+        for output_index in range(NUM_INCLUDING_FILES):
+            plugin.Generate(
+                command_line_args,
+                main_root,
+                [output_dir / "Main{}.json".format(output_index)],
+                lambda status: None,
+            )
+
+    # ----------------------------------------------------------------------
+
+    for desc, output_dir, shared_definitions in [
+        ("Standard", tmp_path / "standard", False),
+        ("Shared definitions", tmp_path / "shared", True),
+    ]:
+        start = time.perf_counter()
+        Generate(output_dir, shared_definitions)
+        duration = time.perf_counter() - start
+
+        sys.stdout.write(
+            "{}: {:,} files generated in {:.4f}s ({:,} bytes)\n".format(
+                desc,
+                NUM_INCLUDING_FILES,
+                duration,
+                sum(filename.stat().st_size for filename in output_dir.iterdir()),
+            ),
+        )
+
+    # Standard output is unchanged
+    assert "Common.definitions.json" not in (tmp_path / "standard" / "Main0.json").read_text()
+
+    # All references to included definitions are resolved by the shared definitions file
+    shared_definitions_filename = tmp_path / "shared" / "Common.definitions.json"
+
+    with shared_definitions_filename.open() as f:
+        shared_definitions = json.load(f)["$defs"]
+
+    assert len(shared_definitions) == NUM_COMMON_STRUCTURES
+
+    with (tmp_path / "shared" / "Main0.json").open() as f:
+        main_schema = json.load(f)
+
+    references = [
+        item["$ref"]
+        for item in main_schema["$defs"]["Main"]["properties"].values()
+    ]
+
+    assert len(references) == NUM_COMMON_STRUCTURES
+
+    for reference in references:
+        filename, definition_name = reference.split("#/$defs/")
+
+        assert filename == shared_definitions_filename.name
+        assert definition_name in shared_definitions
+
+
+# ----------------------------------------------------------------------
+def test_GenerateAll(tmp_path):
+    # Each output file includes a different definition in Common.SimpleSchema, so the shared
+    # definitions change with every file.
+    common_content: list[str] = []
+
+    for structure_index in range(NUM_COMMON_STRUCTURES):
+        common_content.append("Common{} ->\n".format(structure_index))
+
+        for item_index in range(NUM_PROPERTIES_PER_DEFINITION):
+            common_content.append("    item{}: String {{ min_length: 2 }}\n".format(item_index))
+
+        common_content.append("\n")
+
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+
+    (workspace / "Common.SimpleSchema").write_text("".join(common_content))
+
+    main_filenames: list[Path] = []
+
+    for structure_index in range(NUM_COMMON_STRUCTURES):
+        main_filename = workspace / "Main{}.SimpleSchema".format(structure_index)
+        main_filename.write_text("from Common import *\n\nMain ->\n    item: Common{}\n\nmain: Main\n".format(structure_index))
+
+        main_filenames.append(main_filename)
+
+    plugin = JsonSchemaPlugin.Plugin()
+
+    dm_and_sink = iter(GenerateDoneManagerAndSink())
+    dm = cast(DoneManager, next(dm_and_sink))
+
+    results = Parse(
+        dm,
+        {
+            workspace: {
+                filename.relative_to(workspace): filename.read_text
+                for filename in [workspace / "Common.SimpleSchema"] + main_filenames
+            },
+        },
+        single_threaded=True,
+    )
+
+    roots = {
+        workspace / relative_path: cast(RootStatement, root)
+        for relative_path, root in results[workspace].items()
+    }
+
+    assert Resolve(dm, roots, single_threaded=True) is None
+
+    # The included elements are normalized as a part of the roots that include them
+    main_roots = {filename: roots[filename] for filename in main_filenames}
+
+    assert Normalize(
+        dm,
+        main_roots,
+        plugin.metadata_attributes,
+        plugin.extension_names,
+        plugin.flags,
+        single_threaded=True,
+    ) is None
+
+    assert dm.result == 0, next(dm_and_sink)
+
+    command_line_args = {
+        "id": "",
+        "title": "",
+        "description": "",
+        "schema_version": "https://json-schema.org/draft/2020-12/schema#",
+        "allow_additional_data": False,
+        "shared_definitions": True,
+    }
+
+    # ----------------------------------------------------------------------
+    def CreateFilenameMap(
+        output_dir: Path,
+    ) -> dict[Path, list[Path]]:
+        return {
+            filename: [output_dir / filename.with_suffix(".json").name]
+            for filename in main_roots
+        }
+
+    # ----------------------------------------------------------------------
+
+    for desc, output_dir, use_generate_all in [
+        ("Generate", tmp_path / "generate", False),
+        ("GenerateAll", tmp_path / "generate_all", True),
+    ]:
+        # Output counts are tracked by the plugin, so use a new plugin for each measurement
+        plugin = JsonSchemaPlugin.Plugin()
+        filename_map = CreateFilenameMap(output_dir)
+
+        start = time.perf_counter()
+
+        if use_generate_all:
+            plugin.GenerateAll(command_line_args, main_roots, filename_map, lambda status: None)
+        else:
+            for filename, root in main_roots.items():
+                plugin.Generate(command_line_args, root, filename_map[filename], lambda status: None)
+
+        duration = time.perf_counter() - start
+
+        sys.stdout.write(
+            "{}: {:,} files generated in {:.4f}s ({:,} files written)\n".format(
+                desc,
+                len(main_roots),
+                duration,
+                plugin.GetOutputCounts().num_written,
+            ),
+        )
+
+    # The shared definitions are only written once with `GenerateAll`
+    assert plugin.GetOutputCounts().num_written == len(main_roots) + 1
+
+    # The schemas are the same regardless of how they were generated; the shared definitions
+    # written by `Generate` only contain the definitions used by the last file.
+    for filename in (tmp_path / "generate").iterdir():
+        if filename.name == "Common.definitions.json":
+            continue
+
+        assert filename.read_bytes() == (tmp_path / "generate_all" / filename.name).read_bytes()
+
+    with (tmp_path / "generate_all" / "Common.definitions.json").open() as f:
+        assert len(json.load(f)["$defs"]) == NUM_COMMON_STRUCTURES
+
+    # Shared definitions aren't preserved across invocations, so they are written every time
+    # (this is common when running as a daemon).
+    shutil.rmtree(tmp_path / "generate_all")
+
+    plugin.GenerateAll(command_line_args, main_roots, CreateFilenameMap(tmp_path / "generate_all"), lambda status: None)
+
+    with (tmp_path / "generate_all" / "Common.definitions.json").open() as f:
+        assert len(json.load(f)["$defs"]) == NUM_COMMON_STRUCTURES
+
+
+# ----------------------------------------------------------------------
+def test_Equivalence(tmp_path):
+    schema = {
+        "$defs": {
+            "Empty": {},
+            "EmptyList": [],
+            "Unicode": "é中\U0001f600",
+            "Escapes": "\"quoted\"\t\\\n",
+            "Values": [None, True, False, 1, -2.5, 1e100, "    "],
+            "Nested": [[[]], [{}], {"a": [{"b": {}}]}],
+        },
+        "": "empty key",
+    }
+
+    filename = tmp_path / "output.json"
+
+    with filename.open("w") as f:
+        JsonSchemaPlugin._WriteSchema(f, schema)  # pylint: disable=protected-access
+
+    expected = "".join(
+        "{}\n".format(line.rstrip())
+        for line in json.dumps(schema, indent=2, separators=(", ", " : ")).splitlines()
+    )
+
+    assert filename.read_text() == expected
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _CreateSchema() -> dict[str, Any]:
+    definitions: dict[str, Any] = {}
+
+    for definition_index in range(NUM_DEFINITIONS):
+        properties: dict[str, Any] = {}
+
+        for property_index in range(NUM_PROPERTIES_PER_DEFINITION):
+            if property_index % 3 == 0:
+                properties["item{}".format(property_index)] = {
+                    "type": "string",
+                    "minLength": 1,
+                    "description": "Description for item {} in structure {}".format(property_index, definition_index),
+                }
+            elif property_index % 3 == 1:
+                properties["item{}".format(property_index)] = {
+                    "type": "array",
+                    "items": {"$ref": "#/$defs/Structure{}".format(max(definition_index - 1, 0))},
+                    "minItems": 0,
+                }
+            else:
+                properties["item{}".format(property_index)] = {
+                    "oneOf": [{"type": "integer", "minimum": 0}, {"type": "null"}],
+                }
+
+        definitions["Structure{}".format(definition_index)] = {
+            "type": "object",
+            "additionalProperties": False,
+            "properties": properties,
+            "required": list(properties),
+        }
+
+    return {
+        "$schema": "https://json-schema.org/draft/2020-12/schema#",
+        "$defs": definitions,
+        "type": "object",
+        "additionalProperties": False,
+        "properties": {"root": {"$ref": "#/$defs/Structure{}".format(NUM_DEFINITIONS - 1)}},
+        "required": ["root"],
+    }
+
+
+# ----------------------------------------------------------------------
+def _Measure(
+    desc: str,
+    func: Callable[[], None],
+    num_iterations: int=3,
+) -> None:
+    best = None
+
+    for _ in range(num_iterations):
+        start = time.perf_counter()
+        func()
+        duration = time.perf_counter() - start
+
+        if best is None or duration < best:
+            best = duration
+
+    assert best is not None
+
+    gc.collect()
+
+    tracemalloc.start()
+    with ExitStack(tracemalloc.stop):
+        func()
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+
+    sys.stdout.write("{}: {:.4f}s, {:,} peak bytes allocated\n".format(desc, best, peak_bytes))
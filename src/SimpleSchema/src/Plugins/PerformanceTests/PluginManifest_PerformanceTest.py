@@ -0,0 +1,112 @@
+# ----------------------------------------------------------------------
+# |
+# |  PluginManifest_PerformanceTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-24 10:02:44
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""\
+Measures the cold-start time required to list and create plugins with and without the plugin
+manifest (each measurement is made in a new process).
+"""
+
+import subprocess
+import sys
+import textwrap
+import time
+
+from pathlib import Path
+
+from Common_Foundation import PathEx
+
+
+# ----------------------------------------------------------------------
+NUM_ITERATIONS                              = 5
+
+_src_dir                                    = PathEx.EnsureDir(Path(__file__).parent.parent.parent)
+
+
+# ----------------------------------------------------------------------
+def test_ColdStart():
+    baseline = _Measure(
+        "Python startup",
+        "pass",
+    )
+
+    all_plugins = _Measure(
+        "Import and create all plugins",
+        """\
+        from SimpleSchema.PluginManifest import PluginManifest
+
+        manifest = PluginManifest.Load(Path("Plugins"))
+
+        for item in manifest.items:
+            item.CreatePlugin()
+        """,
+    )
+
+    list_plugins = _Measure(
+        "List plugins via the manifest",
+        """\
+        from SimpleSchema.PluginManifest import PluginManifest
+
+        manifest = PluginManifest.Load(Path("Plugins"))
+
+        for item in manifest.items:
+            item.name, item.description
+        """,
+    )
+
+    single_plugin = _Measure(
+        "Import and create the selected plugin",
+        """\
+        from SimpleSchema.PluginManifest import PluginManifest
+
+        PluginManifest.Load(Path("Plugins")).GetItem("JsonSchema").CreatePlugin()
+        """,
+    )
+
+    sys.stdout.write(
+        textwrap.dedent(
+            """\
+
+            Excluding python startup:
+                List plugins: {:.2f}x faster than creating all plugins
+                Selected plugin: {:.2f}x faster than creating all plugins
+            """,
+        ).format(
+            (all_plugins - baseline) / max(list_plugins - baseline, 0.0001),
+            (all_plugins - baseline) / max(single_plugin - baseline, 0.0001),
+        ),
+    )
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _Measure(
+    desc: str,
+    code: str,
+) -> float:
+    code = "from pathlib import Path\n{}".format(textwrap.dedent(code))
+
+    durations: list[float] = []
+
+    for _ in range(NUM_ITERATIONS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=_src_dir, check=True)
+        durations.append(time.perf_counter() - start)
+
+    duration = min(durations)
+
+    sys.stdout.write("{}: {:.4f}s (best of {})\n".format(desc, duration, NUM_ITERATIONS))
+
+    return duration
@@ -0,0 +1,204 @@
+# ----------------------------------------------------------------------
+# |
+# |  PluginProcessPool_PerformanceTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-22 10:04:36
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Measures the time required to generate content for many files using threads and processes"""
+
+import os
+import pickle
+import sys
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, cast
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+from Common_Foundation.Streams.DoneManager import DoneManager
+from Common_Foundation.TestHelpers.StreamTestHelpers import GenerateDoneManagerAndSink
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from Plugins import DiagnosticPlugin
+
+    from SimpleSchema.PluginProcessPool import PluginProcessPool
+    from SimpleSchema.Schema.Elements.Statements.RootStatement import RootStatement
+    from SimpleSchema.Schema.Parse.ANTLR.Parse import Parse
+    from SimpleSchema.Schema.Parse.Normalize.Normalize import Normalize
+    from SimpleSchema.Schema.Parse.TypeResolver.Resolve import Resolve
+
+
+# ----------------------------------------------------------------------
+NUM_FILES                                   = 2000
+NUM_STRUCTURES                              = 5
+NUM_ITEMS_PER_STRUCTURE                     = 5
+
+
+# ----------------------------------------------------------------------
+def test_Generate(tmp_path):
+    plugin = DiagnosticPlugin.Plugin()
+    roots = _CreateRoots(tmp_path, plugin)
+
+    num_cores = os.cpu_count() or 1
+
+    # ----------------------------------------------------------------------
+    def CreateGenerateFunc(
+        num_processes: int,
+    ) -> Callable[[Path], None]:
+        # ----------------------------------------------------------------------
+        def Impl(
+            output_dir: Path,
+        ) -> None:
+            if num_processes == 0:
+                # Threads within this process (the behavior when `--num-processes` is 1)
+                with ThreadPoolExecutor(num_cores) as executor:
+                    for future in [
+                        executor.submit(
+                            plugin.Generate,
+                            {},
+                            root,
+                            [output_dir / filename.with_suffix(".yaml")],
+                            lambda status: None,
+                        )
+                        for filename, root in roots.items()
+                    ]:
+                        future.result()
+
+                return
+
+            with PluginProcessPool(plugin, roots, num_processes) as pool:
+                with ThreadPoolExecutor(num_processes) as executor:
+                    for future in [
+                        executor.submit(
+                            pool.Generate,
+                            {},
+                            filename,
+                            [output_dir / filename.with_suffix(".yaml")],
+                        )
+                        for filename in roots
+                    ]:
+                        future.result()
+
+        # ----------------------------------------------------------------------
+
+        return Impl
+
+    # ----------------------------------------------------------------------
+
+    baseline = _Measure("Threads ({})".format(num_cores), tmp_path / "Threads", CreateGenerateFunc(0))
+
+    for num_processes in sorted({1, 2, num_cores}):
+        duration = _Measure(
+            "Processes ({})".format(num_processes),
+            tmp_path / "Processes{}".format(num_processes),
+            CreateGenerateFunc(num_processes),
+        )
+
+        sys.stdout.write("    {:.2f}x\n".format(baseline / duration))
+
+        # The output is the same regardless of how it was generated
+        for filename in roots:
+            output_filename = filename.with_suffix(".yaml")
+
+            assert (
+                (tmp_path / "Processes{}".format(num_processes) / output_filename).read_bytes()
+                == (tmp_path / "Threads" / output_filename).read_bytes()
+            )
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _CreateRoots(
+    tmp_path: Path,
+    plugin: DiagnosticPlugin.Plugin,
+) -> dict[Path, RootStatement]:
+    content: list[str] = []
+
+    for structure_index in range(NUM_STRUCTURES):
+        content.append("Structure{} ->\n".format(structure_index))
+
+        for item_index in range(NUM_ITEMS_PER_STRUCTURE):
+            if item_index % 3 == 0:
+                content.append("    item{}: String {{ min_length: 2 }}\n".format(item_index))
+            elif item_index % 3 == 1:
+                content.append("    item{}: Integer?\n".format(item_index))
+            else:
+                content.append("    item{}: Structure{}*\n".format(item_index, max(structure_index - 1, 0)))
+
+        content.append("\n")
+
+    filename = tmp_path / "Template.SimpleSchema"
+    filename.write_text("".join(content))
+
+    dm_and_sink = iter(GenerateDoneManagerAndSink())
+    dm = cast(DoneManager, next(dm_and_sink))
+
+    results = Parse(
+        dm,
+        {
+            tmp_path: {
+                Path(filename.name): filename.read_text,
+            },
+        },
+        single_threaded=True,
+    )
+
+    roots = cast(dict[Path, RootStatement], results[tmp_path])
+
+    assert Resolve(dm, roots, single_threaded=True) is None
+    assert Normalize(
+        dm,
+        roots,
+        plugin.metadata_attributes,
+        plugin.extension_names,
+        plugin.flags,
+        single_threaded=True,
+    ) is None
+
+    assert dm.result == 0, next(dm_and_sink)
+
+    # Parsing thousands of files would dominate the time required to run this test, so the corpus is
+    # made up of independent copies of the same content.
+    serialized_root = pickle.dumps(roots[Path(filename.name)], pickle.HIGHEST_PROTOCOL)
+
+    return {
+        Path("File{}.SimpleSchema".format(index)): pickle.loads(serialized_root)
+        for index in range(NUM_FILES)
+    }
+
+
+# ----------------------------------------------------------------------
+def _Measure(
+    desc: str,
+    output_dir: Path,
+    func: Callable[[Path], None],
+) -> float:
+    start = time.perf_counter()
+    func(output_dir)
+    duration = time.perf_counter() - start
+
+    sys.stdout.write(
+        "{}: {:,} files in {:.4f}s ({:.2f} ms per file)\n".format(
+            desc,
+            NUM_FILES,
+            duration,
+            duration / NUM_FILES * 1000,
+        ),
+    )
+
+    return duration
@@ -0,0 +1,171 @@
+# ----------------------------------------------------------------------
+# |
+# |  Plugin_PerformanceTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-18 09:12:44
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Measures the time required to import and construct the plugins"""
+
+import inspect
+import subprocess
+import sys
+import textwrap
+import time
+
+from pathlib import Path
+from typing import Callable
+from unittest import mock
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from Plugins import DiagnosticPlugin
+    from Plugins import JsonSchemaPlugin
+
+    from SimpleSchema.Common.Range import Range
+
+
+# ----------------------------------------------------------------------
+NUM_PLUGINS                                 = 100
+
+
+# ----------------------------------------------------------------------
+def test_Import():
+    with_inspect = _MeasureImport(use_inspect=True)
+    standard = _MeasureImport(use_inspect=False)
+
+    sys.stdout.write(
+        textwrap.dedent(
+            """\
+            Import (inspect.stack): {:.4f}s
+            Import: {:.4f}s
+            """,
+        ).format(with_inspect, standard),
+    )
+
+
+# ----------------------------------------------------------------------
+def test_Construct():
+    for desc, plugin_type in [
+        ("DiagnosticPlugin", DiagnosticPlugin.Plugin),
+        ("JsonSchemaPlugin", JsonSchemaPlugin.Plugin),
+    ]:
+        with mock.patch.object(Range, "CreateFromCode", classmethod(_CreateFromCodeWithInspect)):
+            _Measure("{} (inspect.stack)".format(desc), NUM_PLUGINS // 10, plugin_type, num_iterations=1)
+
+        _Measure(desc, NUM_PLUGINS, plugin_type)
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _CreateFromCodeWithInspect(
+    cls,
+    *,
+    callstack_offset: int=0,
+) -> Range:
+    # The implementation of `Range.CreateFromCode` before it used `sys._getframe`
+    frame = inspect.stack()[callstack_offset + 1][0]
+    line = frame.f_lineno
+
+    return cls.Create(Path(frame.f_code.co_filename), line, line, line, line)
+
+
+# ----------------------------------------------------------------------
+def _MeasureImport(
+    *,
+    use_inspect: bool,
+    num_iterations: int=3,
+) -> float:
+    # Modules can only be imported once per process, so the import is measured in a new process
+    code = textwrap.dedent(
+        """\
+        import inspect
+        import sys
+        import time
+
+        from pathlib import Path
+
+        sys.path.insert(0, {root!r})
+
+        from SimpleSchema.Common.Range import Range
+
+        {create_func}
+
+        if {use_inspect}:
+            Range.CreateFromCode = classmethod(_CreateFromCodeWithInspect)
+
+        start = time.perf_counter()
+
+        from Plugins import JsonSchemaPlugin
+
+        sys.stdout.write(str(time.perf_counter() - start))
+        """,
+    ).format(
+        root=str(Path(__file__).parent.parent.parent),
+        create_func=textwrap.indent(inspect.getsource(_CreateFromCodeWithInspect), " " * 8).lstrip(),
+        use_inspect=use_inspect,
+    )
+
+    best = None
+
+    for _ in range(num_iterations):
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+
+        duration = float(result.stdout)
+
+        if best is None or duration < best:
+            best = duration
+
+    assert best is not None
+    return best
+
+
+# ----------------------------------------------------------------------
+def _Measure(
+    desc: str,
+    num_items: int,
+    func: Callable[[], object],
+    num_iterations: int=3,
+) -> None:
+    best = None
+
+    for _ in range(num_iterations):
+        start = time.perf_counter()
+
+        for _ in range(num_items):
+            func()
+
+        duration = time.perf_counter() - start
+
+        if best is None or duration < best:
+            best = duration
+
+    assert best is not None
+
+    sys.stdout.write(
+        "{}: {:,} plugins constructed in {:.4f}s ({:.2f} us per plugin)\n".format(
+            desc,
+            num_items,
+            best,
+            best / num_items * 1000000,
+        ),
+    )
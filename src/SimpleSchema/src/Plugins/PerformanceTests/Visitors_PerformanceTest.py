@@ -0,0 +1,189 @@
+# ----------------------------------------------------------------------
+# |
+# |  Visitors_PerformanceTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-12 11:05:36
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Measures the throughput of the plugin visitors on a large schema"""
+
+import sys
+import time
+
+from pathlib import Path
+from typing import Any, cast, Callable
+
+import pytest
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+from Common_Foundation.Streams.DoneManager import DoneManager
+from Common_Foundation.TestHelpers.StreamTestHelpers import GenerateDoneManagerAndSink
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from Plugins import DiagnosticPlugin
+    from Plugins import JsonSchemaPlugin
+
+    from SimpleSchema.Plugin import Plugin
+    from SimpleSchema.Schema.Elements.Statements.RootStatement import RootStatement
+    from SimpleSchema.Schema.Parse.ANTLR.Parse import Parse
+    from SimpleSchema.Schema.Parse.Normalize.Normalize import Normalize
+    from SimpleSchema.Schema.Parse.TypeResolver.Resolve import Resolve
+    from SimpleSchema.Schema.Visitors.DescendantVisitor import DescendantVisitor
+
+
+# ----------------------------------------------------------------------
+NUM_STRUCTURES                              = 250
+NUM_ITEMS_PER_STRUCTURE                     = 20
+
+
+# ----------------------------------------------------------------------
+def test_DiagnosticPlugin(tmp_path):
+    plugin = DiagnosticPlugin.Plugin()
+
+    _Measure(
+        "DiagnosticPlugin",
+        _CreateRoot(tmp_path, plugin),
+        lambda root: root.Accept(
+            DiagnosticPlugin._Visitor(plugin),  # pylint: disable=protected-access
+            include_disabled=True,
+        ),
+    )
+
+
+# ----------------------------------------------------------------------
+def test_JsonSchemaPlugin(tmp_path):
+    plugin = JsonSchemaPlugin.Plugin()
+
+    _Measure(
+        "JsonSchemaPlugin",
+        _CreateRoot(tmp_path, plugin),
+        lambda root: root.Accept(
+            JsonSchemaPlugin._Visitor(plugin, allow_additional_data=False),  # pylint: disable=protected-access
+        ),
+    )
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _CreateRoot(
+    workspace: Path,
+    plugin: Plugin,
+) -> RootStatement:
+    types: list[tuple[str, str]] = [
+        ("String", ""),
+        ("Integer", " { min: 0 }"),
+        ("Number", ""),
+        ("Boolean", ""),
+        ("String", " { min_length: 2, max_length: 100 }"),
+    ]
+
+    cardinalities = ["", "?", "*", "[1, 4]"]
+
+    content: list[str] = []
+
+    for structure_index in range(NUM_STRUCTURES):
+        content.append("Structure{} ->\n".format(structure_index))
+
+        for item_index in range(NUM_ITEMS_PER_STRUCTURE):
+            if item_index == 0 and structure_index != 0:
+                the_type, metadata = "Structure{}".format(structure_index - 1), ""
+            else:
+                the_type, metadata = types[item_index % len(types)]
+
+            content.append(
+                "    item{}: {}{}{}\n".format(
+                    item_index,
+                    the_type,
+                    cardinalities[item_index % len(cardinalities)],
+                    metadata,
+                ),
+            )
+
+        content.append("\n")
+
+    content.append("root: Structure{}\n".format(NUM_STRUCTURES - 1))
+
+    content_str = "".join(content)
+    relative_path = Path("Large.SimpleSchema")
+
+    dm_and_sink = iter(GenerateDoneManagerAndSink())
+    dm = cast(DoneManager, next(dm_and_sink))
+
+    results = Parse(
+        dm,
+        {
+            workspace: {
+                relative_path: lambda: content_str,
+            },
+        },
+        single_threaded=True,
+    )
+
+    roots = cast(dict[Path, RootStatement], results[workspace])
+
+    assert Resolve(dm, roots, single_threaded=True) is None
+    assert Normalize(
+        dm,
+        roots,
+        plugin.metadata_attributes,
+        plugin.extension_names,
+        plugin.flags,
+        single_threaded=True,
+    ) is None
+
+    assert dm.result == 0, next(dm_and_sink)
+
+    return roots[relative_path]
+
+
+# ----------------------------------------------------------------------
+def _Measure(
+    desc: str,
+    root: RootStatement,
+    func: Callable[[RootStatement], Any],
+    num_iterations: int=5,
+) -> None:
+    num_elements = 0
+
+    # ----------------------------------------------------------------------
+    def OnElement(*args, **kwargs) -> None:  # pylint: disable=unused-argument
+        nonlocal num_elements
+        num_elements += 1
+
+    # ----------------------------------------------------------------------
+
+    root.Accept(DescendantVisitor(OnElement), include_disabled=True)
+
+    best = None
+
+    for _ in range(num_iterations):
+        start = time.perf_counter()
+        func(root)
+        duration = time.perf_counter() - start
+
+        if best is None or duration < best:
+            best = duration
+
+    assert best is not None
+
+    sys.stdout.write(
+        "{}: {:,} elements visited in {:.4f}s ({:,.0f} elements per second)\n".format(
+            desc,
+            num_elements,
+            best,
+            num_elements / best,
+        ),
+    )
@@ -140,6 +140,9 @@ string_type_regex_failure                   = "The value '{value}' does not matc
 string_type_too_large                       = "No more than {value} {value_verb} expected ({found} {found_verb} found)."
 string_type_too_small                       = "At least {value} {value_verb} expected ({found} {found_verb} found)."
 
+structure_type_missing_item                 = "The required item '{name}' was not provided."
+structure_type_unexpected_item              = "The item '{name}' was not expected."
+
 tuple_type_item_mismatch                    = "{value} {value_verb} expected ({found} {found_verb} found)."
 
 uri_type_invalid_value                      = "'{value}' is not a valid URI."
@@ -195,6 +198,17 @@ normalize_metadata_type_nested              = "The type statement is not a neste
 normalize_metadata_type_root                = "The type statement is not a root statement"
 
 
+# ----------------------------------------------------------------------
+# |
+# |  Validate Errors
+# |
+# ----------------------------------------------------------------------
+validate_invalid_record                     = "A '{python_type}' value cannot be validated; a mapping was expected."
+
+ValidateInvalidDocument                     = DynamicSimpleSchemaException.CreateType(validate_invalid_record, python_type=str)
+ValidateInvalidStructureName                = DynamicSimpleSchemaException.CreateType("The structure '{name}' was not found.", name=str)
+
+
 # ----------------------------------------------------------------------
 # |
 # |  Plugin Errors
@@ -0,0 +1,37 @@
+# ----------------------------------------------------------------------
+# |
+# |  Inflect.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-27 10:12:43
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""\
+Provides access to the inflect engine used when generating messages.
+
+inflect is expensive to import (it is responsible for most of the time required to import this
+package when it is imported eagerly) and is only needed when generating messages (which generally
+happens when errors are encountered), so it is imported when it is first requested rather than
+when the modules that use it are imported.
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import inflect  # pragma: no cover
+
+
+# ----------------------------------------------------------------------
+def Get() -> "inflect.engine":
+    """Returns the inflect engine, importing inflect if necessary"""
+
+    from Common_FoundationEx.InflectEx import inflect as inflect_engine  # pylint: disable=import-outside-toplevel
+
+    return inflect_engine
@@ -15,29 +15,85 @@
 # ----------------------------------------------------------------------
 """Contains the Location object"""
 
-from dataclasses import dataclass
-from functools import cached_property
+from dataclasses import FrozenInstanceError
+from typing import ClassVar
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
 class Location(object):
     """Location within a source file"""
 
-    # ----------------------------------------------------------------------
-    line: int
-    column: int
+    # Locations are stored as a single integer, with the line in the upper bits and the column in the
+    # lower bits; ordering and hashing that integer is equivalent to ordering and hashing the
+    # (line, column) tuple.
+    COLUMN_BITS: ClassVar[int]              = 32
+    COLUMN_MASK: ClassVar[int]              = (1 << COLUMN_BITS) - 1
+
+    __slots__ = ("packed", )
 
     # ----------------------------------------------------------------------
-    def __post_init__(self):
-        if self.line <= 0:
+    def __init__(
+        self,
+        line: int,
+        column: int,
+    ):
+        if line <= 0:
             raise ValueError("Invalid line")
-        if self.column <= 0:
+        if column <= 0 or column > Location.COLUMN_MASK:
             raise ValueError("Invalid column")
 
+        object.__setattr__(self, "packed", (line << Location.COLUMN_BITS) | column)
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def FromPacked(
+        cls,
+        packed: int,
+    ) -> "Location":
+        result = cls.__new__(cls)
+        object.__setattr__(result, "packed", packed)
+
+        return result
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def Pack(
+        line: int,
+        column: int,
+    ) -> int:
+        return (line << Location.COLUMN_BITS) | column
+
+    # ----------------------------------------------------------------------
+    @property
+    def line(self) -> int:
+        return self.packed >> Location.COLUMN_BITS
+
+    @property
+    def column(self) -> int:
+        return self.packed & Location.COLUMN_MASK
+
+    # ----------------------------------------------------------------------
+    def __setattr__(self, name, value):
+        raise FrozenInstanceError("cannot assign to field '{}'".format(name))
+
+    def __delattr__(self, name):
+        raise FrozenInstanceError("cannot delete field '{}'".format(name))
+
+    # ----------------------------------------------------------------------
+    def __reduce__(self):
+        return self.__class__.FromPacked, (self.packed, )
+
+    # ----------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return "{}(line={}, column={})".format(self.__class__.__qualname__, self.line, self.column)
+
     # ----------------------------------------------------------------------
     def __str__(self) -> str:
-        return self._string
+        return "Ln {}, Col {}".format(self.line, self.column)
+
+    # ----------------------------------------------------------------------
+    def __hash__(self) -> int:
+        return hash(self.packed)
 
     # ----------------------------------------------------------------------
     @staticmethod
@@ -56,16 +112,10 @@ class Location(object):
         return 0
 
     # ----------------------------------------------------------------------
-    def __eq__(self, other): return self.__class__.Compare(self, other) == 0    # pylint: disable=multiple-statements
-    def __ne__(self, other): return self.__class__.Compare(self, other) != 0    # pylint: disable=multiple-statements
-    def __lt__(self, other): return self.__class__.Compare(self, other) < 0     # pylint: disable=multiple-statements
-    def __le__(self, other): return self.__class__.Compare(self, other) <= 0    # pylint: disable=multiple-statements
-    def __gt__(self, other): return self.__class__.Compare(self, other) > 0     # pylint: disable=multiple-statements
-    def __ge__(self, other): return self.__class__.Compare(self, other) >= 0    # pylint: disable=multiple-statements
-
-    # ----------------------------------------------------------------------
-    # ----------------------------------------------------------------------
-    # ----------------------------------------------------------------------
-    @cached_property
-    def _string(self) -> str:
-        return "Ln {}, Col {}".format(self.line, self.column)
+    # The packed values are compared directly rather than through `Compare` for performance reasons.
+    def __eq__(self, other): return self.packed == other.packed if isinstance(other, Location) else NotImplemented  # pylint: disable=multiple-statements
+    def __ne__(self, other): return self.packed != other.packed if isinstance(other, Location) else NotImplemented  # pylint: disable=multiple-statements
+    def __lt__(self, other): return self.packed < other.packed if isinstance(other, Location) else NotImplemented   # pylint: disable=multiple-statements
+    def __le__(self, other): return self.packed <= other.packed if isinstance(other, Location) else NotImplemented  # pylint: disable=multiple-statements
+    def __gt__(self, other): return self.packed > other.packed if isinstance(other, Location) else NotImplemented   # pylint: disable=multiple-statements
+    def __ge__(self, other): return self.packed >= other.packed if isinstance(other, Location) else NotImplemented  # pylint: disable=multiple-statements
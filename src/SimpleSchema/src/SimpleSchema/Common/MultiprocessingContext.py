@@ -0,0 +1,98 @@
+# ----------------------------------------------------------------------
+# |
+# |  MultiprocessingContext.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-27 13:41:09
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""\
+Provides the multiprocessing context used when creating processes.
+
+The default context on Linux forks the current process, which isn't safe when the process has
+multiple threads (a lock held by another thread at the time of the fork is never released in the
+child); processes are created by multiple threads when generating content and when running as a
+daemon. Processes are spawned instead (a fork server isn't used, as it doesn't provide `sys.path`
+to the processes that it creates).
+"""
+
+import operator
+import site
+
+from multiprocessing.context import BaseContext, SpawnContext, SpawnProcess
+from pathlib import Path
+from typing import Any, Callable
+
+
+# ----------------------------------------------------------------------
+def Get() -> BaseContext:
+    """Returns the multiprocessing context used when creating processes"""
+
+    return _context
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+class _Context(SpawnContext):
+    """\
+    Spawns processes that are able to import this package, even when it was imported via a path that
+    was only temporarily added to `sys.path` (see EntryPoint/__main__.py); the package root is sent to
+    each process rather than added to this process's `sys.path`.
+    """
+
+    # ----------------------------------------------------------------------
+    def Process(self, *args, **kwargs) -> SpawnProcess:  # type: ignore
+        target = kwargs.get("target", None)
+        if target is not None:
+            kwargs["target"] = _Target(target)
+
+        return SpawnProcess(*args, **kwargs)
+
+
+# ----------------------------------------------------------------------
+class _AddPackageRoot(object):
+    """Adds the package root to `sys.path` when unpickled"""
+
+    # ----------------------------------------------------------------------
+    def __reduce__(self):
+        return site.addsitedir, (_package_root, )
+
+
+# ----------------------------------------------------------------------
+class _Target(object):
+    """\
+    The target of a spawned process, which is unpickled as the target that it wraps after the package
+    root has been added to `sys.path`.
+
+    A process's target is unpickled before its arguments, so the arguments (and anything else
+    unpickled by the process) may reference types in this package.
+    """
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        target: Callable[..., Any],
+    ):
+        self.target                         = target
+
+    # ----------------------------------------------------------------------
+    def __call__(self, *args, **kwargs) -> Any:
+        return self.target(*args, **kwargs)
+
+    # ----------------------------------------------------------------------
+    def __reduce__(self):
+        # The items in the tuple are unpickled in order, and only the target is returned
+        return operator.getitem, ((_AddPackageRoot(), self.target), 1)
+
+
+# ----------------------------------------------------------------------
+_package_root                               = str(Path(__file__).parent.parent.parent)
+_context                                    = _Context()
@@ -0,0 +1,198 @@
+# ----------------------------------------------------------------------
+# |
+# |  Range_PerformanceTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-11 10:27:44
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Performance tests for Range.py"""
+
+import bisect
+import inspect
+import sys
+import time
+
+from pathlib import Path
+from typing import Callable
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from SimpleSchema.Common.Range import Range
+    from SimpleSchema.Schema.Elements.Common.Element import Element
+    from SimpleSchema.Schema.Elements.TestHelpers import CreateSyntheticRoot
+    from SimpleSchema.Schema.Visitors.DescendantVisitor import DescendantVisitor
+
+
+# ----------------------------------------------------------------------
+NUM_RANGES                                  = 50000
+NUM_FILES                                   = 10
+
+
+# ----------------------------------------------------------------------
+def test_Create():
+    filenames = [Path("file{}.SimpleSchema".format(index)) for index in range(NUM_FILES)]
+
+    _Measure(
+        "Create",
+        NUM_RANGES,
+        lambda: [
+            Range.Create(filenames[index % NUM_FILES], index + 1, 1, index + 1, 20)
+            for index in range(NUM_RANGES)
+        ],
+    )
+
+
+# ----------------------------------------------------------------------
+def test_CreateFromCode():
+    num_ranges = NUM_RANGES // 10
+
+    # The previous implementation is significantly slower, so measure fewer ranges
+    num_inspect_ranges = num_ranges // 10
+
+    # ----------------------------------------------------------------------
+    def CreateWithInspect():
+        for _ in range(num_inspect_ranges):
+            frame = inspect.stack()[1][0]
+            line = frame.f_lineno
+
+            Range.Create(Path(frame.f_code.co_filename), line, line, line, line)
+
+    # ----------------------------------------------------------------------
+    def CreateSynthetic():
+        with Range.SyntheticRanges():
+            for _ in range(num_ranges):
+                Range.CreateFromCode()
+
+    # ----------------------------------------------------------------------
+
+    _Measure("CreateFromCode (inspect.stack)", num_inspect_ranges, CreateWithInspect, num_iterations=1)
+    _Measure("CreateFromCode", num_ranges, lambda: [Range.CreateFromCode() for _ in range(num_ranges)])
+    _Measure("CreateFromCode (synthetic)", num_ranges, CreateSynthetic)
+
+
+# ----------------------------------------------------------------------
+def test_Compare():
+    ranges = _CreateRanges()
+    other_ranges = _CreateRanges()
+
+    _Measure("Equal", NUM_RANGES, lambda: [this == that for this, that in zip(ranges, other_ranges)])
+    _Measure("LessThan", NUM_RANGES, lambda: [this < that for this, that in zip(ranges, other_ranges)])
+
+
+# ----------------------------------------------------------------------
+def test_Hash():
+    ranges = _CreateRanges()
+
+    _Measure("Hash", NUM_RANGES, lambda: set(ranges))
+
+
+# ----------------------------------------------------------------------
+def test_Sort():
+    ranges = _CreateRanges()
+
+    _Measure("Sort", NUM_RANGES, lambda: sorted(reversed(ranges)))
+
+
+# ----------------------------------------------------------------------
+def test_Insort():
+    # Modeled after `Namespace.AddNestedItem`
+    ranges = _CreateRanges()[:10000]
+
+    # ----------------------------------------------------------------------
+    def Impl():
+        items: list[tuple[Range, int]] = []
+
+        for index, range_value in enumerate(reversed(ranges)):
+            bisect.insort(items, (range_value, index), key=lambda value: value[0])
+
+    # ----------------------------------------------------------------------
+
+    _Measure("Insort", len(ranges), Impl)
+
+
+# ----------------------------------------------------------------------
+def test_Contains():
+    # Modeled after the `self.range not in ex.ranges` checks in `ReferenceType.Resolve`
+    ranges = _CreateRanges()
+
+    ex_ranges = ranges[:20]
+    lookups = ranges[-5000:]
+
+    _Measure("Contains", len(lookups), lambda: [range_value not in ex_ranges for range_value in lookups])
+
+
+# ----------------------------------------------------------------------
+def test_SortElementRanges():
+    root = CreateSyntheticRoot(500, 20)
+
+    ranges: list[Range] = []
+
+    # ----------------------------------------------------------------------
+    def OnElement(
+        element: Element,
+    ) -> None:
+        ranges.append(element.range)
+
+    # ----------------------------------------------------------------------
+
+    DescendantVisitor.EnumDescendants(root, OnElement)
+
+    _Measure(
+        "Element ranges (sort + unique)",
+        len(ranges),
+        lambda: sorted(set(ranges), reverse=True),
+    )
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _CreateRanges() -> list[Range]:
+    filenames = [Path("file{}.SimpleSchema".format(index)) for index in range(NUM_FILES)]
+
+    return [
+        Range.Create(filenames[(index // 1000) % NUM_FILES], index + 1, 1, index + 1, (index % 40) + 1)
+        for index in range(NUM_RANGES)
+    ]
+
+
+# ----------------------------------------------------------------------
+def _Measure(
+    desc: str,
+    num_items: int,
+    func: Callable[[], object],
+    num_iterations: int=5,
+) -> None:
+    best = None
+
+    for _ in range(num_iterations):
+        start = time.perf_counter()
+        func()
+        duration = time.perf_counter() - start
+
+        if best is None or duration < best:
+            best = duration
+
+    assert best is not None
+
+    sys.stdout.write(
+        "{}: {:,} items in {:.4f}s ({:.2f} us per item)\n".format(
+            desc,
+            num_items,
+            best,
+            best / num_items * 1000000,
+        ),
+    )
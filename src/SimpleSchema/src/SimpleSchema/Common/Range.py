@@ -15,25 +15,40 @@
 # ----------------------------------------------------------------------
 """Contains the Range object"""
 
-import inspect
+import sys
+import threading
 
-from dataclasses import dataclass
-from functools import cached_property
+from contextlib import contextmanager
+from dataclasses import FrozenInstanceError
 from pathlib import Path
-from typing import Union
+from typing import Iterator, Optional, Union
 
 from .Location import Location
+from .SourceTable import SOURCE_TABLE
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
 class Range(object):
     """Range within a source file"""
 
+    # Ranges store the interned id of the filename (see SourceTable.py) and packed begin and end
+    # locations (see Location.py) so that they can be ordered and hashed via native tuple comparisons.
+    __slots__ = ("_file_id", "_begin", "_end", "_string")
+
     # ----------------------------------------------------------------------
-    filename: Path
-    begin: Location
-    end: Location
+    def __init__(
+        self,
+        filename: Path,
+        begin: Location,
+        end: Location,
+    ):
+        if end.packed < begin.packed:
+            raise ValueError("Invalid end")
+
+        object.__setattr__(self, "_file_id", SOURCE_TABLE.GetId(filename))
+        object.__setattr__(self, "_begin", begin.packed)
+        object.__setattr__(self, "_end", end.packed)
+        object.__setattr__(self, "_string", None)
 
     # ----------------------------------------------------------------------
     @classmethod
@@ -58,27 +73,115 @@ class Range(object):
         *,
         callstack_offset: int=0,
     ) -> "Range":
-        frame = inspect.stack()[callstack_offset + 1][0]
-        line = frame.f_lineno
+        """Returns a Range associated with the caller's source line (or the synthetic range when synthetic ranges are active)"""
+
+        if getattr(_synthetic_state, "is_active", False):
+            return cls.CreateSynthetic()
+
+        # `sys._getframe` is used rather than `inspect.stack`, as the latter creates information for
+        # every frame on the stack (including reading source lines from disk) when only the caller's
+        # line number is needed.
+        frame = sys._getframe(callstack_offset + 1)  # pylint: disable=protected-access
+
+        code_filename = frame.f_code.co_filename
+
+        file_id = _code_file_ids.get(code_filename, None)
+        if file_id is None:
+            file_id = SOURCE_TABLE.GetId(Path(code_filename))
+            _code_file_ids[code_filename] = file_id
+
+        packed = Location.Pack(frame.f_lineno, frame.f_lineno)
 
-        return cls.Create(Path(frame.f_code.co_filename), line, line, line, line)
+        return cls._CreateFromPacked(file_id, packed, packed)
 
     # ----------------------------------------------------------------------
-    def __post_init__(self):
-        if self.end < self.begin:
-            raise ValueError("Invalid end")
+    @classmethod
+    def CreateSynthetic(cls) -> "Range":
+        """Returns the range shared by all elements that are created programmatically and don't correspond to a meaningful source location"""
+
+        global _synthetic_range  # pylint: disable=global-statement
+
+        if _synthetic_range is None:
+            _synthetic_range = cls.Create(SYNTHETIC_FILENAME, 1, 1, 1, 1)
+
+        return _synthetic_range
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @contextmanager
+    def SyntheticRanges() -> Iterator[None]:
+        """Causes `CreateFromCode` to return the synthetic range for the current thread while the context is active"""
+
+        prev_value = getattr(_synthetic_state, "is_active", False)
+
+        _synthetic_state.is_active = True
+        try:
+            yield
+        finally:
+            _synthetic_state.is_active = prev_value
+
+    # ----------------------------------------------------------------------
+    @property
+    def file_id(self) -> int:
+        return self._file_id
+
+    @property
+    def filename(self) -> Path:
+        return SOURCE_TABLE.GetFilename(self._file_id)
+
+    @property
+    def begin(self) -> Location:
+        return Location.FromPacked(self._begin)
+
+    @property
+    def end(self) -> Location:
+        return Location.FromPacked(self._end)
+
+    @property
+    def is_synthetic(self) -> bool:
+        return self._file_id == SOURCE_TABLE.GetId(SYNTHETIC_FILENAME)
+
+    # ----------------------------------------------------------------------
+    def __setattr__(self, name, value):
+        raise FrozenInstanceError("cannot assign to field '{}'".format(name))
+
+    def __delattr__(self, name):
+        raise FrozenInstanceError("cannot delete field '{}'".format(name))
+
+    # ----------------------------------------------------------------------
+    def __reduce__(self):
+        # File ids are specific to the current process, so persist the filename instead (the
+        # filename objects are shared by all ranges within the file, so they are only pickled once).
+        return self.__class__._CreateFromPickle, (self.filename, self._begin, self._end)
+
+    # ----------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return "{}(filename={!r}, begin={!r}, end={!r})".format(
+            self.__class__.__qualname__,
+            self.filename,
+            self.begin,
+            self.end,
+        )
 
     # ----------------------------------------------------------------------
     def __str__(self) -> str:
+        if self._string is None:
+            object.__setattr__(self, "_string", "{} <{} -> {}>".format(self.filename, self.begin, self.end))
+
+        assert self._string is not None
         return self._string
 
+    # ----------------------------------------------------------------------
+    def __hash__(self) -> int:
+        return hash((self._file_id, self._begin, self._end))
+
     # ----------------------------------------------------------------------
     @staticmethod
     def Compare(
         this: "Range",
         that: "Range",
     ) -> int:
-        if this.filename != that.filename:
+        if this._file_id != that._file_id:  # pylint: disable=protected-access
             return -1 if this.filename < that.filename else 1
 
         result = Location.Compare(this.begin, that.begin)
@@ -92,12 +195,57 @@ class Range(object):
         return 0
 
     # ----------------------------------------------------------------------
-    def __eq__(self, other): return self.__class__.Compare(self, other) == 0    # pylint: disable=multiple-statements
-    def __ne__(self, other): return self.__class__.Compare(self, other) != 0    # pylint: disable=multiple-statements
-    def __lt__(self, other): return self.__class__.Compare(self, other) < 0     # pylint: disable=multiple-statements
-    def __le__(self, other): return self.__class__.Compare(self, other) <= 0    # pylint: disable=multiple-statements
-    def __gt__(self, other): return self.__class__.Compare(self, other) > 0     # pylint: disable=multiple-statements
-    def __ge__(self, other): return self.__class__.Compare(self, other) >= 0    # pylint: disable=multiple-statements
+    # The operators are implemented in terms of native tuple comparisons rather than `Compare` for
+    # performance reasons; Paths are only compared when the ranges are associated with different files.
+    def __eq__(self, other):
+        if not isinstance(other, Range):
+            return NotImplemented
+
+        return (
+            self._file_id == other._file_id
+            and self._begin == other._begin
+            and self._end == other._end
+        )
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __lt__(self, other):
+        if not isinstance(other, Range):
+            return NotImplemented
+
+        if self._file_id != other._file_id:
+            return self.filename < other.filename
+
+        return (self._begin, self._end) < (other._begin, other._end)
+
+    def __le__(self, other):
+        if not isinstance(other, Range):
+            return NotImplemented
+
+        if self._file_id != other._file_id:
+            return self.filename < other.filename
+
+        return (self._begin, self._end) <= (other._begin, other._end)
+
+    def __gt__(self, other):
+        if not isinstance(other, Range):
+            return NotImplemented
+
+        if self._file_id != other._file_id:
+            return self.filename > other.filename
+
+        return (self._begin, self._end) > (other._begin, other._end)
+
+    def __ge__(self, other):
+        if not isinstance(other, Range):
+            return NotImplemented
+
+        if self._file_id != other._file_id:
+            return self.filename > other.filename
+
+        return (self._begin, self._end) >= (other._begin, other._end)
 
     # ----------------------------------------------------------------------
     def __contains__(
@@ -105,20 +253,64 @@ class Range(object):
         location_or_range: Union[Location, "Range"],
     ) -> bool:
         if isinstance(location_or_range, Location):
-            return self.begin <= location_or_range <= self.end
+            return self._begin <= location_or_range.packed <= self._end
 
         if isinstance(location_or_range, Range):
             return (
-                self.filename == location_or_range.filename
-                and self.begin <= location_or_range.begin
-                and location_or_range.end <= self.end
+                self._file_id == location_or_range._file_id  # pylint: disable=protected-access
+                and self._begin <= location_or_range._begin  # pylint: disable=protected-access
+                and location_or_range._end <= self._end  # pylint: disable=protected-access
             )
 
         assert False, location_or_range  # pragma: no cover
 
     # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
     # ----------------------------------------------------------------------
+    @classmethod
+    def _CreateFromPacked(
+        cls,
+        file_id: int,
+        begin: int,
+        end: int,
+    ) -> "Range":
+        result = cls.__new__(cls)
+
+        object.__setattr__(result, "_file_id", file_id)
+        object.__setattr__(result, "_begin", begin)
+        object.__setattr__(result, "_end", end)
+        object.__setattr__(result, "_string", None)
+
+        return result
+
     # ----------------------------------------------------------------------
-    @cached_property
-    def _string(self) -> str:
-        return "{} <{} -> {}>".format(self.filename, self.begin, self.end)
+    @classmethod
+    def _CreateFromPickle(
+        cls,
+        filename: Path,
+        begin: int,
+        end: int,
+    ) -> "Range":
+        return cls._CreateFromPacked(SOURCE_TABLE.GetId(filename), begin, end)
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Data
+# |
+# ----------------------------------------------------------------------
+SYNTHETIC_FILENAME                          = Path("<synthetic>")
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Data
+# |
+# ----------------------------------------------------------------------
+_synthetic_range: Optional[Range]           = None
+_synthetic_state                            = threading.local()
+
+# File ids for the filenames of python code objects (so that Paths are only created once per file)
+_code_file_ids: dict[str, int]              = {}
@@ -15,11 +15,14 @@
 # ----------------------------------------------------------------------
 """Functionality to consistently dump yaml content"""
 
+import re
 import sys
 import threading
 import yaml
 
-from typing import Any  # pylint: disable=wrong-import-order
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Callable, Iterator, Optional  # pylint: disable=wrong-import-order
 
 from Common_Foundation.ContextlibEx import ExitStack
 
@@ -42,6 +45,185 @@ def ToYamlString(
     return _global_monkey_patched_dumper(content)
 
 
+# ----------------------------------------------------------------------
+class YamlEmitter(object):
+    """\
+    Writes yaml content that is identical to the content produced by `ToYamlString` without using the
+    general purpose (and pure-python) yaml dumper.
+
+    Content is limited to lists, dicts, and str/bool/int/float/None values; the same list or dict may
+    not appear multiple times within the content written by a single call (`ToYamlString` would
+    produce anchors and aliases for that content). Content can be written all at once (`Write`) or
+    incrementally as it is generated (`YieldSequence` and `YieldMapping`).
+    """
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Types
+    # |
+    # ----------------------------------------------------------------------
+    class SequenceWriter(object):
+        """Writes the items of a sequence as they are generated"""
+
+        # ----------------------------------------------------------------------
+        def __init__(
+            self,
+            output: "_Output",
+            prefix: str,
+            indent: str,
+            empty_content: str,
+        ):
+            self._writer                    = _ContainerWriter(output, prefix, indent, empty_content)
+
+        # ----------------------------------------------------------------------
+        def Write(
+            self,
+            item: Any,
+        ) -> None:
+            output = [self._writer.BeginEntry(), "- "]
+
+            _EmitSequenceItem(output, item, self._writer.indent, self._writer.output.GetContainerIds())
+
+            self._writer.output.WriteContent(output)
+
+        # ----------------------------------------------------------------------
+        @contextmanager
+        def YieldSequence(self) -> Iterator["YamlEmitter.SequenceWriter"]:
+            """Writes an item that is a sequence"""
+
+            with self._writer.YieldChild(
+                "- ",
+                lambda: YamlEmitter.SequenceWriter(self._writer.output, "", self._writer.indent + "  ", "[]\n"),
+            ) as writer:
+                yield writer
+
+        # ----------------------------------------------------------------------
+        @contextmanager
+        def YieldMapping(self) -> Iterator["YamlEmitter.MappingWriter"]:
+            """Writes an item that is a mapping"""
+
+            with self._writer.YieldChild(
+                "- ",
+                lambda: YamlEmitter.MappingWriter(self._writer.output, "", self._writer.indent + "  ", "{}\n"),
+            ) as writer:
+                yield writer
+
+    # ----------------------------------------------------------------------
+    class MappingWriter(object):
+        """Writes the items of a mapping as they are generated"""
+
+        # ----------------------------------------------------------------------
+        def __init__(
+            self,
+            output: "_Output",
+            prefix: str,
+            indent: str,
+            empty_content: str,
+        ):
+            self._writer                    = _ContainerWriter(output, prefix, indent, empty_content)
+
+        # ----------------------------------------------------------------------
+        def Write(
+            self,
+            key: Any,
+            value: Any,
+        ) -> None:
+            output = [self._writer.BeginEntry(), _RenderKey(key), ":"]
+
+            _EmitMappingValue(output, value, self._writer.indent, self._writer.output.GetContainerIds())
+
+            self._writer.output.WriteContent(output)
+
+        # ----------------------------------------------------------------------
+        @contextmanager
+        def YieldSequence(
+            self,
+            key: Any,
+        ) -> Iterator["YamlEmitter.SequenceWriter"]:
+            """Writes an item whose value is a sequence"""
+
+            indent = self._writer.indent
+
+            with self._writer.YieldChild(
+                _RenderKey(key) + ":",
+                lambda: YamlEmitter.SequenceWriter(self._writer.output, "\n" + indent, indent, " []\n"),
+            ) as writer:
+                yield writer
+
+        # ----------------------------------------------------------------------
+        @contextmanager
+        def YieldMapping(
+            self,
+            key: Any,
+        ) -> Iterator["YamlEmitter.MappingWriter"]:
+            """Writes an item whose value is a mapping"""
+
+            indent = self._writer.indent + "  "
+
+            with self._writer.YieldChild(
+                _RenderKey(key) + ":",
+                lambda: YamlEmitter.MappingWriter(self._writer.output, "\n" + indent, indent, " {}\n"),
+            ) as writer:
+                yield writer
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        write_func: Callable[[str], None],
+    ):
+        self._output                        = _Output(write_func)
+
+    # ----------------------------------------------------------------------
+    def Write(
+        self,
+        content: Any,
+    ) -> None:
+        """Writes the content as a yaml document"""
+
+        content_type = type(content)
+
+        if content_type is list:
+            with self._output.YieldContainerIds(), self.YieldSequence() as writer:
+                for item in content:
+                    writer.Write(item)
+
+        elif content_type is dict:
+            with self._output.YieldContainerIds(), self.YieldMapping() as writer:
+                for key, value in content.items():
+                    writer.Write(key, value)
+
+        else:
+            self._output.Write(ToYamlString(content))
+
+    # ----------------------------------------------------------------------
+    @contextmanager
+    def YieldSequence(self) -> Iterator["YamlEmitter.SequenceWriter"]:
+        """Writes a yaml document that is a sequence"""
+
+        writer = YamlEmitter.SequenceWriter(self._output, "", "", "[]\n")
+
+        yield writer
+
+        writer._writer.Close()  # pylint: disable=protected-access
+        self._output.Close()
+
+    # ----------------------------------------------------------------------
+    @contextmanager
+    def YieldMapping(self) -> Iterator["YamlEmitter.MappingWriter"]:
+        """Writes a yaml document that is a mapping"""
+
+        writer = YamlEmitter.MappingWriter(self._output, "", "", "{}\n")
+
+        yield writer
+
+        writer._writer.Close()  # pylint: disable=protected-access
+        self._output.Close()
+
+
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
@@ -115,3 +297,340 @@ class _MonkeyPatchedDumper(object):
     # ----------------------------------------------------------------------
     def __call__(self, content):
         return self._dump_func(content)
+
+
+# ----------------------------------------------------------------------
+class _Output(object):
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        write_func: Callable[[str], None],
+    ):
+        self._write_func                    = write_func
+
+        # True when the last value written was a block scalar that preserves trailing newlines; PyYAML
+        # writes a document end marker after these values when they are the last value in the document.
+        self._is_open_ended                 = False
+
+        self._container_ids: Optional[set[int]]     = None
+
+    # ----------------------------------------------------------------------
+    @contextmanager
+    def YieldContainerIds(self) -> Iterator[None]:
+        """Preserves the ids of lists and dicts across entries while content is written all at once"""
+
+        assert self._container_ids is None
+        self._container_ids = set()
+
+        # ----------------------------------------------------------------------
+        def RestoreContainerIds():
+            self._container_ids = None
+
+        # ----------------------------------------------------------------------
+
+        with ExitStack(RestoreContainerIds):
+            yield
+
+    # ----------------------------------------------------------------------
+    def GetContainerIds(self) -> set[int]:
+        # Content written incrementally may be released once it is written (and its ids reused), so
+        # ids are only preserved across entries when the content is written all at once.
+        return self._container_ids if self._container_ids is not None else set()
+
+    # ----------------------------------------------------------------------
+    def Write(
+        self,
+        content: str,
+    ) -> None:
+        self._write_func(content)
+        self._is_open_ended = False
+
+    # ----------------------------------------------------------------------
+    def WriteContent(
+        self,
+        content: list[str],
+    ) -> None:
+        """Writes content produced by the `_Emit...` functions"""
+
+        self._write_func("".join(content))
+
+        # The `_Emit...` functions end with a scalar followed by a newline or an empty container
+        last_value = content[-2]
+        self._is_open_ended = last_value[:1] in ("|", ">") and last_value.split("\n", 1)[0].endswith("+")
+
+    # ----------------------------------------------------------------------
+    def Close(self) -> None:
+        if self._is_open_ended:
+            self.Write("...\n")
+
+
+# ----------------------------------------------------------------------
+class _ContainerWriter(object):
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        output: _Output,
+        prefix: str,
+        indent: str,
+        empty_content: str,
+    ):
+        self.output                         = output
+        self.indent                         = indent
+
+        self._prefix                        = prefix
+        self._empty_content                 = empty_content
+
+        self._has_entries                   = False
+        self._has_active_child              = False
+
+    # ----------------------------------------------------------------------
+    def BeginEntry(self) -> str:
+        """Returns the content written before an entry"""
+
+        assert not self._has_active_child
+
+        if self._has_entries:
+            return self.indent
+
+        self._has_entries = True
+        return self._prefix
+
+    # ----------------------------------------------------------------------
+    @contextmanager
+    def YieldChild(
+        self,
+        header: str,
+        create_writer_func: Callable[[], Any],
+    ) -> Iterator[Any]:
+        self.output.Write(self.BeginEntry() + header)
+
+        writer = create_writer_func()
+
+        self._has_active_child = True
+
+        yield writer
+
+        writer._writer.Close()  # pylint: disable=protected-access
+        self._has_active_child = False
+
+    # ----------------------------------------------------------------------
+    def Close(self) -> None:
+        assert not self._has_active_child
+
+        if not self._has_entries:
+            self.output.Write(self._empty_content)
+
+
+# ----------------------------------------------------------------------
+# PyYAML will only wrap scalars that extend beyond the dumper's width (100000); longer values are not
+# supported, as the wrapping would depend on the context in which the value appears.
+_MAX_SCALAR_LENGTH                          = 10000
+
+# Content that is always written as a plain scalar (when it doesn't resolve to another type); this is
+# a subset of the content that PyYAML writes as a plain scalar.
+_PLAIN_SCALAR_REGEX                         = re.compile(r"[A-Za-z0-9_(/<][ -\"$-9;-~]*(?<! )")
+
+_IMPLICIT_RESOLVERS                         = yaml.resolver.Resolver.yaml_implicit_resolvers
+
+
+# ----------------------------------------------------------------------
+def _EmitSequenceItems(
+    output: list[str],
+    items: list[Any],
+    prefix: str,
+    indent: str,
+    container_ids: set[int],
+) -> None:
+    for item in items:
+        output.append(prefix)
+        output.append("- ")
+
+        _EmitSequenceItem(output, item, indent, container_ids)
+
+        prefix = indent
+
+
+# ----------------------------------------------------------------------
+def _EmitMappingItems(
+    output: list[str],
+    items: dict[Any, Any],
+    prefix: str,
+    indent: str,
+    container_ids: set[int],
+) -> None:
+    for key, value in items.items():
+        output.append(prefix)
+        output.append(_RenderKey(key))
+        output.append(":")
+
+        _EmitMappingValue(output, value, indent, container_ids)
+
+        prefix = indent
+
+
+# ----------------------------------------------------------------------
+def _EmitSequenceItem(
+    output: list[str],
+    value: Any,
+    indent: str,                            # The indentation of the '- ' that precedes the value
+    container_ids: set[int],
+) -> None:
+    value_type = type(value)
+
+    if value_type is list or value_type is dict:
+        _AddContainerId(value, container_ids)
+
+        if not value:
+            output.append("[]\n" if value_type is list else "{}\n")
+        elif value_type is list:
+            _EmitSequenceItems(output, value, "", indent + "  ", container_ids)
+        else:
+            _EmitMappingItems(output, value, "", indent + "  ", container_ids)
+
+        return
+
+    output.append(_RenderScalar(value, indent))
+    output.append("\n")
+
+
+# ----------------------------------------------------------------------
+def _EmitMappingValue(
+    output: list[str],
+    value: Any,
+    indent: str,                            # The indentation of the key associated with the value
+    container_ids: set[int],
+) -> None:
+    value_type = type(value)
+
+    if value_type is list or value_type is dict:
+        _AddContainerId(value, container_ids)
+
+        if not value:
+            output.append(" []\n" if value_type is list else " {}\n")
+        elif value_type is list:
+            # Sequences within mappings are not indented
+            _EmitSequenceItems(output, value, "\n" + indent, indent, container_ids)
+        else:
+            child_indent = indent + "  "
+            _EmitMappingItems(output, value, "\n" + child_indent, child_indent, container_ids)
+
+        return
+
+    output.append(" ")
+    output.append(_RenderScalar(value, indent))
+    output.append("\n")
+
+
+# ----------------------------------------------------------------------
+def _AddContainerId(
+    value: Any,
+    container_ids: set[int],
+) -> None:
+    # PyYAML writes anchors and aliases for lists and dicts that appear multiple times
+    value_id = id(value)
+
+    if value_id in container_ids:
+        raise Exception("Lists and dicts may only appear once within the content.")
+
+    container_ids.add(value_id)
+
+
+# ----------------------------------------------------------------------
+def _RenderScalar(
+    value: Any,
+    indent: str,
+) -> str:
+    if value is None:
+        return "~"
+
+    value_type = type(value)
+
+    if value_type is str:
+        if _IsPlainScalar(value):
+            return value
+
+        first_line, continuation_lines = _RenderComplexString(value)
+
+    elif value_type is bool:
+        return "true" if value else "false"
+
+    elif value_type is int:
+        return str(value)
+
+    elif value_type is float:
+        first_line, continuation_lines = _RenderComplexScalar(value)
+
+    else:
+        raise Exception("'{}' values are not supported.".format(value_type.__name__))
+
+    if not continuation_lines:
+        return first_line
+
+    # Block scalars are indented relative to their context, but empty lines are not indented
+    return "\n".join([first_line, *(indent + line if line else line for line in continuation_lines)])
+
+
+# ----------------------------------------------------------------------
+def _RenderKey(
+    key: Any,
+) -> str:
+    if type(key) is str and _IsPlainScalar(key):  # pylint: disable=unidiomatic-typecheck
+        return key
+
+    return _RenderComplexKey(key)
+
+
+# ----------------------------------------------------------------------
+def _IsPlainScalar(
+    value: str,
+) -> bool:
+    if len(value) > _MAX_SCALAR_LENGTH:
+        raise Exception("Values longer than {} characters are not supported.".format(_MAX_SCALAR_LENGTH))
+
+    if not _PLAIN_SCALAR_REGEX.fullmatch(value):
+        return False
+
+    first_char = value[0]
+
+    # rtyaml quotes values that look like octal numbers
+    if first_char == "0" and value.isdigit():
+        return False
+
+    # Values that resolve to other types are quoted
+    for _, regex in _IMPLICIT_RESOLVERS.get(first_char, []):
+        if regex.match(value):
+            return False
+
+    return True
+
+
+# ----------------------------------------------------------------------
+def _RenderComplexScalar(
+    value: Any,
+) -> tuple[str, tuple[str, ...]]:
+    """Returns the first line and the (unindented) continuation lines of a value written by ToYamlString"""
+
+    # The value is followed by another item so that block scalars aren't followed by a document end marker
+    content = ToYamlString({"key": value, "next_key": None})
+    assert content.startswith("key: ") and content.endswith("\nnext_key: ~\n"), content
+
+    lines = content[len("key: "):-len("\nnext_key: ~\n")].split("\n")
+
+    return lines[0], tuple(lines[1:])
+
+
+# ----------------------------------------------------------------------
+_RenderComplexString                        = lru_cache(maxsize=10000)(_RenderComplexScalar)
+
+
+# ----------------------------------------------------------------------
+@lru_cache(maxsize=1000, typed=True)
+def _RenderComplexKey(
+    key: Any,
+) -> str:
+    content = ToYamlString({key: None})
+
+    if not content.endswith(": ~\n") or content.count("\n") != 1:
+        raise Exception("'{}' is not a supported key.".format(key))
+
+    return content[:-len(": ~\n")]
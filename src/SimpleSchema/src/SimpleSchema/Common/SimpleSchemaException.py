@@ -19,7 +19,7 @@ import itertools
 import textwrap
 
 from dataclasses import dataclass, InitVar, make_dataclass
-from typing import ClassVar, Iterable, Type as PythonType, Union
+from typing import Callable, ClassVar, Iterable, Type as PythonType, Union
 
 from .Range import Range
 
@@ -36,9 +36,17 @@ class SimpleSchemaException(Exception):
     def __init__(
         self,
         range_or_ranges: Union[Range, Iterable[Range]],
-        message: str,
+        message: Union[
+            str,
+            Callable[[], str],              # Invoked when the message is first read; use this when the message is expensive to create
+        ],
     ):
-        super(SimpleSchemaException, self).__init__(message)
+        if isinstance(message, str):
+            super(SimpleSchemaException, self).__init__(message)
+        else:
+            super(SimpleSchemaException, self).__init__()
+
+        object.__setattr__(self, "_message", message)
 
         ranges: list[Range] = []
 
@@ -56,9 +64,21 @@ class SimpleSchemaException(Exception):
     def ranges(self) -> list[Range]:
         return self._ranges  # type: ignore  # pylint: disable=no-member
 
+    @property
+    def message(self) -> str:
+        """The message without range information"""
+
+        message = self._message  # type: ignore  # pylint: disable=no-member
+
+        if not isinstance(message, str):
+            message = message()
+            object.__setattr__(self, "_message", message)
+
+        return message
+
     # ----------------------------------------------------------------------
     def __str__(self) -> str:
-        message = super(SimpleSchemaException, self).__str__()
+        message = self.message
 
         if len(self.ranges) == 1 and "\n" not in message:
             message = "{} ({})".format(message, self.ranges[0])
@@ -91,8 +111,26 @@ class DynamicSimpleSchemaException(SimpleSchemaException):
         message_template: str,
         **args: PythonType,
     ) -> PythonType["DynamicSimpleSchemaException"]:
-        dynamic_fields_class = make_dataclass(
-            "DynamicFields",
+        # ----------------------------------------------------------------------
+        def PostInit(
+            self,
+            range_or_ranges: Union[Range, Iterable[Range]],
+        ):
+            DynamicSimpleSchemaException.__post_init__(self)
+
+            SimpleSchemaException.__init__(
+                self,
+                range_or_ranges,
+                self.__class__.MESSAGE_TEMPLATE.format(**self.__dict__),
+            )
+
+        # ----------------------------------------------------------------------
+
+        # The type is created with a single call (rather than a dataclass that derives from a dynamically
+        # created dataclass), as these types are created when the module that defines them is imported
+        # and creating a dataclass is expensive.
+        return make_dataclass(
+            "Final",
             itertools.chain(
                 [
                     ("range_or_ranges", InitVar[Union[Range, Iterable[Range]]]),
@@ -100,33 +138,13 @@ class DynamicSimpleSchemaException(SimpleSchemaException):
                 args.items(),
             ),
             bases=(DynamicSimpleSchemaException, ),
+            namespace={
+                "MESSAGE_TEMPLATE": message_template,
+                "__post_init__": PostInit,
+            },
             frozen=True,
-            repr=False,
         )
 
-        # ----------------------------------------------------------------------
-        @dataclass(frozen=True)
-        class Final(dynamic_fields_class):  # type: ignore
-            # ----------------------------------------------------------------------
-            MESSAGE_TEMPLATE: ClassVar[str]             = message_template
-
-            # ----------------------------------------------------------------------
-            def __post_init__(
-                self,
-                range_or_ranges: Union[Range, Iterable[Range]],
-            ):
-                super(Final, self).__post_init__()
-
-                SimpleSchemaException.__init__(
-                    self,
-                    range_or_ranges,
-                    self.__class__.MESSAGE_TEMPLATE.format(**self.__dict__),
-                )
-
-        # ----------------------------------------------------------------------
-
-        return Final
-
     # ----------------------------------------------------------------------
     @classmethod
     def Create(cls, *args, **kwargs) -> "SimpleSchemaException":
@@ -0,0 +1,100 @@
+# ----------------------------------------------------------------------
+# |
+# |  SourceTable.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-11 09:14:52
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Contains the SourceTable object"""
+
+import threading
+
+from pathlib import Path
+from typing import Iterable
+
+
+# ----------------------------------------------------------------------
+class SourceTable(object):
+    """\
+    Interns the filenames referenced by Ranges so that each Range can store a small integer
+    rather than a Path (and so that Ranges within the same file can be compared without comparing
+    Paths).
+
+    Ids are only meaningful within the current process and are not reused once a file has been
+    released.
+    """
+
+    # ----------------------------------------------------------------------
+    def __init__(self):
+        self._lock                          = threading.Lock()
+
+        self._filenames: dict[int, Path]    = {}
+        self._file_ids: dict[Path, int]     = {}
+        self._next_file_id                  = 0
+
+    # ----------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._filenames)
+
+    # ----------------------------------------------------------------------
+    def GetId(
+        self,
+        filename: Path,
+    ) -> int:
+        # This method is called for every Range created, so check for an existing value before
+        # acquiring the lock.
+        file_id = self._file_ids.get(filename, None)
+        if file_id is not None:
+            return file_id
+
+        with self._lock:
+            file_id = self._file_ids.get(filename, None)
+            if file_id is None:
+                file_id = self._next_file_id
+                self._next_file_id += 1
+
+                self._filenames[file_id] = filename
+                self._file_ids[filename] = file_id
+
+        return file_id
+
+    # ----------------------------------------------------------------------
+    def GetFilename(
+        self,
+        file_id: int,
+    ) -> Path:
+        return self._filenames[file_id]
+
+    # ----------------------------------------------------------------------
+    def Release(
+        self,
+        filenames: Iterable[Path],
+    ) -> None:
+        """\
+        Removes the files from the table so that long-lived processes don't accumulate entries for
+        files that they no longer reference. This should only be called once the Ranges associated
+        with the files are no longer in use, as those Ranges will not be able to resolve their
+        filenames.
+        """
+
+        with self._lock:
+            for filename in filenames:
+                file_id = self._file_ids.pop(filename, None)
+                if file_id is not None:
+                    del self._filenames[file_id]
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Data
+# |
+# ----------------------------------------------------------------------
+SOURCE_TABLE                                = SourceTable()
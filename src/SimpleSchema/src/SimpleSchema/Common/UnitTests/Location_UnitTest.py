@@ -101,3 +101,41 @@ def test_ComparisonOperators():
     assert Location(3, 4) >= Location(1, 2)
     assert Location(3, 4) >= Location(3, 1)
     assert Location(3, 4) >= Location(3, 4)
+
+
+# ----------------------------------------------------------------------
+def test_ComparisonOperatorsOtherTypes():
+    assert Location(1, 2) != "Ln 1, Col 2"
+    assert not (Location(1, 2) == 10)  # pylint: disable=unnecessary-negation
+
+    for func in [
+        lambda: Location(1, 2) < 10,
+        lambda: Location(1, 2) <= 10,
+        lambda: Location(1, 2) > 10,
+        lambda: Location(1, 2) >= 10,
+    ]:
+        with pytest.raises(TypeError):
+            func()
+
+
+# ----------------------------------------------------------------------
+def test_Hash():
+    assert hash(Location(1, 2)) == hash(Location(1, 2))
+    assert len({Location(1, 2), Location(1, 2), Location(2, 1)}) == 2
+
+
+# ----------------------------------------------------------------------
+def test_Packed():
+    l = Location(10, 11)
+
+    assert Location.FromPacked(l.packed) == l
+    assert Location.Pack(10, 11) == l.packed
+
+    # Packed values preserve (line, column) ordering
+    assert Location(1, 1000).packed < Location(2, 1).packed
+    assert Location(2, 1).packed < Location(2, 2).packed
+
+
+# ----------------------------------------------------------------------
+def test_Repr():
+    assert repr(Location(10, 11)) == "Location(line=10, column=11)"
@@ -0,0 +1,55 @@
+# ----------------------------------------------------------------------
+# |
+# |  MultiprocessingContext_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-27 14:02:36
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for MultiprocessingContext.py"""
+
+import sys
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+
+
+# ----------------------------------------------------------------------
+_package_root = PathEx.EnsureDir(Path(__file__).parent.parent.parent.parent)
+
+sys.path.insert(0, str(_package_root))
+with ExitStack(lambda: sys.path.pop(0)):
+    from SimpleSchema.Common import MultiprocessingContext
+    from SimpleSchema.Common.Location import Location
+
+
+# ----------------------------------------------------------------------
+def test_PackageNotInPath(monkeypatch):
+    monkeypatch.setattr(
+        sys,
+        "path",
+        [value for value in sys.path if Path(value or ".").resolve() != _package_root.resolve()],
+    )
+
+    original_sys_path = list(sys.path)
+
+    with ProcessPoolExecutor(
+        max_workers=1,
+        mp_context=MultiprocessingContext.Get(),
+        initializer=Location,
+        initargs=(1, 2),
+    ) as executor:
+        # The types are imported by the spawned process
+        assert executor.submit(Location, 10, 20).result() == Location(10, 20)
+
+    assert sys.path == original_sys_path
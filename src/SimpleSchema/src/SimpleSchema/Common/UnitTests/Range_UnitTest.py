@@ -15,8 +15,10 @@
 # ----------------------------------------------------------------------
 """Unit tests for Range.py"""
 
+import pickle
 import re
 import sys
+import threading
 
 from pathlib import Path
 from unittest.mock import MagicMock as Mock
@@ -30,7 +32,7 @@ from Common_Foundation import PathEx
 # ----------------------------------------------------------------------
 sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent.parent)))
 with ExitStack(lambda: sys.path.pop(0)):
-    from SimpleSchema.Common.Range import Location, Range
+    from SimpleSchema.Common.Range import Location, Range, SYNTHETIC_FILENAME
 
 
 # ----------------------------------------------------------------------
@@ -51,9 +53,64 @@ def test_CreateFromCode():
     r = Range.CreateFromCode()
 
     assert r.filename == Path(__file__)
-    assert r.begin.line == 51
+    assert r.begin.line == 53
     assert r.begin.line == r.begin.column
     assert r.begin == r.end
+    assert r.is_synthetic is False
+
+
+# ----------------------------------------------------------------------
+def test_CreateFromCodeCallstackOffset():
+    # ----------------------------------------------------------------------
+    def Func():
+        return Range.CreateFromCode(callstack_offset=1)
+
+    # ----------------------------------------------------------------------
+
+    r = Func()
+
+    assert r.filename == Path(__file__)
+    assert r.begin.line == 70
+    assert r.begin == r.end
+
+
+# ----------------------------------------------------------------------
+def test_Synthetic():
+    r = Range.CreateSynthetic()
+
+    assert r is Range.CreateSynthetic()
+    assert r.is_synthetic
+    assert r.filename == SYNTHETIC_FILENAME
+
+    # Pickled ranges are equivalent to, but not the same as, the synthetic range
+    unpickled = pickle.loads(pickle.dumps(r))
+
+    assert unpickled == r
+    assert unpickled.is_synthetic
+
+
+# ----------------------------------------------------------------------
+def test_SyntheticRanges():
+    with Range.SyntheticRanges():
+        assert Range.CreateFromCode() is Range.CreateSynthetic()
+
+        with Range.SyntheticRanges():
+            assert Range.CreateFromCode() is Range.CreateSynthetic()
+
+        # Nested contexts restore the previous state
+        assert Range.CreateFromCode() is Range.CreateSynthetic()
+
+        # Synthetic ranges are only active for the current thread
+        thread_results: list[Range] = []
+
+        thread = threading.Thread(target=lambda: thread_results.append(Range.CreateFromCode()))
+        thread.start()
+        thread.join()
+
+        assert len(thread_results) == 1
+        assert not thread_results[0].is_synthetic
+
+    assert not Range.CreateFromCode().is_synthetic
 
 
 # ----------------------------------------------------------------------
@@ -124,6 +181,23 @@ def test_ComparisonOperators():
     assert Range.Create(Path("file"), 10, 20, 30, 40) >= Range(Path("file"), Location(10, 20), Location(30, 40))
 
 
+# ----------------------------------------------------------------------
+def test_ComparisonOperatorsOtherTypes():
+    range_value = Range.Create(Path("file"), 10, 20, 30, 40)
+
+    assert range_value != Location(10, 20)
+    assert not (range_value == "file")  # pylint: disable=unnecessary-negation
+
+    for func in [
+        lambda: range_value < Location(10, 20),
+        lambda: range_value <= Location(10, 20),
+        lambda: range_value > Location(10, 20),
+        lambda: range_value >= Location(10, 20),
+    ]:
+        with pytest.raises(TypeError):
+            func()
+
+
 # ----------------------------------------------------------------------
 class TestContains(object):
     # ----------------------------------------------------------------------
@@ -159,3 +233,51 @@ class TestContains(object):
         assert Range.Create(Path("filename"), 10, 20, 50, 40) not in the_range
         assert Range.Create(Path("filename"), 15, 20, 50, 40) not in the_range
         assert Range.Create(Path("filename"), 50, 20, 60, 40) not in the_range
+
+
+# ----------------------------------------------------------------------
+def test_Hash():
+    r1 = Range.Create(Path("filename"), 1, 2, 3, 4)
+    r2 = Range.Create(Path("filename"), 1, 2, 3, 4)
+
+    assert r1 is not r2
+    assert hash(r1) == hash(r2)
+    assert len({r1, r2}) == 1
+
+    assert r1 != Range.Create(Path("filename"), 1, 2, 3, 5)
+    assert r1 != Range.Create(Path("other_filename"), 1, 2, 3, 4)
+
+
+# ----------------------------------------------------------------------
+def test_InternedFilenames():
+    r1 = Range.Create(Path("filename"), 1, 2, 3, 4)
+    r2 = Range.Create(Path("filename"), 10, 20, 30, 40)
+
+    assert r1.file_id == r2.file_id
+    assert r1.filename is r2.filename
+
+    assert Range.Create(Path("other_filename"), 1, 2, 3, 4).file_id != r1.file_id
+
+
+# ----------------------------------------------------------------------
+def test_Repr():
+    assert repr(Range.Create(Path("filename"), 1, 2, 3, 4)) == "Range(filename={!r}, begin=Location(line=1, column=2), end=Location(line=3, column=4))".format(Path("filename"))
+
+
+# ----------------------------------------------------------------------
+def test_Pickle():
+    r = Range.Create(Path("filename"), 1, 2, 3, 4)
+
+    result = pickle.loads(pickle.dumps(r))
+
+    assert result == r
+    assert result.filename == Path("filename")
+    assert str(result) == str(r)
+
+
+# ----------------------------------------------------------------------
+def test_Frozen():
+    r = Range.Create(Path("filename"), 1, 2, 3, 4)
+
+    with pytest.raises(AttributeError):
+        r.begin = Location(2, 2)  # type: ignore
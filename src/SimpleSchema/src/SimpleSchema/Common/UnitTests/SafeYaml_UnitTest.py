@@ -33,7 +33,7 @@ from Common_Foundation import PathEx
 # ----------------------------------------------------------------------
 sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent.parent)))
 with ExitStack(lambda: sys.path.pop(0)):
-    from SimpleSchema.Common.SafeYaml import ToYamlString
+    from SimpleSchema.Common.SafeYaml import ToYamlString, YamlEmitter
 
 
 # NOTE: These tests cannot be run in parallel with each other, as they modify the global imports.
@@ -89,3 +89,98 @@ def test_Standard():
         long_key=long_key,
         long_value=long_value,
     )
+
+
+# ----------------------------------------------------------------------
+class TestYamlEmitter(object):
+    # ----------------------------------------------------------------------
+    @pytest.mark.parametrize(
+        "content",
+        [
+            [],
+            {},
+            [{"__type__": "RootStatement", "__disabled__": False, "range": "File.SimpleSchema (Ln 1, Col 1 -> Ln 2, Col 1)"}],
+            {"list": [1, [2, [3, []]], {}], "dict": {"a": {"b": {"c": None}}, "d": []}},
+            [[[]], [{}], [{"a": [{"b": {}}]}], [[1, 2], [3]]],
+            {"values": [None, True, False, 0, -10, 1.5, -0.0, float("inf"), float("nan"), 1e100]},
+            {"quoted": ["", " ", "yes", "No", "null", "~", "0", "0123", "089", "1.5", ".5", "-", "- a", "a: b", "a #b", "...", "<<", "=", "*", "[5]", "é", "tab\there"]},
+            {"plain": ["<single>", "a:b", "a#b", "a, b", "(String | Number)", "String {'__.+__'}", "Category.Source"]},
+            {"": "empty", "yes": 1, "a: b": 2, "multi\nline": 3, 1: 4, True: 5, None: 6},
+            {"block": ["a\nb", "a\n\nb\n", "a\n", "  lead\n  two\n", "x" * 80 + "\n" + "y" * 90], "nested": [{"a": "b\nc"}]},
+            {"document_end": "\n"},
+            ["x\n\n\ny\n\n"],
+        ],
+    )
+    def test_Write(self, content):
+        assert _Emit(content) == ToYamlString(content)
+
+    # ----------------------------------------------------------------------
+    def test_Streaming(self):
+        content = [
+            {
+                "__type__": "RootStatement",
+                "statements": [
+                    {"__type__": "ItemStatement", "children": [[1, 2], {"a": "b\nc"}]},
+                    {"__type__": "StructureStatement", "children": []},
+                ],
+                "empty": {},
+                "value": "\n",
+            },
+            [],
+        ]
+
+        output: list[str] = []
+        emitter = YamlEmitter(output.append)
+
+        with emitter.YieldSequence() as document_writer:
+            with document_writer.YieldMapping() as root_writer:
+                root_writer.Write("__type__", "RootStatement")
+
+                with root_writer.YieldSequence("statements") as statements_writer:
+                    statements_writer.Write(content[0]["statements"][0])
+
+                    with statements_writer.YieldMapping() as statement_writer:
+                        statement_writer.Write("__type__", "StructureStatement")
+
+                        with statement_writer.YieldSequence("children"):
+                            pass
+
+                with root_writer.YieldMapping("empty"):
+                    pass
+
+                root_writer.Write("value", "\n")
+
+            with document_writer.YieldSequence():
+                pass
+
+        assert "".join(output) == ToYamlString(content)
+
+    # ----------------------------------------------------------------------
+    def test_ErrorUnsupportedType(self):
+        with pytest.raises(Exception, match=re.escape("'tuple' values are not supported.")):
+            _Emit([(1, 2)])
+
+    # ----------------------------------------------------------------------
+    def test_ErrorRepeatedContainer(self):
+        items = [1, 2]
+
+        with pytest.raises(Exception, match=re.escape("Lists and dicts may only appear once within the content.")):
+            _Emit({"a": items, "b": items})
+
+    # ----------------------------------------------------------------------
+    def test_ErrorLongValue(self):
+        with pytest.raises(Exception, match=re.escape("Values longer than 10000 characters are not supported.")):
+            _Emit(["a" * 10001])
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _Emit(
+    content,
+) -> str:
+    output: list[str] = []
+
+    YamlEmitter(output.append).Write(content)
+
+    return "".join(output)
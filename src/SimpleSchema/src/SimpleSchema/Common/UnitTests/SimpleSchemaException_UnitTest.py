@@ -111,3 +111,26 @@ def test_Exception2():
             - file2 <Ln 10, Col 20 -> Ln 30, Col 40>
         """,
     )
+
+
+# ----------------------------------------------------------------------
+def test_LazyMessage():
+    num_calls = 0
+
+    # ----------------------------------------------------------------------
+    def CreateMessage() -> str:
+        nonlocal num_calls
+
+        num_calls += 1
+        return "The message"
+
+    # ----------------------------------------------------------------------
+
+    ex = SimpleSchemaException(Range.Create(Path("file"), 1, 2, 3, 4), CreateMessage)
+
+    assert num_calls == 0
+
+    assert ex.message == "The message"
+    assert str(ex) == "The message (file <Ln 1, Col 2 -> Ln 3, Col 4>)"
+
+    assert num_calls == 1
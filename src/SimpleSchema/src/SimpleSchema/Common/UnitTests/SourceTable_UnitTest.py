@@ -0,0 +1,79 @@
+# ----------------------------------------------------------------------
+# |
+# |  SourceTable_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-11 10:02:18
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for SourceTable.py"""
+
+import sys
+
+from pathlib import Path
+from unittest.mock import MagicMock as Mock
+
+import pytest
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from SimpleSchema.Common.SourceTable import SourceTable
+
+
+# ----------------------------------------------------------------------
+def test_GetId():
+    table = SourceTable()
+
+    assert table.GetId(Path("one")) == 0
+    assert table.GetId(Path("two")) == 1
+    assert table.GetId(Path("one")) == 0
+
+    assert len(table) == 2
+
+    assert table.GetFilename(0) == Path("one")
+    assert table.GetFilename(1) == Path("two")
+
+
+# ----------------------------------------------------------------------
+def test_OriginalFilenameIsPreserved():
+    table = SourceTable()
+
+    path_mock = Mock()
+
+    file_id = table.GetId(path_mock)
+
+    assert table.GetFilename(file_id) is path_mock
+
+
+# ----------------------------------------------------------------------
+def test_Release():
+    table = SourceTable()
+
+    assert table.GetId(Path("one")) == 0
+    assert table.GetId(Path("two")) == 1
+
+    table.Release([Path("one"), Path("does not exist")])
+
+    assert len(table) == 1
+    assert table.GetFilename(1) == Path("two")
+
+    with pytest.raises(KeyError):
+        table.GetFilename(0)
+
+    # Ids are not reused
+    assert table.GetId(Path("one")) == 2
+    assert table.GetId(Path("two")) == 1
+
+    assert len(table) == 2
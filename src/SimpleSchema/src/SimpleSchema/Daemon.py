@@ -0,0 +1,646 @@
+# ----------------------------------------------------------------------
+# |
+# |  Daemon.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-26 09:05:31
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""\
+Functionality that allows a long-lived process (the daemon) to execute command lines on behalf of other
+processes (clients), so that the clients don't pay for imports, plugin creation and parsing.
+
+Note that this module is imported by clients before anything else, so it should only import modules
+from the standard library.
+"""
+
+import getpass
+import hashlib
+import io
+import json
+import os
+import socket
+import socketserver
+import stat
+import struct
+import sys
+import tempfile
+import threading
+import traceback
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Hashable, Iterable, Optional
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Data
+# |
+# ----------------------------------------------------------------------
+SOCKET_ENVIRONMENT_VARIABLE_NAME            = "SIMPLE_SCHEMA_DAEMON_SOCKET"
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Types
+# |
+# ----------------------------------------------------------------------
+class Server(object):
+    """\
+    Listens on a Unix socket and executes the command lines sent by clients.
+
+    Clients send their stdout and stderr file descriptors, working directory and environment variables
+    along with the command line; output written while the command line is executed is written directly
+    to the client's streams. Command lines are executed one at a time, as the streams, working directory
+    and environment variables are process-wide. Other process state (for example, stdin, the umask and
+    resource limits) is not sent, so command lines are executed with the daemon's state.
+
+    The socket must be in a directory that is only accessible by the current user, and the server and
+    clients only communicate with processes run by the current user.
+    """
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def IsSupported() -> bool:
+        # File descriptors can't be sent over sockets and peer credentials aren't available on all
+        # platforms.
+        return (
+            hasattr(socket, "AF_UNIX")
+            and hasattr(socket, "send_fds")
+            and hasattr(socket, "SO_PEERCRED")
+        )
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        socket_filename: Path,
+        instance_id: str,                   # See `CreateInstanceId`
+        execute_func: Callable[[list[str]], int],
+    ):
+        _EnsurePrivateDirectory(socket_filename.parent)
+
+        if socket_filename.exists():
+            if _IsListening(socket_filename):
+                raise Exception("A daemon is already listening on '{}'.".format(socket_filename))
+
+            # The file was left behind by a daemon that didn't shut down cleanly
+            socket_filename.unlink()
+
+        self.socket_filename                = socket_filename
+        self.instance_id                    = instance_id
+
+        self._execute_func                  = execute_func
+
+        # ----------------------------------------------------------------------
+        class RequestHandler(socketserver.BaseRequestHandler):
+            # ----------------------------------------------------------------------
+            def handle(self_):  # pylint: disable=no-self-argument
+                self._OnRequest(self_.request)
+
+        # ----------------------------------------------------------------------
+
+        self._server                        = socketserver.UnixStreamServer(str(socket_filename), RequestHandler)
+
+        os.chmod(socket_filename, 0o600)
+
+    # ----------------------------------------------------------------------
+    def Serve(self) -> None:
+        """Executes command lines until `Shutdown` is called"""
+
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            self.socket_filename.unlink(missing_ok=True)
+
+    # ----------------------------------------------------------------------
+    def Shutdown(self) -> None:
+        """Stops a server that is serving in a different thread"""
+
+        self._server.shutdown()
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _OnRequest(
+        self,
+        connection: socket.socket,
+    ) -> None:
+        if _GetPeerUid(connection) != os.getuid():
+            return
+
+        content, fds, _, _ = socket.recv_fds(connection, _MAX_MESSAGE_SIZE, 2)
+
+        try:
+            while not content.endswith(b"\n"):
+                data = connection.recv(_MAX_MESSAGE_SIZE)
+                if not data:
+                    return
+
+                content += data
+
+            request = json.loads(content)
+
+            if request["instance_id"] != self.instance_id or len(fds) != 2:
+                # The client will execute the command line itself
+                result: Optional[int] = None
+            else:
+                result = self._Execute(
+                    request["args"],
+                    Path(request["cwd"]),
+                    request["environment"],
+                    fds[0],
+                    fds[1],
+                )
+
+            connection.sendall("{}\n".format(json.dumps({"result": result})).encode("utf-8"))
+
+        finally:
+            for fd in fds:
+                os.close(fd)
+
+    # ----------------------------------------------------------------------
+    def _Execute(
+        self,
+        args: list[str],
+        working_dir: Path,
+        environment: dict[str, str],
+        stdout_fd: int,
+        stderr_fd: int,
+    ) -> int:
+        original_working_dir = os.getcwd()
+        original_environment = dict(os.environ)
+
+        _FlushStreams()
+
+        original_stdout_fd = os.dup(1)
+        original_stderr_fd = os.dup(2)
+
+        try:
+            os.dup2(stdout_fd, 1)
+            os.dup2(stderr_fd, 2)
+
+            os.chdir(working_dir)
+
+            os.environ.clear()
+            os.environ.update(environment)
+
+            try:
+                return self._execute_func(args)
+            except Exception:  # pylint: disable=broad-exception-caught
+                # Written to the descriptor, as `sys.stderr` may not be associated with it
+                os.write(2, traceback.format_exc().encode("utf-8"))
+                return -1
+
+        finally:
+            _FlushStreams()
+
+            os.dup2(original_stdout_fd, 1)
+            os.dup2(original_stderr_fd, 2)
+
+            os.close(original_stdout_fd)
+            os.close(original_stderr_fd)
+
+            os.chdir(original_working_dir)
+
+            os.environ.clear()
+            os.environ.update(original_environment)
+
+
+# ----------------------------------------------------------------------
+class ModelCache(object):
+    """\
+    Values created from the content of files (for example, parsed and resolved models) that are reused
+    as long as the files are unchanged.
+
+    A file is unchanged when its modification time and size are the same as when the value was cached,
+    or when the hash of its content is the same (so that touching a file doesn't invalidate the value).
+    Methods may be invoked concurrently from multiple threads.
+
+    `on_files_released_func` is invoked with the files that are no longer associated with any cached
+    value when values are removed (because they are stale, replaced or evicted), so that the caller
+    can release information that it maintains for those files. It is invoked while the cache is
+    locked, so it must not call methods on the cache.
+    """
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        max_num_items: int=16,
+        on_files_released_func: Optional[Callable[[list[Path]], None]]=None,
+    ):
+        if max_num_items <= 0:
+            raise ValueError("max_num_items")
+
+        self.max_num_items                  = max_num_items
+
+        self._on_files_released_func        = on_files_released_func
+
+        self._items: dict[Hashable, tuple[list[_FileStamp], Any]]   = {}
+        self._items_lock                    = threading.Lock()
+
+    # ----------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._items)
+
+    # ----------------------------------------------------------------------
+    def Get(
+        self,
+        key: Hashable,
+    ) -> Optional[Any]:
+        """Returns the cached value or None if the value isn't cached or the files have changed"""
+
+        with self._items_lock:
+            item = self._items.pop(key, None)
+            if item is None:
+                return None
+
+            stamps, value = item
+
+            for index, stamp in enumerate(stamps):
+                current_stamp = stamp.GetCurrent()
+                if current_stamp is None:
+                    self._OnItemsRemoved([item])
+                    return None
+
+                stamps[index] = current_stamp
+
+            # Reinserting the item makes it the most recently used
+            self._items[key] = item
+
+            return value
+
+    # ----------------------------------------------------------------------
+    def Set(
+        self,
+        key: Hashable,
+        filenames: Iterable[Path],
+        value: Any,
+        *,
+        recorder: Optional["FileRecorder"]=None,
+    ) -> None:
+        """\
+        Caches a value created from the content of the files. The state of a file read via `recorder`
+        is its state when it was read (so that changes made to the file while the value was being
+        created aren't missed); the state of other files is their current state.
+        """
+
+        stamps = [
+            (None if recorder is None else recorder.GetStamp(filename)) or _FileStamp.Create(filename)
+            for filename in filenames
+        ]
+
+        with self._items_lock:
+            removed_items: list[tuple[list[_FileStamp], Any]] = []
+
+            existing_item = self._items.pop(key, None)
+            if existing_item is not None:
+                removed_items.append(existing_item)
+
+            self._items[key] = (stamps, value)
+
+            while len(self._items) > self.max_num_items:
+                removed_items.append(self._items.pop(next(iter(self._items))))
+
+            self._OnItemsRemoved(removed_items)
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _OnItemsRemoved(
+        self,
+        items: list[tuple[list["_FileStamp"], Any]],
+    ) -> None:
+        # Assumes that the lock is held
+        if self._on_files_released_func is None or not items:
+            return
+
+        referenced_filenames: set[Path] = set(
+            stamp.filename
+            for stamps, _ in self._items.values()
+            for stamp in stamps
+        )
+
+        released_filenames: list[Path] = []
+
+        for stamps, _ in items:
+            for stamp in stamps:
+                if stamp.filename not in referenced_filenames:
+                    referenced_filenames.add(stamp.filename)
+                    released_filenames.append(stamp.filename)
+
+        if released_filenames:
+            self._on_files_released_func(released_filenames)
+
+
+# ----------------------------------------------------------------------
+class FileRecorder(object):
+    """\
+    Reads the content of files and records the state of the content that was read, so that the files
+    are considered to be changed if they were modified after they were read (see `ModelCache.Set`).
+    Methods may be invoked concurrently from multiple threads.
+    """
+
+    # ----------------------------------------------------------------------
+    def __init__(self):
+        self._stamps: dict[Path, _FileStamp]    = {}
+        self._stamps_lock                       = threading.Lock()
+
+    # ----------------------------------------------------------------------
+    @property
+    def filenames(self) -> list[Path]:
+        with self._stamps_lock:
+            return list(self._stamps)
+
+    # ----------------------------------------------------------------------
+    def Read(
+        self,
+        filename: Path,
+        encoding: Optional[str]=None,
+    ) -> str:
+        """Returns the file's content, decoded in the same way as `open` in text mode"""
+
+        with filename.open("rb") as f:
+            # The modification time is captured before the content is read, so a modification made
+            # while the content is being read produces a different modification time.
+            mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+            content = f.read()
+
+        stamp = _FileStamp(filename, mtime_ns, len(content), _HashContent(content))
+
+        with self._stamps_lock:
+            self._stamps[filename] = stamp
+
+        return io.TextIOWrapper(io.BytesIO(content), encoding=encoding).read()
+
+    # ----------------------------------------------------------------------
+    def GetStamp(
+        self,
+        filename: Path,
+    ) -> Optional["_FileStamp"]:
+        with self._stamps_lock:
+            return self._stamps.get(filename, None)
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Functions
+# |
+# ----------------------------------------------------------------------
+def GetSocketFilename() -> Path:
+    """\
+    Returns the name of the socket used when one isn't explicitly provided; the socket is in a directory
+    specific to the current user (see `Server`).
+    """
+
+    value = os.getenv(SOCKET_ENVIRONMENT_VARIABLE_NAME)
+    if value:
+        return Path(value)
+
+    root = os.getenv("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+
+    return Path(root) / "SimpleSchema-{}".format(getpass.getuser()) / "Daemon.sock"
+
+
+# ----------------------------------------------------------------------
+def CreateInstanceId(
+    entry_point_dir: Path,
+) -> str:
+    """\
+    Returns a value that is the same for processes that execute command lines in the same way, so that
+    a client doesn't use a daemon that is running a different version or has different plugins.
+    """
+
+    return json.dumps(
+        [
+            sys.executable,
+            str(entry_point_dir.resolve()),
+            sorted(
+                (k, v)
+                for k, v in os.environ.items()
+                if k.startswith("SIMPLE_SCHEMA_") and k != SOCKET_ENVIRONMENT_VARIABLE_NAME
+            ),
+        ],
+    )
+
+
+# ----------------------------------------------------------------------
+def ExecuteInDaemon(
+    args: list[str],
+    instance_id: str,                       # See `CreateInstanceId`
+    *,
+    socket_filename: Optional[Path]=None,
+    stdout_fd: Optional[int]=None,
+    stderr_fd: Optional[int]=None,
+    environment: Optional[dict[str, str]]=None,
+) -> Optional[int]:
+    """\
+    Executes the command line in a daemon and returns its result; None is returned if a daemon isn't
+    available (in which case the caller should execute the command line itself).
+    """
+
+    if not Server.IsSupported():
+        return None
+
+    if socket_filename is None:
+        socket_filename = GetSocketFilename()
+
+    # Only communicate with a daemon run by the current user, as the daemon receives this process's
+    # streams and its result is trusted.
+    if not _IsPrivateDirectory(socket_filename.parent):
+        return None
+
+    try:
+        socket_stat = os.lstat(socket_filename)
+    except FileNotFoundError:
+        return None
+
+    if not stat.S_ISSOCK(socket_stat.st_mode) or socket_stat.st_uid != os.getuid():
+        return None
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        try:
+            connection.connect(str(socket_filename))
+        except (ConnectionRefusedError, FileNotFoundError):
+            return None
+
+        if _GetPeerUid(connection) != os.getuid():
+            return None
+
+        _FlushStreams()
+
+        request = "{}\n".format(
+            json.dumps(
+                {
+                    "instance_id": instance_id,
+                    "cwd": os.getcwd(),
+                    "environment": dict(os.environ if environment is None else environment),
+                    "args": args,
+                },
+            ),
+        ).encode("utf-8")
+
+        content = b""
+
+        try:
+            num_bytes_sent = socket.send_fds(
+                connection,
+                [request],
+                [
+                    sys.stdout.fileno() if stdout_fd is None else stdout_fd,
+                    sys.stderr.fileno() if stderr_fd is None else stderr_fd,
+                ],
+            )
+
+            # The environment may make the request larger than what can be sent at once
+            if num_bytes_sent != len(request):
+                connection.sendall(request[num_bytes_sent:])
+
+            while not content.endswith(b"\n"):
+                data = connection.recv(_MAX_MESSAGE_SIZE)
+                if not data:
+                    break
+
+                content += data
+
+        except ConnectionError:
+            pass
+
+        if not content.endswith(b"\n"):
+            # The daemon rejected the request or terminated before the command line was executed
+            return None
+
+    return json.loads(content)["result"]
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+_MAX_MESSAGE_SIZE                           = 64 * 1024
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class _FileStamp(object):
+    # ----------------------------------------------------------------------
+    filename: Path
+    mtime_ns: int
+    size: int
+    hash: str
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def Create(
+        cls,
+        filename: Path,
+    ) -> "_FileStamp":
+        stat = filename.stat()
+
+        return cls(filename, stat.st_mtime_ns, stat.st_size, _Hash(filename))
+
+    # ----------------------------------------------------------------------
+    def GetCurrent(self) -> Optional["_FileStamp"]:
+        """Returns the stamp for the file's current state or None if the content has changed"""
+
+        try:
+            stat = self.filename.stat()
+        except FileNotFoundError:
+            return None
+
+        if stat.st_mtime_ns == self.mtime_ns and stat.st_size == self.size:
+            return self
+
+        if stat.st_size != self.size or _Hash(self.filename) != self.hash:
+            return None
+
+        return _FileStamp(self.filename, stat.st_mtime_ns, stat.st_size, self.hash)
+
+
+# ----------------------------------------------------------------------
+def _Hash(
+    filename: Path,
+) -> str:
+    with filename.open("rb") as f:
+        return _HashContent(f.read())
+
+
+# ----------------------------------------------------------------------
+def _HashContent(
+    content: bytes,
+) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+# ----------------------------------------------------------------------
+def _IsPrivateDirectory(
+    directory: Path,
+) -> bool:
+    """Returns True if the directory is owned by and only accessible by the current user"""
+
+    try:
+        directory_stat = os.lstat(directory)
+    except FileNotFoundError:
+        return False
+
+    return (
+        stat.S_ISDIR(directory_stat.st_mode)                # Symbolic links aren't followed
+        and directory_stat.st_uid == os.getuid()
+        and stat.S_IMODE(directory_stat.st_mode) & 0o077 == 0
+    )
+
+
+# ----------------------------------------------------------------------
+def _EnsurePrivateDirectory(
+    directory: Path,
+) -> None:
+    try:
+        directory.mkdir(mode=0o700)
+    except FileExistsError:
+        pass
+
+    if not _IsPrivateDirectory(directory):
+        raise Exception(
+            "The directory '{}' must be owned by the current user and only accessible by the current user.".format(
+                directory,
+            ),
+        )
+
+
+# ----------------------------------------------------------------------
+def _GetPeerUid(
+    connection: socket.socket,
+) -> int:
+    credentials = connection.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+
+    _, uid, _ = struct.unpack("3i", credentials)   # pid, uid, gid
+    return uid
+
+
+# ----------------------------------------------------------------------
+def _IsListening(
+    socket_filename: Path,
+) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        try:
+            connection.connect(str(socket_filename))
+        except (ConnectionRefusedError, FileNotFoundError):
+            return False
+
+    return True
+
+
+# ----------------------------------------------------------------------
+def _FlushStreams() -> None:
+    for stream in [sys.stdout, sys.stderr]:
+        try:
+            stream.flush()
+        except (OSError, ValueError):
+            pass
@@ -15,9 +15,20 @@
 # ----------------------------------------------------------------------
 """Contains the Plugin object"""
 
+import hashlib
+import importlib.util
+import inspect
+import os
+import shutil
+import sys
+import threading
+import uuid
+
 from abc import abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Optional, Protocol
+from typing import Any, Callable, Iterator, Optional, Protocol, TextIO
 
 from Common_Foundation.Types import extensionmethod
 
@@ -51,6 +62,14 @@ class Plugin(PluginBase):
     # ----------------------------------------------------------------------
     Flag                                    = NormalizeFlag
 
+    # ----------------------------------------------------------------------
+    @dataclass(frozen=True)
+    class OutputCounts(object):
+        """Number of output files written by the plugin"""
+
+        num_written: int
+        num_unchanged: int                  # Files that weren't written because their content didn't change
+
     # ----------------------------------------------------------------------
     # |
     # |  Public Methods
@@ -95,6 +114,44 @@ class Plugin(PluginBase):
         self.extension_names                = custom_extension_names or set()
         self.metadata_attributes            = metadata_attributes
 
+        self._output_counts_lock            = threading.Lock()
+        self._num_outputs_written           = 0
+        self._num_outputs_unchanged         = 0
+
+    # ----------------------------------------------------------------------
+    def GetOutputCounts(self) -> "Plugin.OutputCounts":
+        """Returns the number of output files written (or not written because they didn't change) by the plugin"""
+
+        with self._output_counts_lock:
+            return Plugin.OutputCounts(self._num_outputs_written, self._num_outputs_unchanged)
+
+    # ----------------------------------------------------------------------
+    @extensionmethod
+    def IsProcessSafe(
+        self,
+        command_line_args: dict[str, Any],  # pylint: disable=unused-argument
+    ) -> bool:
+        """\
+        Returns True if `Validate` and `Generate` may be invoked in other processes. Plugins that
+        return True must be constructible without arguments, as they are created anew in each
+        process, and must not depend on state shared by the invocations of `Generate`.
+        """
+
+        return False
+
+    # ----------------------------------------------------------------------
+    @extensionmethod
+    def UsesGenerateAll(
+        self,
+        command_line_args: dict[str, Any],  # pylint: disable=unused-argument
+    ) -> bool:
+        """\
+        Returns True if `GenerateAll` should be invoked for all of the content rather than `Generate`
+        for each file (which allows the files to be generated in parallel).
+        """
+
+        return False
+
     # ----------------------------------------------------------------------
     @extensionmethod
     def Validate(
@@ -131,6 +188,34 @@ class Plugin(PluginBase):
 
         raise Exception("Abstract method")  # pragma: no cover
 
+    # ----------------------------------------------------------------------
+    @extensionmethod
+    def GenerateAll(
+        self,
+        command_line_args: dict[str, Any],
+        roots: dict[Path, RootStatement],
+        filename_map: dict[Path, list[Path]],   # Output filenames for each root (using the keys in `roots`)
+        on_status_update_func: Callable[[str], None],
+    ) -> None:
+        """\
+        Generate output for all of the provided content in a single invocation. Plugins that share
+        work across files (for example, lookup tables that are built once per run) should override
+        this method and `UsesGenerateAll`; `Generate` is invoked for each root by default.
+        """
+
+        for filename, root in roots.items():
+            self.Generate(command_line_args, root, filename_map[filename], on_status_update_func)
+
+    # ----------------------------------------------------------------------
+    def __reduce__(self):
+        # Plugins are created anew when unpickled in other processes (see `IsProcessSafe`). Plugin
+        # modules may be loaded dynamically, so persist the module's filename as well.
+        return _CreatePlugin, (
+            self.__class__.__module__,
+            Path(inspect.getfile(self.__class__)),
+            self.__class__.__qualname__,
+        )
+
     # ----------------------------------------------------------------------
     # |
     # |  Protected Methods
@@ -190,3 +275,106 @@ class Plugin(PluginBase):
                 filename_map[input_filename] = output_filenames
 
         return filename_map
+
+    # ----------------------------------------------------------------------
+    @contextmanager
+    def _YieldOutputFile(
+        self,
+        filename: Path,
+        *,
+        buffering: int=-1,
+    ) -> Iterator[TextIO]:
+        """\
+        Yields a file used to write the content of an output file; the output file is only modified
+        when its content has changed (so that its modification time is preserved otherwise).
+        """
+
+        filename.parent.mkdir(parents=True, exist_ok=True)
+
+        # Content is written to a temporary file in the same directory, so that it can replace the
+        # output file in a single operation.
+        temp_filename = filename.with_name(".{}.{}.tmp".format(filename.name, uuid.uuid4().hex))
+
+        try:
+            with temp_filename.open("x", buffering=buffering) as f:
+                yield f
+
+            is_unchanged = (
+                filename.is_file()
+                and filename.stat().st_size == temp_filename.stat().st_size
+                and _HashFile(filename) == _HashFile(temp_filename)
+            )
+
+            if not is_unchanged:
+                # The temporary file was created with the default permissions; preserve those of an
+                # existing output file.
+                if filename.is_file():
+                    shutil.copymode(filename, temp_filename)
+
+                os.replace(temp_filename, filename)
+
+        finally:
+            if temp_filename.exists():
+                temp_filename.unlink()
+
+        if is_unchanged:
+            self._AddOutputCounts(Plugin.OutputCounts(0, 1))
+        else:
+            self._AddOutputCounts(Plugin.OutputCounts(1, 0))
+
+    # ----------------------------------------------------------------------
+    def _AddOutputCounts(
+        self,
+        output_counts: "Plugin.OutputCounts",
+    ) -> None:
+        """Adds to the counts returned by `GetOutputCounts` (for example, for files written by this plugin in another process)"""
+
+        with self._output_counts_lock:
+            self._num_outputs_written += output_counts.num_written
+            self._num_outputs_unchanged += output_counts.num_unchanged
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+_HASH_CHUNK_SIZE                            = 1024 * 1024
+
+
+# ----------------------------------------------------------------------
+def _CreatePlugin(
+    module_name: str,
+    module_filename: Path,
+    class_name: str,
+) -> Plugin:
+    mod = sys.modules.get(module_name, None)
+    if mod is None:
+        spec = importlib.util.spec_from_file_location(module_name, module_filename)
+        assert spec is not None and spec.loader is not None, module_filename
+
+        mod = importlib.util.module_from_spec(spec)
+
+        sys.modules[module_name] = mod
+        spec.loader.exec_module(mod)
+
+    plugin_class = mod
+    for name_part in class_name.split("."):
+        plugin_class = getattr(plugin_class, name_part)
+
+    return plugin_class()
+
+
+# ----------------------------------------------------------------------
+def _HashFile(
+    filename: Path,
+) -> bytes:
+    hasher = hashlib.sha256()
+
+    with filename.open("rb") as f:
+        while True:
+            chunk = f.read(_HASH_CHUNK_SIZE)
+            if not chunk:
+                break
+
+            hasher.update(chunk)
+
+    return hasher.digest()
@@ -0,0 +1,143 @@
+# ----------------------------------------------------------------------
+# |
+# |  PluginManifest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-24 08:31:52
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Contains the PluginManifest and PluginManifestItem objects"""
+
+import importlib.util
+import json
+import sys
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .Plugin import Plugin  # pragma: no cover
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class PluginManifestItem(object):
+    """Information about a plugin that is available without importing the plugin"""
+
+    # ----------------------------------------------------------------------
+    name: str
+    description: str
+    filename: Path
+
+    # ----------------------------------------------------------------------
+    def CreatePlugin(self) -> "Plugin":
+        """Imports the module that defines the plugin and creates the plugin"""
+
+        module_name = self.filename.stem
+
+        mod = sys.modules.get(module_name, None)
+        if mod is None:
+            spec = importlib.util.spec_from_file_location(module_name, self.filename)
+            assert spec is not None and spec.loader is not None, self.filename
+
+            mod = importlib.util.module_from_spec(spec)
+
+            sys.modules[module_name] = mod
+            spec.loader.exec_module(mod)
+
+        plugin = mod.Plugin()
+
+        if plugin.name != self.name:
+            raise Exception(
+                "The plugin name '{}' does not match the name in the manifest ('{}').".format(
+                    plugin.name,
+                    self.name,
+                ),
+            )
+
+        return plugin
+
+
+# ----------------------------------------------------------------------
+class PluginManifest(object):
+    """\
+    Names and descriptions of the plugins within a directory, so that the plugins can be listed
+    without importing them (which is expensive, as creating a plugin creates the types associated
+    with its metadata attributes).
+
+    The manifest is a JSON file in the plugin directory:
+
+        {
+            "<plugin name>": {
+                "description": "<plugin description>",
+                "filename": "<python filename relative to the plugin directory>"
+            }
+        }
+    """
+
+    # ----------------------------------------------------------------------
+    FILENAME                                = "PluginManifest.json"
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def Load(
+        cls,
+        plugin_dir: Path,
+    ) -> Optional["PluginManifest"]:
+        """\
+        Returns the manifest within the directory; None is returned if the directory doesn't contain a
+        manifest or if it contains python files that aren't listed in the manifest (so that those
+        plugins aren't hidden).
+        """
+
+        manifest_filename = plugin_dir / cls.FILENAME
+
+        if not manifest_filename.is_file():
+            return None
+
+        with manifest_filename.open() as f:
+            content = json.load(f)
+
+        manifest = cls(
+            [
+                PluginManifestItem(name, item["description"], plugin_dir / item["filename"])
+                for name, item in content.items()
+            ],
+        )
+
+        manifest_filenames = set(item.filename for item in manifest.items)
+
+        for child in plugin_dir.iterdir():
+            if (
+                child.is_file()
+                and child.suffix == ".py"
+                and child.stem != "__init__"
+                and child not in manifest_filenames
+            ):
+                return None
+
+        return manifest
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        items: list[PluginManifestItem],
+    ):
+        self.items                          = items
+
+        self._items_by_name: dict[str, PluginManifestItem]  = {item.name: item for item in items}
+
+    # ----------------------------------------------------------------------
+    def GetItem(
+        self,
+        name: str,
+    ) -> Optional[PluginManifestItem]:
+        return self._items_by_name.get(name, None)
@@ -0,0 +1,165 @@
+# ----------------------------------------------------------------------
+# |
+# |  PluginProcessPool.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-22 08:41:17
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Contains the PluginProcessPool object"""
+
+import os
+import pickle
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Optional
+
+from .Common import MultiprocessingContext
+from .Plugin import Plugin
+
+from .Schema.Elements.Statements.RootStatement import RootStatement
+
+
+# ----------------------------------------------------------------------
+class PluginProcessPool(object):
+    """\
+    Invokes `Plugin.Validate` and `Plugin.Generate` in other processes for plugins that are
+    process-safe (see `Plugin.IsProcessSafe`).
+
+    Each root is pickled once, when it is first used, and the pickled content is sent to the process
+    that handles the request; every process creates its own instance of the plugin. Methods may be
+    invoked concurrently from multiple threads.
+    """
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        plugin: Plugin,
+        roots: dict[Path, RootStatement],
+        max_num_processes: Optional[int]=None,
+    ):
+        if max_num_processes is None:
+            max_num_processes = os.cpu_count() or 1
+        elif max_num_processes <= 0:
+            raise ValueError("max_num_processes")
+
+        self.plugin                         = plugin
+        self.roots                          = roots
+
+        self._serialized_roots: dict[Path, bytes]       = {}
+
+        self._executor                      = ProcessPoolExecutor(
+            max_workers=min(max_num_processes, max(len(roots), 1)),
+            mp_context=MultiprocessingContext.Get(),
+            initializer=_InitializeProcess,
+            initargs=(plugin, ),
+        )
+
+    # ----------------------------------------------------------------------
+    def __enter__(self) -> "PluginProcessPool":
+        return self
+
+    # ----------------------------------------------------------------------
+    def __exit__(self, *args) -> None:
+        self._executor.shutdown()
+
+    # ----------------------------------------------------------------------
+    def Validate(
+        self,
+        filename: Path,
+    ) -> None:
+        """Invokes `Plugin.Validate` for the root associated with the filename"""
+
+        self._executor.submit(_Validate, self._GetSerializedRoot(filename)).result()
+
+    # ----------------------------------------------------------------------
+    def Generate(
+        self,
+        command_line_args: dict[str, Any],
+        filename: Path,
+        output_filenames: list[Path],
+    ) -> None:
+        """Invokes `Plugin.Generate` for the root associated with the filename"""
+
+        output_counts = self._executor.submit(
+            _Generate,
+            command_line_args,
+            self._GetSerializedRoot(filename),
+            output_filenames,
+        ).result()
+
+        # Files were written by the plugin in the other process, but are reported by this one
+        self.plugin._AddOutputCounts(output_counts)  # pylint: disable=protected-access
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _GetSerializedRoot(
+        self,
+        filename: Path,
+    ) -> bytes:
+        serialized_root = self._serialized_roots.get(filename, None)
+        if serialized_root is None:
+            # Multiple threads may serialize the same root, which is harmless as the results will be
+            # equivalent.
+            serialized_root = pickle.dumps(self.roots[filename], pickle.HIGHEST_PROTOCOL)
+            self._serialized_roots[filename] = serialized_root
+
+        return serialized_root
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+_process_plugin: Optional[Plugin]           = None
+
+
+# ----------------------------------------------------------------------
+def _InitializeProcess(
+    plugin: Plugin,
+) -> None:
+    global _process_plugin  # pylint: disable=global-statement
+    _process_plugin = plugin
+
+
+# ----------------------------------------------------------------------
+def _Validate(
+    serialized_root: bytes,
+) -> None:
+    assert _process_plugin is not None
+    _process_plugin.Validate(pickle.loads(serialized_root))
+
+
+# ----------------------------------------------------------------------
+def _Generate(
+    command_line_args: dict[str, Any],
+    serialized_root: bytes,
+    output_filenames: list[Path],
+) -> Plugin.OutputCounts:
+    assert _process_plugin is not None
+
+    # Requests are processed one at a time within a process, so the change in counts is
+    # attributable to this request.
+    initial_output_counts = _process_plugin.GetOutputCounts()
+
+    _process_plugin.Generate(
+        command_line_args,
+        pickle.loads(serialized_root),
+        output_filenames,
+        lambda status: None,
+    )
+
+    output_counts = _process_plugin.GetOutputCounts()
+
+    return Plugin.OutputCounts(
+        output_counts.num_written - initial_output_counts.num_written,
+        output_counts.num_unchanged - initial_output_counts.num_unchanged,
+    )
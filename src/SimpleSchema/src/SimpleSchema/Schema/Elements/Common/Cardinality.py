@@ -16,24 +16,22 @@
 """Contains the Cardinality object"""
 
 from dataclasses import dataclass, field, InitVar
-from functools import cached_property
 from typing import Any, Optional, Union
 
 from Common_Foundation.Types import overridemethod
-from Common_FoundationEx.InflectEx import inflect
 
 from .Element import Element
 
 from ..Expressions.Expression import Expression
 from ..Expressions.IntegerExpression import IntegerExpression
 
-from ....Common import Errors
+from ....Common import Errors, Inflect
 from ....Common.Range import Range
 from ....Common.SimpleSchemaException import SimpleSchemaException
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Cardinality(Element):
     """Specifies the minimum and maximum number of items expected within a collection"""
 
@@ -44,6 +42,12 @@ class Cardinality(Element):
     min: IntegerExpression                  = field(init=False)
     max: Optional[IntegerExpression]        = field(init=False)
 
+    is_single: bool                         = field(init=False, repr=False, compare=False)
+    is_optional: bool                       = field(init=False, repr=False, compare=False)
+    is_container: bool                      = field(init=False, repr=False, compare=False)
+
+    _string: Optional[str]                  = field(init=False, default=None, repr=False, compare=False)
+
     # ----------------------------------------------------------------------
     @classmethod
     def CreateFromCode(
@@ -98,22 +102,17 @@ class Cardinality(Element):
         object.__setattr__(self, "min", min_param)
         object.__setattr__(self, "max", max_param)
 
-    # ----------------------------------------------------------------------
-    def __str__(self) -> str:
-        return self._string
+        object.__setattr__(self, "is_single", min_param.value == 1 and max_param is not None and max_param.value == 1)
+        object.__setattr__(self, "is_optional", min_param.value == 0 and max_param is not None and max_param.value == 1)
+        object.__setattr__(self, "is_container", max_param is None or max_param.value > 1)
 
     # ----------------------------------------------------------------------
-    @cached_property
-    def is_single(self) -> bool:
-        return self.min.value == 1 and self.max is not None and self.max.value == 1
-
-    @cached_property
-    def is_optional(self) -> bool:
-        return self.min.value == 0 and self.max is not None and self.max.value == 1
+    def __str__(self) -> str:
+        if self._string is None:
+            object.__setattr__(self, "_string", self._CreateString())
 
-    @cached_property
-    def is_container(self) -> bool:
-        return self.max is None or self.max.value > 1
+        assert self._string is not None
+        return self._string
 
     # ----------------------------------------------------------------------
     def Validate(
@@ -137,6 +136,8 @@ class Cardinality(Element):
                 num_items = len(value)
 
                 if num_items < self.min.value:
+                    inflect = Inflect.Get()
+
                     raise Exception(
                         Errors.cardinality_validate_list_too_small.format(
                             value=inflect.no("item", self.min.value),
@@ -147,6 +148,8 @@ class Cardinality(Element):
                     )
 
                 if self.max is not None and num_items > self.max.value:
+                    inflect = Inflect.Get()
+
                     raise Exception(
                         Errors.cardinality_validate_list_too_large.format(
                             value=inflect.no("item", self.max.value),
@@ -180,11 +183,38 @@ class Cardinality(Element):
 
         Impl(expression_or_value)
 
+    # ----------------------------------------------------------------------
+    def IsValid(
+        self,
+        expression_or_value: Union[Expression, Any],
+    ) -> bool:
+        """Returns True if `Validate` would succeed for the value (without raising exceptions)"""
+
+        if isinstance(expression_or_value, Expression):
+            value = expression_or_value.value
+        else:
+            value = expression_or_value
+
+        if value is None:
+            return self.is_optional
+
+        if self.is_container:
+            if not isinstance(value, list):
+                return False
+
+            num_items = len(value)
+
+            return num_items >= self.min.value and (self.max is None or num_items <= self.max.value)
+
+        if self.is_optional:
+            return True
+
+        return not isinstance(value, list)
+
     # ----------------------------------------------------------------------
     # ----------------------------------------------------------------------
     # ----------------------------------------------------------------------
-    @cached_property
-    def _string(self) -> str:
+    def _CreateString(self) -> str:
         if self.is_single:
             return ""
 
@@ -15,11 +15,15 @@
 # ----------------------------------------------------------------------
 """Contains the Element object"""
 
+import hashlib
+import re
+
 from abc import ABC
 from contextlib import contextmanager
-from dataclasses import dataclass, field
-from enum import auto, Flag
-from typing import Any, ClassVar, Generator, Iterator, Optional, Tuple, Union
+from dataclasses import dataclass, field, fields, MISSING
+from enum import auto, Enum, EnumMeta, Flag
+from types import FunctionType
+from typing import Any, Callable, ClassVar, Generator, Iterator, Optional, Tuple, Type, Union
 from weakref import ReferenceType as WeakReferenceType
 
 from Common_Foundation.Types import extensionmethod
@@ -42,7 +46,7 @@ class VisitResult(Flag):
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class Element(ABC):
     """Root for all entities processed by SimpleSchema"""
 
@@ -58,6 +62,10 @@ class Element(ABC):
         list[WeakReferenceType["Element"]],
     ]
 
+    # Generators used when visiting elements iteratively yield the elements to visit and are sent
+    # the corresponding visit results.
+    AcceptGeneratorType                     = Generator["Element", VisitResult, VisitResult]
+
     # ----------------------------------------------------------------------
     # |
     # |  Data
@@ -69,6 +77,49 @@ class Element(ABC):
 
     is_disabled: bool                                   = field(init=False, default=False)
 
+    _fingerprint: Optional[bytes]                       = field(init=False, default=None, repr=False, compare=False)
+
+    # ----------------------------------------------------------------------
+    def __init_subclass__(cls, **kwargs):
+        super(Element, cls).__init_subclass__(**kwargs)
+
+        # Field values are stored in slots, which means that field defaults are not available as
+        # class attributes. The `__init__` method generated for a dataclass that isn't decorated with
+        # `slots=True` relies on those class attributes for fields that it doesn't initialize (for
+        # example, `is_disabled`), so provide them here (they are removed from classes that are
+        # decorated with `slots=True`, as those classes initialize every field).
+        if "__slots__" in cls.__dict__:
+            return
+
+        annotations = cls.__dict__.get("__annotations__", {})
+
+        for field_info in cls.__dataclass_fields__.values():  # pylint: disable=no-member
+            if (
+                not field_info.init
+                and field_info.default is not MISSING
+                and field_info.name not in cls.__dict__
+                and field_info.name not in annotations
+            ):
+                setattr(cls, field_info.name, field_info.default)
+
+    # ----------------------------------------------------------------------
+    @property
+    def fingerprint(self) -> bytes:
+        """\
+        Digest of the element's structure. Elements with the same fingerprint are semantically
+        identical, regardless of where they are defined (ranges, and names generated from ranges,
+        do not contribute to the fingerprint).
+
+        The fingerprint is calculated once and then cached; it should not be accessed until the
+        element (and everything that it references) has been resolved.
+        """
+
+        if self._fingerprint is None:
+            _FingerprintCalculator().Calculate(self)
+
+        assert self._fingerprint is not None
+        return self._fingerprint
+
     # ----------------------------------------------------------------------
     def Disable(self) -> None:
         if self.is_disabled:
@@ -86,43 +137,44 @@ class Element(ABC):
         if self.is_disabled and not include_disabled:
             return VisitResult.Continue
 
-        method = getattr(visitor, "OnElement", self.__class__._GenericYieldFunc)  # pylint: disable=protected-access
-        with method(self) as element_visit_result:
+        dispatch_table = _AcceptDispatchTable.Get(visitor, self.__class__)
+
+        if dispatch_table.is_iterative:
+            return self.__class__._ExecuteAcceptGenerator(  # pylint: disable=protected-access
+                self._EnumAccept(visitor, include_disabled=include_disabled),
+                visitor,
+                include_disabled=include_disabled,
+            )
+
+        with dispatch_table.on_element(visitor, self) as element_visit_result:
             if element_visit_result == VisitResult.Terminate:
                 return element_visit_result
 
             if element_visit_result == VisitResult.SkipAll:
                 return VisitResult.Continue
 
-            method_name = "On{}".format(self.__class__.__name__)
-
-            method = getattr(visitor, method_name, None)
-            assert method is not None, method_name
-
-            with method(self) as method_visit_result:
+            with dispatch_table.on_method(visitor, self) as method_visit_result:
                 if method_visit_result == VisitResult.Terminate:
                     return method_visit_result
 
                 # Enumerate the details associated with the Element (if any)
-                if not self.__class__._GetFirstVisitResult(method_visit_result, element_visit_result) & VisitResult.SkipDetails:  # pylint: disable=protected-access
+                if (
+                    dispatch_table.generates_details
+                    and not self.__class__._GetFirstVisitResult(method_visit_result, element_visit_result) & VisitResult.SkipDetails  # pylint: disable=protected-access
+                ):
                     accept_details = list(self._GenerateAcceptDetails())
 
                     if accept_details:
-                        method = getattr(visitor, "OnElementDetails", self.__class__._GenericYieldFunc)  # pylint: disable=protected-access
-                        with method(self) as details_visit_result:
+                        with dispatch_table.on_element_details(visitor, self) as details_visit_result:
                             if details_visit_result == VisitResult.Terminate:
                                 return details_visit_result
 
                             if not self.__class__._GetFirstVisitResult(details_visit_result) & VisitResult.SkipDetails:  # pylint: disable=protected-access
-                                method_name_prefix = "On{}__".format(self.__class__.__name__)
-
                                 for detail_name, detail_value in accept_details:
-                                    method_name = method_name_prefix + detail_name
-
-                                    method = getattr(visitor, method_name, None)
-                                    assert method is not None, method_name
+                                    method = dispatch_table.GetDetailMethod(detail_name)
 
                                     details_visit_result = method(
+                                        visitor,
                                         detail_value,
                                         include_disabled=include_disabled,
                                     )
@@ -131,11 +183,13 @@ class Element(ABC):
                                         return details_visit_result
 
                 # Enumerate the children associated with the Element (if any)
-                if not self.__class__._GetFirstVisitResult(method_visit_result, element_visit_result) & VisitResult.SkipChildren:  # pylint: disable=protected-access
+                if (
+                    dispatch_table.generates_children
+                    and not self.__class__._GetFirstVisitResult(method_visit_result, element_visit_result) & VisitResult.SkipChildren  # pylint: disable=protected-access
+                ):
                     with self._GenerateAcceptChildren() as children:
                         if children:
-                            method = getattr(visitor, "OnElementChildren", self.__class__._GenericYieldFunc)  # pylint: disable=protected-access
-                            with method(self) as children_visit_result:
+                            with dispatch_table.on_element_children(visitor, self) as children_visit_result:
                                 if children_visit_result == VisitResult.Terminate:
                                     return children_visit_result
 
@@ -160,6 +214,13 @@ class Element(ABC):
 
         return VisitResult.Continue
 
+    # ----------------------------------------------------------------------
+    def __reduce__(self):
+        # The `__getstate__` methods generated by `dataclass` enumerate the fields of the element's
+        # class every time that they are invoked, which dominates the time required to pickle large
+        # models (for example, when they are sent to other processes).
+        return _CreateElementFromState, (self.__class__, self._GetState())
+
     # ----------------------------------------------------------------------
     # |
     # |  Protected Types
@@ -173,6 +234,31 @@ class Element(ABC):
 
     _GenerateAcceptChildrenGeneratorType    = Iterator[Optional[list["Element"]]]
 
+    _GenerateFingerprintItemsGeneratorType  = Generator[Tuple[str, Any], None, None]
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Protected Methods
+    # |
+    # ----------------------------------------------------------------------
+    @classmethod
+    def _GetStateFieldNames(cls) -> Tuple[str, ...]:
+        """Returns the names of the fields persisted when an element is pickled (in the order of the values returned by `_GetState`)"""
+
+        field_names = _state_field_names.get(cls, None)
+        if field_names is None:
+            field_names = tuple(field_info.name for field_info in fields(cls))
+            _state_field_names[cls] = field_names
+
+        return field_names
+
+    # ----------------------------------------------------------------------
+    @extensionmethod
+    def _GetState(self) -> list[Any]:
+        """Returns the field values persisted when the element is pickled"""
+
+        return [getattr(self, field_name) for field_name in self.__class__._GetStateFieldNames()]
+
     # ----------------------------------------------------------------------
     # |
     # |  Private Methods
@@ -197,6 +283,167 @@ class Element(ABC):
         # No children by default
         yield None
 
+    # ----------------------------------------------------------------------
+    @extensionmethod
+    def _GenerateFingerprintItems(self) -> _GenerateFingerprintItemsGeneratorType:
+        # By default, the fingerprint is based on the public fields that participate in comparisons
+        # (other than the range).
+        for field_name in _FingerprintCalculator.GetFieldNames(self.__class__):
+            value = getattr(self, field_name)
+
+            if field_name == "name":
+                # Names generated while parsing may include the location of the element that they
+                # were generated for.
+                name_value = getattr(value, "value", None)
+                if isinstance(name_value, str):
+                    value = _FingerprintCalculator.GENERATED_NAME_LOCATION_REGEX.sub("", name_value)
+
+            yield field_name, value
+
+    # ----------------------------------------------------------------------
+    def _EnumAccept(
+        self,
+        visitor: Any,
+        *,
+        include_disabled: bool,
+    ) -> AcceptGeneratorType:
+        """\
+        Implements the same protocol as `Accept`, but yields the children (and default details) to
+        visit rather than visiting them recursively; the yielded elements are visited by
+        `_ExecuteAcceptGenerator` and the results sent back to this generator.
+
+        Any changes made to `Accept` must be reflected here as well.
+        """
+
+        dispatch_table = _AcceptDispatchTable.Get(visitor, self.__class__)
+
+        with dispatch_table.on_element(visitor, self) as element_visit_result:
+            if element_visit_result == VisitResult.Terminate:
+                return element_visit_result
+
+            if element_visit_result == VisitResult.SkipAll:
+                return VisitResult.Continue
+
+            with dispatch_table.on_method(visitor, self) as method_visit_result:
+                if method_visit_result == VisitResult.Terminate:
+                    return method_visit_result
+
+                # Enumerate the details associated with the Element (if any)
+                if (
+                    dispatch_table.generates_details
+                    and not self.__class__._GetFirstVisitResult(method_visit_result, element_visit_result) & VisitResult.SkipDetails  # pylint: disable=protected-access
+                ):
+                    accept_details = list(self._GenerateAcceptDetails())
+
+                    if accept_details:
+                        with dispatch_table.on_element_details(visitor, self) as details_visit_result:
+                            if details_visit_result == VisitResult.Terminate:
+                                return details_visit_result
+
+                            if not self.__class__._GetFirstVisitResult(details_visit_result) & VisitResult.SkipDetails:  # pylint: disable=protected-access
+                                for detail_name, detail_value in accept_details:
+                                    generator_func = dispatch_table.GetDetailGenerator(detail_name)
+
+                                    if generator_func is None:
+                                        details_visit_result = dispatch_table.GetDetailMethod(detail_name)(
+                                            visitor,
+                                            detail_value,
+                                            include_disabled=include_disabled,
+                                        )
+                                    else:
+                                        details_visit_result = yield from generator_func(
+                                            visitor,
+                                            detail_value,
+                                            include_disabled=include_disabled,
+                                        )
+
+                                    if details_visit_result == VisitResult.Terminate:
+                                        return details_visit_result
+
+                # Enumerate the children associated with the Element (if any)
+                if (
+                    dispatch_table.generates_children
+                    and not self.__class__._GetFirstVisitResult(method_visit_result, element_visit_result) & VisitResult.SkipChildren  # pylint: disable=protected-access
+                ):
+                    with self._GenerateAcceptChildren() as children:
+                        if children:
+                            with dispatch_table.on_element_children(visitor, self) as children_visit_result:
+                                if children_visit_result == VisitResult.Terminate:
+                                    return children_visit_result
+
+                                if not self.__class__._GetFirstVisitResult(children_visit_result) & VisitResult.SkipChildren:  # pylint: disable=protected-access
+                                    # As with `Accept`, the length of the children is checked after
+                                    # each child is visited, as visiting the child may modify its siblings.
+                                    child_index = 0
+
+                                    while child_index < len(children):
+                                        child = children[child_index]
+                                        child_index += 1
+
+                                        child_visit_result = yield child
+
+                                        if child_visit_result == VisitResult.Terminate:
+                                            return child_visit_result
+
+        return VisitResult.Continue
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _ExecuteAcceptGenerator(
+        generator: AcceptGeneratorType,
+        visitor: Any,
+        *,
+        include_disabled: bool,
+    ) -> VisitResult:
+        """\
+        Visits elements using an explicit stack of generators rather than recursion, which means
+        that the depth of the elements being visited is not limited by the interpreter's recursion
+        limit.
+        """
+
+        # The generator at the end of the stack is associated with the element currently being visited
+        generators: list[Element.AcceptGeneratorType] = [generator]
+
+        send_value: Optional[VisitResult] = None
+        exception: Optional[BaseException] = None
+
+        while True:
+            try:
+                if exception is None:
+                    element = generators[-1].send(send_value)  # type: ignore
+                else:
+                    # Raise the exception within the parent's generator so that its context
+                    # managers are exited just as they would be if the child were visited recursively.
+                    this_exception = exception
+                    exception = None
+
+                    element = generators[-1].throw(this_exception)
+
+            except StopIteration as ex:
+                generators.pop()
+
+                if not generators:
+                    return ex.value
+
+                send_value = ex.value
+                continue
+
+            except BaseException as ex:  # pylint: disable=broad-exception-caught
+                generators.pop()
+
+                if not generators:
+                    raise
+
+                exception = ex
+                continue
+
+            if element.is_disabled and not include_disabled:
+                send_value = VisitResult.Continue
+                continue
+
+            generators.append(element._EnumAccept(visitor, include_disabled=include_disabled))  # pylint: disable=protected-access
+            send_value = None
+
     # ----------------------------------------------------------------------
     @staticmethod
     def _GetFirstVisitResult(
@@ -207,3 +454,405 @@ class Element(ABC):
                 return result
 
         return VisitResult.Continue
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Data
+# |
+# ----------------------------------------------------------------------
+_state_field_names: dict[type, Tuple[str, ...]]                             = {}
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Types
+# |
+# ----------------------------------------------------------------------
+class _AcceptDispatchTable(object):
+    """\
+    Visitor methods invoked by `Element.Accept` for a specific (visitor class, element class) pair.
+
+    Methods are resolved once per pair rather than once per visit. Methods defined on the visitor
+    class (or its bases) are invoked directly; all other methods (for example, those provided by
+    a `__getattr__` implementation that isn't accompanied by a `CreateDefaultMethod` classmethod)
+    are resolved on the visitor instance for every invocation, just as they would be without the
+    table. Visitor instances that define any of the methods themselves (for example, via
+    `mock.patch.object`) use a table that resolves every method on the instance.
+
+    Tables are stored on the visitor class so that they are released along with it.
+    """
+
+    # Visitor methods are invoked with the visitor as the first argument
+    MethodType                              = Callable[..., Any]
+    GeneratorMethodType                     = Callable[..., Element.AcceptGeneratorType]
+
+    TABLES_ATTRIBUTE_NAME: ClassVar[str]    = "_accept_dispatch_tables"
+
+    __slots__ = (
+        "visitor_class",
+        "element_class",
+        "on_element",
+        "on_method",
+        "on_element_details",
+        "on_element_children",
+        "generates_details",
+        "generates_children",
+        "is_iterative",
+        "_is_dynamic",
+        "_method_names",
+        "_dynamic_table",
+        "_detail_methods",
+        "_detail_generators",
+    )
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def Get(
+        cls,
+        visitor: Any,
+        element_class: Type[Element],
+    ) -> "_AcceptDispatchTable":
+        visitor_class = visitor.__class__
+
+        tables = visitor_class.__dict__.get(cls.TABLES_ATTRIBUTE_NAME, None)
+        if tables is None:
+            tables = {}
+
+            try:
+                setattr(visitor_class, cls.TABLES_ATTRIBUTE_NAME, tables)
+            except TypeError:
+                # The visitor's class can't be modified, so the table is created for this visit only
+                pass
+
+        # Multiple threads may create a table for the same element class, which is harmless as the
+        # tables will be equivalent.
+        table = tables.get(element_class, None)
+        if table is None:
+            table = cls(visitor_class, element_class)
+            tables[element_class] = table
+
+        # Methods defined on the visitor instance take precedence over those defined by its class
+        instance_dict = getattr(visitor, "__dict__", None)
+        if instance_dict:
+            for method_name in table._method_names:  # pylint: disable=protected-access
+                if method_name in instance_dict:
+                    return table._GetDynamicTable()  # pylint: disable=protected-access
+
+        return table
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        visitor_class: type,
+        element_class: Type[Element],
+        *,
+        is_dynamic: bool=False,
+    ):
+        generic_yield_func = Element._GenericYieldFunc  # pylint: disable=protected-access
+
+        self.visitor_class                  = visitor_class
+        self.element_class                  = element_class
+
+        self._is_dynamic                    = is_dynamic
+        self._dynamic_table: Optional[_AcceptDispatchTable]                                     = None
+
+        # The names of the methods resolved by this table (names of detail methods are added as
+        # they are resolved).
+        self._method_names: list[str]       = [
+            "OnElement",
+            "On{}".format(element_class.__name__),
+            "OnElementDetails",
+            "OnElementChildren",
+        ]
+
+        self.on_element                     = self._ResolveMethod("OnElement", generic_yield_func)
+        self.on_method                      = self._ResolveMethod("On{}".format(element_class.__name__), None)
+        self.on_element_details             = self._ResolveMethod("OnElementDetails", generic_yield_func)
+        self.on_element_children            = self._ResolveMethod("OnElementChildren", generic_yield_func)
+
+        # The default implementations don't generate details or children, so there is no need to
+        # invoke them.
+        self.generates_details              = element_class._GenerateAcceptDetails is not Element._GenerateAcceptDetails    # pylint: disable=protected-access
+        self.generates_children             = element_class._GenerateAcceptChildren is not Element._GenerateAcceptChildren  # pylint: disable=protected-access
+
+        # Visitors opt in to iterative visitation by defining `ITERATIVE_ACCEPT` as True
+        self.is_iterative                   = bool(getattr(visitor_class, "ITERATIVE_ACCEPT", False))
+
+        self._detail_methods: dict[str, _AcceptDispatchTable.MethodType]                        = {}
+        self._detail_generators: dict[str, Optional[_AcceptDispatchTable.GeneratorMethodType]]  = {}
+
+    # ----------------------------------------------------------------------
+    def GetDetailMethod(
+        self,
+        detail_name: str,
+    ) -> MethodType:
+        method = self._detail_methods.get(detail_name, None)
+        if method is None:
+            method_name = "On{}__{}".format(self.element_class.__name__, detail_name)
+
+            method = self._ResolveMethod(method_name, None)
+
+            self._detail_methods[detail_name] = method
+            self._method_names.append(method_name)
+
+        return method
+
+    # ----------------------------------------------------------------------
+    def GetDetailGenerator(
+        self,
+        detail_name: str,
+    ) -> Optional[GeneratorMethodType]:
+        """\
+        Returns a generator-based implementation of the detail method for use during iterative
+        visitation, or None if the detail method must be invoked directly.
+
+        Generators are only available for detail methods that aren't defined by the visitor's class
+        (or instance) and when the visitor class provides a `CreateDefaultGenerator` classmethod.
+        """
+
+        if self._is_dynamic:
+            return None
+
+        try:
+            return self._detail_generators[detail_name]
+        except KeyError:
+            pass
+
+        method_name = "On{}__{}".format(self.element_class.__name__, detail_name)
+        generator_func: Optional[_AcceptDispatchTable.GeneratorMethodType] = None
+
+        if not any(method_name in base.__dict__ for base in self.visitor_class.__mro__):
+            create_default_generator_func = getattr(self.visitor_class, "CreateDefaultGenerator", None)
+            if create_default_generator_func is not None:
+                generator_func = create_default_generator_func(method_name)
+
+        self._detail_generators[detail_name] = generator_func
+        return generator_func
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _GetDynamicTable(self) -> "_AcceptDispatchTable":
+        """Returns a table that resolves every method on the visitor instance"""
+
+        if self._dynamic_table is None:
+            self._dynamic_table = self.__class__(self.visitor_class, self.element_class, is_dynamic=True)
+
+        return self._dynamic_table
+
+    # ----------------------------------------------------------------------
+    def _ResolveMethod(
+        self,
+        method_name: str,
+        default_value: Optional[Callable[..., Any]],
+    ) -> MethodType:
+        if self._is_dynamic:
+            return self.__class__._CreateDynamicMethod(method_name, default_value)
+
+        for base in self.visitor_class.__mro__:
+            attribute = base.__dict__.get(method_name, None)
+            if attribute is None:
+                continue
+
+            # Only plain functions can be invoked directly; anything else (staticmethods,
+            # classmethods, custom descriptors, etc.) is resolved on the instance.
+            if isinstance(attribute, FunctionType):
+                return attribute
+
+            return self.__class__._CreateDynamicMethod(method_name, default_value)
+
+        create_default_method_func = getattr(self.visitor_class, "CreateDefaultMethod", None)
+        if create_default_method_func is not None:
+            method = create_default_method_func(method_name)
+            if method is not None:
+                return method
+
+        return self.__class__._CreateDynamicMethod(method_name, default_value)
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreateDynamicMethod(
+        method_name: str,
+        default_value: Optional[Callable[..., Any]],
+    ) -> MethodType:
+        # ----------------------------------------------------------------------
+        def Impl(visitor, *args, **kwargs):
+            method = getattr(visitor, method_name, default_value)
+            assert method is not None, method_name
+
+            return method(*args, **kwargs)
+
+        # ----------------------------------------------------------------------
+
+        return Impl
+
+# ----------------------------------------------------------------------
+class _FingerprintCalculator(object):
+    """\
+    Calculates the fingerprints of elements bottom-up.
+
+    References to an element that is currently being calculated (which happens with recursive
+    structures) contribute the distance to that element rather than its fingerprint. The
+    fingerprints of elements that are part of (or refer to) a cycle depend on where the
+    calculation started, so they are cached as `_CyclicFingerprint`s that are only used when
+    requested directly.
+    """
+
+    GENERATED_NAME_LOCATION_REGEX           = re.compile(r"(?<=[-_])Ln\d+Col\d+")
+
+    _field_names: ClassVar[dict[type, Tuple[str, ...]]]                     = {}
+
+    # ----------------------------------------------------------------------
+    class _CyclicFingerprint(bytes):
+        pass
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def GetFieldNames(
+        cls,
+        element_class: Type[Element],
+    ) -> Tuple[str, ...]:
+        field_names = cls._field_names.get(element_class, None)
+        if field_names is None:
+            field_names = tuple(
+                field_info.name
+                for field_info in fields(element_class)
+                if field_info.compare and field_info.name != "range" and not field_info.name.startswith("_")
+            )
+
+            cls._field_names[element_class] = field_names
+
+        return field_names
+
+    # ----------------------------------------------------------------------
+    def __init__(self):
+        # Elements whose fingerprint is being calculated and the index of each within the stack
+        self._stack_indexes: dict[int, int] = {}
+
+    # ----------------------------------------------------------------------
+    def Calculate(
+        self,
+        element: Element,
+    ) -> Tuple[bytes, Optional[int]]:
+        """\
+        Returns the fingerprint and the lowest stack index of an in-progress element referenced while
+        calculating it (or None if the fingerprint doesn't depend upon in-progress elements).
+        """
+
+        fingerprint = element._fingerprint  # pylint: disable=protected-access
+        if fingerprint is not None and not isinstance(fingerprint, _FingerprintCalculator._CyclicFingerprint):
+            return fingerprint, None
+
+        element_id = id(element)
+
+        stack_index = self._stack_indexes.get(element_id, None)
+        if stack_index is not None:
+            return "cycle:{}".format(len(self._stack_indexes) - stack_index).encode("utf-8"), stack_index
+
+        stack_index = len(self._stack_indexes)
+        self._stack_indexes[element_id] = stack_index
+
+        try:
+            hasher = hashlib.blake2b(element.__class__.__name__.encode("utf-8"), digest_size=16)
+            min_stack_index: Optional[int] = None
+
+            for item_name, item_value in element._GenerateFingerprintItems():  # pylint: disable=protected-access
+                hasher.update(b"|")
+                hasher.update(item_name.encode("utf-8"))
+                hasher.update(b"=")
+
+                min_stack_index = self.__class__._Min(min_stack_index, self._Update(hasher, item_value))
+
+        finally:
+            del self._stack_indexes[element_id]
+
+        fingerprint = hasher.digest()
+
+        if min_stack_index is None:
+            object.__setattr__(element, "_fingerprint", fingerprint)
+        elif min_stack_index >= stack_index:
+            # The fingerprint depends upon cycles, but only those that start with this element
+            object.__setattr__(element, "_fingerprint", _FingerprintCalculator._CyclicFingerprint(fingerprint))
+
+        return fingerprint, min_stack_index
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _Update(
+        self,
+        hasher: Any,
+        value: Any,
+    ) -> Optional[int]:
+        if isinstance(value, WeakReferenceType):
+            value = value()
+            assert value is not None
+
+        if isinstance(value, Element):
+            fingerprint, min_stack_index = self.Calculate(value)
+
+            hasher.update(b"<")
+            hasher.update(fingerprint)
+            hasher.update(b">")
+
+            return min_stack_index
+
+        if isinstance(value, (list, tuple, dict)):
+            if isinstance(value, dict):
+                hasher.update("{{{}:".format(len(value)).encode("utf-8"))
+                items = [item for key in sorted(value) for item in (key, value[key])]
+            else:
+                hasher.update("[{}:".format(len(value)).encode("utf-8"))
+                items = value
+
+            min_stack_index: Optional[int] = None
+
+            for item in items:
+                min_stack_index = self.__class__._Min(min_stack_index, self._Update(hasher, item))
+
+            hasher.update(b"]")
+            return min_stack_index
+
+        if isinstance(value, Enum):
+            content = "{}.{}".format(value.__class__.__name__, value.name)
+        elif isinstance(value, EnumMeta):
+            # Dynamically created enums are described by their members
+            content = repr([(member.name, member.value) for member in value])  # type: ignore
+        else:
+            content = repr(value)
+
+        hasher.update("{}({}):".format(value.__class__.__name__, len(content)).encode("utf-8"))
+        hasher.update(content.encode("utf-8"))
+
+        return None
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _Min(
+        a: Optional[int],
+        b: Optional[int],
+    ) -> Optional[int]:
+        if a is None:
+            return b
+        if b is None:
+            return a
+
+        return min(a, b)
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Functions
+# |
+# ----------------------------------------------------------------------
+def _CreateElementFromState(
+    element_class: Type[Element],
+    state: list[Any],
+) -> Element:
+    element = element_class.__new__(element_class)
+
+    for field_name, value in zip(element_class._GetStateFieldNames(), state):  # pylint: disable=protected-access
+        object.__setattr__(element, field_name, value)
+
+    return element
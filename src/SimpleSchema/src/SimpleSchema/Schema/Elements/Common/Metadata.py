@@ -30,7 +30,7 @@ from ....Common import Errors
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MetadataItem(Element):
     """Individual metadata within a collection of metadata items"""
 
@@ -48,7 +48,7 @@ class MetadataItem(Element):
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Metadata(Element):
     """Collection of metadata items"""
 
@@ -0,0 +1,236 @@
+# ----------------------------------------------------------------------
+# |
+# |  Element_PerformanceTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-10 08:31:07
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Performance tests for Element.py"""
+
+import gc
+import sys
+import time
+import tracemalloc
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+from Common_Foundation.Types import overridemethod
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent.parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from SimpleSchema.Common.Range import Range
+    from SimpleSchema.Schema.Elements.Common.Element import Element, VisitResult
+    from SimpleSchema.Schema.Elements.Common.SimpleElement import SimpleElement
+    from SimpleSchema.Schema.Elements.Statements.RootStatement import RootStatement
+    from SimpleSchema.Schema.Elements.Statements.StructureStatement import StructureStatement
+    from SimpleSchema.Schema.Elements.TestHelpers import CountElements, CreateSyntheticRoot
+    from SimpleSchema.Schema.Visitors.DescendantVisitor import DescendantVisitor
+    from SimpleSchema.Schema.Visitors.Visitor import Visitor
+
+
+# ----------------------------------------------------------------------
+NUM_STRUCTURES                              = 2000
+NUM_ITEMS_PER_STRUCTURE                     = 20
+
+DEEP_DEPTH                                  = 10000
+WIDE_WIDTH                                  = 100000
+
+
+# ----------------------------------------------------------------------
+def test_BytesPerElement():
+    # Prime any class-level state so that it isn't included in the measurements
+    CreateSyntheticRoot(1, NUM_ITEMS_PER_STRUCTURE)
+
+    gc.collect()
+
+    tracemalloc.start()
+    with ExitStack(tracemalloc.stop):
+        root = CreateSyntheticRoot(NUM_STRUCTURES, NUM_ITEMS_PER_STRUCTURE)
+        num_bytes = tracemalloc.get_traced_memory()[0]
+
+    num_elements = CountElements(root)
+
+    sys.stdout.write(
+        "{:,} items, {:,} elements, {:,} bytes: {:.1f} bytes per element\n".format(
+            NUM_STRUCTURES * NUM_ITEMS_PER_STRUCTURE,
+            num_elements,
+            num_bytes,
+            num_bytes / num_elements,
+        ),
+    )
+
+    assert num_elements > NUM_STRUCTURES * NUM_ITEMS_PER_STRUCTURE
+
+
+# ----------------------------------------------------------------------
+def test_NoInstanceDicts():
+    # Element data (and the data of the Ranges and Locations that they contain) is stored in slots
+    root = CreateSyntheticRoot(10, NUM_ITEMS_PER_STRUCTURE)
+
+    # ----------------------------------------------------------------------
+    def OnElement(
+        element: Element,
+    ) -> None:
+        assert not hasattr(element, "__dict__"), element.__class__.__name__
+        assert not hasattr(element.range, "__dict__")
+        assert not hasattr(element.range.begin, "__dict__")
+
+    # ----------------------------------------------------------------------
+
+    DescendantVisitor.EnumDescendants(root, OnElement)
+
+
+# ----------------------------------------------------------------------
+def test_IterativeConformance():
+    # Iterative visitation must produce the same events as recursive visitation, including those
+    # generated while visiting the elements referenced by ReferenceTypes.
+    root = CreateSyntheticRoot(50, NUM_ITEMS_PER_STRUCTURE)
+
+    recursive_visitor = _RecordingVisitor()
+    iterative_visitor = _IterativeRecordingVisitor()
+
+    assert root.Accept(recursive_visitor) == VisitResult.Continue
+    assert root.Accept(iterative_visitor) == VisitResult.Continue
+
+    assert recursive_visitor.events
+    assert any(is_reference for _, is_reference in recursive_visitor.events)
+    assert iterative_visitor.events == recursive_visitor.events
+
+
+# ----------------------------------------------------------------------
+def test_Deep():
+    root = RootStatement(_CreateRange(), [_CreateDeepStructure(DEEP_DEPTH)])
+
+    # The recursive implementation requires a recursion limit that is larger than the depth
+    original_recursion_limit = sys.getrecursionlimit()
+
+    sys.setrecursionlimit(DEEP_DEPTH * 4 + original_recursion_limit)
+    with ExitStack(lambda: sys.setrecursionlimit(original_recursion_limit)):
+        _Measure("Deep (recursive)", DEEP_DEPTH, lambda: root.Accept(_CountingVisitor()))
+
+    _Measure("Deep (iterative)", DEEP_DEPTH, lambda: root.Accept(_IterativeCountingVisitor()))
+
+
+# ----------------------------------------------------------------------
+def test_Wide():
+    root = RootStatement(
+        _CreateRange(),
+        [
+            StructureStatement(_CreateRange(), SimpleElement[str](_CreateRange(), "Structure{}".format(index)), [], [])
+            for index in range(WIDE_WIDTH)
+        ],
+    )
+
+    _Measure("Wide (recursive)", WIDE_WIDTH, lambda: root.Accept(_CountingVisitor()))
+    _Measure("Wide (iterative)", WIDE_WIDTH, lambda: root.Accept(_IterativeCountingVisitor()))
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+class _CountingVisitor(Visitor):
+    # ----------------------------------------------------------------------
+    def __init__(self):
+        super(_CountingVisitor, self).__init__()
+
+        self.num_elements                   = 0
+
+    # ----------------------------------------------------------------------
+    @contextmanager
+    @overridemethod
+    def OnElement(self, element: Element) -> Iterator[Optional[VisitResult]]:
+        self.num_elements += 1
+        yield
+
+
+# ----------------------------------------------------------------------
+class _IterativeCountingVisitor(_CountingVisitor):
+    ITERATIVE_ACCEPT                        = True
+
+
+# ----------------------------------------------------------------------
+class _RecordingVisitor(Visitor):
+    # ----------------------------------------------------------------------
+    def __init__(self):
+        super(_RecordingVisitor, self).__init__()
+
+        self.events: list[tuple[int, bool]] = []
+
+    # ----------------------------------------------------------------------
+    @contextmanager
+    @overridemethod
+    def OnElement(self, element: Element) -> Iterator[Optional[VisitResult]]:
+        self.events.append((id(element), self.is_processing_reference_element))
+        yield
+        self.events.append((-id(element), self.is_processing_reference_element))
+
+
+# ----------------------------------------------------------------------
+class _IterativeRecordingVisitor(_RecordingVisitor):
+    ITERATIVE_ACCEPT                        = True
+
+
+# ----------------------------------------------------------------------
+def _CreateRange() -> Range:
+    return Range.Create(Path("synthetic.SimpleSchema"), 1, 1, 1, 10)
+
+
+# ----------------------------------------------------------------------
+def _CreateDeepStructure(
+    depth: int,
+) -> StructureStatement:
+    structure: Optional[StructureStatement] = None
+
+    for index in range(depth):
+        structure = StructureStatement(
+            _CreateRange(),
+            SimpleElement[str](_CreateRange(), "Structure{}".format(index)),
+            [],
+            [] if structure is None else [structure],
+        )
+
+    assert structure is not None
+    return structure
+
+
+# ----------------------------------------------------------------------
+def _Measure(
+    desc: str,
+    num_items: int,
+    func: Callable[[], object],
+    num_iterations: int=3,
+) -> None:
+    best = None
+
+    for _ in range(num_iterations):
+        start = time.perf_counter()
+        func()
+        duration = time.perf_counter() - start
+
+        if best is None or duration < best:
+            best = duration
+
+    assert best is not None
+
+    sys.stdout.write(
+        "{}: {:,} items in {:.4f}s ({:.2f} us per item)\n".format(
+            desc,
+            num_items,
+            best,
+            best / num_items * 1000000,
+        ),
+    )
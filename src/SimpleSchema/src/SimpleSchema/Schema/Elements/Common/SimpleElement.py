@@ -15,8 +15,8 @@
 # ----------------------------------------------------------------------
 """Contains the SimpleElement object"""
 
-from dataclasses import dataclass
-from typing import Generic, TypeVar
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
 
 from .Element import Element
 
@@ -25,9 +25,15 @@ from .Element import Element
 SimpleElementType                           = TypeVar("SimpleElementType")  # pylint: disable=invalid-name
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SimpleElement(Generic[SimpleElementType], Element):
     """Element with a single value member"""
 
     # ----------------------------------------------------------------------
     value: SimpleElementType
+
+    # `typing` attempts to assign this attribute when an instance is created via
+    # `SimpleElement[<type>](...)` and ignores the AttributeError raised by frozen dataclasses.
+    # Declaring it as a field ensures that an AttributeError (rather than a TypeError) is raised
+    # now that the class uses slots.
+    __orig_class__: Any                     = field(init=False, default=None, repr=False, compare=False)
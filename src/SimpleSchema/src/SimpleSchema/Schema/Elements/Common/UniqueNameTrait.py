@@ -24,12 +24,24 @@ from typing import Union
 class UniqueNameTrait(object):
     """Trait for Elements that are given a unique name during Parsing"""
 
+    # ----------------------------------------------------------------------
+    # Storage for the fields is provided by the (slotted) Element that incorporates this trait
+    __slots__ = ()
+
     # ----------------------------------------------------------------------
     _unique_name: Union[
         None,                               # Before NormalizeUniqueName is called
         str,                                # After NormalizeUniqueName is called
     ]                                       = field(init=False, default=None)
 
+    # ----------------------------------------------------------------------
+    def __new__(cls, *args, **kwargs):  # pylint: disable=unused-argument
+        # The trait doesn't provide storage for its fields when it is created on its own
+        if cls is UniqueNameTrait:
+            cls = _StandaloneUniqueNameTrait
+
+        return super(UniqueNameTrait, cls).__new__(cls)
+
     # ----------------------------------------------------------------------
     @property
     def is_unique_name_normalized(self) -> bool:
@@ -48,3 +60,11 @@ class UniqueNameTrait(object):
     ) -> None:
         assert self._unique_name is None
         object.__setattr__(self, "_unique_name", unique_name)
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class _StandaloneUniqueNameTrait(UniqueNameTrait):
+    """UniqueNameTrait that provides storage for its fields"""
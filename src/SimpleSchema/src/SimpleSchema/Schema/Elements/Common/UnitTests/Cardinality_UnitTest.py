@@ -252,3 +252,29 @@ class TestValidate(object):
             match=re.escape("No more than 2 items were expected (3 items were found)."),
         ):
             Cardinality.CreateFromCode(2, 2).Validate([10, 20, 30])
+
+
+# ----------------------------------------------------------------------
+def test_IsValid():
+    single = Cardinality.CreateFromCode()
+
+    assert single.IsValid(10)
+    assert single.IsValid(IntegerExpression(Mock(), 10))
+    assert not single.IsValid(None)
+    assert not single.IsValid([10, 20])
+
+    optional = Cardinality.CreateFromCode(0, 1)
+
+    assert optional.IsValid(10)
+    assert optional.IsValid(None)
+
+    container = Cardinality.CreateFromCode(2, 3)
+
+    assert container.IsValid([10, 20])
+    assert container.IsValid([10, 20, 30])
+    assert not container.IsValid([10])
+    assert not container.IsValid([10, 20, 30, 40])
+    assert not container.IsValid(10)
+    assert not container.IsValid(None)
+
+    assert Cardinality.CreateFromCode(0, None).IsValid([])
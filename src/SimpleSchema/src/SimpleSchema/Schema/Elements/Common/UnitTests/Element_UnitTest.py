@@ -15,13 +15,16 @@
 # ----------------------------------------------------------------------
 """Unit tests for Element.py"""
 
+import gc
 import re
 import sys
+import weakref
 
 from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, cast, Iterator, Optional
+from typing import Any, cast, Iterator, Optional, Tuple
+from unittest import mock
 from unittest.mock import MagicMock as Mock
 
 import pytest
@@ -136,6 +139,68 @@ class MyVisitor(object):
         return VisitResult.Continue
 
 
+# ----------------------------------------------------------------------
+class MyIterativeVisitor(MyVisitor):
+    ITERATIVE_ACCEPT                        = True
+
+
+# ----------------------------------------------------------------------
+class MyRecordingVisitor(MyVisitor):
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        *,
+        raise_on_value: Optional[int]=None,
+        terminate_on_value: Optional[int]=None,
+        add_sibling_on_value: Optional[int]=None,
+    ):
+        super(MyRecordingVisitor, self).__init__()
+
+        self._raise_on_value                = raise_on_value
+        self._terminate_on_value            = terminate_on_value
+        self._add_sibling_on_value          = add_sibling_on_value
+
+        self.events: list[str]              = []
+        self.parent: Optional[MyElement]    = None
+
+    # ----------------------------------------------------------------------
+    @contextmanager
+    def OnElement(self, element) -> Iterator[Optional[VisitResult]]:
+        description = element.value if isinstance(element, SimpleElement) else element.name.value
+
+        self.events.append("enter {}".format(description))
+        try:
+            yield None
+        except Exception as ex:
+            self.events.append("exception {} ({})".format(description, ex))
+            raise
+        else:
+            self.events.append("exit {}".format(description))
+
+    # ----------------------------------------------------------------------
+    @contextmanager
+    def OnMyElement(self, element) -> Iterator[Optional[VisitResult]]:
+        self.parent = element
+        yield None
+
+    # ----------------------------------------------------------------------
+    @contextmanager
+    def OnSimpleElement(self, element) -> Iterator[Optional[VisitResult]]:
+        if element.value == self._raise_on_value:
+            raise Exception("Raised on {}".format(element.value))
+
+        if element.value == self._add_sibling_on_value:
+            assert self.parent is not None
+            self.parent.children.append(SimpleElement[int](Mock(), element.value * 100))
+
+        yield VisitResult.Terminate if element.value == self._terminate_on_value else None
+
+
+# ----------------------------------------------------------------------
+class MyIterativeRecordingVisitor(MyRecordingVisitor):
+    ITERATIVE_ACCEPT                        = True
+
+
 # ----------------------------------------------------------------------
 # |
 # |  Public Functions
@@ -174,11 +239,19 @@ def test_Disable(_element):
         _element.Disable()
 
 
+# ----------------------------------------------------------------------
+def test_UnknownAttribute(_element):
+    with pytest.raises(AttributeError):
+        _element.does_not_exist
+
+
 # ----------------------------------------------------------------------
 class TestVisitor(object):
+    VISITOR_TYPE: type                      = MyVisitor
+
     # ----------------------------------------------------------------------
     def test_Standard(self, _element):
-        v = MyVisitor()
+        v = self.VISITOR_TYPE()
 
         assert _element.Accept(v) == VisitResult.Continue
 
@@ -201,7 +274,7 @@ class TestVisitor(object):
 
     # ----------------------------------------------------------------------
     def test_OnElementTerminate(self, _element):
-        v = MyVisitor(
+        v = self.VISITOR_TYPE(
             on_element_result=VisitResult.Terminate,
         )
 
@@ -213,7 +286,7 @@ class TestVisitor(object):
 
     # ----------------------------------------------------------------------
     def test_OnElementSkipAll(self, _element):
-        v = MyVisitor(
+        v = self.VISITOR_TYPE(
             on_element_result=VisitResult.SkipAll,
         )
 
@@ -225,7 +298,7 @@ class TestVisitor(object):
 
     # ----------------------------------------------------------------------
     def test_OnElementSkipDetails(self, _element):
-        v = MyVisitor(
+        v = self.VISITOR_TYPE(
             on_element_result=VisitResult.SkipDetails,
         )
 
@@ -246,7 +319,7 @@ class TestVisitor(object):
 
     # ----------------------------------------------------------------------
     def test_OnElementSkipChildren(self, _element):
-        v = MyVisitor(
+        v = self.VISITOR_TYPE(
             on_element_result=VisitResult.SkipChildren,
         )
 
@@ -263,7 +336,7 @@ class TestVisitor(object):
 
     # ----------------------------------------------------------------------
     def test_OnMyElementTerminate(self, _element):
-        v = MyVisitor(
+        v = self.VISITOR_TYPE(
             on_my_element_result=VisitResult.Terminate,
         )
 
@@ -276,7 +349,7 @@ class TestVisitor(object):
 
     # ----------------------------------------------------------------------
     def test_OnMyElementSkipAll(self, _element):
-        v = MyVisitor(
+        v = self.VISITOR_TYPE(
             on_my_element_result=VisitResult.SkipAll,
         )
 
@@ -289,7 +362,7 @@ class TestVisitor(object):
 
     # ----------------------------------------------------------------------
     def test_OnMyElementSkipDetails(self, _element):
-        v = MyVisitor(
+        v = self.VISITOR_TYPE(
             on_my_element_result=VisitResult.SkipDetails,
         )
 
@@ -310,7 +383,7 @@ class TestVisitor(object):
 
     # ----------------------------------------------------------------------
     def test_OnMyElementSkipChildren(self, _element):
-        v = MyVisitor(
+        v = self.VISITOR_TYPE(
             on_my_element_result=VisitResult.SkipChildren,
         )
 
@@ -327,7 +400,7 @@ class TestVisitor(object):
 
     # ----------------------------------------------------------------------
     def test_OnDetailsTerminate(self, _element):
-        v = MyVisitor(
+        v = self.VISITOR_TYPE(
             on_details_result=VisitResult.Terminate,
         )
 
@@ -340,7 +413,7 @@ class TestVisitor(object):
 
     # ----------------------------------------------------------------------
     def test_OnDetailsSkip(self, _element):
-        v = MyVisitor(
+        v = self.VISITOR_TYPE(
             on_details_result=VisitResult.SkipDetails,
         )
 
@@ -361,7 +434,7 @@ class TestVisitor(object):
 
     # ----------------------------------------------------------------------
     def test_OnChildrenTerminate(self, _element):
-        v = MyVisitor(
+        v = self.VISITOR_TYPE(
             on_children_result=VisitResult.Terminate,
         )
 
@@ -378,7 +451,7 @@ class TestVisitor(object):
 
     # ----------------------------------------------------------------------
     def test_OnChildrenSkip(self, _element):
-        v = MyVisitor(
+        v = self.VISITOR_TYPE(
             on_children_result=VisitResult.SkipChildren,
         )
 
@@ -395,7 +468,7 @@ class TestVisitor(object):
 
     # ----------------------------------------------------------------------
     def test_OnDetailItemTerminate(self, _element):
-        v = MyVisitor(
+        v = self.VISITOR_TYPE(
             on_detail_item_result=VisitResult.Terminate,
         )
 
@@ -410,7 +483,7 @@ class TestVisitor(object):
 
     # ----------------------------------------------------------------------
     def test_OnChildItemTerminate(self, _element):
-        v = MyVisitor(
+        v = self.VISITOR_TYPE(
             on_child_item_result=VisitResult.Terminate,
         )
 
@@ -429,7 +502,7 @@ class TestVisitor(object):
     # ----------------------------------------------------------------------
     def test_Disabled(self, _element):
         # Standard
-        v = MyVisitor()
+        v = self.VISITOR_TYPE()
 
         _element.number.Disable()
         _element.children[0].Disable()
@@ -449,7 +522,7 @@ class TestVisitor(object):
         ]
 
         # Include Disabled
-        v = MyVisitor()
+        v = self.VISITOR_TYPE()
 
         assert _element.Accept(v, include_disabled=True) == VisitResult.Continue
 
@@ -470,9 +543,274 @@ class TestVisitor(object):
             _element.children[3].value,
         ]
 
+    # ----------------------------------------------------------------------
+    def test_DerivedVisitor(self, _element):
+        # Methods are resolved for each visitor class
+        class MyDerivedVisitor(self.VISITOR_TYPE):
+            # ----------------------------------------------------------------------
+            @contextmanager
+            def OnSimpleElement(self, element) -> Iterator[VisitResult]:
+                self.values.append(-1)
+                yield VisitResult.Continue
+
+        # ----------------------------------------------------------------------
+
+        v = self.VISITOR_TYPE()
+
+        assert _element.Accept(v) == VisitResult.Continue
+        assert -1 not in v.values
+
+        v = MyDerivedVisitor()
+
+        assert _element.Accept(v) == VisitResult.Continue
+
+        assert v.values == [
+            _element,   # OnElement
+            _element,   # OnMyElement
+            _element.name,
+            -1,
+            _element.number,
+            -1,
+            _element.children[0],
+            -1,
+            _element.children[1],
+            -1,
+            _element.children[2],
+            -1,
+            _element.children[3],
+            -1,
+        ]
+
+    # ----------------------------------------------------------------------
+    def test_DynamicVisitor(self, _element):
+        # Methods that aren't defined by the visitor's class are resolved on the instance
+        class MyDynamicVisitor(object):
+            # ----------------------------------------------------------------------
+            def __init__(self):
+                self._visitor = MyVisitor()
+
+            # ----------------------------------------------------------------------
+            def __getattr__(self, name):
+                return getattr(self._visitor, name)
+
+        # ----------------------------------------------------------------------
+
+        v = MyDynamicVisitor()
+
+        assert _element.Accept(v) == VisitResult.Continue
+
+        assert v.values == [
+            _element,   # OnElement
+            _element,   # OnMyElement
+            _element.name,
+            _element.name.value,
+            _element.number,
+            _element.number.value,
+            _element.children[0],
+            _element.children[0].value,
+            _element.children[1],
+            _element.children[1].value,
+            _element.children[2],
+            _element.children[2].value,
+            _element.children[3],
+            _element.children[3].value,
+        ]
+
+    # ----------------------------------------------------------------------
+    def test_InstanceMethods(self, _element):
+        # Methods defined on the visitor instance take precedence over those defined by its class
+        v = self.VISITOR_TYPE()
+
+        assert _element.Accept(v) == VisitResult.Continue
+        assert v.values[1] is _element
+
+        # ----------------------------------------------------------------------
+        @contextmanager
+        def OnMyElement(element) -> Iterator[VisitResult]:
+            v.values.append("instance")
+            yield VisitResult.Continue
+
+        # ----------------------------------------------------------------------
+
+        v = self.VISITOR_TYPE()
+
+        with (
+            mock.patch.object(v, "OnMyElement", OnMyElement),
+            mock.patch.object(v, "OnMyElement__number", lambda value, *, include_disabled: VisitResult.Continue),
+        ):
+            assert _element.Accept(v) == VisitResult.Continue
+
+        assert v.values == [
+            _element,   # OnElement
+            "instance", # OnMyElement
+            _element.name,
+            _element.name.value,
+            _element.children[0],
+            _element.children[0].value,
+            _element.children[1],
+            _element.children[1].value,
+            _element.children[2],
+            _element.children[2].value,
+            _element.children[3],
+            _element.children[3].value,
+        ]
+
+        # The class methods are used once the instance methods are removed
+        v.values.clear()
+
+        assert _element.Accept(v) == VisitResult.Continue
+        assert v.values[:4] == [_element, _element, _element.name, _element.name.value]
+
+    # ----------------------------------------------------------------------
+    def test_VisitorClassReleased(self, _element):
+        class MyTemporaryVisitor(self.VISITOR_TYPE):
+            pass
+
+        # ----------------------------------------------------------------------
+
+        assert _element.Accept(MyTemporaryVisitor()) == VisitResult.Continue
+
+        visitor_class_ref = weakref.ref(MyTemporaryVisitor)
+        del MyTemporaryVisitor
+
+        gc.collect()
+        assert visitor_class_ref() is None
+
+
+# ----------------------------------------------------------------------
+class TestIterativeVisitor(TestVisitor):
+    VISITOR_TYPE: type                      = MyIterativeVisitor
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.parametrize(
+        "visitor_kwargs",
+        [
+            {},
+            {"raise_on_value": 3},
+            {"terminate_on_value": 2},
+            {"add_sibling_on_value": 2},
+            {"add_sibling_on_value": 4},
+        ],
+    )
+    def test_Conformance(self, visitor_kwargs):
+        results: list[tuple[list[str], Optional[VisitResult], Optional[str]]] = []
+
+        for visitor_type in [MyRecordingVisitor, MyIterativeRecordingVisitor]:
+            element = _CreateElement([_CreateElement([]), _CreateElement([])])
+
+            v = visitor_type(**visitor_kwargs)
+
+            try:
+                result = element.Accept(v)
+                exception = None
+            except Exception as ex:
+                result = None
+                exception = str(ex)
+
+            results.append((v.events, result, exception))
+
+        assert results[0] == results[1]
+
+    # ----------------------------------------------------------------------
+    def test_Deep(self):
+        depth = sys.getrecursionlimit() * 2
+
+        element = _CreateElement([])
+
+        for _ in range(depth - 1):
+            element = _CreateElement([element])
+
+        v = MyIterativeVisitor()
+
+        assert element.Accept(v) == VisitResult.Continue
+        assert len(v.values) == depth * (6 + 4 * 2)
+
+        with pytest.raises(RecursionError):
+            element.Accept(MyVisitor())
+
+
+# ----------------------------------------------------------------------
+class TestFingerprint(object):
+    # ----------------------------------------------------------------------
+    def test_Standard(self, _element):
+        fingerprint = _element.fingerprint
+
+        assert isinstance(fingerprint, bytes)
+        assert _element.fingerprint is fingerprint
+
+        # Ranges are not considered
+        assert _CreateElement([]).fingerprint == _CreateElement([]).fingerprint
+
+    # ----------------------------------------------------------------------
+    def test_Different(self, _element):
+        fingerprint = _CreateElement([]).fingerprint
+
+        assert _element.fingerprint != fingerprint
+        assert _CreateElement([_CreateElement([])]).fingerprint != fingerprint
+
+        element = _CreateElement([])
+        element.children[0].Disable()
+
+        assert element.fingerprint != fingerprint
+
+    # ----------------------------------------------------------------------
+    def test_GeneratedNames(self):
+        # Locations within generated names are not considered
+        assert (
+            SimpleElement[str](Mock(), "Type-Ln1Col2").fingerprint
+            != SimpleElement[str](Mock(), "Type-Ln3Col4").fingerprint
+        )
+
+        element1 = MyElement(Mock(), SimpleElement[str](Mock(), "Type-Ln1Col2"), SimpleElement[float](Mock(), 1.0), [])
+        element2 = MyElement(Mock(), SimpleElement[str](Mock(), "Type-Ln3Col4"), SimpleElement[float](Mock(), 1.0), [])
+        element3 = MyElement(Mock(), SimpleElement[str](Mock(), "Other-Ln1Col2"), SimpleElement[float](Mock(), 1.0), [])
+
+        assert element1.fingerprint == element2.fingerprint
+        assert element1.fingerprint != element3.fingerprint
+
+    # ----------------------------------------------------------------------
+    def test_Cycles(self):
+        # ----------------------------------------------------------------------
+        def Create() -> Tuple[MyElement, MyElement]:
+            child = _CreateElement([])
+            parent = _CreateElement([child])
+
+            child.children.append(parent)
+
+            return parent, child
+
+        # ----------------------------------------------------------------------
+
+        parent1, child1 = Create()
+        parent2, child2 = Create()
+
+        # The fingerprint is the same regardless of the order in which the elements are calculated
+        assert parent1.fingerprint == parent2.fingerprint
+        assert child2.fingerprint == child1.fingerprint
+
+        parent3, child3 = Create()
+
+        assert child3.fingerprint == child1.fingerprint
+        assert parent3.fingerprint == parent1.fingerprint
+
+        assert parent1.fingerprint != child1.fingerprint
+        assert parent1.fingerprint != _CreateElement([_CreateElement([])]).fingerprint
+
 
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _CreateElement(
+    children: list[Any],
+) -> MyElement:
+    return MyElement(
+        Mock(),
+        SimpleElement[str](Mock(), "Element"),
+        SimpleElement[float](Mock(), 1.23),
+        children + [SimpleElement[int](Mock(), value) for value in range(1, 5)],
+    )
+
+
 # ----------------------------------------------------------------------
 @pytest.fixture
 def _element() -> MyElement:
@@ -38,11 +38,32 @@ class Visibility(Enum):
 class VisibilityTrait(object):
     """Trait for Elements that have a visibility attribute"""
 
+    # ----------------------------------------------------------------------
+    # Storage for the fields is provided by the (slotted) Element that incorporates this trait
+    __slots__ = ()
+
+    # ----------------------------------------------------------------------
     visibility: SimpleElement[Visibility]
 
+    # ----------------------------------------------------------------------
+    def __new__(cls, *args, **kwargs):  # pylint: disable=unused-argument
+        # The trait doesn't provide storage for its fields when it is created on its own
+        if cls is VisibilityTrait:
+            cls = _StandaloneVisibilityTrait
+
+        return super(VisibilityTrait, cls).__new__(cls)
+
     # ----------------------------------------------------------------------
     # ----------------------------------------------------------------------
     # ----------------------------------------------------------------------
     @overridemethod
     def _GenerateAcceptDetails(self) -> Element._GenerateAcceptDetailsGeneratorType:  # pragma: no cover
         yield "visibility", self.visibility
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class _StandaloneVisibilityTrait(VisibilityTrait):
+    """VisibilityTrait that provides storage for its fields"""
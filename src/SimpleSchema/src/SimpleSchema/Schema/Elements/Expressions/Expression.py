@@ -22,7 +22,7 @@ from ..Common.Element import Element
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Expression(Element):
     """Abstract base class for all expressions"""
 
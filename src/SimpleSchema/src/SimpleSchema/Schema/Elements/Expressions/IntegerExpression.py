@@ -22,7 +22,7 @@ from .Expression import Expression
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IntegerExpression(Expression):
     """Integer value"""
 
@@ -24,7 +24,7 @@ from .Expression import Element, Expression
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ListExpression(Expression):
     """A list of expressions"""
 
@@ -23,7 +23,7 @@ from .Expression import Expression
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NoneExpression(Expression):
     """None value"""
 
@@ -26,7 +26,7 @@ from ....Common import Errors
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TupleExpression(Expression):
     """One or more expressions"""
 
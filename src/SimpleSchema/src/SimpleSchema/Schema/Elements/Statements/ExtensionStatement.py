@@ -29,7 +29,7 @@ from ....Common import Errors
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExtensionStatementKeywordArg(Element):
     """Keyword argument associated with an extension statement"""
 
@@ -47,7 +47,7 @@ class ExtensionStatementKeywordArg(Element):
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExtensionStatement(Statement):
     """An extension/function statement"""
 
@@ -15,18 +15,21 @@
 # ----------------------------------------------------------------------
 """Contains the RootStatement object"""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from contextlib import contextmanager
-from typing import cast, ClassVar
+from typing import cast, ClassVar, Optional, TYPE_CHECKING
 
 from Common_Foundation.Types import overridemethod
 
 from .Statement import Element, Statement
 from ....Common import Errors
 
+if TYPE_CHECKING:
+    from ..Types.Impl.ItemTable import ItemTable  # pragma: no cover
+
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RootStatement(Statement):
     """Collection of statements associated with a translation unit/file"""
 
@@ -35,12 +38,28 @@ class RootStatement(Statement):
 
     statements: list[Statement]  # Can be an empty list
 
+    # Created on demand by `GetItemTable`
+    _item_table: Optional["ItemTable"]      = field(init=False, default=None, repr=False, compare=False)
+
     # ----------------------------------------------------------------------
     def __post_init__(self):
         for statement in self.statements:
             if isinstance(statement, RootStatement):
                 raise Errors.RootStatementInvalidNested.Create(statement.range)
 
+    # ----------------------------------------------------------------------
+    def GetItemTable(self) -> "ItemTable":
+        """Returns information about the root items used to validate python mappings"""
+
+        if self._item_table is None:
+            # Note that this content is imported here to avoid circular dependencies
+            from ..Types.Impl.ItemTable import ItemTable
+
+            object.__setattr__(self, "_item_table", ItemTable.Create(self.statements))
+
+        assert self._item_table is not None
+        return self._item_table
+
     # ----------------------------------------------------------------------
     # ----------------------------------------------------------------------
     # ----------------------------------------------------------------------
@@ -21,7 +21,7 @@ from ..Common.Element import Element
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Statement(Element):
     """Abstract base class for all statements"""
 
@@ -16,8 +16,8 @@
 """Contains the StructureStatement object"""
 
 from contextlib import contextmanager
-from dataclasses import dataclass
-from typing import cast, ClassVar, TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import cast, ClassVar, Optional, TYPE_CHECKING
 from weakref import ref, ReferenceType as WeakReferenceType
 
 from Common_Foundation.Types import overridemethod
@@ -29,11 +29,12 @@ from ..Common.SimpleElement import SimpleElement
 from ..Common.UniqueNameTrait import UniqueNameTrait
 
 if TYPE_CHECKING:
-    from ..Types.ReferenceType import ReferenceType  # pragma: no cover
+    from ..Types.Impl.ItemTable import ItemTable        # pragma: no cover
+    from ..Types.ReferenceType import ReferenceType     # pragma: no cover
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StructureStatement(UniqueNameTrait, Statement):
     """The definition of a structure"""
 
@@ -44,6 +45,22 @@ class StructureStatement(UniqueNameTrait, Statement):
     base_types: list["ReferenceType"]       # Can be an empty list
     children: list[Statement]               # Can be an empty list
 
+    # Created on demand by `GetItemTable`
+    _item_table: Optional["ItemTable"]      = field(init=False, default=None, repr=False, compare=False)
+
+    # ----------------------------------------------------------------------
+    def GetItemTable(self) -> "ItemTable":
+        """Returns information about the items (including those defined by base types) used to validate python mappings"""
+
+        if self._item_table is None:
+            # Note that this content is imported here to avoid circular dependencies
+            from ..Types.Impl.ItemTable import ItemTable
+
+            object.__setattr__(self, "_item_table", ItemTable.Create(self.children, self.base_types))
+
+        assert self._item_table is not None
+        return self._item_table
+
     # ----------------------------------------------------------------------
     # ----------------------------------------------------------------------
     # ----------------------------------------------------------------------
@@ -0,0 +1,172 @@
+# ----------------------------------------------------------------------
+# |
+# |  TestHelpers.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-10 08:12:41
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Implements functionality leveraged across different tests within this module and its descendants"""
+
+from pathlib import Path
+from typing import Optional
+
+from .Common.Cardinality import Cardinality
+from .Common.Element import Element
+from .Common.SimpleElement import SimpleElement
+from .Common.Visibility import Visibility
+
+from .Expressions.IntegerExpression import IntegerExpression
+
+from .Statements.ItemStatement import ItemStatement
+from .Statements.RootStatement import RootStatement
+from .Statements.Statement import Statement
+from .Statements.StructureStatement import StructureStatement
+
+from .Types.BasicType import BasicType
+from .Types.FundamentalTypes.BooleanType import BooleanType
+from .Types.FundamentalTypes.IntegerType import IntegerType
+from .Types.FundamentalTypes.NumberType import NumberType
+from .Types.FundamentalTypes.StringType import StringType
+from .Types.ReferenceType import ReferenceType
+from .Types.StructureType import StructureType
+
+from ..Visitors.DescendantVisitor import DescendantVisitor
+
+from ...Common.Range import Range
+
+
+# ----------------------------------------------------------------------
+def CreateSyntheticRoot(
+    num_structures: int,
+    num_items_per_structure: int,
+    filename: Path=Path("synthetic.SimpleSchema"),
+) -> RootStatement:
+    """\
+    Creates a RootStatement that resembles the output of a resolved schema file with the specified
+    number of structures and items.
+
+    Items reference a rotating set of fundamental types and cardinalities; the first item in every
+    structure (other than the first structure) references the structure defined before it.
+    """
+
+    line = 0
+
+    # ----------------------------------------------------------------------
+    def NextRange(
+        num_columns: int=10,
+    ) -> Range:
+        nonlocal line
+        line += 1
+
+        return Range.Create(filename, line, 1, line, num_columns + 1)
+
+    # ----------------------------------------------------------------------
+    def CreateCardinality(
+        index: int,
+    ) -> Cardinality:
+        cardinality_type = index % 4
+        range_value = NextRange(3)
+
+        if cardinality_type == 0:
+            return Cardinality(range_value, None, None)
+        if cardinality_type == 1:
+            return Cardinality(range_value, IntegerExpression(range_value, 0), IntegerExpression(range_value, 1))
+        if cardinality_type == 2:
+            return Cardinality(range_value, IntegerExpression(range_value, 0), None)
+
+        return Cardinality(range_value, IntegerExpression(range_value, 1), IntegerExpression(range_value, 4))
+
+    # ----------------------------------------------------------------------
+    def CreateType(
+        index: int,
+        previous_structure: Optional[StructureStatement],
+    ) -> BasicType:
+        if index == 0 and previous_structure is not None:
+            return StructureType(NextRange(), previous_structure)
+
+        type_type = index % 5
+        range_value = NextRange()
+
+        if type_type == 0:
+            return StringType(range_value)
+        if type_type == 1:
+            return IntegerType(range_value, min=0)
+        if type_type == 2:
+            return NumberType(range_value)
+        if type_type == 3:
+            return BooleanType(range_value)
+
+        return StringType(range_value, min_length=2, max_length=100)
+
+    # ----------------------------------------------------------------------
+
+    statements: list[Statement] = []
+    previous_structure: Optional[StructureStatement] = None
+
+    for structure_index in range(num_structures):
+        structure_range = NextRange()
+
+        children: list[Statement] = []
+
+        for item_index in range(num_items_per_structure):
+            item_range = NextRange()
+            item_name = SimpleElement[str](item_range, "item{}".format(item_index))
+            item_visibility = SimpleElement[Visibility](item_range, Visibility.Public)
+
+            children.append(
+                ItemStatement(
+                    item_range,
+                    item_visibility,
+                    item_name,
+                    ReferenceType.Create(
+                        item_visibility,
+                        item_name,
+                        CreateType(item_index, previous_structure),
+                        CreateCardinality(item_index),
+                        None,
+                        range_value=item_range,
+                    ),
+                ),
+            )
+
+        structure = StructureStatement(
+            structure_range,
+            SimpleElement[str](structure_range, "Structure{}".format(structure_index)),
+            [],
+            children,
+        )
+
+        statements.append(structure)
+        previous_structure = structure
+
+    return RootStatement(Range.Create(filename, 1, 1, max(line, 1), 1), statements)
+
+
+# ----------------------------------------------------------------------
+def CountElements(
+    element: Element,
+) -> int:
+    """Returns the number of unique elements reachable from the provided element (including the element itself)"""
+
+    num_elements = 0
+
+    # ----------------------------------------------------------------------
+    def OnElement(
+        element: Element,  # pylint: disable=unused-argument
+    ) -> None:
+        nonlocal num_elements
+        num_elements += 1
+
+    # ----------------------------------------------------------------------
+
+    DescendantVisitor.EnumDescendants(element, OnElement)
+
+    return num_elements
@@ -17,11 +17,12 @@
 
 from abc import abstractmethod
 from dataclasses import dataclass, field, fields, Field, MISSING
-from typing import Any, Callable, ClassVar, Optional, Tuple, Type as PythonType, Union
+from typing import Any, Callable, ClassVar, Optional, Tuple, Type as PythonType, Union, TYPE_CHECKING
 
-from Common_Foundation.Types import DoesNotExist, overridemethod
+from Common_Foundation.Types import DoesNotExist, extensionmethod, overridemethod
 
 from .Impl.BaseType import BaseType
+from .Impl.InvalidValue import InvalidValueMarker
 
 from ..Common.Metadata import Metadata, MetadataItem
 
@@ -31,9 +32,12 @@ from ....Common import Errors
 from ....Common.Range import Range
 from ....Common.SimpleSchemaException import SimpleSchemaException
 
+if TYPE_CHECKING:
+    from .ReferenceType import ReferenceType  # pragma: no cover
+
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BasicType(BaseType):
     """A type that does not have cardinality or metadata"""
 
@@ -42,6 +46,10 @@ class BasicType(BaseType):
 
     FIELDS: ClassVar[dict[str, Field]]                                      = field(init=False)
 
+    # Types used to convert metadata values, by field name; populated on demand by `_GetMetadataType`
+    # (as some fields, such as the types of a Variant, can't be provided via metadata).
+    METADATA_TYPES: ClassVar[dict[str, "ReferenceType"]]                    = field(init=False)
+
     # ----------------------------------------------------------------------
     @classmethod
     def __new__(cls, *args, **kwargs):  # pylint: disable=unused-argument
@@ -69,6 +77,7 @@ class BasicType(BaseType):
         }
 
         cls.FIELDS = class_fields
+        cls.METADATA_TYPES = {}
 
     # ----------------------------------------------------------------------
     @classmethod
@@ -164,15 +173,7 @@ class BasicType(BaseType):
             else:
                 assert isinstance(metadata_item, MetadataItem), metadata_item
 
-                # Note that this content is imported here to avoid circular dependencies
-                from .FundamentalTypes.Impl.CreateTypeFromAnnotation import CreateTypeFromAnnotation
-
-                metadata_type = CreateTypeFromAnnotation(
-                    class_field.type,
-                    has_default_value=class_field.default is not MISSING or class_field.default_factory is not MISSING,
-                )
-
-                metadata_value = metadata_type.ToPython(metadata_item.expression)
+                metadata_value = cls._GetMetadataType(class_field).ToPython(metadata_item.expression)
 
             if (
                 metadata_value is not None
@@ -193,6 +194,53 @@ class BasicType(BaseType):
                 str(ex),
             ) from ex
 
+    # ----------------------------------------------------------------------
+    @classmethod
+    def _GetMetadataType(
+        cls,
+        class_field: Field,
+    ) -> "ReferenceType":
+        # Creating the type is expensive (each element created captures the callstack for its
+        # range), so create it once per class and field.
+        metadata_type = cls.METADATA_TYPES.get(class_field.name, None)
+
+        if metadata_type is None:
+            # Note that this content is imported here to avoid circular dependencies
+            from .FundamentalTypes.Impl.CreateTypeFromAnnotation import CreateTypeFromAnnotation
+
+            metadata_type = CreateTypeFromAnnotation(
+                class_field.type,
+                has_default_value=class_field.default is not MISSING or class_field.default_factory is not MISSING,
+            )
+
+            cls.METADATA_TYPES[class_field.name] = metadata_type
+
+        return metadata_type
+
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def _TryToPython(
+        self,
+        value: Any,
+    ) -> Union[Any, InvalidValueMarker]:
+        if not isinstance(value, self.SUPPORTED_PYTHON_TYPES):  # pylint: disable=isinstance-second-argument-not-valid-type
+            return InvalidValueMarker.instance
+
+        return self._TryToPythonImpl(value)
+
+    # ----------------------------------------------------------------------
+    @extensionmethod
+    def _TryToPythonImpl(
+        self,
+        value: Any,
+    ) -> Union[Any, InvalidValueMarker]:
+        """Returns the python value or InvalidValueMarker.instance; types with validation logic should implement this without raising exceptions"""
+
+        try:
+            return self._ToPythonImpl(value)
+        except Exception:  # pylint: disable=broad-exception-caught
+            return InvalidValueMarker.instance
+
     # ----------------------------------------------------------------------
     @abstractmethod
     def _ToPythonImpl(
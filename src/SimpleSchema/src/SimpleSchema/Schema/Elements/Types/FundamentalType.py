@@ -24,7 +24,7 @@ from .BasicType import BasicType
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FundamentalType(BasicType):
     """Abstract base class for fundamental types"""
 
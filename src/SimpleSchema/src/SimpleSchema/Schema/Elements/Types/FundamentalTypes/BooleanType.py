@@ -22,7 +22,7 @@ from ..FundamentalType import FundamentalType
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BooleanType(FundamentalType):
     """A Boolean"""
 
@@ -17,17 +17,20 @@
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import ClassVar, Tuple, Type as PythonType
+from typing import Any, ClassVar, Tuple, Type as PythonType, Union
 
 from Common_Foundation.Types import overridemethod
 
 from ..FundamentalType import FundamentalType
+from ..Impl.InvalidValue import InvalidValueMarker
+
+from .Impl.FilesystemProbe import PathExists, PathIsDir, PathIsFile, Prefetch
 
 from .....Common import Errors
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DirectoryType(FundamentalType):
     """A directory"""
 
@@ -37,6 +40,15 @@ class DirectoryType(FundamentalType):
 
     ensure_exists: bool                     = field(default=True, kw_only=True)
 
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def PrefetchValues(
+        self,
+        values: list[Any],
+    ) -> None:
+        if self.ensure_exists:
+            Prefetch(value for value in values if isinstance(value, Path))
+
     # ----------------------------------------------------------------------
     # ----------------------------------------------------------------------
     # ----------------------------------------------------------------------
@@ -56,7 +68,18 @@ class DirectoryType(FundamentalType):
         self,
         value: Path,
     ) -> Path:
-        if self.ensure_exists and not value.is_dir():
+        if self.ensure_exists and not PathIsDir(value):
             raise Exception(Errors.directory_type_invalid_dir.format(value=value))
 
         return value
+
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def _TryToPythonImpl(
+        self,
+        value: Path,
+    ) -> Union[Path, InvalidValueMarker]:
+        if self.ensure_exists and not PathIsDir(value):
+            return InvalidValueMarker.instance
+
+        return value
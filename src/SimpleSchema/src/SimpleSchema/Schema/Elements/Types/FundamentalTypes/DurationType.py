@@ -23,7 +23,7 @@ from ..FundamentalType import FundamentalType
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DurationType(FundamentalType):
     """A duration"""
 
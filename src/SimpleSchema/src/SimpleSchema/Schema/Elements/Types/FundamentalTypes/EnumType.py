@@ -16,22 +16,32 @@
 """Contains the EnumType object"""
 
 import itertools
+import json
 
 from dataclasses import dataclass, field, InitVar
 from enum import Enum, EnumMeta
-from typing import Callable, cast, ClassVar, Optional, Tuple, Type as PythonType, Union
+from pathlib import Path
+from typing import Any, Callable, cast, ClassVar, Optional, Tuple, Type as PythonType, Union
+
+import yaml
 
 from Common_Foundation.Types import overridemethod
 
 from ..FundamentalType import FundamentalType
+from ..Impl.InvalidValue import InvalidValueMarker
 
 from .....Common import Errors
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EnumType(FundamentalType):
-    """An enum value"""
+    """\
+    An enum value.
+
+    The python `Enum` class is created when it is first requested, as creating the class is expensive
+    for enums with many values and many schemas are processed without ever converting values.
+    """
 
     # ----------------------------------------------------------------------
     NAME: ClassVar[str]                                                     = "Enum"
@@ -42,21 +52,46 @@ class EnumType(FundamentalType):
         list[str],
         list[Tuple[int, str]],
         list[Tuple[str, str]],
-    ]
+    ]                                                   = field(default_factory=list)
 
     starting_value: int                                 = 1
 
     enum_class_param: InitVar[Optional[EnumMeta]]       = None
 
-    EnumClass: EnumMeta                                 = field(init=False)
+    # JSON or YAML file that contains the values (in the same format as `values`); relative filenames
+    # are relative to the file that defines the type.
+    values_filename: Optional[str]                      = None
+
+    # Enum member values by enum member name (in the order in which they were defined)
+    _members: dict[str, Union[int, str]]                = field(init=False, repr=False, compare=False)
+
+    # Enum member names by enum member value; aliases (names whose value is shared with a member
+    # defined before it) are not included.
+    _names_by_value: dict[Any, str]                     = field(init=False, repr=False, compare=False)
+
+    _names: frozenset[str]                              = field(init=False, repr=False, compare=False)
+
+    _is_string_enum: bool                               = field(init=False, repr=False, compare=False)
+    _is_enum_class_provided: bool                       = field(init=False, repr=False, compare=False)
+    _enum_class: Optional[EnumMeta]                     = field(init=False, default=None, repr=False, compare=False)
 
     # ----------------------------------------------------------------------
     def __post_init__(
         self,
         enum_class_param: Optional[EnumMeta],
     ):
+        if self.values_filename is not None:
+            if self.values:
+                raise ValueError("Values and a values filename cannot both be provided.")
+
+            object.__setattr__(self, "values", self._LoadValues(self.values_filename))
+
+        members: dict[str, Union[int, str]] = {}
+        is_string_enum = False
+
         if enum_class_param is not None:
-            enum_class = enum_class_param
+            for enum in enum_class_param:   # type: ignore
+                members[enum.name] = enum.value  # type: ignore
         else:
             if not self.values:
                 raise ValueError("Values must be provided.")
@@ -75,22 +110,19 @@ class EnumType(FundamentalType):
                     return v[0]
 
                 # ----------------------------------------------------------------------
-                def CreateTupleEnumType(
+                def CreateTupleMembers(
                     value_to_enum_func: Callable[[Union[int, str]], str],
-                ) -> EnumMeta:
-                    return Enum(
-                        "EnumClass",
-                        {
-                            value_to_enum_func(value[0]): value[1]
-                            for value in cast(list[Tuple[Union[int, str], str]], self.values)
-                        },
-                        type=str,
-                    )
+                ) -> dict[str, Union[int, str]]:
+                    return {
+                        value_to_enum_func(value[0]): value[1]
+                        for value in cast(list[Tuple[Union[int, str], str]], self.values)
+                    }
 
                 # ----------------------------------------------------------------------
 
                 get_value_func = GetTupleValue
-                create_enum_type_func = CreateTupleEnumType
+                create_members_func = CreateTupleMembers
+                is_string_enum = True
 
             else:
                 # ----------------------------------------------------------------------
@@ -103,24 +135,21 @@ class EnumType(FundamentalType):
                     return v
 
                 # ----------------------------------------------------------------------
-                def CreateNonTupleEnumType(
+                def CreateNonTupleMembers(
                     value_to_enum_name_func: Callable[[Union[int, str]], str],
-                ) -> EnumMeta:
-                    return Enum(
-                        "EnumClass",
-                        {
-                            value_to_enum_name_func(value): int_value
-                            for value, int_value in zip(
-                                cast(list[Union[int, str]], self.values),
-                                itertools.count(self.starting_value),
-                            )
-                        },
-                    )
+                ) -> dict[str, Union[int, str]]:
+                    return {
+                        value_to_enum_name_func(value): int_value
+                        for value, int_value in zip(
+                            cast(list[Union[int, str]], self.values),
+                            itertools.count(self.starting_value),
+                        )
+                    }
 
                 # ----------------------------------------------------------------------
 
                 get_value_func = GetNonTupleValue
-                create_enum_type_func = CreateNonTupleEnumType
+                create_members_func = CreateNonTupleMembers
 
             if isinstance(get_value_func(0), int):
                 value_to_enum_name_func = "Value{}".format
@@ -141,39 +170,129 @@ class EnumType(FundamentalType):
                 if not isinstance(get_value_func(value_index), expected_type):
                     raise ValueError("{} was expected (index: {}).".format(expected_desc, value_index))
 
-            enum_class = create_enum_type_func(value_to_enum_name_func)
+            members = create_members_func(value_to_enum_name_func)
+
+        names_by_value: dict[Any, str] = {}
+
+        for name, value in members.items():
+            try:
+                names_by_value.setdefault(value, name)
+            except TypeError:
+                # Unhashable values (which may be used by provided enum classes) can't be compared
+                # to python values, so they don't need to be in the map.
+                pass
 
         # Commit
-        object.__setattr__(self, "EnumClass", enum_class)
+        object.__setattr__(self, "_members", members)
+        object.__setattr__(self, "_names_by_value", names_by_value)
+        object.__setattr__(self, "_names", frozenset(names_by_value.values()))
+        object.__setattr__(self, "_is_string_enum", is_string_enum)
+        object.__setattr__(self, "_is_enum_class_provided", enum_class_param is not None)
+        object.__setattr__(self, "_enum_class", enum_class_param)
 
     # ----------------------------------------------------------------------
+    @property
+    def EnumClass(self) -> EnumMeta:
+        if self._enum_class is None:
+            if self._is_string_enum:
+                enum_class = Enum("EnumClass", self._members, type=str)
+            else:
+                enum_class = Enum("EnumClass", self._members)
+
+            object.__setattr__(self, "_enum_class", enum_class)
+
+        assert self._enum_class is not None
+        return self._enum_class
+
     # ----------------------------------------------------------------------
+    @overridemethod
+    def _GetState(self) -> list[Any]:
+        # Enum classes created from values can't be pickled; they are created on demand when
+        # unpickled.
+        return [
+            None if field_name == "_enum_class" and not self._is_enum_class_provided else getattr(self, field_name)
+            for field_name in self.__class__._GetStateFieldNames()
+        ]
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _LoadValues(
+        self,
+        values_filename: str,
+    ) -> list[Union[int, str, Tuple[Union[int, str], str]]]:
+        filename = Path(values_filename)
+
+        if not filename.is_absolute():
+            filename = self.range.filename.parent / filename
+
+        if not filename.is_file():
+            raise ValueError("The values file '{}' does not exist.".format(filename))
+
+        with filename.open(encoding="utf-8") as f:
+            if filename.suffix.lower() == ".json":
+                content = json.load(f)
+            else:
+                content = yaml.load(f, Loader=_yaml_loader)  # nosec
+
+        if not isinstance(content, list):
+            raise ValueError("A list of values was expected in '{}'.".format(filename))
+
+        return [tuple(value) if isinstance(value, list) else value for value in content]
+
     # ----------------------------------------------------------------------
     @overridemethod
     def _ToPythonImpl(
         self,
         value: Union[Enum, str, int],
     ) -> EnumMeta:
-        if isinstance(value, Enum) and value in self.EnumClass:
-            return value                    # type: ignore
+        result = self._TryToPythonImpl(value)
+
+        if result is InvalidValueMarker.instance:
+            if isinstance(value, int):
+                value = "Value{}".format(value)
+
+            raise Exception(Errors.enum_type_invalid_value.format(value=value))
+
+        return result  # type: ignore
+
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def _TryToPythonImpl(
+        self,
+        value: Union[Enum, str, int],
+    ) -> Union[EnumMeta, InvalidValueMarker]:
+        if isinstance(value, Enum):
+            if value in self.EnumClass:
+                return value                # type: ignore
+
+            if not isinstance(value, (int, str)):
+                return InvalidValueMarker.instance
+
+            # Compare the int or string content of enums defined elsewhere
+            value = value.value
+
+        name: Optional[str] = None
 
         if isinstance(value, int):
             # Check by value
-            for enum in self.EnumClass:     # type: ignore
-                if enum.value == value:     # type: ignore
-                    return enum             # type: ignore
+            name = self._names_by_value.get(value, None)
 
-            value = "Value{}".format(value)
+            if name is None:
+                value = "Value{}".format(value)
 
-        if isinstance(value, str):
-            # Check by name
-            for enum in self.EnumClass:     # type: ignore
-                if enum.name == value:      # type: ignore
-                    return enum             # type: ignore
+        if name is None and isinstance(value, str):
+            # Check by name, then by value
+            if value in self._names:
+                name = value
+            else:
+                name = self._names_by_value.get(value, None)
 
-            # Check by value
-            for enum in self.EnumClass:     # type: ignore
-                if enum.value == value:     # type: ignore
-                    return enum             # type: ignore
+        if name is None:
+            return InvalidValueMarker.instance
+
+        return self.EnumClass[name]         # type: ignore
 
-        raise Exception(Errors.enum_type_invalid_value.format(value=value))
+
+# ----------------------------------------------------------------------
+_yaml_loader                                = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
@@ -17,17 +17,20 @@
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import ClassVar, Tuple, Type as PythonType
+from typing import Any, ClassVar, Tuple, Type as PythonType, Union
 
 from Common_Foundation.Types import overridemethod
 
 from ..FundamentalType import FundamentalType
+from ..Impl.InvalidValue import InvalidValueMarker
+
+from .Impl.FilesystemProbe import PathExists, PathIsDir, PathIsFile, Prefetch
 
 from .....Common import Errors
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FilenameType(FundamentalType):
     """A filename"""
 
@@ -43,6 +46,15 @@ class FilenameType(FundamentalType):
         if self.match_any and not self.ensure_exists:
             raise ValueError("'match_any' should only be set when 'ensure_exists' is set as well.")
 
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def PrefetchValues(
+        self,
+        values: list[Any],
+    ) -> None:
+        if self.ensure_exists:
+            Prefetch(value for value in values if isinstance(value, Path))
+
     # ----------------------------------------------------------------------
     # ----------------------------------------------------------------------
     # ----------------------------------------------------------------------
@@ -66,9 +78,23 @@ class FilenameType(FundamentalType):
         value: Path,
     ) -> Path:
         if self.ensure_exists:
-            if self.match_any and not value.exists():
+            if self.match_any and not PathExists(value):
                 raise Exception(Errors.filename_type_does_not_exist.format(value=value))
-            elif not self.match_any and not value.is_file():
+            elif not self.match_any and not PathIsFile(value):
                 raise Exception(Errors.filename_type_invalid_file.format(value=value))
 
         return value
+
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def _TryToPythonImpl(
+        self,
+        value: Path,
+    ) -> Union[Path, InvalidValueMarker]:
+        if self.ensure_exists:
+            if self.match_any and not PathExists(value):
+                return InvalidValueMarker.instance
+            elif not self.match_any and not PathIsFile(value):
+                return InvalidValueMarker.instance
+
+        return value
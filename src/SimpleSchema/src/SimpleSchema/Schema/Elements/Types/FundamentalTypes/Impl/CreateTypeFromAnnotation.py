@@ -43,6 +43,23 @@ def CreateTypeFromAnnotation(
     python_type_annotation: PythonType,
     *,
     has_default_value: bool,
+) -> ReferenceType:
+    # The types don't correspond to meaningful source locations (and their ranges are suppressed
+    # in exceptions), so they share the synthetic range.
+    with Range.SyntheticRanges():
+        return _CreateTypeFromAnnotationImpl(
+            python_type_annotation,
+            has_default_value=has_default_value,
+        )
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _CreateTypeFromAnnotationImpl(
+    python_type_annotation: PythonType,
+    *,
+    has_default_value: bool,
 ) -> ReferenceType:
     cardinality_min: int = 0 if has_default_value else 1
     cardinality_max: Optional[int] = 1
@@ -69,7 +86,7 @@ def CreateTypeFromAnnotation(
             basic_type = VariantType(
                 Range.CreateFromCode(),
                 [
-                    CreateTypeFromAnnotation(the_type, has_default_value=False)
+                    _CreateTypeFromAnnotationImpl(the_type, has_default_value=False)
                     for the_type in types
                 ],
             )
@@ -91,7 +108,7 @@ def CreateTypeFromAnnotation(
             basic_type = TupleType(
                 Range.CreateFromCode(),
                 [
-                    CreateTypeFromAnnotation(the_type, has_default_value=False)
+                    _CreateTypeFromAnnotationImpl(the_type, has_default_value=False)
                     for the_type in python_type_annotation.__args__
                 ],
             )
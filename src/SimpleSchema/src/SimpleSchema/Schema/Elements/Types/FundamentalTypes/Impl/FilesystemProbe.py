@@ -0,0 +1,340 @@
+# ----------------------------------------------------------------------
+# |
+# |  FilesystemProbe.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-17 09:26:41
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Contains the FilesystemProbe object and functions that use it when it is active"""
+
+import os
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Tuple, Union
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Types
+# |
+# ----------------------------------------------------------------------
+class FilesystemProbe(object):
+    """\
+    Answers questions about the existence of files and directories using information cached
+    during the probe's lifetime; the entries of a directory are read with a single `os.scandir`
+    call when the first path within that directory is checked.
+
+    The answers are the same as those of `Path.exists`, `Path.is_file` and `Path.is_dir` at the
+    time that the directory was read. Paths that are not found in a directory listing are checked
+    directly (and the result is cached) so that case-insensitive file systems produce the same
+    results.
+
+    Call `Invalidate` when the file system may have changed since the information was cached
+    (for example, in long-running processes that validate values more than once).
+    """
+
+    # ----------------------------------------------------------------------
+    DEFAULT_MAX_NUM_PREFETCH_THREADS        = 16
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        *,
+        max_num_prefetch_threads: Optional[int]=None,
+    ):
+        self.max_num_prefetch_threads       = max_num_prefetch_threads or self.__class__.DEFAULT_MAX_NUM_PREFETCH_THREADS
+
+        # Entries by directory; the value is None when the directory doesn't exist and
+        # _UNLISTABLE when it exists but can't be read.
+        self._directories: dict[str, Union[None, _UnlistableDirectory, dict[str, int]]]     = {}
+
+        # Results for paths that were checked directly
+        self._paths: dict[str, int]                                                         = {}
+
+    # ----------------------------------------------------------------------
+    def Exists(
+        self,
+        path: Path,
+    ) -> bool:
+        return self._GetKind(path) != _MISSING
+
+    # ----------------------------------------------------------------------
+    def IsFile(
+        self,
+        path: Path,
+    ) -> bool:
+        return self._GetKind(path) == _FILE
+
+    # ----------------------------------------------------------------------
+    def IsDir(
+        self,
+        path: Path,
+    ) -> bool:
+        return self._GetKind(path) == _DIRECTORY
+
+    # ----------------------------------------------------------------------
+    def Prefetch(
+        self,
+        paths: Iterable[Path],
+    ) -> None:
+        """Reads the directories that contain the paths, using multiple threads when there are multiple directories"""
+
+        directories: dict[str, None] = {}
+
+        for path in paths:
+            directory, name = _Split(os.fspath(path))
+
+            if name in _DIRECT_NAMES:
+                continue
+
+            if directory not in self._directories:
+                directories[directory] = None
+
+        if not directories:
+            return
+
+        if len(directories) == 1 or self.max_num_prefetch_threads == 1:
+            for directory in directories:
+                self._directories[directory] = _ScanDirectory(directory)
+
+            return
+
+        with ThreadPoolExecutor(max_workers=min(len(directories), self.max_num_prefetch_threads)) as executor:
+            for directory, entries in zip(directories, executor.map(_ScanDirectory, directories)):
+                self._directories[directory] = entries
+
+    # ----------------------------------------------------------------------
+    def Invalidate(
+        self,
+        path: Optional[Path]=None,
+    ) -> None:
+        """Removes cached information about the path and its parent directory (or all cached information if a path isn't provided)"""
+
+        if path is None:
+            self._directories.clear()
+            self._paths.clear()
+            return
+
+        path_str = os.fspath(path)
+
+        self._directories.pop(path_str, None)
+        self._directories.pop(_Split(path_str)[0], None)
+        self._paths.pop(path_str, None)
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    @contextmanager
+    def Activate(
+        cls,
+        probe: Optional["FilesystemProbe"]=None,
+    ) -> Iterator["FilesystemProbe"]:
+        """\
+        Makes the probe available to the types that check the file system (via the functions in
+        this module) on the current thread for the lifetime of the context. A new probe is created
+        if one isn't provided and a probe isn't already active.
+        """
+
+        previous_probe = getattr(_active_state, "probe", None)
+
+        if probe is None:
+            probe = previous_probe or cls()
+
+        _active_state.probe = probe
+        try:
+            yield probe
+        finally:
+            _active_state.probe = previous_probe
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _GetKind(
+        self,
+        path: Path,
+    ) -> int:
+        path_str = os.fspath(path)
+
+        kind = self._paths.get(path_str, None)
+        if kind is not None:
+            return kind
+
+        directory, name = _Split(path_str)
+
+        if name not in _DIRECT_NAMES:
+            entries = self._directories.get(directory, _NOT_READ)
+            if entries is _NOT_READ:
+                entries = _ScanDirectory(directory)
+                self._directories[directory] = entries
+
+            if entries is None:
+                return _MISSING
+
+            if isinstance(entries, dict):
+                kind = entries.get(name, None)
+                if kind is not None:
+                    return kind
+
+        kind = _GetKindDirectly(path_str)
+        self._paths[path_str] = kind
+
+        return kind
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Functions
+# |
+# ----------------------------------------------------------------------
+def GetActiveProbe() -> Optional[FilesystemProbe]:
+    return getattr(_active_state, "probe", None)
+
+
+# ----------------------------------------------------------------------
+def PathExists(
+    path: Path,
+) -> bool:
+    """Equivalent to `path.exists()`, but uses the active probe (if any)"""
+
+    probe = getattr(_active_state, "probe", None)
+    if probe is None:
+        return path.exists()
+
+    return probe.Exists(path)
+
+
+# ----------------------------------------------------------------------
+def PathIsFile(
+    path: Path,
+) -> bool:
+    """Equivalent to `path.is_file()`, but uses the active probe (if any)"""
+
+    probe = getattr(_active_state, "probe", None)
+    if probe is None:
+        return path.is_file()
+
+    return probe.IsFile(path)
+
+
+# ----------------------------------------------------------------------
+def PathIsDir(
+    path: Path,
+) -> bool:
+    """Equivalent to `path.is_dir()`, but uses the active probe (if any)"""
+
+    probe = getattr(_active_state, "probe", None)
+    if probe is None:
+        return path.is_dir()
+
+    return probe.IsDir(path)
+
+
+# ----------------------------------------------------------------------
+def Prefetch(
+    paths: Iterable[Path],
+) -> None:
+    """Prefetches the paths using the active probe (if any)"""
+
+    probe = getattr(_active_state, "probe", None)
+    if probe is not None:
+        probe.Prefetch(paths)
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Types
+# |
+# ----------------------------------------------------------------------
+class _UnlistableDirectory(object):
+    """Indicates that a directory exists but its entries can't be read (its paths are checked directly)"""
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Data
+# |
+# ----------------------------------------------------------------------
+_MISSING                                    = 0
+_FILE                                       = 1
+_DIRECTORY                                  = 2
+_OTHER                                      = 3             # Exists, but isn't a file or directory
+
+# Names that never appear in directory listings
+_DIRECT_NAMES                               = frozenset(["", ".", ".."])
+
+_UNLISTABLE                                 = _UnlistableDirectory()
+_NOT_READ                                   = object()
+
+_active_state                               = threading.local()
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Functions
+# |
+# ----------------------------------------------------------------------
+def _ScanDirectory(
+    directory: str,
+) -> Union[None, _UnlistableDirectory, dict[str, int]]:
+    entries: dict[str, int] = {}
+
+    try:
+        with os.scandir(directory) as iterator:
+            for entry in iterator:
+                # `is_dir` and `is_file` follow symbolic links, just like `Path.is_dir` and `Path.is_file`
+                if entry.is_dir():
+                    kind = _DIRECTORY
+                elif entry.is_file():
+                    kind = _FILE
+                elif entry.is_symlink():
+                    # Broken links don't exist, according to `Path.exists`
+                    kind = _GetKindDirectly(entry.path)
+                else:
+                    kind = _OTHER
+
+                entries[entry.name] = kind
+
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+    except OSError:
+        return _UNLISTABLE
+
+    return entries
+
+
+# ----------------------------------------------------------------------
+def _Split(
+    path: str,
+) -> Tuple[str, str]:
+    # Equivalent to `(os.fspath(Path(path).parent), Path(path).name)`, but without creating Paths
+    directory, name = os.path.split(path)
+
+    if not directory:
+        directory = "."
+
+    return directory, name
+
+
+# ----------------------------------------------------------------------
+def _GetKindDirectly(
+    path: str,
+) -> int:
+    if os.path.isdir(path):
+        return _DIRECTORY
+    if os.path.isfile(path):
+        return _FILE
+    if os.path.exists(path):
+        return _OTHER
+
+    return _MISSING
@@ -0,0 +1,231 @@
+# ----------------------------------------------------------------------
+# |
+# |  FilesystemProbe_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-17 10:48:12
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for FilesystemProbe.py"""
+
+import os
+import sys
+import threading
+
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent.parent.parent.parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from SimpleSchema.Schema.Elements.Types.FundamentalTypes.Impl import FilesystemProbe as FilesystemProbeModule
+    from SimpleSchema.Schema.Elements.Types.FundamentalTypes.Impl.FilesystemProbe import FilesystemProbe, GetActiveProbe, PathExists, PathIsDir, PathIsFile
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture
+def root(tmp_path):
+    (tmp_path / "dir").mkdir()
+    (tmp_path / "dir" / "file.txt").write_text("content")
+    (tmp_path / "dir" / "nested").mkdir()
+    (tmp_path / "file.txt").write_text("content")
+
+    if hasattr(os, "symlink"):
+        try:
+            (tmp_path / "link_to_file").symlink_to(tmp_path / "file.txt")
+            (tmp_path / "link_to_dir").symlink_to(tmp_path / "dir")
+            (tmp_path / "broken_link").symlink_to(tmp_path / "does_not_exist")
+        except OSError:
+            pass
+
+    return tmp_path
+
+
+# ----------------------------------------------------------------------
+def test_Conformance(root):
+    paths = [
+        root,
+        root / "dir",
+        root / "dir" / "file.txt",
+        root / "dir" / "nested",
+        root / "dir" / "does_not_exist",
+        root / "file.txt",
+        root / "file.txt" / "child",
+        root / "does_not_exist",
+        root / "does_not_exist" / "child",
+        root / "link_to_file",
+        root / "link_to_dir",
+        root / "link_to_dir" / "file.txt",
+        root / "broken_link",
+        root / "dir" / "..",
+        root / "dir" / ".." / "file.txt",
+        Path("/"),
+    ]
+
+    probe = FilesystemProbe()
+
+    for path in paths:
+        assert probe.Exists(path) == path.exists(), path
+        assert probe.IsFile(path) == path.is_file(), path
+        assert probe.IsDir(path) == path.is_dir(), path
+
+
+# ----------------------------------------------------------------------
+def test_SingleScanPerDirectory(root):
+    probe = FilesystemProbe()
+
+    with mock.patch.object(FilesystemProbeModule, "_ScanDirectory", wraps=FilesystemProbeModule._ScanDirectory) as scan_mock:  # pylint: disable=protected-access
+        assert probe.IsFile(root / "file.txt")
+        assert probe.IsDir(root / "dir")
+        assert probe.Exists(root / "link_to_file") == (root / "link_to_file").exists()
+
+        assert scan_mock.call_count == 1
+
+
+# ----------------------------------------------------------------------
+def test_Cached(root):
+    probe = FilesystemProbe()
+
+    filename = root / "new_file.txt"
+
+    assert probe.IsFile(filename) is False
+
+    filename.write_text("content")
+
+    # The cached information is used until it is invalidated
+    assert probe.IsFile(filename) is False
+
+    probe.Invalidate(filename)
+    assert probe.IsFile(filename) is True
+
+    filename.unlink()
+    assert probe.IsFile(filename) is True
+
+    probe.Invalidate()
+    assert probe.IsFile(filename) is False
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("max_num_prefetch_threads", [1, 4])
+def test_Prefetch(tmp_path, max_num_prefetch_threads):
+    paths: list[Path] = []
+
+    for dir_index in range(10):
+        dir_path = tmp_path / "dir{}".format(dir_index)
+        dir_path.mkdir()
+
+        for file_index in range(5):
+            filename = dir_path / "file{}".format(file_index)
+            filename.write_text("content")
+
+            paths.append(filename)
+
+        paths.append(dir_path / "does_not_exist")
+
+    probe = FilesystemProbe(max_num_prefetch_threads=max_num_prefetch_threads)
+
+    probe.Prefetch(paths)
+
+    with mock.patch.object(FilesystemProbeModule, "_ScanDirectory") as scan_mock:
+        for path in paths:
+            assert probe.IsFile(path) == path.is_file(), path
+
+        assert scan_mock.call_count == 0
+
+
+# ----------------------------------------------------------------------
+def test_Activate(root):
+    assert GetActiveProbe() is None
+
+    # No active probe
+    assert PathIsFile(root / "file.txt")
+    assert PathIsDir(root / "dir")
+    assert PathExists(root / "does_not_exist") is False
+
+    with FilesystemProbe.Activate() as probe:
+        assert GetActiveProbe() is probe
+
+        # Nested activations use the active probe
+        with FilesystemProbe.Activate() as nested_probe:
+            assert nested_probe is probe
+
+        # Unless a probe is provided
+        other_probe = FilesystemProbe()
+
+        with FilesystemProbe.Activate(other_probe) as nested_probe:
+            assert nested_probe is other_probe
+            assert GetActiveProbe() is other_probe
+
+        assert GetActiveProbe() is probe
+
+        assert PathIsFile(root / "file.txt")
+        assert PathIsDir(root / "dir")
+        assert PathExists(root / "does_not_exist") is False
+
+    assert GetActiveProbe() is None
+
+
+# ----------------------------------------------------------------------
+def test_ActivateMultipleThreads():
+    # Activations on different threads are independent, even when they end out of order
+    first_activated = threading.Event()
+    second_activated = threading.Event()
+    first_deactivated = threading.Event()
+
+    results: dict[str, bool] = {}
+
+    # ----------------------------------------------------------------------
+    def First():
+        with FilesystemProbe.Activate() as probe:
+            first_activated.set()
+            second_activated.wait()
+
+            results["first_active"] = GetActiveProbe() is probe
+
+        first_deactivated.set()
+
+    # ----------------------------------------------------------------------
+    def Second():
+        first_activated.wait()
+
+        results["second_initial"] = GetActiveProbe() is None
+
+        with FilesystemProbe.Activate() as probe:
+            second_activated.set()
+            first_deactivated.wait()
+
+            results["second_active"] = GetActiveProbe() is probe
+
+        results["second_final"] = GetActiveProbe() is None
+
+    # ----------------------------------------------------------------------
+
+    threads = [threading.Thread(target=First), threading.Thread(target=Second)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert results == {
+        "first_active": True,
+        "second_initial": True,
+        "second_active": True,
+        "second_final": True,
+    }
+
+    assert GetActiveProbe() is None
@@ -17,17 +17,18 @@
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import ClassVar, Optional, Tuple, Type as PythonType
+from typing import ClassVar, Optional, Tuple, Type as PythonType, Union
 
 from Common_Foundation.Types import overridemethod
 
 from ..FundamentalType import FundamentalType
+from ..Impl.InvalidValue import InvalidValueMarker
 
 from .....Common import Errors
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IntegerType(FundamentalType):
     """An integer"""
 
@@ -98,3 +99,14 @@ class IntegerType(FundamentalType):
             )
 
         return value
+
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def _TryToPythonImpl(
+        self,
+        value: int,
+    ) -> Union[int, InvalidValueMarker]:
+        if (self.min is not None and value < self.min) or (self.max is not None and value > self.max):
+            return InvalidValueMarker.instance
+
+        return value
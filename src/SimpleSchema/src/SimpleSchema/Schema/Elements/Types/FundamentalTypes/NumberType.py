@@ -22,12 +22,13 @@ from typing import ClassVar, Optional, Tuple, Type as PythonType, Union
 from Common_Foundation.Types import overridemethod
 
 from ..FundamentalType import FundamentalType
+from ..Impl.InvalidValue import InvalidValueMarker
 
 from .....Common import Errors
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NumberType(FundamentalType):
     """A number"""
 
@@ -100,3 +101,16 @@ class NumberType(FundamentalType):
             )
 
         return value
+
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def _TryToPythonImpl(
+        self,
+        value: Union[float, int],
+    ) -> Union[float, InvalidValueMarker]:
+        value = float(value)
+
+        if (self.min is not None and value < self.min) or (self.max is not None and value > self.max):
+            return InvalidValueMarker.instance
+
+        return value
@@ -0,0 +1,103 @@
+# ----------------------------------------------------------------------
+# |
+# |  EnumType_PerformanceTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-16 14:12:45
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Performance tests for EnumType.py"""
+
+import sys
+import time
+
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent.parent.parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from SimpleSchema.Common.Range import Range
+    from SimpleSchema.Schema.Elements.Types.FundamentalTypes.EnumType import EnumType
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("num_members", [10, 1000, 100000])
+def test_Members(num_members):
+    values = ["Member{}".format(index) for index in range(num_members)]
+
+    # The number of lookups is the same for all sizes so that the per-value times are comparable
+    num_lookups = 100000
+
+    names = [values[index % num_members] for index in range(num_lookups)]
+    ints = [index % num_members + 1 for index in range(num_lookups)]
+
+    # ----------------------------------------------------------------------
+    def Construct() -> EnumType:
+        return EnumType(_CreateRange(), values)
+
+    # ----------------------------------------------------------------------
+
+    sys.stdout.write("\n{:,} members\n".format(num_members))
+
+    _Measure("Construct", num_members, Construct)
+    _Measure("Construct (with class)", num_members, lambda: Construct().EnumClass)
+
+    et = Construct()
+
+    _Measure("Lookup by name", num_lookups, lambda: [et.ToPython(name) for name in names])
+    _Measure("Lookup by value", num_lookups, lambda: [et.ToPython(value) for value in ints])
+
+    assert et.ToPython(names[-1]) is et.EnumClass[names[-1]]
+    assert et.ToPython(ints[-1]).value == ints[-1]
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _CreateRange() -> Range:
+    return Range.Create(Path("synthetic.SimpleSchema"), 1, 1, 1, 10)
+
+
+# ----------------------------------------------------------------------
+def _Measure(
+    desc: str,
+    num_values: int,
+    func: Callable[[], Any],
+    num_iterations: int=3,
+) -> float:
+    best = None
+
+    for _ in range(num_iterations):
+        start = time.perf_counter()
+        func()
+        duration = time.perf_counter() - start
+
+        if best is None or duration < best:
+            best = duration
+
+    assert best is not None
+
+    sys.stdout.write(
+        "    {}: {:,} values in {:.4f}s ({:.2f} us per value)\n".format(
+            desc,
+            num_values,
+            best,
+            best / num_values * 1000000,
+        ),
+    )
+
+    return best
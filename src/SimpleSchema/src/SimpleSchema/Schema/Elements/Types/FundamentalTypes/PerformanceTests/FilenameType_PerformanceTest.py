@@ -0,0 +1,172 @@
+# ----------------------------------------------------------------------
+# |
+# |  FilenameType_PerformanceTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-17 13:05:27
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Performance tests for FilenameType.py"""
+
+import os
+import sys
+import time
+
+from pathlib import Path
+from typing import Any, Callable
+from unittest import mock
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent.parent.parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from SimpleSchema.Common.Range import Range
+    from SimpleSchema.Schema.Elements.Common.Cardinality import Cardinality
+    from SimpleSchema.Schema.Elements.Common.SimpleElement import SimpleElement
+    from SimpleSchema.Schema.Elements.Common.Visibility import Visibility
+    from SimpleSchema.Schema.Elements.Types.FundamentalTypes.FilenameType import FilenameType
+    from SimpleSchema.Schema.Elements.Types.FundamentalTypes.Impl.FilesystemProbe import FilesystemProbe
+    from SimpleSchema.Schema.Elements.Types.ReferenceType import ReferenceType
+
+
+# ----------------------------------------------------------------------
+NUM_DIRECTORIES                             = 100
+NUM_FILES_PER_DIRECTORY                     = 100
+
+# Latency added to each file system call to simulate a network file system
+SIMULATED_LATENCY_NUM_DIRECTORIES           = 20
+SIMULATED_LATENCY_NUM_FILES_PER_DIRECTORY   = 50
+SIMULATED_LATENCY                           = 0.0005
+
+
+# ----------------------------------------------------------------------
+def test_Manifest(tmp_path):
+    filenames = _CreateFiles(tmp_path, NUM_DIRECTORIES, NUM_FILES_PER_DIRECTORY)
+    _Execute(_CreateReference(), filenames)
+
+
+# ----------------------------------------------------------------------
+def test_ManifestWithSimulatedLatency(tmp_path):
+    filenames = _CreateFiles(tmp_path, SIMULATED_LATENCY_NUM_DIRECTORIES, SIMULATED_LATENCY_NUM_FILES_PER_DIRECTORY)
+    reference = _CreateReference()
+
+    original_stat = os.stat
+    original_scandir = os.scandir
+
+    # ----------------------------------------------------------------------
+    def Stat(*args, **kwargs):
+        time.sleep(SIMULATED_LATENCY)
+        return original_stat(*args, **kwargs)
+
+    # ----------------------------------------------------------------------
+    def ScanDir(*args, **kwargs):
+        time.sleep(SIMULATED_LATENCY)
+        return original_scandir(*args, **kwargs)
+
+    # ----------------------------------------------------------------------
+
+    sys.stdout.write("Simulated latency: {:.1f} ms per call\n".format(SIMULATED_LATENCY * 1000))
+
+    with (
+        mock.patch.object(os, "stat", Stat),
+        mock.patch.object(os, "scandir", ScanDir),
+    ):
+        _Execute(reference, filenames)
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _CreateFiles(
+    root: Path,
+    num_directories: int,
+    num_files_per_directory: int,
+) -> list[Path]:
+    filenames: list[Path] = []
+
+    for dir_index in range(num_directories):
+        dir_path = root / "dir{}".format(dir_index)
+        dir_path.mkdir()
+
+        for file_index in range(num_files_per_directory):
+            filename = dir_path / "file{}.txt".format(file_index)
+            filename.touch()
+
+            filenames.append(filename)
+
+    return filenames
+
+
+# ----------------------------------------------------------------------
+def _CreateReference() -> ReferenceType:
+    range_value = Range.Create(Path("synthetic.SimpleSchema"), 1, 1, 1, 10)
+
+    return ReferenceType.Create(
+        SimpleElement[Visibility](range_value, Visibility.Public),
+        SimpleElement[str](range_value, "Filenames"),
+        FilenameType(range_value),
+        Cardinality.CreateFromCode(0, None),
+        None,
+    )
+
+
+# ----------------------------------------------------------------------
+def _Execute(
+    reference: ReferenceType,
+    filenames: list[Path],
+) -> None:
+    # ----------------------------------------------------------------------
+    def WithProbe():
+        # A new probe for each run so that the directories are read every time
+        with FilesystemProbe.Activate(FilesystemProbe()):
+            return reference.ToPython(filenames)
+
+    # ----------------------------------------------------------------------
+
+    assert reference.ToPython(filenames) == WithProbe() == filenames
+
+    without_probe = _Measure("Without probe", len(filenames), lambda: reference.ToPython(filenames))
+    with_probe = _Measure("With probe", len(filenames), WithProbe)
+
+    sys.stdout.write("Speedup: {:.1f}x\n".format(without_probe / with_probe))
+
+
+# ----------------------------------------------------------------------
+def _Measure(
+    desc: str,
+    num_values: int,
+    func: Callable[[], Any],
+    num_iterations: int=3,
+) -> float:
+    best = None
+
+    for _ in range(num_iterations):
+        start = time.perf_counter()
+        func()
+        duration = time.perf_counter() - start
+
+        if best is None or duration < best:
+            best = duration
+
+    assert best is not None
+
+    sys.stdout.write(
+        "{}: {:,} values in {:.4f}s ({:.2f} us per value)\n".format(
+            desc,
+            num_values,
+            best,
+            best / num_values * 1000000,
+        ),
+    )
+
+    return best
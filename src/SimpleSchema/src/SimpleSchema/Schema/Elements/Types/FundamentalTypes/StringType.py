@@ -18,19 +18,18 @@
 import re
 
 from dataclasses import dataclass, field
-from typing import ClassVar, Optional, Pattern, Tuple, Type as PythonType
+from typing import ClassVar, Optional, Pattern, Tuple, Type as PythonType, Union
 
 from Common_Foundation.Types import overridemethod
 
-from Common_FoundationEx.InflectEx import inflect
-
 from ..FundamentalType import FundamentalType
+from ..Impl.InvalidValue import InvalidValueMarker
 
-from .....Common import Errors
+from .....Common import Errors, Inflect
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StringType(FundamentalType):
     """A String"""
 
@@ -66,6 +65,8 @@ class StringType(FundamentalType):
     @property
     @overridemethod
     def _display_type(self) -> str:
+        inflect = Inflect.Get()
+
         constraints: list[str] = []
 
         if self.min_length != 1:
@@ -91,6 +92,8 @@ class StringType(FundamentalType):
         num_chars = len(value)
 
         if num_chars < self.min_length:
+            inflect = Inflect.Get()
+
             raise Exception(
                 Errors.string_type_too_small.format(
                     value=inflect.no("character", self.min_length),
@@ -101,6 +104,8 @@ class StringType(FundamentalType):
             )
 
         if self.max_length is not None and num_chars > self.max_length:
+            inflect = Inflect.Get()
+
             raise Exception(
                 Errors.string_type_too_large.format(
                     value=inflect.no("character", self.max_length),
@@ -119,3 +124,20 @@ class StringType(FundamentalType):
             )
 
         return value
+
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def _TryToPythonImpl(
+        self,
+        value: str,
+    ) -> Union[str, InvalidValueMarker]:
+        num_chars = len(value)
+
+        if (
+            num_chars < self.min_length
+            or (self.max_length is not None and num_chars > self.max_length)
+            or (self._validation_regex is not None and not self._validation_regex.match(value))
+        ):
+            return InvalidValueMarker.instance
+
+        return value
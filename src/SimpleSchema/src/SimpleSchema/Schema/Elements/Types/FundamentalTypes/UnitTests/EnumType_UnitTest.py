@@ -15,6 +15,7 @@
 # ----------------------------------------------------------------------
 """Unit tests for EnumType.py"""
 
+import pickle
 import re
 import sys
 
@@ -31,6 +32,7 @@ from Common_Foundation import PathEx
 # ----------------------------------------------------------------------
 sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent.parent.parent.parent.parent)))
 with ExitStack(lambda: sys.path.pop(0)):
+    from SimpleSchema.Common.Range import Range
     from SimpleSchema.Schema.Elements.Types.FundamentalTypes.EnumType import EnumType
 
 
@@ -128,6 +130,117 @@ def test_StartingValue():
     assert et.ToPython("Value3").value == 103
 
 
+# ----------------------------------------------------------------------
+def test_LazyEnumClass():
+    et = EnumType(Mock(), ["One", "Two", "Three"])
+
+    assert et._enum_class is None  # pylint: disable=protected-access
+
+    # Invalid values don't require the class
+    assert not et.IsValid("Four")
+    assert not et.IsValid(4)
+
+    assert et._enum_class is None  # pylint: disable=protected-access
+
+    assert et.IsValid("Two")
+    assert et.IsValid(3)
+    assert et.ToPython("Two") is et.EnumClass.Two
+    assert et.EnumClass is et.EnumClass
+
+
+# ----------------------------------------------------------------------
+def test_Aliases():
+    et = EnumType(Mock(), [("One", "value"), ("Two", "value"), ("Three", "other")])
+
+    assert [e.name for e in et.EnumClass] == ["One", "Three"]
+
+    assert et.ToPython("value") is et.EnumClass.One
+    assert et.ToPython("Three") is et.EnumClass.Three
+
+    # Aliases are not matched by name
+    assert not et.IsValid("Two")
+
+
+# ----------------------------------------------------------------------
+def test_EnumFromElsewhere():
+    et = EnumType(Mock(), ["One", "Two", "Three"])
+    other = EnumType(Mock(), ["One", "Two", "Three"])
+
+    with pytest.raises(
+        Exception,
+        match=re.escape("'EnumClass.One' is not a valid enum value."),
+    ):
+        et.ToPython(other.EnumClass.One)
+
+
+# ----------------------------------------------------------------------
+def test_Pickle():
+    et = EnumType(Range.Create(Path("filename"), 1, 2, 3, 4), ["One", "Two", "Three"])
+
+    # The enum class has been created
+    assert et.ToPython("Two").value == 2
+
+    et2 = pickle.loads(pickle.dumps(et))
+
+    assert et2.values == et.values
+    assert et2.ToPython("Two").value == 2
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("extension, content", [
+    (".json", '[[1, "One"], [2, "Two"], [3, "Three"]]'),
+    (".yaml", "- [1, One]\n- [2, Two]\n- [3, Three]\n"),
+])
+def test_ValuesFilename(tmp_path, extension, content):
+    values_filename = tmp_path / "values{}".format(extension)
+
+    with values_filename.open("w") as f:
+        f.write(content)
+
+    expected_values = [(1, "One"), (2, "Two"), (3, "Three")]
+
+    # Absolute
+    et = EnumType(Mock(), values_filename=str(values_filename))
+
+    assert et.values == expected_values
+    assert et.ToPython("Two") is et.EnumClass.Value2
+
+    # Relative to the file that defines the type
+    et = EnumType(Range.Create(tmp_path / "filename.SimpleSchema", 1, 2, 3, 4), values_filename=values_filename.name)
+
+    assert et.values == expected_values
+    assert et.ToPython(3) is et.EnumClass.Value3
+
+
+# ----------------------------------------------------------------------
+def test_ErrorValuesAndValuesFilename():
+    with pytest.raises(
+        ValueError,
+        match=re.escape("Values and a values filename cannot both be provided."),
+    ):
+        EnumType(Mock(), [1, 2, 3], values_filename="values.json")
+
+
+# ----------------------------------------------------------------------
+def test_ErrorValuesFilename(tmp_path):
+    with pytest.raises(
+        ValueError,
+        match=re.escape("The values file '{}' does not exist.".format(tmp_path / "values.json")),
+    ):
+        EnumType(Mock(), values_filename=str(tmp_path / "values.json"))
+
+    values_filename = tmp_path / "values.yaml"
+
+    with values_filename.open("w") as f:
+        f.write("one: 1\n")
+
+    with pytest.raises(
+        ValueError,
+        match=re.escape("A list of values was expected in '{}'.".format(values_filename)),
+    ):
+        EnumType(Mock(), values_filename=str(values_filename))
+
+
 # ----------------------------------------------------------------------
 def test_ErrorNoValues():
     with pytest.raises(
@@ -19,6 +19,7 @@ import re
 import sys
 
 from pathlib import Path
+from unittest import mock
 from unittest.mock import MagicMock as Mock
 from uuid import uuid4
 
@@ -31,7 +32,12 @@ from Common_Foundation import PathEx
 # ----------------------------------------------------------------------
 sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent.parent.parent.parent.parent)))
 with ExitStack(lambda: sys.path.pop(0)):
+    from SimpleSchema.Schema.Elements.Common.Cardinality import Cardinality
+    from SimpleSchema.Schema.Elements.Common.SimpleElement import SimpleElement
+    from SimpleSchema.Schema.Elements.Common.Visibility import Visibility
     from SimpleSchema.Schema.Elements.Types.FundamentalTypes.FilenameType import FilenameType
+    from SimpleSchema.Schema.Elements.Types.FundamentalTypes.Impl.FilesystemProbe import FilesystemProbe
+    from SimpleSchema.Schema.Elements.Types.ReferenceType import ReferenceType
 
 
 # ----------------------------------------------------------------------
@@ -112,3 +118,50 @@ class TestToPython(object):
         assert filename_type.ToPython(self.valid_filename) == self.valid_filename
         assert filename_type.ToPython(self.invalid_filename) == self.invalid_filename
         assert filename_type.ToPython(self.valid_dir) == self.valid_dir
+
+
+# ----------------------------------------------------------------------
+def test_FilesystemProbe(tmp_path):
+    filename_type = FilenameType(Mock())
+    filename = tmp_path / "filename.txt"
+
+    with FilesystemProbe.Activate() as probe:
+        assert filename_type.IsValid(filename) is False
+
+        filename.write_text("content")
+
+        # The file system information is cached by the probe
+        assert filename_type.IsValid(filename) is False
+
+        probe.Invalidate(filename)
+        assert filename_type.ToPython(filename) == filename
+
+    # Without an active probe
+    filename.unlink()
+    assert filename_type.IsValid(filename) is False
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("use_compiled_validator", [False, True])
+def test_PrefetchContainer(tmp_path, use_compiled_validator):
+    filenames = [tmp_path / "file{}.txt".format(index) for index in range(5)]
+
+    for filename in filenames:
+        filename.write_text("content")
+
+    reference = ReferenceType.Create(
+        SimpleElement[Visibility](Mock(), Visibility.Public),
+        SimpleElement[str](Mock(), "Filenames"),
+        FilenameType(Mock()),
+        Cardinality.CreateFromCode(0, None),
+        None,
+    )
+
+    to_python_func = reference.GetCompiledValidator() if use_compiled_validator else reference.ToPython
+
+    with FilesystemProbe.Activate() as probe:
+        with mock.patch.object(probe, "Prefetch", wraps=probe.Prefetch) as prefetch_mock:
+            assert to_python_func(filenames) == filenames
+            assert reference.TryToPython(filenames) == filenames
+
+            assert prefetch_mock.call_count == 2
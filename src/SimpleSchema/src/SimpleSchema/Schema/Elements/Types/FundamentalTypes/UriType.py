@@ -24,6 +24,7 @@ from typing import ClassVar, Optional, Pattern, Tuple, Type as PythonType, Union
 from Common_Foundation.Types import overridemethod
 
 from ..FundamentalType import FundamentalType
+from ..Impl.InvalidValue import InvalidValueMarker
 
 from .....Common import Errors
 
@@ -101,7 +102,7 @@ class Uri(object):
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UriType(FundamentalType):
     """A uri"""
 
@@ -149,13 +150,26 @@ class UriType(FundamentalType):
         self,
         value: Union[str, Uri],
     ) -> Uri:
+        result = self._TryToPythonImpl(value)
+
+        if result is InvalidValueMarker.instance:
+            raise Exception(Errors.uri_type_invalid_value.format(value=value))
+
+        return result  # type: ignore
+
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def _TryToPythonImpl(
+        self,
+        value: Union[str, Uri],
+    ) -> Union[Uri, InvalidValueMarker]:
         if isinstance(value, Uri):
             return value
 
         match = self.__class__._VALIDATION_EXPRESSION.match(value)  # pylint: disable=protected-access
 
         if not match:
-            raise Exception(Errors.uri_type_invalid_value.format(value=value))
+            return InvalidValueMarker.instance
 
         authority: Optional[Uri.Authority] = None
 
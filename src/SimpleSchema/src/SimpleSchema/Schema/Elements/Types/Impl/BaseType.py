@@ -16,9 +16,8 @@
 """Contains the BaseType object"""
 
 from abc import abstractmethod
-from dataclasses import dataclass
-from functools import cached_property
-from typing import Any, ClassVar, Union
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Optional, Union
 
 from Common_Foundation.Types import DoesNotExist, extensionmethod
 
@@ -27,23 +26,31 @@ from ...Common.UniqueNameTrait import UniqueNameTrait
 
 from ...Expressions.Expression import Expression
 
+from .InvalidValue import InvalidValue, InvalidValueMarker
+
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BaseType(UniqueNameTrait, Element):
     """Abstract base class for BasicType and ComplexType"""
 
     # ----------------------------------------------------------------------
     NAME: ClassVar[str]                                 = DoesNotExist.instance  # type: ignore
 
+    _display_type_cache: Optional[str]                  = field(init=False, default=None, repr=False, compare=False)
+
     # ----------------------------------------------------------------------
     def __post_init__(self):
         assert self.NAME != DoesNotExist.instance, "Make sure to define the type's name."
 
     # ----------------------------------------------------------------------
-    @cached_property
+    @property
     def display_type(self) -> str:
-        return self._display_type
+        if self._display_type_cache is None:
+            object.__setattr__(self, "_display_type_cache", self._display_type)
+
+        assert self._display_type_cache is not None
+        return self._display_type_cache
 
     # ----------------------------------------------------------------------
     @abstractmethod
@@ -53,6 +60,52 @@ class BaseType(UniqueNameTrait, Element):
     ) -> Any:
         raise Exception("Abstract method")  # pragma: no cover
 
+    # ----------------------------------------------------------------------
+    def TryToPython(
+        self,
+        expression_or_value: Union[Expression, Any],
+    ) -> Union[Any, InvalidValue]:
+        """\
+        Returns the same value as `ToPython` when the value is valid and an InvalidValue when it is not;
+        python values are validated without raising (or creating) exceptions.
+        """
+
+        if isinstance(expression_or_value, Expression):
+            try:
+                return self.ToPython(expression_or_value)
+            except Exception:  # pylint: disable=broad-exception-caught
+                return InvalidValue(self, expression_or_value)
+
+        result = self._TryToPython(expression_or_value)
+
+        if result is InvalidValueMarker.instance:
+            return InvalidValue(self, expression_or_value)
+
+        return result
+
+    # ----------------------------------------------------------------------
+    def IsValid(
+        self,
+        expression_or_value: Union[Expression, Any],
+    ) -> bool:
+        """Returns True if `ToPython` would succeed for the value"""
+
+        return not isinstance(self.TryToPython(expression_or_value), InvalidValue)
+
+    # ----------------------------------------------------------------------
+    @extensionmethod
+    def PrefetchValues(
+        self,
+        values: list[Any],
+    ) -> None:
+        """\
+        Called before the items in a list are converted; types may use this to prepare for the
+        conversions (for example, by reading information from the file system in parallel).
+        """
+
+        # Nothing to do by default
+        return
+
     # ----------------------------------------------------------------------
     # ----------------------------------------------------------------------
     # ----------------------------------------------------------------------
@@ -60,3 +113,16 @@ class BaseType(UniqueNameTrait, Element):
     @extensionmethod
     def _display_type(self) -> str:
         return self.__class__.NAME
+
+    # ----------------------------------------------------------------------
+    @extensionmethod
+    def _TryToPython(
+        self,
+        value: Any,
+    ) -> Union[Any, InvalidValueMarker]:
+        """Returns the python value or InvalidValueMarker.instance; derived types should implement this without raising exceptions"""
+
+        try:
+            return self.ToPython(value)
+        except Exception:  # pylint: disable=broad-exception-caught
+            return InvalidValueMarker.instance
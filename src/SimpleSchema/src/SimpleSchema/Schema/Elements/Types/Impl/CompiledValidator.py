@@ -0,0 +1,587 @@
+# ----------------------------------------------------------------------
+# |
+# |  CompiledValidator.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-12 10:21:37
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Contains the CompiledValidator object"""
+
+from collections.abc import Mapping
+from typing import Any, Callable, Iterable, Optional, TYPE_CHECKING
+
+from Common_Foundation.Types import DoesNotExist
+
+from .ItemTable import ItemTable
+
+from ..BasicType import BasicType
+from ..FundamentalType import FundamentalType
+from ..FundamentalTypes.IntegerType import IntegerType
+from ..FundamentalTypes.NumberType import NumberType
+from ..FundamentalTypes.StringType import StringType
+from ..StructureType import StructureType
+from ..TupleType import TupleType
+from ..VariantType import VariantType
+
+if TYPE_CHECKING:
+    from ..ReferenceType import ReferenceType  # pragma: no cover
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Types
+# |
+# ----------------------------------------------------------------------
+class CompiledValidator(object):
+    """\
+    Validates and converts python values using functions specialized for a resolved ReferenceType;
+    the results are the same as those produced by `ReferenceType.ToPython`.
+
+    The specialized functions only implement the checks required to accept valid values. When a
+    check fails, the value is processed by `ReferenceType.ToPython` so that the exception (and its
+    error message and ranges) is the same as it would have been without the validator.
+
+    Values must be python values; expressions are processed by `ReferenceType.ToPython`. Values read
+    from JSON or YAML documents should be processed by `FromDocument` first.
+    """
+
+    __slots__ = ("reference", "func", "_document_func")
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        reference: "ReferenceType",
+    ):
+        self.reference                      = reference
+
+        # Function that raises an exception (of any type) when the value isn't valid
+        self.func: ValidateFuncType         = _CreateReferenceFunc(reference)
+
+        # Created on demand by `FromDocument`
+        self._document_func: Optional[ValidateFuncType]     = None
+
+    # ----------------------------------------------------------------------
+    def __call__(
+        self,
+        value: Any,
+    ) -> Any:
+        try:
+            return self.func(value)
+        except Exception:  # pylint: disable=broad-exception-caught
+            pass
+
+        return self.reference.ToPython(value)
+
+    # ----------------------------------------------------------------------
+    def FromDocument(
+        self,
+        value: Any,
+    ) -> Any:
+        """\
+        Returns the value with lists converted to tuples where the reference (or its descendants)
+        expects tuples; JSON and YAML documents don't have tuples, so they are represented as lists.
+        The result is validated in the same way as any other python value.
+        """
+
+        if self._document_func is None:
+            self._document_func = _CreateDocumentReferenceFunc(self.reference)
+
+        return self._document_func(value)
+
+
+# ----------------------------------------------------------------------
+ValidateFuncType                            = Callable[[Any], Any]
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Functions
+# |
+# ----------------------------------------------------------------------
+def ContainsTuples(
+    types: Iterable[Any],
+) -> bool:
+    """Returns True if any of the types (or their descendants) are tuples"""
+
+    # Note that this content is imported here to avoid circular dependencies
+    from ..ReferenceType import ReferenceType
+
+    visited: set[int] = set()
+
+    # ----------------------------------------------------------------------
+    def Impl(
+        the_type: Any,
+    ) -> bool:
+        while isinstance(the_type, ReferenceType):
+            the_type = the_type.type
+
+        if isinstance(the_type, TupleType):
+            return True
+
+        if isinstance(the_type, VariantType):
+            return any(Impl(sub_type) for sub_type in the_type.types)
+
+        if isinstance(the_type, StructureType):
+            # Structures may be recursive
+            if id(the_type.structure) in visited:
+                return False
+
+            visited.add(id(the_type.structure))
+
+            return any(Impl(item.reference) for item in the_type.structure.GetItemTable().items)
+
+        return False
+
+    # ----------------------------------------------------------------------
+
+    return any(Impl(the_type) for the_type in types)
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Types
+# |
+# ----------------------------------------------------------------------
+class _ValidationError(Exception):
+    """Raised by the specialized functions when a value isn't valid"""
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Functions
+# |
+# ----------------------------------------------------------------------
+def _CreateFunc(
+    the_type: Any,
+) -> ValidateFuncType:
+    # Note that this content is imported here to avoid circular dependencies
+    from ..ReferenceType import ReferenceType
+
+    if isinstance(the_type, ReferenceType):
+        return the_type.GetCompiledValidator().func
+
+    if isinstance(the_type, VariantType):
+        return _CreateVariantFunc(the_type)
+
+    assert isinstance(the_type, BasicType), the_type
+    return _CreateBasicFunc(the_type)
+
+
+# ----------------------------------------------------------------------
+def _CreateReferenceFunc(
+    reference: "ReferenceType",
+) -> ValidateFuncType:
+    # Equivalent to `ReferenceType.ToPython`
+    if reference.cardinality.is_optional:
+        type_func = _CreateFunc(reference.type)
+
+        # ----------------------------------------------------------------------
+        def OptionalReference(value):
+            if value is None:
+                return None
+
+            return type_func(value)
+
+        # ----------------------------------------------------------------------
+
+        return OptionalReference
+
+    with reference.Resolve() as resolved_type:
+        impl_func = _CreateReferenceImplFunc(resolved_type)
+
+        if isinstance(resolved_type.type, VariantType) and resolved_type.type.has_child_cardinality:
+            # Equivalent to `VariantType.ToPythonReferenceOverride`
+            variant_func = _CreateVariantFunc(resolved_type.type)
+
+            # ----------------------------------------------------------------------
+            def VariantImpl(value):
+                try:
+                    return variant_func(value)
+                except Exception:  # pylint: disable=broad-exception-caught
+                    pass
+
+                return impl_func(value)
+
+            # ----------------------------------------------------------------------
+
+            body_func = VariantImpl
+        else:
+            body_func = impl_func
+
+    # ----------------------------------------------------------------------
+    def Reference(value):
+        if value is None:
+            raise _ValidationError()
+
+        return body_func(value)
+
+    # ----------------------------------------------------------------------
+
+    return Reference
+
+
+# ----------------------------------------------------------------------
+def _CreateReferenceImplFunc(
+    reference: "ReferenceType",
+) -> ValidateFuncType:
+    # Equivalent to `ReferenceType.ToPythonImpl` (which includes `Cardinality.Validate`)
+    cardinality = reference.cardinality
+    type_func = _CreateFunc(reference.type)
+
+    if cardinality.is_container:
+        min_items = cardinality.min.value
+        max_items = cardinality.max.value if cardinality.max is not None else None
+
+        prefetch_func = reference.type.PrefetchValues
+
+        # ----------------------------------------------------------------------
+        def Container(value):
+            if not isinstance(value, list):
+                raise _ValidationError()
+
+            num_items = len(value)
+
+            if num_items < min_items or (max_items is not None and num_items > max_items):
+                raise _ValidationError()
+
+            prefetch_func(value)
+            return [type_func(item) for item in value]
+
+        # ----------------------------------------------------------------------
+
+        return Container
+
+    if cardinality.is_optional:
+        # ----------------------------------------------------------------------
+        def Optional(value):
+            if isinstance(value, list):
+                return [type_func(item) for item in value]
+
+            return type_func(value)
+
+        # ----------------------------------------------------------------------
+
+        return Optional
+
+    # ----------------------------------------------------------------------
+    def Single(value):
+        if isinstance(value, list):
+            raise _ValidationError()
+
+        return type_func(value)
+
+    # ----------------------------------------------------------------------
+
+    return Single
+
+
+# ----------------------------------------------------------------------
+def _CreateVariantFunc(
+    variant_type: VariantType,
+) -> ValidateFuncType:
+    # Equivalent to `VariantType.ToPython`
+    type_funcs = [_CreateFunc(sub_type) for sub_type in variant_type.types]
+
+    type_funcs_by_python_type: dict[type, list[ValidateFuncType]] = {}
+
+    # ----------------------------------------------------------------------
+    def Variant(value):
+        python_type = type(value)
+
+        candidate_funcs = type_funcs_by_python_type.get(python_type, None)
+        if candidate_funcs is None:
+            if python_type is value.__class__:
+                candidate_funcs = [type_funcs[index] for index in variant_type.GetCandidateIndexes(python_type)]
+                type_funcs_by_python_type[python_type] = candidate_funcs
+            else:
+                candidate_funcs = type_funcs
+
+        for type_func in candidate_funcs:
+            try:
+                return type_func(value)
+            except Exception:  # pylint: disable=broad-exception-caught
+                pass
+
+        raise _ValidationError()
+
+    # ----------------------------------------------------------------------
+
+    return Variant
+
+
+# ----------------------------------------------------------------------
+# The following functions create functions that convert values read from JSON or YAML documents (see
+# `CompiledValidator.FromDocument`); values that can't be converted are returned as-is, as they will
+# be rejected by the validation that follows.
+
+# ----------------------------------------------------------------------
+def _CreateDocumentFunc(
+    the_type: Any,
+) -> ValidateFuncType:
+    # Note that this content is imported here to avoid circular dependencies
+    from ..ReferenceType import ReferenceType
+
+    if isinstance(the_type, ReferenceType):
+        # Created when first invoked, as structures may be recursive
+        return lambda value: the_type.GetCompiledValidator().FromDocument(value)
+
+    if isinstance(the_type, VariantType):
+        return _CreateDocumentVariantFunc(the_type)
+
+    if isinstance(the_type, TupleType):
+        type_funcs = [_CreateDocumentFunc(child_type) for child_type in the_type.types]
+        num_types = len(type_funcs)
+
+        # ----------------------------------------------------------------------
+        def DocumentTuple(value):
+            if not isinstance(value, (list, tuple)):
+                return value
+
+            if len(value) != num_types:
+                return tuple(value)
+
+            return tuple(type_func(item) for type_func, item in zip(type_funcs, value))
+
+        # ----------------------------------------------------------------------
+
+        return DocumentTuple
+
+    if isinstance(the_type, StructureType):
+        structure = the_type.structure
+
+        return lambda value: structure.GetItemTable().FromDocument(value)
+
+    return _DocumentIdentity
+
+
+# ----------------------------------------------------------------------
+def _CreateDocumentReferenceFunc(
+    reference: "ReferenceType",
+) -> ValidateFuncType:
+    if reference.category == reference.Category.Alias and not isinstance(reference.type, BasicType):
+        # The alias has the same cardinality as the type that it references
+        return _CreateDocumentFunc(reference.type)
+
+    type_func = _CreateDocumentFunc(reference.type)
+
+    if type_func is _DocumentIdentity:
+        return type_func
+
+    if reference.cardinality.is_container:
+        # ----------------------------------------------------------------------
+        def DocumentContainer(value):
+            if not isinstance(value, list):
+                return value
+
+            return [type_func(item) for item in value]
+
+        # ----------------------------------------------------------------------
+
+        return DocumentContainer
+
+    return type_func
+
+
+# ----------------------------------------------------------------------
+def _CreateDocumentVariantFunc(
+    variant_type: VariantType,
+) -> ValidateFuncType:
+    if not ContainsTuples([variant_type]):
+        return _DocumentIdentity
+
+    type_infos = [(sub_type, _CreateDocumentFunc(sub_type)) for sub_type in variant_type.types]
+
+    # ----------------------------------------------------------------------
+    def DocumentVariant(value):
+        # Only lists and mappings (which may contain lists) are converted
+        if not isinstance(value, (list, Mapping)):
+            return value
+
+        # The value may be a tuple for one type and a list for another, so use the conversion
+        # associated with the first type that accepts the converted value (which is the type that
+        # will be selected during validation).
+        for sub_type, type_func in type_infos:
+            result = type_func(value)
+
+            if sub_type.IsValid(result):
+                return result
+
+        return value
+
+    # ----------------------------------------------------------------------
+
+    return DocumentVariant
+
+
+# ----------------------------------------------------------------------
+def _DocumentIdentity(
+    value: Any,
+) -> Any:
+    return value
+
+
+# ----------------------------------------------------------------------
+def _CreateBasicFunc(
+    basic_type: BasicType,
+) -> ValidateFuncType:
+    # Equivalent to `BasicType.ToPython` and the type's `_ToPythonImpl`
+    supported_python_types = basic_type.SUPPORTED_PYTHON_TYPES
+
+    if isinstance(basic_type, IntegerType):
+        min_value = basic_type.min
+        max_value = basic_type.max
+
+        # ----------------------------------------------------------------------
+        def Integer(value):
+            if (
+                not isinstance(value, supported_python_types)
+                or (min_value is not None and value < min_value)
+                or (max_value is not None and value > max_value)
+            ):
+                raise _ValidationError()
+
+            return value
+
+        # ----------------------------------------------------------------------
+
+        return Integer
+
+    if isinstance(basic_type, NumberType):
+        min_value = basic_type.min
+        max_value = basic_type.max
+
+        # ----------------------------------------------------------------------
+        def Number(value):
+            if not isinstance(value, supported_python_types):
+                raise _ValidationError()
+
+            value = float(value)
+
+            if (min_value is not None and value < min_value) or (max_value is not None and value > max_value):
+                raise _ValidationError()
+
+            return value
+
+        # ----------------------------------------------------------------------
+
+        return Number
+
+    if isinstance(basic_type, StringType):
+        min_length = basic_type.min_length
+        max_length = basic_type.max_length
+        validation_regex = basic_type._validation_regex  # pylint: disable=protected-access
+
+        # ----------------------------------------------------------------------
+        def String(value):
+            if not isinstance(value, supported_python_types):
+                raise _ValidationError()
+
+            num_chars = len(value)
+
+            if (
+                num_chars < min_length
+                or (max_length is not None and num_chars > max_length)
+                or (validation_regex is not None and not validation_regex.match(value))
+            ):
+                raise _ValidationError()
+
+            return value
+
+        # ----------------------------------------------------------------------
+
+        return String
+
+    if isinstance(basic_type, TupleType):
+        type_funcs = [_CreateFunc(child_type) for child_type in basic_type.types]
+        num_types = len(type_funcs)
+
+        # ----------------------------------------------------------------------
+        def Tuple(value):
+            if not isinstance(value, tuple) or len(value) != num_types:
+                raise _ValidationError()
+
+            return tuple(type_func(item) for type_func, item in zip(type_funcs, value))
+
+        # ----------------------------------------------------------------------
+
+        return Tuple
+
+    if isinstance(basic_type, StructureType):
+        # Equivalent to `ItemTable.ToPython`
+        structure = basic_type.structure
+        does_not_exist = DoesNotExist.instance
+
+        # The item functions are created when first invoked, as structures may be recursive
+        item_infos: Optional[list[tuple[str, ValidateFuncType, ItemTable.Item]]] = None
+
+        # ----------------------------------------------------------------------
+        def Structure(value):
+            nonlocal item_infos
+
+            if not isinstance(value, supported_python_types):
+                raise _ValidationError()
+
+            if item_infos is None:
+                item_infos = [
+                    (item.name, item.reference.GetCompiledValidator().func, item)
+                    for item in structure.GetItemTable().items
+                ]
+
+            results = {}
+            num_found = 0
+
+            for item_name, item_func, item in item_infos:
+                item_value = value.get(item_name, does_not_exist)
+
+                if item_value is does_not_exist:
+                    if item.is_required:
+                        raise _ValidationError()
+
+                    results[item_name] = item.GetMissingValue()
+                    continue
+
+                num_found += 1
+                results[item_name] = item_func(item_value)
+
+            if num_found != len(value):
+                raise _ValidationError()
+
+            return results
+
+        # ----------------------------------------------------------------------
+
+        return Structure
+
+    if type(basic_type)._ToPythonImpl is FundamentalType._ToPythonImpl:  # pylint: disable=protected-access
+        # The type doesn't have any custom conversion logic
+        # ----------------------------------------------------------------------
+        def Fundamental(value):
+            if not isinstance(value, supported_python_types):
+                raise _ValidationError()
+
+            return value
+
+        # ----------------------------------------------------------------------
+
+        return Fundamental
+
+    to_python_impl_func = basic_type._ToPythonImpl  # pylint: disable=protected-access
+
+    # ----------------------------------------------------------------------
+    def Basic(value):
+        if not isinstance(value, supported_python_types):
+            raise _ValidationError()
+
+        return to_python_impl_func(value)
+
+    # ----------------------------------------------------------------------
+
+    return Basic
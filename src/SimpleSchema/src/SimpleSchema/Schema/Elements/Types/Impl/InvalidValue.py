@@ -0,0 +1,76 @@
+# ----------------------------------------------------------------------
+# |
+# |  InvalidValue.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-16 08:03:29
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Contains the InvalidValue and InvalidValueMarker objects"""
+
+from typing import Any, ClassVar, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .BaseType import BaseType  # pragma: no cover
+
+
+# ----------------------------------------------------------------------
+class InvalidValue(object):
+    """\
+    Returned by `TryToPython` when a value isn't valid.
+
+    The error message is the message of the exception that `ToPython` raises for the value; it is
+    created when first requested.
+    """
+
+    __slots__ = ("type", "value", "_message")
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        the_type: "BaseType",
+        value: Any,
+    ):
+        self.type                           = the_type
+        self.value                          = value
+
+        self._message: Optional[str]        = None
+
+    # ----------------------------------------------------------------------
+    def __bool__(self) -> bool:
+        return False
+
+    # ----------------------------------------------------------------------
+    @property
+    def message(self) -> str:
+        if self._message is None:
+            try:
+                self.type.ToPython(self.value)
+                assert False, self.value  # pragma: no cover
+
+            except Exception as ex:  # pylint: disable=broad-exception-caught
+                self._message = str(ex)
+
+        assert self._message is not None
+        return self._message
+
+
+# ----------------------------------------------------------------------
+class InvalidValueMarker(object):
+    """\
+    Returned by the `_TryToPython` methods when a value isn't valid (these methods are invoked
+    recursively and don't create InvalidValue objects, as they aren't needed unless returned to the
+    caller).
+    """
+
+    instance: ClassVar["InvalidValueMarker"]
+
+
+InvalidValueMarker.instance = InvalidValueMarker()
@@ -0,0 +1,240 @@
+# ----------------------------------------------------------------------
+# |
+# |  ItemTable.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-13 09:42:18
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Contains the ItemTable object"""
+
+from typing import Any, Iterable, Mapping, Optional, TYPE_CHECKING, Union
+
+from Common_Foundation.Types import DoesNotExist
+
+from .InvalidValue import InvalidValueMarker
+
+from ...Statements.ItemStatement import ItemStatement
+from ...Statements.Statement import Statement
+
+from .....Common import Errors
+
+if TYPE_CHECKING:
+    from ..ReferenceType import ReferenceType  # pragma: no cover
+
+
+# ----------------------------------------------------------------------
+class ItemTable(object):
+    """\
+    Information about the items within a structure (or root) that is precomputed so that the
+    validation of a python mapping is linear in the size of the mapping.
+    """
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Types
+    # |
+    # ----------------------------------------------------------------------
+    class Item(object):
+        """Information about a single item"""
+
+        __slots__ = ("name", "reference", "default_value", "missing_value", "is_required")
+
+        # ----------------------------------------------------------------------
+        def __init__(
+            self,
+            name: str,
+            reference: "ReferenceType",
+        ):
+            default_value: Union[DoesNotExist, Any] = DoesNotExist.instance
+
+            if reference.is_metadata_resolved:
+                # Note that this content is imported here to avoid circular dependencies
+                from ....MetadataAttributes.ElementAttributes import DefaultMetadataAttribute
+
+                default_element = reference.resolved_metadata.get(DefaultMetadataAttribute.name, None)
+                if default_element is not None:
+                    default_value = default_element.value
+
+            cardinality = reference.cardinality
+
+            if not isinstance(default_value, DoesNotExist):
+                missing_value = default_value
+            elif cardinality.is_optional:
+                missing_value = None
+            elif cardinality.is_container and cardinality.min.value == 0:
+                missing_value = []
+            else:
+                missing_value = DoesNotExist.instance
+
+            self.name                       = name
+            self.reference                  = reference
+            self.default_value              = default_value
+
+            # Value used when the item isn't provided (or DoesNotExist when the item is required)
+            self.missing_value              = missing_value
+
+            self.is_required                = isinstance(missing_value, DoesNotExist)
+
+        # ----------------------------------------------------------------------
+        def GetMissingValue(self) -> Any:
+            """Returns the value used when the item isn't provided"""
+
+            assert not self.is_required
+
+            # Containers are returned as new lists so that callers can modify the results
+            if isinstance(self.missing_value, list):
+                return list(self.missing_value)
+
+            return self.missing_value
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    @classmethod
+    def Create(
+        cls,
+        statements: Iterable[Statement],
+        base_types: Iterable["ReferenceType"]=(),
+    ) -> "ItemTable":
+        # Note that this content is imported here to avoid circular dependencies
+        from ..StructureType import StructureType
+
+        items: dict[str, ItemTable.Item] = {}
+
+        for base_type in base_types:
+            with base_type.Resolve() as resolved_base_type:
+                # Fundamental base types don't contribute items
+                if not isinstance(resolved_base_type.type, StructureType):
+                    continue
+
+                for item in resolved_base_type.type.structure.GetItemTable().items:
+                    items[item.name] = item
+
+        for statement in statements:
+            if not isinstance(statement, ItemStatement) or statement.is_disabled:
+                continue
+
+            items[statement.name.value] = cls.Item(statement.name.value, statement.type)
+
+        return cls(list(items.values()))
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        items: list[Item],
+    ):
+        self.items                          = items
+        self.names                          = frozenset(item.name for item in items)
+
+        # Calculated on demand by `FromDocument`
+        self._contains_tuples: Optional[bool]           = None
+
+    # ----------------------------------------------------------------------
+    def FromDocument(
+        self,
+        value: Any,
+    ) -> Any:
+        """\
+        Returns the mapping with lists converted to tuples where the items expect tuples (see
+        `CompiledValidator.FromDocument`); the mapping is returned as-is when none of the items
+        contain tuples.
+        """
+
+        if self._contains_tuples is None:
+            # Note that this content is imported here to avoid circular dependencies
+            from .CompiledValidator import ContainsTuples
+
+            self._contains_tuples = ContainsTuples(item.reference for item in self.items)
+
+        if not self._contains_tuples or not isinstance(value, Mapping):
+            return value
+
+        results = dict(value)
+
+        for item in self.items:
+            item_value = results.get(item.name, DoesNotExist.instance)
+            if isinstance(item_value, DoesNotExist):
+                continue
+
+            results[item.name] = item.reference.GetCompiledValidator().FromDocument(item_value)
+
+        return results
+
+    # ----------------------------------------------------------------------
+    def ToPython(
+        self,
+        value: Mapping[str, Any],
+        *,
+        use_compiled_validators: bool=False,
+    ) -> dict[str, Any]:
+        """Validates the mapping and returns a dictionary of python values (where defaults have been applied)"""
+
+        results: dict[str, Any] = {}
+        num_found = 0
+
+        for item in self.items:
+            item_value = value.get(item.name, DoesNotExist.instance)
+
+            if isinstance(item_value, DoesNotExist):
+                if item.is_required:
+                    raise Exception(Errors.structure_type_missing_item.format(name=item.name))
+
+                results[item.name] = item.GetMissingValue()
+                continue
+
+            num_found += 1
+
+            if use_compiled_validators:
+                results[item.name] = item.reference.GetCompiledValidator()(item_value)
+            else:
+                results[item.name] = item.reference.ToPython(item_value)
+
+        if num_found != len(value):
+            for key in value:
+                if key not in self.names:
+                    raise Exception(Errors.structure_type_unexpected_item.format(name=key))
+
+        return results
+
+    # ----------------------------------------------------------------------
+    def _TryToPython(
+        self,
+        value: Mapping[str, Any],
+    ) -> Union[dict[str, Any], InvalidValueMarker]:
+        """Returns the same results as `ToPython` when the mapping is valid and InvalidValueMarker.instance when it is not (without raising exceptions)"""
+
+        results: dict[str, Any] = {}
+        num_found = 0
+
+        for item in self.items:
+            item_value = value.get(item.name, DoesNotExist.instance)
+
+            if isinstance(item_value, DoesNotExist):
+                if item.is_required:
+                    return InvalidValueMarker.instance
+
+                results[item.name] = item.GetMissingValue()
+                continue
+
+            num_found += 1
+
+            item_result = item.reference._TryToPython(item_value)  # pylint: disable=protected-access
+            if item_result is InvalidValueMarker.instance:
+                return InvalidValueMarker.instance
+
+            results[item.name] = item_result
+
+        if num_found != len(value):
+            return InvalidValueMarker.instance
+
+        return results
@@ -0,0 +1,136 @@
+# ----------------------------------------------------------------------
+# |
+# |  BasicType_PerformanceTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-17 15:40:06
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Performance tests for BasicType.py"""
+
+import sys
+import time
+
+from pathlib import Path
+from typing import cast
+from unittest import mock
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+from Common_Foundation.Streams.DoneManager import DoneManager
+from Common_Foundation.TestHelpers.StreamTestHelpers import GenerateDoneManagerAndSink
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent.parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from SimpleSchema.Schema.Elements.Statements.RootStatement import RootStatement
+    from SimpleSchema.Schema.Elements.Types.BasicType import BasicType
+    from SimpleSchema.Schema.Parse.ANTLR.Parse import Parse
+    from SimpleSchema.Schema.Parse.TypeResolver.Resolve import Resolve
+
+
+# ----------------------------------------------------------------------
+NUM_STRUCTURES                              = 10
+NUM_ITEMS_PER_STRUCTURE                     = 20
+
+
+# ----------------------------------------------------------------------
+def test_Metadata(tmp_path):
+    # Every item carries metadata that is converted when the type is created
+    types = [
+        "String { min_length: 2, max_length: 100 }",
+        "Integer { min: 0, max: 100 }",
+        "Number { min: 0.0, max: 1.0 }",
+    ]
+
+    content: list[str] = []
+
+    for structure_index in range(NUM_STRUCTURES):
+        content.append("Structure{} ->\n".format(structure_index))
+
+        for item_index in range(NUM_ITEMS_PER_STRUCTURE):
+            content.append("    item{}: {}\n".format(item_index, types[item_index % len(types)]))
+
+        content.append("\n")
+
+    content_str = "".join(content)
+
+    num_items = NUM_STRUCTURES * NUM_ITEMS_PER_STRUCTURE
+
+    original_get_metadata_type = BasicType._GetMetadataType.__func__  # type: ignore  # pylint: disable=protected-access
+
+    # ----------------------------------------------------------------------
+    def GetMetadataTypeUncached(cls, class_field):
+        cls.METADATA_TYPES.clear()
+        return original_get_metadata_type(cls, class_field)
+
+    # ----------------------------------------------------------------------
+
+    with mock.patch.object(BasicType, "_GetMetadataType", classmethod(GetMetadataTypeUncached)):
+        uncached = _Measure("Uncached", num_items, tmp_path, content_str)
+
+    cached = _Measure("Cached", num_items, tmp_path, content_str)
+
+    sys.stdout.write("Speedup: {:.1f}x\n".format(uncached / cached))
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _Measure(
+    desc: str,
+    num_items: int,
+    workspace: Path,
+    content: str,
+    num_iterations: int=2,
+) -> float:
+    relative_path = Path("Metadata.SimpleSchema")
+
+    best = None
+
+    for _ in range(num_iterations):
+        dm_and_sink = iter(GenerateDoneManagerAndSink())
+        dm = cast(DoneManager, next(dm_and_sink))
+
+        results = Parse(
+            dm,
+            {
+                workspace: {
+                    relative_path: lambda: content,
+                },
+            },
+            single_threaded=True,
+        )
+
+        roots = cast(dict[Path, RootStatement], results[workspace])
+
+        # Types are created (and their metadata converted) during resolution
+        start = time.perf_counter()
+        assert Resolve(dm, roots, single_threaded=True) is None
+        duration = time.perf_counter() - start
+
+        assert dm.result == 0, next(dm_and_sink)
+
+        if best is None or duration < best:
+            best = duration
+
+    assert best is not None
+
+    sys.stdout.write(
+        "{}: {:,} items resolved in {:.4f}s ({:.2f} us per item)\n".format(
+            desc,
+            num_items,
+            best,
+            best / num_items * 1000000,
+        ),
+    )
+
+    return best
@@ -0,0 +1,215 @@
+# ----------------------------------------------------------------------
+# |
+# |  ReferenceType_PerformanceTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-12 11:02:48
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Performance tests for ReferenceType.py"""
+
+import sys
+import time
+
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent.parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from SimpleSchema.Common.Range import Range
+    from SimpleSchema.Schema.Elements.Common.Cardinality import Cardinality
+    from SimpleSchema.Schema.Elements.Common.SimpleElement import SimpleElement
+    from SimpleSchema.Schema.Elements.Common.Visibility import Visibility
+    from SimpleSchema.Schema.Elements.Expressions.IntegerExpression import IntegerExpression
+    from SimpleSchema.Schema.Elements.Types.BasicType import BasicType
+    from SimpleSchema.Schema.Elements.Types.FundamentalTypes.BooleanType import BooleanType
+    from SimpleSchema.Schema.Elements.Types.FundamentalTypes.IntegerType import IntegerType
+    from SimpleSchema.Schema.Elements.Types.FundamentalTypes.NumberType import NumberType
+    from SimpleSchema.Schema.Elements.Types.FundamentalTypes.StringType import StringType
+    from SimpleSchema.Schema.Elements.Types.ReferenceType import ReferenceType
+    from SimpleSchema.Schema.Elements.Types.TupleType import TupleType
+
+
+# ----------------------------------------------------------------------
+NUM_LISTS                                   = 200
+NUM_RECORDS_PER_LIST                        = 100
+
+NUM_MOSTLY_INVALID_RECORDS                  = 20000
+
+
+# ----------------------------------------------------------------------
+def test_Conformance():
+    reference = _CreateNestedRecordsReference()
+    value = _CreateNestedRecords(10, 10)
+
+    assert reference.GetCompiledValidator()(value) == reference.ToPython(value)
+
+
+# ----------------------------------------------------------------------
+def test_NestedRecords():
+    reference = _CreateNestedRecordsReference()
+    value = _CreateNestedRecords(NUM_LISTS, NUM_RECORDS_PER_LIST)
+
+    num_values = NUM_LISTS * NUM_RECORDS_PER_LIST
+
+    interpreted = _Measure("Interpreted", num_values, lambda: reference.ToPython(value))
+
+    # Include the time to compile the validator (which happens once per type)
+    start = time.perf_counter()
+    validator = reference.GetCompiledValidator()
+    sys.stdout.write("Compile: {:.4f}s\n".format(time.perf_counter() - start))
+
+    compiled = _Measure("Compiled", num_values, lambda: validator(value))
+
+    sys.stdout.write("Speedup: {:.1f}x\n".format(interpreted / compiled))
+
+
+# ----------------------------------------------------------------------
+def test_MostlyInvalid():
+    # 9 out of every 10 records have an invalid id
+    reference = _CreateRecordReference()
+
+    records = [
+        (-record_index if record_index % 10 else record_index, "Record{}".format(record_index), record_index / 2, True)
+        for record_index in range(NUM_MOSTLY_INVALID_RECORDS)
+    ]
+
+    # ----------------------------------------------------------------------
+    def WithExceptions() -> int:
+        num_valid = 0
+
+        for record in records:
+            try:
+                reference.ToPython(record)
+                num_valid += 1
+            except Exception:  # pylint: disable=broad-exception-caught
+                pass
+
+        return num_valid
+
+    # ----------------------------------------------------------------------
+    def WithoutExceptions() -> int:
+        return sum(1 for record in records if reference.IsValid(record))
+
+    # ----------------------------------------------------------------------
+
+    assert WithExceptions() == WithoutExceptions() == NUM_MOSTLY_INVALID_RECORDS // 10
+
+    with_exceptions = _Measure("ToPython", NUM_MOSTLY_INVALID_RECORDS, WithExceptions)
+    without_exceptions = _Measure("IsValid", NUM_MOSTLY_INVALID_RECORDS, WithoutExceptions)
+
+    sys.stdout.write("Speedup: {:.1f}x\n".format(with_exceptions / without_exceptions))
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _CreateRange() -> Range:
+    return Range.Create(Path("synthetic.SimpleSchema"), 1, 1, 1, 10)
+
+
+# ----------------------------------------------------------------------
+def _CreateReference(
+    name: str,
+    the_type: Union[BasicType, ReferenceType],
+    cardinality: Optional[Cardinality]=None,
+) -> ReferenceType:
+    range_value = _CreateRange()
+
+    return ReferenceType.Create(
+        SimpleElement[Visibility](range_value, Visibility.Public),
+        SimpleElement[str](range_value, name),
+        the_type,
+        cardinality or Cardinality(range_value, None, None),
+        None,
+    )
+
+
+# ----------------------------------------------------------------------
+def _CreateRecordReference() -> ReferenceType:
+    # <Integer {>= 0}, String, Number, Boolean>
+    return _CreateReference(
+        "Record",
+        TupleType(
+            _CreateRange(),
+            [
+                _CreateReference("id", IntegerType(_CreateRange(), min=0)),
+                _CreateReference("name", StringType(_CreateRange())),
+                _CreateReference("value", NumberType(_CreateRange())),
+                _CreateReference("enabled", BooleanType(_CreateRange())),
+            ],
+        ),
+    )
+
+
+# ----------------------------------------------------------------------
+def _CreateNestedRecordsReference() -> ReferenceType:
+    # <Integer {>= 0}, String, Number, Boolean>[*][*]
+    records = _CreateReference(
+        "Records",
+        _CreateRecordReference(),
+        Cardinality(_CreateRange(), IntegerExpression(_CreateRange(), 0), None),
+    )
+
+    return _CreateReference(
+        "NestedRecords",
+        records,
+        Cardinality(_CreateRange(), IntegerExpression(_CreateRange(), 0), None),
+    )
+
+
+# ----------------------------------------------------------------------
+def _CreateNestedRecords(
+    num_lists: int,
+    num_records_per_list: int,
+) -> list[list[tuple[int, str, float, bool]]]:
+    return [
+        [
+            (record_index, "Record{}".format(record_index), record_index / 2, bool(record_index % 2))
+            for record_index in range(num_records_per_list)
+        ]
+        for _ in range(num_lists)
+    ]
+
+
+# ----------------------------------------------------------------------
+def _Measure(
+    desc: str,
+    num_values: int,
+    func: Callable[[], Any],
+    num_iterations: int=3,
+) -> float:
+    best = None
+
+    for _ in range(num_iterations):
+        start = time.perf_counter()
+        func()
+        duration = time.perf_counter() - start
+
+        if best is None or duration < best:
+            best = duration
+
+    assert best is not None
+
+    sys.stdout.write(
+        "{}: {:,} values in {:.4f}s ({:,.0f} values per second)\n".format(
+            desc,
+            num_values,
+            best,
+            num_values / best,
+        ),
+    )
+
+    return best
@@ -0,0 +1,167 @@
+# ----------------------------------------------------------------------
+# |
+# |  VariantType_PerformanceTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-15 08:47:12
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Performance tests for VariantType.py"""
+
+import sys
+import time
+
+from datetime import date, datetime, time as datetime_time, timedelta
+from pathlib import Path
+from typing import Any, Callable
+from uuid import uuid4
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent.parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from SimpleSchema.Common.Range import Range
+    from SimpleSchema.Schema.Elements.Common.Cardinality import Cardinality
+    from SimpleSchema.Schema.Elements.Common.SimpleElement import SimpleElement
+    from SimpleSchema.Schema.Elements.Common.Visibility import Visibility
+    from SimpleSchema.Schema.Elements.Types.BasicType import BasicType
+    from SimpleSchema.Schema.Elements.Types.FundamentalTypes.BooleanType import BooleanType
+    from SimpleSchema.Schema.Elements.Types.FundamentalTypes.DateTimeType import DateTimeType
+    from SimpleSchema.Schema.Elements.Types.FundamentalTypes.DateType import DateType
+    from SimpleSchema.Schema.Elements.Types.FundamentalTypes.DurationType import DurationType
+    from SimpleSchema.Schema.Elements.Types.FundamentalTypes.GuidType import GuidType
+    from SimpleSchema.Schema.Elements.Types.FundamentalTypes.IntegerType import IntegerType
+    from SimpleSchema.Schema.Elements.Types.FundamentalTypes.NumberType import NumberType
+    from SimpleSchema.Schema.Elements.Types.FundamentalTypes.StringType import StringType
+    from SimpleSchema.Schema.Elements.Types.FundamentalTypes.TimeType import TimeType
+    from SimpleSchema.Schema.Elements.Types.ReferenceType import ReferenceType
+    from SimpleSchema.Schema.Elements.Types.VariantType import VariantType
+
+
+# ----------------------------------------------------------------------
+NUM_VALUES                                  = 20000
+
+
+# ----------------------------------------------------------------------
+def test_WideVariant():
+    # (Guid | Date | Time | DateTime | Duration | Boolean | Integer | Number | String)
+    variant = VariantType(
+        _CreateRange(),
+        [
+            _CreateReference(GuidType(_CreateRange())),
+            _CreateReference(DateType(_CreateRange())),
+            _CreateReference(TimeType(_CreateRange())),
+            _CreateReference(DateTimeType(_CreateRange())),
+            _CreateReference(DurationType(_CreateRange())),
+            _CreateReference(BooleanType(_CreateRange())),
+            _CreateReference(IntegerType(_CreateRange())),
+            _CreateReference(NumberType(_CreateRange())),
+            _CreateReference(StringType(_CreateRange())),
+        ],
+    )
+
+    values: list[Any] = [
+        "String{}".format(index) if index % 4 == 0 else
+        index if index % 4 == 1 else
+        index / 2 if index % 4 == 2 else
+        uuid4()
+        for index in range(NUM_VALUES)
+    ]
+
+    values += [date.today(), datetime_time(), datetime.now(), timedelta(), True]
+
+    _Measure("Wide variant", len(values), lambda: [variant.ToPython(value) for value in values])
+
+    reference = _CreateReference(variant)
+    validator = reference.GetCompiledValidator()
+
+    _Measure("Wide variant (compiled)", len(values), lambda: [validator(value) for value in values])
+
+
+# ----------------------------------------------------------------------
+def test_Errors():
+    # Errors are common when a variant is within another variant, but the messages are rarely read
+    variant = VariantType(
+        _CreateRange(),
+        [
+            _CreateReference(BooleanType(_CreateRange())),
+            _CreateReference(IntegerType(_CreateRange())),
+            _CreateReference(StringType(_CreateRange())),
+        ],
+    )
+
+    # ----------------------------------------------------------------------
+    def Execute():
+        for index in range(NUM_VALUES):
+            try:
+                variant.ToPython(index / 2)
+                assert False  # pragma: no cover
+            except Exception:  # pylint: disable=broad-exception-caught
+                pass
+
+    # ----------------------------------------------------------------------
+
+    _Measure("Errors", NUM_VALUES, Execute)
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _CreateRange() -> Range:
+    return Range.Create(Path("synthetic.SimpleSchema"), 1, 1, 1, 10)
+
+
+# ----------------------------------------------------------------------
+def _CreateReference(
+    the_type: BasicType,
+) -> ReferenceType:
+    range_value = _CreateRange()
+
+    return ReferenceType.Create(
+        SimpleElement[Visibility](range_value, Visibility.Public),
+        SimpleElement[str](range_value, "Type"),
+        the_type,
+        Cardinality.CreateFromCode(),
+        None,
+    )
+
+
+# ----------------------------------------------------------------------
+def _Measure(
+    desc: str,
+    num_values: int,
+    func: Callable[[], Any],
+    num_iterations: int=3,
+) -> float:
+    best = None
+
+    for _ in range(num_iterations):
+        start = time.perf_counter()
+        func()
+        duration = time.perf_counter() - start
+
+        if best is None or duration < best:
+            best = duration
+
+    assert best is not None
+
+    sys.stdout.write(
+        "{}: {:,} values in {:.4f}s ({:,.0f} values per second)\n".format(
+            desc,
+            num_values,
+            best,
+            num_values / best,
+        ),
+    )
+
+    return best
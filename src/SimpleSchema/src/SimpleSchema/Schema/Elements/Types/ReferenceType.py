@@ -19,7 +19,7 @@ from contextlib import contextmanager
 from dataclasses import dataclass, field, InitVar
 from enum import auto, Enum
 from types import NoneType
-from typing import Any, cast, ClassVar, Iterator, Optional, Union
+from typing import Any, cast, ClassVar, Iterator, Optional, Union, TYPE_CHECKING
 from weakref import ref, ReferenceType as WeakReferenceType
 
 from Common_Foundation.Types import overridemethod
@@ -27,6 +27,7 @@ from Common_Foundation.Types import overridemethod
 from .BasicType import BasicType
 
 from .Impl.BaseType import BaseType
+from .Impl.InvalidValue import InvalidValueMarker
 
 from ..Common.Cardinality import Cardinality
 from ..Common.Element import Element
@@ -45,9 +46,12 @@ from ....Common import Errors
 from ....Common.Range import Range
 from ....Common.SimpleSchemaException import SimpleSchemaException
 
+if TYPE_CHECKING:
+    from .Impl.CompiledValidator import CompiledValidator  # pragma: no cover
+
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReferenceType(VisibilityTrait, BaseType):
     """A type that references another type, but adds specific cardinality and/or metadata"""
 
@@ -89,6 +93,9 @@ class ReferenceType(VisibilityTrait, BaseType):
     # Valid after `ResolvedIsShared` is called
     _is_shared: Optional[bool]              = field(init=False, default=None)
 
+    # Created on demand by `GetCompiledValidator`
+    _compiled_validator: Optional["CompiledValidator"]  = field(init=False, default=None, repr=False, compare=False)
+
     is_source: InitVar[bool]                = field(kw_only=True, default=False)
 
     # Indicate that is reference's range should not be added in the exceptions range stack.
@@ -257,7 +264,9 @@ class ReferenceType(VisibilityTrait, BaseType):
             raise
 
         except Exception as ex:
-            raise SimpleSchemaException(self.range, str(ex)) from ex
+            # Create the message when it is read, as it may be expensive to create and exceptions
+            # are often discarded (for example, when trying the types within a variant).
+            raise SimpleSchemaException(self.range, ex.__str__) from ex
 
     # ----------------------------------------------------------------------
     @overridemethod
@@ -284,6 +293,42 @@ class ReferenceType(VisibilityTrait, BaseType):
 
             return resolved_type.ToPythonImpl(expression_or_value)
 
+    # ----------------------------------------------------------------------
+    def GetCompiledValidator(self) -> "CompiledValidator":
+        """\
+        Returns a validator that produces the same results as `ToPython` for python values, but is
+        specialized for this type and its descendants; the validator is created once per instance.
+        """
+
+        if self._compiled_validator is None:
+            # Note that this content is imported here to avoid circular dependencies
+            from .Impl.CompiledValidator import CompiledValidator
+
+            object.__setattr__(self, "_compiled_validator", CompiledValidator(self))
+
+        assert self._compiled_validator is not None
+        return self._compiled_validator
+
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def PrefetchValues(
+        self,
+        values: list[Any],
+    ) -> None:
+        # The items of containers are lists, which are prefetched when they are converted
+        if not self.cardinality.is_container:
+            self.type.PrefetchValues(values)
+
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def _GetState(self) -> list[Any]:
+        # Compiled validators are made up of functions that can't be pickled; they are created on
+        # demand when unpickled.
+        return [
+            None if field_name == "_compiled_validator" else getattr(self, field_name)
+            for field_name in self.__class__._GetStateFieldNames()
+        ]
+
     # ----------------------------------------------------------------------
     def ToPythonImpl(
         self,
@@ -303,10 +348,39 @@ class ReferenceType(VisibilityTrait, BaseType):
             items = expression_or_value
 
         if items is not None:
+            self.type.PrefetchValues(items)
             return [self.type.ToPython(item) for item in items]
 
         return self.type.ToPython(expression_or_value)
 
+    # ----------------------------------------------------------------------
+    def TryToPythonImpl(
+        self,
+        value: Any,
+    ) -> Union[Any, InvalidValueMarker]:
+        """Equivalent to `ToPythonImpl` for python values, but returns InvalidValueMarker.instance rather than raising an exception"""
+
+        assert value is not None
+
+        if not self.cardinality.IsValid(value):
+            return InvalidValueMarker.instance
+
+        if isinstance(value, list):
+            self.type.PrefetchValues(value)
+
+            items: list[Any] = []
+
+            for item in value:
+                item_result = self.type._TryToPython(item)  # pylint: disable=protected-access
+                if item_result is InvalidValueMarker.instance:
+                    return InvalidValueMarker.instance
+
+                items.append(item_result)
+
+            return items
+
+        return self.type._TryToPython(value)  # pylint: disable=protected-access
+
     # ----------------------------------------------------------------------
     # ----------------------------------------------------------------------
     # ----------------------------------------------------------------------
@@ -335,3 +409,37 @@ class ReferenceType(VisibilityTrait, BaseType):
             yield "metadata", self._metadata
 
         yield "type", cast(WeakReferenceType[Element], ref(self.type))
+
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def _GenerateFingerprintItems(self) -> Element._GenerateFingerprintItemsGeneratorType:
+        yield from super(ReferenceType, self)._GenerateFingerprintItems()
+
+        # Includes the resolved metadata values once the metadata has been resolved
+        yield "metadata", self._metadata
+
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def _TryToPython(
+        self,
+        value: Any,
+    ) -> Union[Any, InvalidValueMarker]:
+        # Equivalent to `ToPython`
+        if value is None:
+            return None if self.cardinality.is_optional else InvalidValueMarker.instance
+
+        if self.cardinality.is_optional:
+            return self.type._TryToPython(value)  # pylint: disable=protected-access
+
+        # Equivalent to `Resolve`, without the overhead of the context manager (there aren't any
+        # exceptions to decorate)
+        resolved_type = self
+
+        while resolved_type.category == ReferenceType.Category.Alias and not isinstance(resolved_type.type, BasicType):
+            assert isinstance(resolved_type.type, ReferenceType), resolved_type.type
+            resolved_type = resolved_type.type
+
+        if isinstance(resolved_type.type, VariantType):
+            return resolved_type.type.TryToPythonReferenceOverride(resolved_type, value)
+
+        return resolved_type.TryToPythonImpl(value)
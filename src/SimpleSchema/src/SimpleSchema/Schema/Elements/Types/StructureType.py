@@ -15,12 +15,14 @@
 # ----------------------------------------------------------------------
 """Contains the StructureType object"""
 
+from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import Any, ClassVar, Tuple, Type as PythonType
+from typing import Any, ClassVar, Tuple, Type as PythonType, Union
 
 from Common_Foundation.Types import overridemethod
 
 from .BasicType import BasicType
+from .Impl.InvalidValue import InvalidValueMarker
 
 from ..Common.Element import Element
 
@@ -28,13 +30,13 @@ from ..Statements.StructureStatement import StructureStatement
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StructureType(BasicType):
     """Type based on a StructureStatement"""
 
     # ----------------------------------------------------------------------
     NAME: ClassVar[str]                                                     = "Structure"
-    SUPPORTED_PYTHON_TYPES: ClassVar[Tuple[PythonType, ...]]                = (object, )
+    SUPPORTED_PYTHON_TYPES: ClassVar[Tuple[PythonType, ...]]                = (Mapping, )
 
     structure: StructureStatement
 
@@ -54,6 +56,14 @@ class StructureType(BasicType):
     @overridemethod
     def _ToPythonImpl(
         self,
-        value: Any,  # pylint: disable=unused-argument
-    ) -> Any:
-        raise Exception("This method should never be called for StructureType instances.")
+        value: Mapping[str, Any],
+    ) -> dict[str, Any]:
+        return self.structure.GetItemTable().ToPython(value)
+
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def _TryToPythonImpl(
+        self,
+        value: Mapping[str, Any],
+    ) -> Union[dict[str, Any], InvalidValueMarker]:
+        return self.structure.GetItemTable()._TryToPython(value)  # pylint: disable=protected-access
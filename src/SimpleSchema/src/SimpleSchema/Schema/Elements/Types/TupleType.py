@@ -18,22 +18,21 @@
 import itertools
 
 from dataclasses import dataclass
-from typing import Any, cast, ClassVar, Tuple, Type as PythonType
+from typing import Any, cast, ClassVar, Tuple, Type as PythonType, Union
 
 from Common_Foundation.Types import DoesNotExist, overridemethod
 
-from Common_FoundationEx.InflectEx import inflect
-
 from .BasicType import BasicType
+from .Impl.InvalidValue import InvalidValueMarker
 from .ReferenceType import ReferenceType
 
 from ..Common.Element import Element
 
-from ....Common import Errors
+from ....Common import Errors, Inflect
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TupleType(BasicType):
     """A list of types"""
 
@@ -87,6 +86,8 @@ class TupleType(BasicType):
             fillvalue=DoesNotExist.instance,
         ):
             if isinstance(child_type, DoesNotExist) or isinstance(child_expression_or_value, DoesNotExist):
+                inflect = Inflect.Get()
+
                 raise Exception(
                     Errors.tuple_type_item_mismatch.format(
                         value=inflect.no("tuple item", len(self.types)),
@@ -99,3 +100,23 @@ class TupleType(BasicType):
             tuple_items.append(child_type.ToPython(child_expression_or_value))
 
         return tuple(tuple_items)
+
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def _TryToPythonImpl(
+        self,
+        value: Tuple[Any, ...],
+    ) -> Union[Tuple[Any, ...], InvalidValueMarker]:
+        if len(value) != len(self.types):
+            return InvalidValueMarker.instance
+
+        tuple_items: list[Any] = []
+
+        for child_type, child_value in zip(self.types, value):
+            child_result = child_type._TryToPython(child_value)  # pylint: disable=protected-access
+            if child_result is InvalidValueMarker.instance:
+                return InvalidValueMarker.instance
+
+            tuple_items.append(child_result)
+
+        return tuple(tuple_items)
@@ -48,11 +48,20 @@ with ExitStack(lambda: sys.path.pop(0)):
     from SimpleSchema.Schema.Elements.Expressions.NoneExpression import NoneExpression
     from SimpleSchema.Schema.Elements.Expressions.StringExpression import StringExpression
 
+    from SimpleSchema.Schema.Elements.Statements.ItemStatement import ItemStatement
+    from SimpleSchema.Schema.Elements.Statements.StructureStatement import StructureStatement
+
     from SimpleSchema.Schema.Elements.Types.BasicType import BasicType
+    from SimpleSchema.Schema.Elements.Types.FundamentalTypes.BooleanType import BooleanType
+    from SimpleSchema.Schema.Elements.Types.FundamentalTypes.EnumType import EnumType
     from SimpleSchema.Schema.Elements.Types.FundamentalTypes.IntegerType import IntegerType
+    from SimpleSchema.Schema.Elements.Types.FundamentalTypes.NumberType import NumberType
     from SimpleSchema.Schema.Elements.Types.FundamentalTypes.StringType import StringType
+    from SimpleSchema.Schema.Elements.Types.FundamentalTypes.UriType import UriType
+    from SimpleSchema.Schema.Elements.Types.Impl.InvalidValue import InvalidValue
     from SimpleSchema.Schema.Elements.Types.ReferenceType  import ReferenceType
     from SimpleSchema.Schema.Elements.Types.StructureType import StructureType
+    from SimpleSchema.Schema.Elements.Types.TupleType import TupleType
     from SimpleSchema.Schema.Elements.Types.VariantType import VariantType
 
 
@@ -560,6 +569,360 @@ class TestToPython(object):
         ]
 
 
+# ----------------------------------------------------------------------
+class TestCompiledValidator(object):
+    # ----------------------------------------------------------------------
+    def test_Standard(self):
+        self._Execute(
+            _Create(IntegerType(Mock(), min=0, max=10), Cardinality.CreateFromCode()),
+            [0, 10, True],
+            [-1, 11, "foo", None, [1], 1.5],
+        )
+
+    # ----------------------------------------------------------------------
+    def test_String(self):
+        self._Execute(
+            _Create(
+                StringType(Mock(), min_length=2, max_length=4, validation_expression="b"),
+                Cardinality.CreateFromCode(),
+            ),
+            ["ba", "bar", "bazz"],
+            ["b", "bazzz", "foo", 10, None],
+        )
+
+    # ----------------------------------------------------------------------
+    def test_Number(self):
+        self._Execute(
+            _Create(NumberType(Mock(), min=1.5), Cardinality.CreateFromCode()),
+            [1.5, 2, 3.25],
+            [1, 1.25, "2.0", None],
+        )
+
+    # ----------------------------------------------------------------------
+    def test_Container(self):
+        self._Execute(
+            _Create(StringType(Mock()), Cardinality.CreateFromCode(1, 2)),
+            [["foo"], ["foo", "bar"]],
+            [[], ["foo", "bar", "baz"], "foo", [""], None],
+        )
+
+    # ----------------------------------------------------------------------
+    def test_Optional(self):
+        self._Execute(
+            _Create(BooleanType(Mock()), Cardinality.CreateFromCode(0, 1)),
+            [True, False, None],
+            ["true", 1, [True]],
+        )
+
+    # ----------------------------------------------------------------------
+    def test_Tuple(self):
+        self._Execute(
+            _Create(
+                TupleType(
+                    Mock(),
+                    [
+                        _Create(StringType(Mock()), Cardinality.CreateFromCode()),
+                        _Create(IntegerType(Mock()), Cardinality.CreateFromCode(0, None)),
+                    ],
+                ),
+                Cardinality.CreateFromCode(0, None),
+            ),
+            [[("foo", [1, 2])], [], [("foo", []), ("bar", [3])]],
+            [("foo", [1]), [("foo",)], [("foo", [1], 2)], [("foo", 1)], [["foo", [1]]]],
+        )
+
+    # ----------------------------------------------------------------------
+    def test_Variant(self):
+        self._Execute(
+            _Create(
+                VariantType(
+                    Mock(),
+                    [
+                        _Create(StringType(Mock()), Cardinality.CreateFromCode(2, 2)),
+                        _Create(IntegerType(Mock()), Cardinality.CreateFromCode()),
+                    ],
+                ),
+                Cardinality.CreateFromCode(1, None),
+            ),
+            [[1, 2, 3], [["foo", "bar"], 1]],
+            [["foo", "bar"], ["foo"], [], 1, "foo", [["foo"], 1], None],
+        )
+
+    # ----------------------------------------------------------------------
+    def test_ReferenceReference(self):
+        self._Execute(
+            _Create(
+                _Create(IntegerType(Mock(), max=5), Cardinality.CreateFromCode()),
+                Cardinality.CreateFromCode(),
+            ),
+            [1, 5],
+            [6, "foo", None],
+        )
+
+    # ----------------------------------------------------------------------
+    def test_Structure(self):
+        structure = StructureStatement(
+            Mock(),
+            SimpleElement[str](Mock(), "Structure"),
+            [],
+            [
+                ItemStatement(Mock(), Mock(), SimpleElement[str](Mock(), "value"), _Create(IntegerType(Mock(), min=0), Cardinality.CreateFromCode())),
+                ItemStatement(Mock(), Mock(), SimpleElement[str](Mock(), "name"), _Create(StringType(Mock()), Cardinality.CreateFromCode(0, 1))),
+                ItemStatement(Mock(), Mock(), SimpleElement[str](Mock(), "values"), _Create(IntegerType(Mock()), Cardinality.CreateFromCode(0, None))),
+            ],
+        )
+
+        self._Execute(
+            _Create(StructureType(Mock(), structure), Cardinality.CreateFromCode(0, None)),
+            [
+                [{"value": 1}],
+                [{"value": 1, "name": "foo", "values": [1, 2]}, {"value": 2, "name": None}],
+            ],
+            [[{}], [{"value": -1}], [{"value": 1, "other": 2}], [{"value": 1, "values": 1}], [1], {"value": 1}],
+        )
+
+    # ----------------------------------------------------------------------
+    def test_Expressions(self):
+        rt = _Create(StringType(Mock()), Cardinality.CreateFromCode(0, None))
+
+        validator = rt.GetCompiledValidator()
+
+        assert validator(ListExpression(Mock(), [StringExpression(Mock(), "foo")])) == ["foo"]
+
+    # ----------------------------------------------------------------------
+    def test_Cache(self):
+        rt = _Create(
+            _Create(IntegerType(Mock()), Cardinality.CreateFromCode()),
+            Cardinality.CreateFromCode(),
+        )
+
+        validator = rt.GetCompiledValidator()
+
+        assert rt.GetCompiledValidator() is validator
+        assert rt.type.GetCompiledValidator().func is not None
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _Execute(
+        rt: ReferenceType,
+        valid_values: list,
+        invalid_values: list,
+    ) -> None:
+        validator = rt.GetCompiledValidator()
+
+        for value in valid_values:
+            result = validator(value)
+
+            assert result == rt.ToPython(value)
+            assert type(result) is type(rt.ToPython(value))
+
+        for value in invalid_values:
+            with pytest.raises(Exception) as compiled_ex:
+                validator(value)
+
+            with pytest.raises(Exception) as interpreted_ex:
+                rt.ToPython(value)
+
+            assert type(compiled_ex.value) is type(interpreted_ex.value)
+            assert str(compiled_ex.value) == str(interpreted_ex.value)
+
+
+# ----------------------------------------------------------------------
+class TestTryToPython(object):
+    # ----------------------------------------------------------------------
+    def test_Standard(self):
+        self._Execute(
+            _Create(IntegerType(Mock(), min=0, max=10), Cardinality.CreateFromCode()),
+            [0, 10, True],
+            [-1, 11, "foo", None, [1], 1.5],
+        )
+
+    # ----------------------------------------------------------------------
+    def test_String(self):
+        self._Execute(
+            _Create(
+                StringType(Mock(), min_length=2, max_length=4, validation_expression="b"),
+                Cardinality.CreateFromCode(),
+            ),
+            ["ba", "bar", "bazz"],
+            ["b", "bazzz", "foo", 10, None],
+        )
+
+    # ----------------------------------------------------------------------
+    def test_Number(self):
+        self._Execute(
+            _Create(NumberType(Mock(), min=1.5), Cardinality.CreateFromCode()),
+            [1.5, 2, 3.25],
+            [1, 1.25, "2.0", None],
+        )
+
+    # ----------------------------------------------------------------------
+    def test_Enum(self):
+        self._Execute(
+            _Create(EnumType(Mock(), ["one", "two"]), Cardinality.CreateFromCode()),
+            ["one", "two", 1, 2],
+            ["three", 3, 0, None],
+        )
+
+    # ----------------------------------------------------------------------
+    def test_Uri(self):
+        self._Execute(
+            _Create(UriType(Mock()), Cardinality.CreateFromCode()),
+            ["https://example.com/foo?bar=1", "file:///foo"],
+            ["not a uri", 1, None],
+        )
+
+    # ----------------------------------------------------------------------
+    def test_Container(self):
+        self._Execute(
+            _Create(StringType(Mock()), Cardinality.CreateFromCode(1, 2)),
+            [["foo"], ["foo", "bar"]],
+            [[], ["foo", "bar", "baz"], "foo", [""], None],
+        )
+
+    # ----------------------------------------------------------------------
+    def test_Optional(self):
+        self._Execute(
+            _Create(BooleanType(Mock()), Cardinality.CreateFromCode(0, 1)),
+            [True, False, None],
+            ["true", 1, [True]],
+        )
+
+    # ----------------------------------------------------------------------
+    def test_Tuple(self):
+        self._Execute(
+            _Create(
+                TupleType(
+                    Mock(),
+                    [
+                        _Create(StringType(Mock()), Cardinality.CreateFromCode()),
+                        _Create(IntegerType(Mock()), Cardinality.CreateFromCode(0, None)),
+                    ],
+                ),
+                Cardinality.CreateFromCode(0, None),
+            ),
+            [[("foo", [1, 2])], [], [("foo", []), ("bar", [3])]],
+            [("foo", [1]), [("foo",)], [("foo", [1], 2)], [("foo", 1)], [["foo", [1]]]],
+        )
+
+    # ----------------------------------------------------------------------
+    def test_Variant(self):
+        self._Execute(
+            _Create(
+                VariantType(
+                    Mock(),
+                    [
+                        _Create(StringType(Mock()), Cardinality.CreateFromCode(2, 2)),
+                        _Create(IntegerType(Mock()), Cardinality.CreateFromCode()),
+                    ],
+                ),
+                Cardinality.CreateFromCode(1, None),
+            ),
+            [[1, 2, 3], [["foo", "bar"], 1]],
+            [["foo", "bar"], ["foo"], [], 1, "foo", [["foo"], 1], None],
+        )
+
+    # ----------------------------------------------------------------------
+    def test_ReferenceReference(self):
+        self._Execute(
+            _Create(
+                _Create(IntegerType(Mock(), max=5), Cardinality.CreateFromCode()),
+                Cardinality.CreateFromCode(),
+            ),
+            [1, 5],
+            [6, "foo", None],
+        )
+
+    # ----------------------------------------------------------------------
+    def test_Structure(self):
+        structure = StructureStatement(
+            Mock(),
+            SimpleElement[str](Mock(), "Structure"),
+            [],
+            [
+                ItemStatement(Mock(), Mock(), SimpleElement[str](Mock(), "value"), _Create(IntegerType(Mock(), min=0), Cardinality.CreateFromCode())),
+                ItemStatement(Mock(), Mock(), SimpleElement[str](Mock(), "name"), _Create(StringType(Mock()), Cardinality.CreateFromCode(0, 1))),
+                ItemStatement(Mock(), Mock(), SimpleElement[str](Mock(), "values"), _Create(IntegerType(Mock()), Cardinality.CreateFromCode(0, None))),
+            ],
+        )
+
+        self._Execute(
+            _Create(StructureType(Mock(), structure), Cardinality.CreateFromCode(0, None)),
+            [
+                [{"value": 1}],
+                [{"value": 1, "name": "foo", "values": [1, 2]}, {"value": 2, "name": None}],
+            ],
+            [[{}], [{"value": -1}], [{"value": 1, "other": 2}], [{"value": 1, "values": 1}], [1], {"value": 1}],
+        )
+
+    # ----------------------------------------------------------------------
+    def test_Expressions(self):
+        rt = _Create(StringType(Mock()), Cardinality.CreateFromCode(0, None))
+
+        assert rt.TryToPython(ListExpression(Mock(), [StringExpression(Mock(), "foo")])) == ["foo"]
+        assert rt.IsValid(ListExpression(Mock(), [StringExpression(Mock(), "foo")]))
+
+        expression = StringExpression(Range.Create(Path("filename"), 1, 2, 3, 4), "foo")
+
+        result = rt.TryToPython(expression)
+
+        assert isinstance(result, InvalidValue)
+        assert not rt.IsValid(expression)
+
+        with pytest.raises(Exception) as ex:
+            rt.ToPython(expression)
+
+        assert result.message == str(ex.value)
+        assert result.message.startswith("A list of items was expected.")
+
+    # ----------------------------------------------------------------------
+    def test_LazyMessage(self):
+        rt = _Create(
+            IntegerType(Mock(), max=5),
+            Cardinality.CreateFromCode(),
+            range_value=Range.Create(Path("filename"), 1, 2, 3, 4),
+        )
+
+        result = rt.TryToPython(6)
+
+        assert isinstance(result, InvalidValue)
+        assert not result
+        assert result.value == 6
+        assert result._message is None  # pylint: disable=protected-access
+
+        assert result.message == "'6' is greater than '5'. (filename <Ln 1, Col 2 -> Ln 3, Col 4>)"
+        assert result._message == result.message  # pylint: disable=protected-access
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _Execute(
+        rt: ReferenceType,
+        valid_values: list,
+        invalid_values: list,
+    ) -> None:
+        for value in valid_values:
+            result = rt.TryToPython(value)
+
+            assert result == rt.ToPython(value)
+            assert type(result) is type(rt.ToPython(value))
+            assert rt.IsValid(value)
+
+        for value in invalid_values:
+            result = rt.TryToPython(value)
+
+            assert isinstance(result, InvalidValue), value
+            assert not rt.IsValid(value)
+
+            with pytest.raises(Exception) as ex:
+                rt.ToPython(value)
+
+            assert result.message == str(ex.value)
+
+
 # ----------------------------------------------------------------------
 class TestDisplayType(object):
     # ----------------------------------------------------------------------
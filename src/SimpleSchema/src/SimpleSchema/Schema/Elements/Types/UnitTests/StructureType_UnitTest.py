@@ -31,6 +31,7 @@ from Common_Foundation import PathEx
 sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent.parent.parent.parent)))
 with ExitStack(lambda: sys.path.pop(0)):
     from SimpleSchema.Schema.Elements.Types.StructureType import StructureType
+    from SimpleSchema.Schema.Elements.Types.Impl.InvalidValue import InvalidValue, InvalidValueMarker
 
 
 # ----------------------------------------------------------------------
@@ -52,10 +53,42 @@ def test_DisplayType():
     assert StructureType(Mock(), statement_mock).display_type == "Mocked Statement"
 
 
+# ----------------------------------------------------------------------
+def test_ToPython():
+    statement_mock = Mock()
+    statement_mock.GetItemTable.return_value.ToPython.return_value = {"value": 1}
+
+    assert StructureType(Mock(), statement_mock).ToPython({"value": "1"}) == {"value": 1}
+
+    statement_mock.GetItemTable.return_value.ToPython.assert_called_once_with({"value": "1"})
+
+
+# ----------------------------------------------------------------------
+def test_TryToPython():
+    statement_mock = Mock()
+    statement_mock.GetItemTable.return_value._TryToPython.return_value = {"value": 1}
+
+    assert StructureType(Mock(), statement_mock).TryToPython({"value": "1"}) == {"value": 1}
+
+    statement_mock.GetItemTable.return_value._TryToPython.return_value = InvalidValueMarker.instance
+
+    st = StructureType(Mock(), statement_mock)
+
+    result = st.TryToPython({"value": "invalid"})
+
+    assert isinstance(result, InvalidValue)
+    assert result.type is st
+    assert result.value == {"value": "invalid"}
+    assert st.IsValid({"value": "invalid"}) is False
+
+
 # ----------------------------------------------------------------------
 def test_ErrorToPython():
+    statement_mock = Mock()
+    statement_mock.name.value = "Mocked Statement"
+
     with pytest.raises(
         Exception,
-        match=re.escape("This method should never be called for StructureType instances."),
+        match=re.escape("A 'str' value cannot be converted to a 'Mocked Statement' type."),
     ):
-        StructureType(Mock(), Mock()).ToPython("test")
+        StructureType(Mock(), statement_mock).ToPython("test")
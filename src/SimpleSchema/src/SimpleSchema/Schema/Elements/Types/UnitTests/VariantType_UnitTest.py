@@ -22,7 +22,7 @@ import textwrap
 from dataclasses import dataclass
 from pathlib import Path
 from typing import ClassVar, Tuple, Type as PythonType
-from unittest.mock import MagicMock as Mock
+from unittest.mock import MagicMock as Mock, patch, PropertyMock
 
 import pytest
 
@@ -269,6 +269,74 @@ def test_ToPythonSubtleCardinality():
     assert rt.ToPython(123) == 123
 
 
+# ----------------------------------------------------------------------
+def test_CandidateIndexes():
+    v = VariantType(
+        Mock(),
+        [
+            ReferenceType.Create(Mock(), Mock(), _SimpleStringType(Mock()), Cardinality.CreateFromCode(), None),
+            ReferenceType.Create(Mock(), Mock(), _SimpleIntegerType(Mock()), Cardinality.CreateFromCode(0, None), None),
+            ReferenceType.Create(Mock(), Mock(), _SimpleIntegerType(Mock()), Cardinality.CreateFromCode(0, 1), None),
+            ReferenceType.Create(Mock(), Mock(), _SimpleIntegerType(Mock()), Cardinality.CreateFromCode(), None),
+        ],
+    )
+
+    assert v.GetCandidateIndexes(str) == (0, )
+    assert v.GetCandidateIndexes(int) == (2, 3)
+    assert v.GetCandidateIndexes(bool) == (2, 3)
+    assert v.GetCandidateIndexes(list) == (1, )
+    assert v.GetCandidateIndexes(type(None)) == (2, )
+    assert v.GetCandidateIndexes(float) == ()
+
+    # Results are cached
+    assert v.GetCandidateIndexes(str) is v.GetCandidateIndexes(str)
+
+    assert v.ToPython("foo") == "foo"
+    assert v.ToPython(123) == 123
+    assert v.ToPython([1, 2]) == [1, 2]
+    assert v.ToPython(None) is None
+
+
+# ----------------------------------------------------------------------
+def test_LazyErrorMessage():
+    v = VariantType(
+        Mock(),
+        [
+            ReferenceType.Create(Mock(), Mock(), _SimpleStringType(Range.Create(Path("filename"), 1, 2, 3, 4)), Cardinality.CreateFromCode(), None),
+            ReferenceType.Create(Mock(), Mock(), _SimpleIntegerType(Range.Create(Path("filename"), 11, 22, 33, 44)), Cardinality.CreateFromCode(), None),
+        ],
+    )
+
+    with patch.object(VariantType, "display_type", new_callable=PropertyMock) as display_type_mock:
+        display_type_mock.return_value = "(SimpleString | SimpleInteger)"
+
+        with pytest.raises(Exception) as ex:
+            v.ToPython("")
+
+        # The message is created when it is read
+        assert display_type_mock.call_count == 0
+
+        # The integer type was not invoked when validating, but is included in the message
+        assert str(ex.value) == textwrap.dedent(
+            """\
+            A 'str' value does not correspond to any types within '(SimpleString | SimpleInteger)'.
+
+                Additional Information:
+                    SimpleString
+                        Invalid simple string value (filename <Ln 1, Col 2 -> Ln 3, Col 4>)
+
+                    SimpleInteger
+                        A 'str' value cannot be converted to a 'SimpleInteger' type. (filename <Ln 11, Col 22 -> Ln 33, Col 44>)
+            """,
+        )
+
+        assert display_type_mock.call_count == 1
+
+        # The message is only created once
+        assert str(ex.value) == str(ex.value)
+        assert display_type_mock.call_count == 1
+
+
 # ----------------------------------------------------------------------
 def test_ErrorNotEnoughTypes():
     with pytest.raises(
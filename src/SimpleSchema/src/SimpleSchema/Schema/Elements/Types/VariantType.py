@@ -18,13 +18,14 @@
 import textwrap
 
 from dataclasses import dataclass, field
-from functools import cached_property
+from types import NoneType
 from typing import Any, cast, ClassVar, Optional, Tuple, Type as PythonType, Union, TYPE_CHECKING
 
 from Common_Foundation import TextwrapEx
 from Common_Foundation.Types import overridemethod
 
 from .BasicType import BasicType
+from .Impl.InvalidValue import InvalidValueMarker
 
 from ..Common.Element import Element
 
@@ -38,7 +39,7 @@ if TYPE_CHECKING:
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VariantType(BasicType):
     """A list of types"""
 
@@ -50,6 +51,9 @@ class VariantType(BasicType):
 
     has_child_cardinality: bool                                             = field(init=False, compare=False)
 
+    # Indexes of the types that may accept a python type; populated on demand by `GetCandidateIndexes`
+    _dispatch_table: dict[PythonType, Tuple[int, ...]]                      = field(init=False, default_factory=dict, repr=False, compare=False)
+
     # ----------------------------------------------------------------------
     def __post_init__(self):
         if len(self.types) < 2:
@@ -111,42 +115,22 @@ class VariantType(BasicType):
         def Impl(
             value: Any,
         ) -> Any:
-            exceptions: list[Exception] = []
+            exceptions: dict[int, Exception] = {}
+
+            if type(value) is value.__class__:
+                indexes = self.GetCandidateIndexes(type(value))
+            else:
+                # The value is pretending to be something else (for example, a mock)
+                indexes = tuple(range(len(self.types)))
 
-            for sub_type in self.types:
+            for index in indexes:
                 try:
-                    return sub_type.ToPython(value)
+                    return self.types[index].ToPython(value)
                 except Exception as ex:
-                    exceptions.append(ex)
+                    exceptions[index] = ex
 
             # If here, we didn't find a matching type
-            raise Exception(
-                Errors.variant_type_invalid_value.format(
-                    python_type=type(value).__name__,
-                    type=self.display_type,
-                    additional_info=TextwrapEx.Indent(
-                        "".join(
-                            textwrap.dedent(
-                                """\
-                                {}
-                                    {}
-
-                                """,
-                            ).format(
-                                sub_type.display_type,
-                                TextwrapEx.Indent(
-                                    str(exception),
-                                    4,
-                                    skip_first_line=True,
-                                ).rstrip(),
-                            )
-                            for sub_type, exception in zip(self.types, exceptions)
-                        ).rstrip(),
-                        8,
-                        skip_first_line=True,
-                    ),
-                ),
-            )
+            raise _InvalidValueException(self, value, exceptions)
 
         # ----------------------------------------------------------------------
 
@@ -160,9 +144,57 @@ class VariantType(BasicType):
         return Impl(expression_or_value)
 
     # ----------------------------------------------------------------------
+    def GetCandidateIndexes(
+        self,
+        python_type: PythonType,
+    ) -> Tuple[int, ...]:
+        """\
+        Returns the indexes of the types that may accept a value of the python type (in the order in
+        which they were defined); the other types are guaranteed to reject values of that type.
+        """
+
+        indexes = self._dispatch_table.get(python_type, None)
+
+        if indexes is None:
+            indexes = tuple(
+                index
+                for index, sub_type in enumerate(self.types)
+                if _MayAcceptPythonType(sub_type, python_type)
+            )
+
+            self._dispatch_table[python_type] = indexes
+
+        return indexes
+
+    # ----------------------------------------------------------------------
+    def TryToPythonReferenceOverride(
+        self,
+        reference: "ReferenceType",
+        value: Any,
+    ) -> Union[Any, InvalidValueMarker]:
+        """Equivalent to `ToPythonReferenceOverride`, but returns InvalidValueMarker.instance rather than raising an exception"""
+
+        if self.has_child_cardinality:
+            result = self._TryToPython(value)
+            if result is not InvalidValueMarker.instance:
+                return result
+
+        return reference.TryToPythonImpl(value)
+
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def _GetState(self) -> list[Any]:
+        # The dispatch table may contain python types that can't be pickled; it is populated on
+        # demand when unpickled.
+        return [
+            {} if field_name == "_dispatch_table" else getattr(self, field_name)
+            for field_name in self.__class__._GetStateFieldNames()
+        ]
+
     # ----------------------------------------------------------------------
     # ----------------------------------------------------------------------
-    @cached_property
+    # ----------------------------------------------------------------------
+    @property
     @overridemethod
     def _display_type(self) -> str:
         display_values: list[str] = []
@@ -184,6 +216,25 @@ class VariantType(BasicType):
 
         yield "types", cast(list[Element], self.types)
 
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def _TryToPython(
+        self,
+        value: Any,
+    ) -> Union[Any, InvalidValueMarker]:
+        if type(value) is value.__class__:
+            indexes = self.GetCandidateIndexes(type(value))
+        else:
+            # The value is pretending to be something else (for example, a mock)
+            indexes = range(len(self.types))
+
+        for index in indexes:
+            result = self.types[index]._TryToPython(value)  # pylint: disable=protected-access
+            if result is not InvalidValueMarker.instance:
+                return result
+
+        return InvalidValueMarker.instance
+
     # ----------------------------------------------------------------------
     @overridemethod
     def _ToPythonImpl(
@@ -191,3 +242,130 @@ class VariantType(BasicType):
         value: Any,
     ) -> Any:
         raise Exception("This will never be called for variant types.")  # pragma: no cover
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Types
+# |
+# ----------------------------------------------------------------------
+class _InvalidValueException(Exception):
+    """\
+    Raised when a value doesn't correspond to any of the types within a variant.
+
+    The message is created when it is first read, as it is expensive to create and these exceptions
+    are often discarded (for example, when the variant is itself within a variant).
+    """
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        variant_type: VariantType,
+        value: Any,
+        exceptions: dict[int, Exception],   # Exceptions generated by the types that were attempted
+    ):
+        super(_InvalidValueException, self).__init__()
+
+        self._variant_type                  = variant_type
+        self._value                         = value
+        self._exceptions                    = exceptions
+        self._message: Optional[str]        = None
+
+    # ----------------------------------------------------------------------
+    def __str__(self) -> str:
+        if self._message is None:
+            exceptions: list[Exception] = []
+
+            for index, sub_type in enumerate(self._variant_type.types):
+                exception = self._exceptions.get(index, None)
+
+                if exception is None:
+                    # This type wasn't attempted because it can't accept values of this python
+                    # type; invoke it now to get the error message.
+                    try:
+                        sub_type.ToPython(self._value)
+                        assert False, sub_type  # pragma: no cover
+                    except Exception as ex:  # pylint: disable=broad-exception-caught
+                        exception = ex
+
+                exceptions.append(exception)
+
+            self._message = Errors.variant_type_invalid_value.format(
+                python_type=type(self._value).__name__,
+                type=self._variant_type.display_type,
+                additional_info=TextwrapEx.Indent(
+                    "".join(
+                        textwrap.dedent(
+                            """\
+                            {}
+                                {}
+
+                            """,
+                        ).format(
+                            sub_type.display_type,
+                            TextwrapEx.Indent(
+                                str(exception),
+                                4,
+                                skip_first_line=True,
+                            ).rstrip(),
+                        )
+                        for sub_type, exception in zip(self._variant_type.types, exceptions)
+                    ).rstrip(),
+                    8,
+                    skip_first_line=True,
+                ),
+            )
+
+            # The information required to create the message is no longer needed
+            self._exceptions = {}
+            self._value = None
+
+        return self._message
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Functions
+# |
+# ----------------------------------------------------------------------
+def _MayAcceptPythonType(
+    the_type: Any,
+    python_type: PythonType,
+) -> bool:
+    """Returns False if the type is guaranteed to reject values of the python type"""
+
+    # Note that this content is imported here to avoid circular dependencies
+    from .ReferenceType import ReferenceType
+
+    if isinstance(the_type, ReferenceType):
+        # Equivalent to `ReferenceType.ToPython`
+        if python_type is NoneType:
+            return the_type.cardinality.is_optional
+
+        if the_type.cardinality.is_optional:
+            return _MayAcceptPythonType(the_type.type, python_type)
+
+        with the_type.Resolve() as resolved_type:
+            if isinstance(resolved_type.type, VariantType):
+                return True
+
+            # Equivalent to `ReferenceType.ToPythonImpl`
+            if resolved_type.cardinality.is_container:
+                return issubclass(python_type, list)
+
+            if resolved_type.cardinality.is_optional:
+                return True
+
+            if issubclass(python_type, list):
+                return False
+
+            return _MayAcceptPythonType(resolved_type.type, python_type)
+
+    if (
+        isinstance(the_type, BasicType)
+        and not isinstance(the_type, VariantType)
+        and type(the_type).ToPython is BasicType.ToPython
+    ):
+        return issubclass(python_type, the_type.SUPPORTED_PYTHON_TYPES)
+
+    return True
@@ -0,0 +1,332 @@
+# ----------------------------------------------------------------------
+# |
+# |  Lower.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-23 09:12:40
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Lowers resolved and normalized SimpleSchema elements into a flat, index-based intermediate representation"""
+
+from enum import Enum
+from pathlib import Path
+from typing import Any, Optional, Tuple, Union
+
+from ..Elements.Common.Cardinality import Cardinality
+from ..Elements.Common.SimpleElement import SimpleElement
+
+from ..Elements.Expressions.Expression import Expression
+
+from ..Elements.Statements.ExtensionStatement import ExtensionStatement
+from ..Elements.Statements.ItemStatement import ItemStatement
+from ..Elements.Statements.RootStatement import RootStatement
+from ..Elements.Statements.Statement import Statement
+from ..Elements.Statements.StructureStatement import StructureStatement
+
+from ..Elements.Types.BasicType import BasicType
+from ..Elements.Types.FundamentalTypes.EnumType import EnumType
+from ..Elements.Types.ReferenceType import ReferenceType
+
+from ...Common.Range import Range
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Data
+# |
+# ----------------------------------------------------------------------
+# Incremented when the format of the intermediate representation changes in a way that isn't backwards
+# compatible.
+VERSION                                     = 1
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Functions
+# |
+# ----------------------------------------------------------------------
+def Lower(
+    root: RootStatement,
+) -> dict[str, Any]:
+    """\
+    Lowers a resolved and normalized root into an intermediate representation made up of tables that
+    only contain JSON-compatible values, so that the schema can be consumed without this package.
+
+    Elements refer to other elements by their (0-based) index within the corresponding table:
+
+        version:        The version of the format (see `VERSION`).
+        filenames:      Names of the files that define the elements.
+        cardinalities:  [min, max] pairs; max is null when the cardinality is unbounded.
+        metadata:       Resolved metadata values by metadata name.
+        types:          Reference types ("kind" is "Reference") and basic types ("kind" is the name of
+                        the type, for example "String" or "Structure").
+        structures:     Structure definitions.
+        items:          Item definitions.
+        extensions:     Extension statements.
+        root:           The items, types and extensions defined at the root.
+
+    Ranges are [filename index, begin line, begin column, end line, end column]. Disabled statements
+    are not included.
+    """
+
+    lowerer = _Lowerer()
+
+    root_content = lowerer.LowerStatements(root.statements)
+    root_content["range"] = lowerer.LowerRange(root.range)
+
+    return {
+        "version": VERSION,
+        "filenames": lowerer.filenames,
+        "cardinalities": lowerer.cardinalities,
+        "metadata": lowerer.metadata,
+        "types": lowerer.types,
+        "structures": lowerer.structures,
+        "items": lowerer.items,
+        "extensions": lowerer.extensions,
+        "root": root_content,
+    }
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+class _Lowerer(object):
+    # ----------------------------------------------------------------------
+    def __init__(self):
+        self.filenames: list[str]                                   = []
+        self.cardinalities: list[list[Optional[int]]]               = []
+        self.metadata: list[dict[str, Any]]                         = []
+        self.types: list[dict[str, Any]]                            = []
+        self.structures: list[dict[str, Any]]                       = []
+        self.items: list[dict[str, Any]]                            = []
+        self.extensions: list[dict[str, Any]]                       = []
+
+        self._filename_indexes: dict[Path, int]                     = {}
+        self._cardinality_indexes: dict[Tuple[int, Optional[int]], int]     = {}
+
+        # Types and structures are shared and may be recursive, so they are looked up by identity
+        self._type_indexes: dict[int, int]                          = {}
+        self._structure_indexes: dict[int, int]                     = {}
+
+    # ----------------------------------------------------------------------
+    def LowerStatements(
+        self,
+        statements: list[Statement],
+    ) -> dict[str, Any]:
+        item_indexes: list[int] = []
+        type_indexes: list[int] = []
+        extension_indexes: list[int] = []
+
+        for statement in statements:
+            if statement.is_disabled:
+                continue
+
+            if isinstance(statement, ItemStatement):
+                item_indexes.append(self._LowerItem(statement))
+            elif isinstance(statement, ReferenceType):
+                type_indexes.append(self._LowerType(statement))
+            elif isinstance(statement, ExtensionStatement):
+                extension_indexes.append(self._LowerExtension(statement))
+            else:
+                assert False, statement  # pragma: no cover
+
+        return {
+            "items": item_indexes,
+            "types": type_indexes,
+            "extensions": extension_indexes,
+        }
+
+    # ----------------------------------------------------------------------
+    def LowerRange(
+        self,
+        range_value: Range,
+    ) -> list[int]:
+        filename = range_value.filename
+
+        filename_index = self._filename_indexes.get(filename, None)
+        if filename_index is None:
+            filename_index = len(self.filenames)
+
+            self.filenames.append(filename.as_posix())
+            self._filename_indexes[filename] = filename_index
+
+        return [
+            filename_index,
+            range_value.begin.line,
+            range_value.begin.column,
+            range_value.end.line,
+            range_value.end.column,
+        ]
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _LowerItem(
+        self,
+        statement: ItemStatement,
+    ) -> int:
+        content = {
+            "name": statement.name.value,
+            "visibility": statement.visibility.value.name,
+            "range": self.LowerRange(statement.range),
+            "type": self._LowerType(statement.type),
+        }
+
+        # Lowering the type may have added other items
+        self.items.append(content)
+        return len(self.items) - 1
+
+    # ----------------------------------------------------------------------
+    def _LowerExtension(
+        self,
+        statement: ExtensionStatement,
+    ) -> int:
+        self.extensions.append(
+            {
+                "name": statement.name.value,
+                "range": self.LowerRange(statement.range),
+                "positional_args": [self._LowerValue(arg) for arg in statement.positional_args],
+                "keyword_args": {
+                    name: self._LowerValue(keyword_arg.expression)
+                    for name, keyword_arg in statement.keyword_args.items()
+                },
+            },
+        )
+
+        return len(self.extensions) - 1
+
+    # ----------------------------------------------------------------------
+    def _LowerType(
+        self,
+        the_type: Union[BasicType, ReferenceType],
+    ) -> int:
+        type_index = self._type_indexes.get(id(the_type), None)
+        if type_index is not None:
+            return type_index
+
+        content: dict[str, Any] = {
+            "kind": the_type.NAME,
+            "unique_name": the_type.unique_name,
+            "range": self.LowerRange(the_type.range),
+        }
+
+        # The content is added before the details are lowered, as types may be recursive
+        type_index = len(self.types)
+
+        self.types.append(content)
+        self._type_indexes[id(the_type)] = type_index
+
+        if isinstance(the_type, ReferenceType):
+            content["name"] = the_type.name.value
+            content["visibility"] = the_type.visibility.value.name
+            content["category"] = the_type.category.name
+            content["cardinality"] = self._LowerCardinality(the_type.cardinality)
+            content["metadata"] = self._LowerMetadata(the_type.resolved_metadata)
+            content["type"] = self._LowerType(the_type.type)
+
+            # The first type in the chain of aliases that introduces a new type
+            with the_type.Resolve() as resolved_type:
+                content["resolved_type"] = self._LowerType(resolved_type)
+
+        elif isinstance(the_type, EnumType):
+            # The values are lowered as defined by the python class, as they may have been loaded
+            # from a file.
+            content["values"] = [
+                [e.name, e.value]                   # type: ignore
+                for e in the_type.EnumClass         # type: ignore
+            ]
+
+        else:
+            for field_name in the_type.__class__.FIELDS:
+                content[field_name] = self._LowerValue(getattr(the_type, field_name))
+
+        return type_index
+
+    # ----------------------------------------------------------------------
+    def _LowerStructure(
+        self,
+        structure: StructureStatement,
+    ) -> int:
+        structure_index = self._structure_indexes.get(id(structure), None)
+        if structure_index is not None:
+            return structure_index
+
+        content: dict[str, Any] = {
+            "name": structure.name.value,
+            "unique_name": structure.unique_name,
+            "range": self.LowerRange(structure.range),
+        }
+
+        # The content is added before the children are lowered, as structures may be recursive
+        structure_index = len(self.structures)
+
+        self.structures.append(content)
+        self._structure_indexes[id(structure)] = structure_index
+
+        content["base_types"] = [self._LowerType(base_type) for base_type in structure.base_types]
+        content.update(self.LowerStatements(structure.children))
+
+        return structure_index
+
+    # ----------------------------------------------------------------------
+    def _LowerCardinality(
+        self,
+        cardinality: Cardinality,
+    ) -> int:
+        key = (
+            cardinality.min.value,
+            None if cardinality.max is None else cardinality.max.value,
+        )
+
+        cardinality_index = self._cardinality_indexes.get(key, None)
+        if cardinality_index is None:
+            cardinality_index = len(self.cardinalities)
+
+            self.cardinalities.append(list(key))
+            self._cardinality_indexes[key] = cardinality_index
+
+        return cardinality_index
+
+    # ----------------------------------------------------------------------
+    def _LowerMetadata(
+        self,
+        metadata: dict[str, Union[SimpleElement, Expression]],
+    ) -> Optional[int]:
+        if not metadata:
+            return None
+
+        self.metadata.append({name: self._LowerValue(value) for name, value in metadata.items()})
+        return len(self.metadata) - 1
+
+    # ----------------------------------------------------------------------
+    def _LowerValue(
+        self,
+        value: Any,
+    ) -> Any:
+        if isinstance(value, (SimpleElement, Expression)):
+            return self._LowerValue(value.value)
+        if isinstance(value, (BasicType, ReferenceType)):
+            return self._LowerType(value)
+        if isinstance(value, StructureStatement):
+            return self._LowerStructure(value)
+        if isinstance(value, (list, tuple)):
+            return [self._LowerValue(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self._LowerValue(item) for key, item in value.items()}
+
+        # Enums must be checked before the other scalar types, as enums may derive from them
+        if isinstance(value, Enum):
+            return value.name
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        if isinstance(value, Path):
+            return value.as_posix()
+
+        return str(value)
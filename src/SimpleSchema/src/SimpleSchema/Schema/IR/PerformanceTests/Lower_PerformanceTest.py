@@ -0,0 +1,212 @@
+# ----------------------------------------------------------------------
+# |
+# |  Lower_PerformanceTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-23 11:20:05
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Compares the intermediate representation produced by Lower.py with the elements that it is based on"""
+
+import json
+import pickle
+import sys
+import time
+
+from pathlib import Path
+from typing import Any, Callable, cast
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+from Common_Foundation.Streams.DoneManager import DoneManager
+from Common_Foundation.TestHelpers.StreamTestHelpers import GenerateDoneManagerAndSink
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from SimpleSchema.Schema.Elements.Statements.RootStatement import RootStatement
+    from SimpleSchema.Schema.Elements.TestHelpers import CountElements
+
+    from SimpleSchema.Schema.IR.Lower import Lower
+
+    from SimpleSchema.Schema.MetadataAttributes.ElementAttributes import DefaultMetadataAttribute
+
+    from SimpleSchema.Schema.Parse.ANTLR.Parse import Parse
+    from SimpleSchema.Schema.Parse.Normalize.Normalize import Normalize, Flag as NormalizeFlag
+    from SimpleSchema.Schema.Parse.TypeResolver.Resolve import Resolve
+
+
+# ----------------------------------------------------------------------
+NUM_STRUCTURES                              = 500
+NUM_ITEMS_PER_STRUCTURE                     = 10
+
+
+# ----------------------------------------------------------------------
+def test_Lower(tmp_path):
+    root = _CreateRoot(tmp_path)
+
+    ir = _Measure("Lower", lambda: Lower(root))
+
+    sys.stdout.write("\n")
+
+    # Serialization
+    json_content = _Measure("IR to JSON", lambda: json.dumps(ir, separators=(",", ":")))
+    _Measure("IR from JSON", lambda: json.loads(json_content))
+
+    pickle_content = _Measure("Elements to pickle", lambda: pickle.dumps(root, pickle.HIGHEST_PROTOCOL))
+    _Measure("Elements from pickle", lambda: pickle.loads(pickle_content))
+
+    sys.stdout.write(
+        "\nJSON: {:,} bytes\nPickle: {:,} bytes\n\n".format(len(json_content), len(pickle_content)),
+    )
+
+    # Iteration
+    num_elements = _Measure("Visit elements", lambda: CountElements(root))
+    num_ir_elements = _Measure("Iterate IR", lambda: _CountIRElements(ir))
+
+    sys.stdout.write("\nElements: {:,}\nIR elements: {:,}\n".format(num_elements, num_ir_elements))
+
+    assert num_ir_elements >= NUM_STRUCTURES * NUM_ITEMS_PER_STRUCTURE
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _CreateRoot(
+    tmp_path: Path,
+) -> RootStatement:
+    content: list[str] = []
+
+    for structure_index in range(NUM_STRUCTURES):
+        content.append("Structure{} ->\n".format(structure_index))
+
+        for item_index in range(NUM_ITEMS_PER_STRUCTURE):
+            if item_index % 3 == 0:
+                content.append("    item{}: String {{ min_length: 2 }}\n".format(item_index))
+            elif item_index % 3 == 1:
+                content.append("    item{}: Integer? {{ default: 10 }}\n".format(item_index))
+            else:
+                content.append("    item{}: Structure{}*\n".format(item_index, max(structure_index - 1, 0)))
+
+        content.append("\n")
+
+    filename = tmp_path / "Schema.SimpleSchema"
+    filename.write_text("".join(content))
+
+    dm_and_sink = iter(GenerateDoneManagerAndSink())
+    dm = cast(DoneManager, next(dm_and_sink))
+
+    results = Parse(
+        dm,
+        {
+            tmp_path: {
+                Path(filename.name): filename.read_text,
+            },
+        },
+        single_threaded=True,
+    )
+
+    roots = cast(dict[Path, RootStatement], results[tmp_path])
+
+    assert Resolve(dm, roots, single_threaded=True) is None
+    assert Normalize(
+        dm,
+        roots,
+        [DefaultMetadataAttribute()],  # pylint: disable=no-value-for-parameter
+        set(),
+        NormalizeFlag.AllowRootStructures | NormalizeFlag.AllowNestedItems | NormalizeFlag.AllowNestedTypes,
+        single_threaded=True,
+    ) is None
+
+    assert dm.result == 0, next(dm_and_sink)
+
+    return roots[Path(filename.name)]
+
+
+# ----------------------------------------------------------------------
+def _CountIRElements(
+    ir: dict[str, Any],
+) -> int:
+    # Walk the IR from the root in the same way that a generator would
+    types = ir["types"]
+    structures = ir["structures"]
+    items = ir["items"]
+
+    visited_types: set[int] = set()
+    visited_structures: set[int] = set()
+
+    num_elements = 0
+
+    # ----------------------------------------------------------------------
+    def OnType(
+        type_index: int,
+    ) -> None:
+        if type_index in visited_types:
+            return
+
+        visited_types.add(type_index)
+
+        nonlocal num_elements
+        num_elements += 1
+
+        the_type = types[type_index]
+
+        if the_type["kind"] == "Reference":
+            OnType(the_type["type"])
+        elif the_type["kind"] == "Structure":
+            OnStructure(the_type["structure"])
+
+    # ----------------------------------------------------------------------
+    def OnStructure(
+        structure_index: int,
+    ) -> None:
+        if structure_index in visited_structures:
+            return
+
+        visited_structures.add(structure_index)
+
+        nonlocal num_elements
+        num_elements += 1
+
+        OnStatements(structures[structure_index])
+
+    # ----------------------------------------------------------------------
+    def OnStatements(
+        statements: dict[str, Any],
+    ) -> None:
+        nonlocal num_elements
+
+        for item_index in statements["items"]:
+            num_elements += 1
+            OnType(items[item_index]["type"])
+
+        for type_index in statements["types"]:
+            OnType(type_index)
+
+    # ----------------------------------------------------------------------
+
+    OnStatements(ir["root"])
+
+    return num_elements
+
+
+# ----------------------------------------------------------------------
+def _Measure(
+    desc: str,
+    func: Callable[[], Any],
+) -> Any:
+    start = time.perf_counter()
+    result = func()
+    duration = time.perf_counter() - start
+
+    sys.stdout.write("{}: {:.4f}s\n".format(desc, duration))
+
+    return result
@@ -0,0 +1,281 @@
+# ----------------------------------------------------------------------
+# |
+# |  Lower_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-23 10:02:18
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""\
+Unit tests for Lower.py
+
+Note that these tests are actually Integration tests (as they are using more than one
+class or function), but are named "UnitTests" to ensure that they participate in code
+coverage collection and enforcement.
+"""
+
+import json
+import sys
+import textwrap
+
+from pathlib import Path
+from typing import Any, cast, Optional
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+from Common_Foundation.Streams.DoneManager import DoneManager
+from Common_Foundation.TestHelpers.StreamTestHelpers import GenerateDoneManagerAndSink
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from SimpleSchema.Schema.Elements.Statements.RootStatement import RootStatement
+
+    from SimpleSchema.Schema.IR.Lower import Lower, VERSION
+
+    from SimpleSchema.Schema.MetadataAttributes.ElementAttributes import DefaultMetadataAttribute
+
+    from SimpleSchema.Schema.Parse import TestHelpers
+    from SimpleSchema.Schema.Parse.ANTLR.Parse import Parse
+    from SimpleSchema.Schema.Parse.Normalize.Normalize import Normalize, Flag as NormalizeFlag
+    from SimpleSchema.Schema.Parse.TypeResolver.Resolve import Resolve
+
+
+# ----------------------------------------------------------------------
+def test_Standard():
+    ir = Lower(
+        _Parse(
+            textwrap.dedent(
+                """\
+                Base ->
+                    id: Integer { min: 0 }
+
+                Name: String { min_length: 2 }
+
+                Person: Base ->
+                    name: Name
+                    tags: Name*
+                    location: (Number, Number)?
+
+                person: Person
+                count: Integer? { default: 10 }
+                """,
+            ),
+        ),
+    )
+
+    assert ir["version"] == VERSION
+    assert ir["filenames"] == [(TestHelpers.DEFAULT_WORKSPACE_PATH / "entry_point").as_posix()]
+
+    # The content only contains JSON-compatible values
+    assert json.loads(json.dumps(ir)) == ir
+
+    types = ir["types"]
+    structures = ir["structures"]
+    items = ir["items"]
+
+    # Root
+    root = ir["root"]
+
+    assert root["range"] == [0, 1, 1, 13, 1]
+    assert [items[index]["name"] for index in root["items"]] == ["person", "count"]
+    assert [types[index]["name"] for index in root["types"]] == ["Base", "Name", "Person"]
+    assert root["extensions"] == []
+
+    # Structures
+    person_type = types[root["types"][2]]
+
+    assert person_type["kind"] == "Reference"
+    assert person_type["category"] == "Source"
+    assert person_type["unique_name"] == "Person"
+
+    person_structure_type = types[person_type["type"]]
+
+    assert person_structure_type["kind"] == "Structure"
+
+    person_structure = structures[person_structure_type["structure"]]
+
+    assert person_structure["name"] == "PersonStruct"
+    assert person_structure["unique_name"] == "PersonStruct"
+    assert [items[index]["name"] for index in person_structure["items"]] == ["name", "tags", "location"]
+
+    # Base types
+    assert len(person_structure["base_types"]) == 1
+
+    base_type = types[person_structure["base_types"][0]]
+
+    assert base_type["category"] == "Alias"
+    assert types[base_type["resolved_type"]]["name"] == "Base"
+
+    # Items
+    name_type = types[items[person_structure["items"][0]]["type"]]
+
+    assert name_type["category"] == "Alias"
+    assert ir["cardinalities"][name_type["cardinality"]] == [1, 1]
+
+    resolved_name_type = types[name_type["resolved_type"]]
+
+    assert resolved_name_type["name"] == "Name"
+    assert types[resolved_name_type["type"]] == {
+        "kind": "String",
+        "unique_name": "String-Ln4Col7",
+        "range": [0, 4, 7, 4, 31],
+        "min_length": 2,
+        "max_length": None,
+        "validation_expression": None,
+    }
+
+    tags_type = types[items[person_structure["items"][1]]["type"]]
+
+    assert tags_type["category"] == "Reference"
+    assert ir["cardinalities"][tags_type["cardinality"]] == [0, None]
+
+    # Types are shared
+    assert tags_type["type"] == name_type["resolved_type"]
+
+    location_type = types[items[person_structure["items"][2]]["type"]]
+
+    assert ir["cardinalities"][location_type["cardinality"]] == [0, 1]
+    assert [types[types[index]["type"]]["kind"] for index in types[location_type["type"]]["types"]] == ["Number", "Number"]
+
+    # Metadata
+    count_type = types[items[root["items"][1]]["type"]]
+
+    assert ir["metadata"][count_type["metadata"]] == {"default": 10}
+    assert types[count_type["type"]]["min"] is None
+
+    # Cardinalities are not duplicated
+    assert len(ir["cardinalities"]) == len(set(tuple(cardinality) for cardinality in ir["cardinalities"]))
+
+
+# ----------------------------------------------------------------------
+def test_RecursiveStructure():
+    ir = Lower(
+        _Parse(
+            textwrap.dedent(
+                """\
+                Node ->
+                    children: Node*
+                """,
+            ),
+        ),
+    )
+
+    assert len(ir["structures"]) == 1
+
+    structure = ir["structures"][0]
+    children_type = ir["types"][ir["items"][structure["items"][0]]["type"]]
+
+    node_type = ir["types"][children_type["type"]]
+
+    assert node_type["name"] == "Node"
+    assert ir["types"][node_type["type"]]["structure"] == 0
+
+
+# ----------------------------------------------------------------------
+def test_Enum():
+    ir = Lower(
+        _Parse(
+            textwrap.dedent(
+                """\
+                value: Enum { values: ["one", "two"], starting_value: 10 }
+                """,
+            ),
+        ),
+    )
+
+    assert ir["types"][ir["types"][ir["items"][0]["type"]]["type"]]["values"] == [
+        ["one", 10],
+        ["two", 11],
+    ]
+
+
+# ----------------------------------------------------------------------
+def test_Extensions():
+    ir = Lower(
+        _Parse(
+            textwrap.dedent(
+                """\
+                Extension(1, "two", (3, 4.0), three=[True, None])
+                """,
+            ),
+            {"Extension", },
+        ),
+    )
+
+    assert ir["root"]["extensions"] == [0]
+    assert ir["extensions"] == [
+        {
+            "name": "Extension",
+            "range": [0, 1, 1, 2, 1],
+            "positional_args": [1, "two", [3, 4.0]],
+            "keyword_args": {
+                "three": [True, None],
+            },
+        },
+    ]
+
+
+# ----------------------------------------------------------------------
+def test_DisabledStatements():
+    ir = Lower(
+        _Parse(
+            textwrap.dedent(
+                """\
+                Extension()
+                value: String
+                """,
+            ),
+            flags=NormalizeFlag.DisableUnsupportedExtensions,
+        ),
+    )
+
+    assert ir["root"]["extensions"] == []
+    assert ir["extensions"] == []
+    assert [item["name"] for item in ir["items"]] == ["value"]
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _Parse(
+    content: str,
+    extension_names: Optional[set[str]]=None,
+    flags: Any=NormalizeFlag(0),
+) -> RootStatement:
+    with TestHelpers.GenerateMockedPath({"entry_point": content}, ["entry_point", ]) as workspaces:
+        results = Parse(cast(DoneManager, next(iter(GenerateDoneManagerAndSink()))), workspaces)
+
+        assert len(results) == 1, results
+        workspace_root, results = next(iter(results.items()))
+
+        roots = {workspace_root / key: cast(RootStatement, value) for key, value in results.items()}
+
+    assert Resolve(cast(DoneManager, next(iter(GenerateDoneManagerAndSink()))), roots) is None
+
+    assert Normalize(
+        cast(DoneManager, next(iter(GenerateDoneManagerAndSink()))),
+        roots,
+        [DefaultMetadataAttribute()],  # pylint: disable=no-value-for-parameter
+        extension_names or set(),
+        (
+            NormalizeFlag.AllowRootItems
+            | NormalizeFlag.AllowRootStructures
+            | NormalizeFlag.AllowRootTypes
+            | NormalizeFlag.AllowNestedItems
+            | NormalizeFlag.AllowNestedStructures
+            | NormalizeFlag.AllowNestedTypes
+            | flags
+        ),
+    ) is None
+
+    assert len(roots) == 1
+    return next(iter(roots.values()))
@@ -86,23 +86,26 @@ class DefaultMetadataAttribute(MetadataAttribute):
 
         # ----------------------------------------------------------------------
 
-        variant = VariantType(
-            Range.CreateFromCode(),
-            [
-                CreateType(BooleanType(Range.CreateFromCode())),
-                CreateType(IntegerType(Range.CreateFromCode())),
-                CreateType(NumberType(Range.CreateFromCode())),
-                CreateType(StringType(Range.CreateFromCode())),
-            ],
-        )
-
-        variant = VariantType(
-            Range.CreateFromCode(),
-            [
-                CreateType(variant),
-                CreateType(variant, Cardinality.CreateFromCode(1, None)),
-            ],
-        )
+        # The types are created for every instance and don't correspond to meaningful source
+        # locations, so they share the synthetic range.
+        with Range.SyntheticRanges():
+            variant = VariantType(
+                Range.CreateFromCode(),
+                [
+                    CreateType(BooleanType(Range.CreateFromCode())),
+                    CreateType(IntegerType(Range.CreateFromCode())),
+                    CreateType(NumberType(Range.CreateFromCode())),
+                    CreateType(StringType(Range.CreateFromCode())),
+                ],
+            )
+
+            variant = VariantType(
+                Range.CreateFromCode(),
+                [
+                    CreateType(variant),
+                    CreateType(variant, Cardinality.CreateFromCode(1, None)),
+                ],
+            )
 
         # TODO: Add support for N dimensional arrays
 
@@ -16,7 +16,6 @@
 """Contains the ParseIdentifier type"""
 
 from dataclasses import dataclass, field
-from functools import cached_property
 from typing import Optional
 
 from .....Elements.Common.Element import Element
@@ -28,14 +27,15 @@ from ......Common.Range import Location, Range
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParseIdentifier(Element):
     """Identifier generated during parsing and replaced in subsequent steps"""
 
     # ----------------------------------------------------------------------
     value: str
 
-    _first_char: str                        = field(init=False)
+    _first_char: str                                    = field(init=False)
+    _visibility: Optional[SimpleElement[Visibility]]    = field(init=False, default=None, repr=False, compare=False)
 
     # ----------------------------------------------------------------------
     def __post_init__(self):
@@ -54,16 +54,30 @@ class ParseIdentifier(Element):
         object.__setattr__(self, "_first_char", first_char)
 
     # ----------------------------------------------------------------------
-    @cached_property
+    @property
     def is_expression(self) -> bool:
         return self._first_char.islower()
 
-    @cached_property
+    @property
     def is_type(self) -> bool:
         return self._first_char.isupper()
 
-    @cached_property
+    @property
     def visibility(self) -> SimpleElement[Visibility]:
+        if self._visibility is None:
+            object.__setattr__(self, "_visibility", self._CreateVisibility())
+
+        assert self._visibility is not None
+        return self._visibility
+
+    # ----------------------------------------------------------------------
+    def ToSimpleElement(self) -> SimpleElement[str]:
+        return SimpleElement[str](self.range, self.value)
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _CreateVisibility(self) -> SimpleElement[Visibility]:
         range_value: Optional[Range] = None
 
         if self.value[0] == "_":
@@ -83,12 +97,6 @@ class ParseIdentifier(Element):
 
         return SimpleElement[Visibility](range_value, visibility)
 
-    # ----------------------------------------------------------------------
-    def ToSimpleElement(self) -> SimpleElement[str]:
-        return SimpleElement[str](self.range, self.value)
-
-    # ----------------------------------------------------------------------
-    # ----------------------------------------------------------------------
     # ----------------------------------------------------------------------
     @staticmethod
     def _GetFirstChar(
@@ -47,7 +47,7 @@ class ParseIncludeStatementType(Enum):
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParseIncludeStatementItem(Element):
     """Named item imported"""
 
@@ -79,7 +79,7 @@ class ParseIncludeStatementItem(Element):
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParseIncludeStatement(Statement):
     """Statement that includes content from another file"""
 
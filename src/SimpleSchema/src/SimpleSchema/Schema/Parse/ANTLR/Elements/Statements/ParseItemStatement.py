@@ -26,7 +26,7 @@ from .....Elements.Statements.Statement import Element, Statement
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParseItemStatement(Statement):
     """Defines a single item; instances are only valid during the parsing process and are converted to other items in subsequent steps."""
 
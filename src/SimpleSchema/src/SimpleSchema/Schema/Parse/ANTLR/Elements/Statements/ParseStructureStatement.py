@@ -32,7 +32,7 @@ from .....Elements.Statements.Statement import Element, Statement
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParseStructureStatement(Statement):
     """A structure-like statement that is used during the parsing process"""
 
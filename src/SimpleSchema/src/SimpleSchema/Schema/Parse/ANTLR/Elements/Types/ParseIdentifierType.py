@@ -31,7 +31,7 @@ from ......Common.Range import Range
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParseIdentifierType(ParseType):
     """Temporary identifier generated during parsing and replaced in subsequent steps"""
 
@@ -28,7 +28,7 @@ from .....Elements.Types.Impl.BaseType import BaseType
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParseType(BaseType):
     """Temporary type generated during parsing and replaced during subsequent steps"""
 
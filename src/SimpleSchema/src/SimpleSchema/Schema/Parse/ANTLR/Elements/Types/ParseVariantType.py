@@ -28,7 +28,7 @@ from ......Common import Errors
 
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParseVariantType(ParseType):
     """A list of types used during the parsing process; subsequent steps will overwrite this value"""
 
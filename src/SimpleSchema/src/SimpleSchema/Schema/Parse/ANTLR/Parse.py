@@ -124,6 +124,7 @@ def Parse(
     single_threaded: bool=False,
     quiet: bool=False,
     raise_if_single_exception: bool=True,
+    read_included_file_func: Optional[Callable[[Path], str]]=None,     # Returns the UTF-8 decoded content of an included file
 ) -> dict[
     Path,                                   # workspace root
     dict[
@@ -277,6 +278,9 @@ def Parse(
             if should_enqueue:
                 # ----------------------------------------------------------------------
                 def GetContent() -> str:
+                    if read_included_file_func is not None:
+                        return read_included_file_func(filename)
+
                     with filename.open(encoding="UTF-8") as f:
                         return f.read()
 
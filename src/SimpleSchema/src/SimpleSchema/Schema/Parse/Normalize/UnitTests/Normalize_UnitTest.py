@@ -1722,6 +1722,75 @@ def test_ItemReference():
     )
 
 
+# ----------------------------------------------------------------------
+class TestFingerprint(object):
+    content                                 = textwrap.dedent(
+        """\
+        Container: String+ { min_length: 10 }
+
+        Node ->
+            value: Integer { min: 0 }
+            values: Container?
+            children: Node*
+            tuple: (Integer, String)
+            variant: (Integer | String[10])
+
+        root: Node
+        """,
+    )
+
+    # ----------------------------------------------------------------------
+    def test_Standard(self):
+        root1 = self.__class__._Execute(self.__class__.content)
+        root2 = self.__class__._Execute("# Comment\n\n" + self.__class__.content.replace("\n", "\n\n"))
+
+        # Ranges and generated names based on ranges are not considered
+        for statement1, statement2 in zip(root1.statements, root2.statements, strict=True):
+            assert statement1.fingerprint == statement2.fingerprint
+
+        assert root1.fingerprint == root2.fingerprint
+
+    # ----------------------------------------------------------------------
+    def test_Different(self):
+        root1 = self.__class__._Execute(self.__class__.content)
+
+        for original, replacement in [
+            ("min_length: 10", "min_length: 11"),
+            ("min: 0", "min: 1"),
+            ("Node*", "Node+"),
+            ("(Integer, String)", "(String, Integer)"),
+            ("String[10]", "String[11]"),
+            ("root: Node", "root: Container"),
+        ]:
+            root2 = self.__class__._Execute(self.__class__.content.replace(original, replacement))
+            assert root1.fingerprint != root2.fingerprint, original
+
+    # ----------------------------------------------------------------------
+    def test_Order(self):
+        # The fingerprints of recursive structures do not depend on the order in which they are calculated
+        root1 = self.__class__._Execute(self.__class__.content)
+        root2 = self.__class__._Execute(self.__class__.content)
+
+        fingerprints1 = [statement.fingerprint for statement in root1.statements]
+        fingerprints2 = [statement.fingerprint for statement in reversed(root2.statements)]
+
+        assert fingerprints1 == list(reversed(fingerprints2))
+        assert root1.fingerprint == root2.fingerprint
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _Execute(
+        content: str,
+    ) -> RootStatement:
+        results, _ = _TestEx({"entry_point": content}, ["entry_point", ])
+
+        assert len(results) == 1
+        root = next(iter(results.values()))
+
+        assert isinstance(root, RootStatement), root
+        return root
+
+
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
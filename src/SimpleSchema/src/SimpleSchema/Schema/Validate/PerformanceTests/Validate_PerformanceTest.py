@@ -0,0 +1,279 @@
+# ----------------------------------------------------------------------
+# |
+# |  Validate_PerformanceTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-14 09:12:46
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""\
+Performance tests for Validate.py
+
+The size of the generated input can be set with the environment variable
+SIMPLE_SCHEMA_VALIDATE_PERFORMANCE_TEST_NUM_BYTES (for example, set it to 1073741824 to
+validate 1 GB of JSON Lines content).
+"""
+
+import json
+import os
+import sys
+import time
+
+from pathlib import Path
+from typing import cast, Optional, Union
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+from Common_Foundation.Streams.DoneManager import DoneManager
+from Common_Foundation.TestHelpers.StreamTestHelpers import GenerateDoneManagerAndSink
+
+try:
+    import resource
+except ImportError:
+    # resource is not available on Windows
+    resource = None
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from SimpleSchema.Common.Range import Range
+    from SimpleSchema.Schema.Elements.Common.Cardinality import Cardinality
+    from SimpleSchema.Schema.Elements.Common.SimpleElement import SimpleElement
+    from SimpleSchema.Schema.Elements.Common.Visibility import Visibility
+    from SimpleSchema.Schema.Elements.Statements.ItemStatement import ItemStatement
+    from SimpleSchema.Schema.Elements.Statements.StructureStatement import StructureStatement
+    from SimpleSchema.Schema.Elements.Types.BasicType import BasicType
+    from SimpleSchema.Schema.Elements.Types.FundamentalTypes.BooleanType import BooleanType
+    from SimpleSchema.Schema.Elements.Types.FundamentalTypes.IntegerType import IntegerType
+    from SimpleSchema.Schema.Elements.Types.FundamentalTypes.NumberType import NumberType
+    from SimpleSchema.Schema.Elements.Types.FundamentalTypes.StringType import StringType
+    from SimpleSchema.Schema.Elements.Types.ReferenceType import ReferenceType
+    from SimpleSchema.Schema.Elements.Types.StructureType import StructureType
+    from SimpleSchema.Schema.Validate.Validate import RecordError, ValidateJsonLines, ValidateJsonLinesInParallel
+
+
+# ----------------------------------------------------------------------
+NUM_BYTES                                   = int(os.getenv("SIMPLE_SCHEMA_VALIDATE_PERFORMANCE_TEST_NUM_BYTES", 4 * 1024 * 1024))
+INVALID_RECORD_FREQUENCY                    = 1000
+
+
+# ----------------------------------------------------------------------
+def test_JsonLines(tmp_path):
+    structure = _CreateStructure()
+
+    data_filename = tmp_path / "records.jsonl"
+    num_records = _GenerateJsonLines(data_filename, NUM_BYTES)
+
+    num_bytes = data_filename.stat().st_size
+
+    for desc, use_compiled_validators in [
+        ("Interpreted", False),
+        ("Compiled", True),
+    ]:
+        errors: list[RecordError] = []
+
+        start = time.perf_counter()
+
+        with data_filename.open(encoding="utf-8") as f:
+            result = ValidateJsonLines(
+                structure,
+                f,
+                errors.append,
+                use_compiled_validators=use_compiled_validators,
+            )
+
+        duration = time.perf_counter() - start
+
+        assert result.num_records == num_records
+        assert result.num_errors == len(errors) == (num_records + INVALID_RECORD_FREQUENCY - 1) // INVALID_RECORD_FREQUENCY
+        assert all(error.path == "values[1].value" for error in errors)
+
+        sys.stdout.write(
+            "{}: {:,} records ({:,.1f} MB) in {:.4f}s ({:,.0f} records per second, {:,.1f} MB per second)\n".format(
+                desc,
+                num_records,
+                num_bytes / (1024 * 1024),
+                duration,
+                num_records / duration,
+                num_bytes / (1024 * 1024) / duration,
+            ),
+        )
+
+    if resource is not None:
+        # ru_maxrss is in kilobytes on Linux and bytes on macOS
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        if sys.platform != "darwin":
+            max_rss *= 1024
+
+        sys.stdout.write("Peak RSS: {:,.1f} MB\n".format(max_rss / (1024 * 1024)))
+
+
+# ----------------------------------------------------------------------
+def test_JsonLinesScaling(tmp_path):
+    structure = _CreateStructure()
+
+    data_filename = tmp_path / "records.jsonl"
+    num_records = _GenerateJsonLines(data_filename, NUM_BYTES)
+
+    num_bytes = data_filename.stat().st_size
+
+    max_num_processes = os.cpu_count() or 1
+
+    num_processes_values: list[int] = []
+
+    num_processes = 1
+    while num_processes < max_num_processes:
+        num_processes_values.append(num_processes)
+        num_processes *= 2
+
+    num_processes_values.append(max_num_processes)
+
+    single_process_duration: Optional[float] = None
+
+    for num_processes in num_processes_values:
+        errors: list[RecordError] = []
+
+        start = time.perf_counter()
+
+        result = ValidateJsonLinesInParallel(
+            cast(DoneManager, next(iter(GenerateDoneManagerAndSink()))),
+            structure,
+            data_filename,
+            errors.append,
+            # Create multiple chunks per process so that the work is balanced
+            chunk_size=max(num_bytes // (num_processes * 4), 1),
+            max_num_processes=num_processes,
+        )
+
+        duration = time.perf_counter() - start
+
+        assert result.num_records == num_records
+        assert result.num_errors == len(errors)
+        assert [error.record_index for error in errors] == list(range(0, num_records, INVALID_RECORD_FREQUENCY))
+
+        if single_process_duration is None:
+            single_process_duration = duration
+
+        sys.stdout.write(
+            "{} process(es): {:,} records in {:.4f}s ({:,.0f} records per second, {:,.1f} MB per second, {:.1f}x)\n".format(
+                num_processes,
+                num_records,
+                duration,
+                num_records / duration,
+                num_bytes / (1024 * 1024) / duration,
+                single_process_duration / duration,
+            ),
+        )
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _CreateRange() -> Range:
+    return Range.Create(Path("synthetic.SimpleSchema"), 1, 1, 1, 10)
+
+
+# ----------------------------------------------------------------------
+def _CreateItem(
+    name: str,
+    the_type: Union[BasicType, ReferenceType],
+    cardinality: Optional[Cardinality]=None,
+) -> ItemStatement:
+    range_value = _CreateRange()
+
+    return ItemStatement(
+        range_value,
+        SimpleElement[Visibility](range_value, Visibility.Public),
+        SimpleElement[str](range_value, name),
+        ReferenceType.Create(
+            SimpleElement[Visibility](range_value, Visibility.Private),
+            SimpleElement[str](range_value, name),
+            the_type,
+            cardinality or Cardinality.CreateFromCode(),
+            None,
+        ),
+    )
+
+
+# ----------------------------------------------------------------------
+def _CreateStructure() -> StructureStatement:
+    # Record ->
+    #     id: Integer { min: 0 }
+    #     name: String
+    #     description: String?
+    #     enabled: Boolean
+    #     values: Value*
+    #
+    # Value ->
+    #     name: String
+    #     value: Number { min: 0.0 }
+    value_structure = StructureStatement(
+        _CreateRange(),
+        SimpleElement[str](_CreateRange(), "Value"),
+        [],
+        [
+            _CreateItem("name", StringType(_CreateRange())),
+            _CreateItem("value", NumberType(_CreateRange(), min=0.0)),
+        ],
+    )
+
+    return StructureStatement(
+        _CreateRange(),
+        SimpleElement[str](_CreateRange(), "Record"),
+        [],
+        [
+            _CreateItem("id", IntegerType(_CreateRange(), min=0)),
+            _CreateItem("name", StringType(_CreateRange())),
+            _CreateItem("description", StringType(_CreateRange()), Cardinality.CreateFromCode(0, 1)),
+            _CreateItem("enabled", BooleanType(_CreateRange())),
+            _CreateItem(
+                "values",
+                StructureType(_CreateRange(), value_structure),
+                Cardinality.CreateFromCode(0, None),
+            ),
+        ],
+    )
+
+
+# ----------------------------------------------------------------------
+def _GenerateJsonLines(
+    filename: Path,
+    num_bytes: int,
+) -> int:
+    # Records are written as they are generated so that the size of the file isn't limited by memory
+    num_records = 0
+    num_bytes_written = 0
+
+    with filename.open("w", encoding="utf-8") as f:
+        while num_bytes_written < num_bytes:
+            line = json.dumps(
+                {
+                    "id": num_records,
+                    "name": "Record{}".format(num_records),
+                    "description": None if num_records % 2 else "The description",
+                    "enabled": bool(num_records % 3),
+                    "values": [
+                        {
+                            "name": "Value{}".format(index),
+                            "value": -1.0 if num_records % INVALID_RECORD_FREQUENCY == 0 and index == 1 else index * 1.5,
+                        }
+                        for index in range(num_records % 5 + 2)
+                    ],
+                },
+            ) + "\n"
+
+            f.write(line)
+
+            num_records += 1
+            num_bytes_written += len(line)
+
+    return num_records
@@ -0,0 +1,505 @@
+# ----------------------------------------------------------------------
+# |
+# |  Validate_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-13 11:05:24
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""\
+Unit tests for Validate.py
+
+Note that these tests are actually Integration tests (as they are using more than one
+class or function), but are named "UnitTests" to ensure that they participate in code
+coverage collection and enforcement.
+"""
+
+import json
+import pickle
+import re
+import sys
+import textwrap
+
+from pathlib import Path
+from typing import Any, cast
+
+import pytest
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+from Common_Foundation.Streams.DoneManager import DoneManager
+from Common_Foundation.TestHelpers.StreamTestHelpers import GenerateDoneManagerAndSink
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from SimpleSchema.Common.SimpleSchemaException import SimpleSchemaException
+
+    from SimpleSchema.Schema.Elements.Statements.RootStatement import RootStatement
+    from SimpleSchema.Schema.Elements.Statements.StructureStatement import StructureStatement
+    from SimpleSchema.Schema.Elements.Types.ReferenceType import ReferenceType
+
+    from SimpleSchema.Schema.MetadataAttributes.ElementAttributes import DefaultMetadataAttribute
+
+    from SimpleSchema.Schema.Parse import TestHelpers
+    from SimpleSchema.Schema.Parse.ANTLR.Parse import Parse
+    from SimpleSchema.Schema.Parse.Normalize.Normalize import Normalize, Flag as NormalizeFlag
+    from SimpleSchema.Schema.Parse.TypeResolver.Resolve import Resolve
+
+    from SimpleSchema.Schema.Validate.Validate import (
+        FindStructure,
+        RecordError,
+        Validate,
+        ValidateJson,
+        ValidateJsonLines,
+        ValidateJsonLinesInParallel,
+        ValidateRecords,
+        ValidateRecordsResult,
+        ValidateYaml,
+        ValidateYamlDocuments,
+    )
+
+
+# ----------------------------------------------------------------------
+_content                                    = textwrap.dedent(
+    """\
+    Base ->
+        id: Integer { min: 0 }
+
+    Person: Base ->
+        name: String
+        nickname: String? { default: "none" }
+        tags: String*
+        children: Person*
+        location: (Number, Number)?
+        contact: (String | Integer[2])
+
+    person: Person
+    count: Integer? { default: 10 }
+    """,
+)
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture(scope="module")
+def root() -> RootStatement:
+    return _Parse(_content)
+
+
+# ----------------------------------------------------------------------
+def test_Standard(root):
+    assert Validate(
+        root,
+        {
+            "person": {
+                "id": 1,
+                "name": "Alice",
+                "tags": ["a", "b"],
+                "children": [
+                    {
+                        "id": 2,
+                        "name": "Bob",
+                        "nickname": "Bobby",
+                        "contact": [1, 2],
+                        "location": (1, 2.5),
+                    },
+                ],
+                "contact": "alice@example.com",
+            },
+        },
+    ) == {
+        "person": {
+            "id": 1,
+            "name": "Alice",
+            "nickname": "none",
+            "tags": ["a", "b"],
+            "children": [
+                {
+                    "id": 2,
+                    "name": "Bob",
+                    "nickname": "Bobby",
+                    "tags": [],
+                    "children": [],
+                    "location": (1.0, 2.5),
+                    "contact": [1, 2],
+                },
+            ],
+            "location": None,
+            "contact": "alice@example.com",
+        },
+        "count": 10,
+    }
+
+
+# ----------------------------------------------------------------------
+def test_Structure(root):
+    structure = next(
+        statement.type.structure
+        for statement in root.statements
+        if isinstance(statement, ReferenceType) and statement.name.value == "Base"
+    )
+
+    assert isinstance(structure, StructureStatement)
+    assert Validate(structure, {"id": 3}) == {"id": 3}
+
+
+# ----------------------------------------------------------------------
+def test_Json(root):
+    assert ValidateJson(
+        root,
+        json.dumps({"person": {"id": 1, "name": "Alice", "contact": "alice"}, "count": 2}),
+    )["count"] == 2
+
+
+# ----------------------------------------------------------------------
+def test_Yaml(root):
+    assert ValidateYaml(
+        root,
+        textwrap.dedent(
+            """\
+            person:
+              id: 1
+              name: Alice
+              contact: [1, 2]
+              children:
+                - id: 2
+                  name: Bob
+                  contact: bob
+            """,
+        ),
+    )["person"]["children"][0]["name"] == "Bob"
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("use_compiled_validators", [True, False])
+def test_JsonTuple(root, use_compiled_validators):
+    # JSON doesn't have tuples, so they are represented as lists
+    result = ValidateJson(
+        root,
+        json.dumps(
+            {
+                "person": {
+                    "id": 1,
+                    "name": "Alice",
+                    "location": [1, 2.5],
+                    "contact": [1, 2],
+                    "children": [{"id": 2, "name": "Bob", "location": [3, 4], "contact": "bob"}],
+                },
+            },
+        ),
+        use_compiled_validators=use_compiled_validators,
+    )
+
+    assert result["person"]["location"] == (1.0, 2.5)
+    assert result["person"]["contact"] == [1, 2]
+    assert result["person"]["children"][0]["location"] == (3.0, 4.0)
+
+    with pytest.raises(SimpleSchemaException, match=re.escape("A 'str' value cannot be converted to a 'Number' type.")):
+        ValidateJson(
+            root,
+            json.dumps({"person": {"id": 1, "name": "Alice", "location": [1, "two"], "contact": "alice"}}),
+            use_compiled_validators=use_compiled_validators,
+        )
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("use_compiled_validators", [True, False])
+def test_YamlTuple(root, use_compiled_validators):
+    # YAML doesn't have tuples, so they are represented as lists
+    result = ValidateYaml(
+        root,
+        textwrap.dedent(
+            """\
+            person:
+              id: 1
+              name: Alice
+              location: [1, 2.5]
+              contact: [1, 2]
+              children:
+                - id: 2
+                  name: Bob
+                  contact: bob
+                  location:
+                    - 3
+                    - 4
+            """,
+        ),
+        use_compiled_validators=use_compiled_validators,
+    )
+
+    assert result["person"]["location"] == (1.0, 2.5)
+    assert result["person"]["contact"] == [1, 2]
+    assert result["person"]["children"][0]["location"] == (3.0, 4.0)
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("use_compiled_validators", [True, False])
+def test_DocumentTupleVariant(use_compiled_validators):
+    # Lists are converted to tuples when the variant type that accepts them is a tuple
+    root = _Parse(
+        textwrap.dedent(
+            """\
+            values: ((Integer, String) | Integer+)*
+            """,
+        ),
+    )
+
+    assert ValidateJson(
+        root,
+        json.dumps({"values": [[1, "one"], [1, 2, 3], [2, "two"]]}),
+        use_compiled_validators=use_compiled_validators,
+    ) == {"values": [(1, "one"), [1, 2, 3], (2, "two")]}
+
+    # Python data isn't converted by default
+    with pytest.raises(SimpleSchemaException):
+        Validate(root, {"values": [[1, "one"]]}, use_compiled_validators=use_compiled_validators)
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("use_compiled_validators", [True, False])
+def test_Errors(root, use_compiled_validators):
+    for data, expected in [
+        ([], "A 'list' value cannot be validated; a mapping was expected."),
+        ({}, "The required item 'person' was not provided."),
+        ({"person": {"name": "Alice", "contact": "alice"}}, "The required item 'id' was not provided."),
+        ({"person": {"id": 1, "name": "Alice", "contact": "alice"}, "other": 1}, "The item 'other' was not expected."),
+        ({"person": {"id": 1, "name": "Alice", "contact": "alice", "other": 1}}, "The item 'other' was not expected."),
+        ({"person": {"id": -1, "name": "Alice", "contact": "alice"}}, "'-1' is less than '0'."),
+        ({"person": {"id": 1, "name": "Alice", "contact": "alice", "children": [{"id": 2, "contact": "bob"}]}}, "The required item 'name' was not provided."),
+        ({"person": 1}, "A 'int' value cannot be converted to a 'PersonStruct' type."),
+    ]:
+        with pytest.raises(SimpleSchemaException, match=re.escape(expected)):
+            Validate(root, cast(Any, data), use_compiled_validators=use_compiled_validators)
+
+
+# ----------------------------------------------------------------------
+def test_CompiledConformance(root):
+    for data in [
+        {"person": {"id": 1, "name": "Alice", "contact": [1, 2], "children": [{"id": 2, "name": "Bob", "contact": "bob"}]}},
+        {"person": {"id": 1, "name": "Alice", "contact": [1, 2, 3]}},
+        {"person": {"id": 1, "name": "", "contact": "alice"}},
+        {"person": {"id": 1, "name": "Alice", "contact": "alice", "location": (1, "2")}},
+        {"person": {"id": 1, "name": "Alice", "contact": "alice", "children": [{"id": 2, "name": "Bob"}]}},
+    ]:
+        try:
+            expected = Validate(root, data, use_compiled_validators=False)
+        except SimpleSchemaException as ex:
+            expected = str(ex)
+
+        try:
+            result = Validate(root, data, use_compiled_validators=True)
+        except SimpleSchemaException as ex:
+            result = str(ex)
+
+        assert result == expected
+
+
+# ----------------------------------------------------------------------
+def test_FindStructure(root):
+    assert FindStructure(root, "Base").GetItemTable().names == {"id"}
+    assert "children" in FindStructure(root, "Person").GetItemTable().names
+
+    with pytest.raises(SimpleSchemaException, match=re.escape("The structure 'Invalid' was not found.")):
+        FindStructure(root, "Invalid")
+
+    with pytest.raises(SimpleSchemaException, match=re.escape("The structure 'Person.Invalid' was not found.")):
+        FindStructure(root, "Person.Invalid")
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("use_compiled_validators", [True, False])
+def test_Records(root, use_compiled_validators):
+    errors: list[RecordError] = []
+
+    assert ValidateRecords(
+        FindStructure(root, "Person"),
+        [
+            {"id": 1, "name": "Alice", "contact": "alice"},
+            {"id": 2, "contact": "bob"},
+            [],
+            {"id": 3, "name": "Charlie", "contact": "charlie", "children": [{"id": 4, "name": "Dave", "contact": "dave"}, {"id": -5, "name": "Eve", "contact": "eve"}]},
+            {"id": 6, "name": "Frank", "contact": "frank", "location": (1, "two")},
+            {"id": 7, "name": "Grace", "contact": "grace", "other": True},
+            {"id": 8, "name": "Heidi", "contact": "heidi", "tags": ["a", 1]},
+            {"id": 9, "name": "Ivan", "contact": 10},
+        ],
+        errors.append,
+        use_compiled_validators=use_compiled_validators,
+    ) == ValidateRecordsResult(8, 7)
+
+    assert [(error.record_index, error.path) for error in errors] == [
+        (1, "name"),
+        (2, ""),
+        (3, "children[1].id"),
+        (4, "location[1]"),
+        (5, "other"),
+        (6, "tags[1]"),
+        (7, "contact"),
+    ]
+
+    assert errors[0].message == "The required item 'name' was not provided."
+    assert errors[1].message == "A 'list' value cannot be validated; a mapping was expected."
+    assert errors[2].message == "'-5' is less than '0'."
+    assert errors[3].message == "A 'str' value cannot be converted to a 'Number' type."
+    assert errors[4].message == "The item 'other' was not expected."
+    assert errors[5].message == "A 'int' value cannot be converted to a 'String' type."
+
+
+# ----------------------------------------------------------------------
+def test_JsonLines(root):
+    errors: list[RecordError] = []
+
+    assert ValidateJsonLines(
+        FindStructure(root, "Base"),
+        [
+            '{"id": 1}\n',
+            "\n",
+            '{"id": -2}\n',
+            "{invalid\n",
+            '{"id": 3}\n',
+        ],
+        errors.append,
+    ) == ValidateRecordsResult(4, 2)
+
+    assert [(error.record_index, error.path) for error in errors] == [(1, "id"), (2, "")]
+    assert errors[1].message.startswith("Expecting property name")
+
+    # Tuples are represented as lists
+    errors = []
+
+    assert ValidateJsonLines(
+        FindStructure(root, "Person"),
+        [
+            '{"id": 1, "name": "Alice", "contact": "alice", "location": [1, 2]}\n',
+            '{"id": 2, "name": "Bob", "contact": "bob", "location": [1, "two"]}\n',
+        ],
+        errors.append,
+    ) == ValidateRecordsResult(2, 1)
+
+    assert [(error.record_index, error.path) for error in errors] == [(1, "location[1]")]
+
+
+# ----------------------------------------------------------------------
+def test_Pickle(root):
+    # Structures are pickled when sent to other processes, including those with compiled validators
+    structure = FindStructure(root, "Person")
+    data = {"id": 1, "name": "Alice", "contact": "alice", "children": [{"id": 2, "name": "Bob", "contact": [1, 2]}]}
+
+    expected = Validate(structure, data)
+
+    assert Validate(pickle.loads(pickle.dumps(structure)), data) == expected
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("chunk_size", [1, 50, 1024 * 1024])
+def test_JsonLinesInParallel(root, tmp_path, chunk_size):
+    structure = FindStructure(root, "Person")
+
+    # Compile the validators before the structure is sent to the other processes (compiled
+    # validators are not pickled)
+    assert Validate(structure, {"id": 0, "name": "Alice", "contact": "alice"})
+
+    filename = tmp_path / "records.jsonl"
+
+    with filename.open("w") as f:
+        for index in range(25):
+            if index % 7 == 3:
+                f.write('{{"id": {}, "contact": "bob"}}\n'.format(index))
+            elif index % 11 == 5:
+                f.write("{invalid\n\n")
+            else:
+                f.write('{{"id": {}, "name": "Person{}", "contact": "person"}}\n'.format(index, index))
+
+    expected_errors: list[RecordError] = []
+
+    with filename.open() as f:
+        expected_result = ValidateJsonLines(structure, f, expected_errors.append)
+
+    assert expected_result == ValidateRecordsResult(25, 6)
+
+    errors: list[RecordError] = []
+
+    assert ValidateJsonLinesInParallel(
+        cast(DoneManager, next(iter(GenerateDoneManagerAndSink()))),
+        structure,
+        filename,
+        errors.append,
+        chunk_size=chunk_size,
+        max_num_processes=2,
+    ) == expected_result
+
+    assert errors == expected_errors
+
+
+# ----------------------------------------------------------------------
+def test_YamlDocuments(root):
+    errors: list[RecordError] = []
+
+    assert ValidateYamlDocuments(
+        FindStructure(root, "Base"),
+        textwrap.dedent(
+            """\
+            id: 1
+            ---
+            id: two
+            ---
+            id: 3
+            """,
+        ),
+        errors.append,
+    ) == ValidateRecordsResult(3, 1)
+
+    assert [(error.record_index, error.path) for error in errors] == [(1, "id")]
+
+    errors = []
+
+    assert ValidateYamlDocuments(
+        FindStructure(root, "Base"),
+        "id: 1\n---\nid: [1\n",
+        errors.append,
+    ) == ValidateRecordsResult(2, 1)
+
+    assert [(error.record_index, error.path) for error in errors] == [(1, "")]
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _Parse(
+    content: str,
+) -> RootStatement:
+    with TestHelpers.GenerateMockedPath({"entry_point": content}, ["entry_point", ]) as workspaces:
+        results = Parse(cast(DoneManager, next(iter(GenerateDoneManagerAndSink()))), workspaces)
+
+        assert len(results) == 1, results
+        workspace_root, results = next(iter(results.items()))
+
+        roots = {workspace_root / key: cast(RootStatement, value) for key, value in results.items()}
+
+    assert Resolve(cast(DoneManager, next(iter(GenerateDoneManagerAndSink()))), roots) is None
+
+    assert Normalize(
+        cast(DoneManager, next(iter(GenerateDoneManagerAndSink()))),
+        roots,
+        [DefaultMetadataAttribute()],  # pylint: disable=no-value-for-parameter
+        set(),
+        (
+            NormalizeFlag.AllowRootItems
+            | NormalizeFlag.AllowRootStructures
+            | NormalizeFlag.AllowRootTypes
+            | NormalizeFlag.AllowNestedItems
+            | NormalizeFlag.AllowNestedStructures
+            | NormalizeFlag.AllowNestedTypes
+        ),
+    ) is None
+
+    assert len(roots) == 1
+    return next(iter(roots.values()))
@@ -0,0 +1,584 @@
+# ----------------------------------------------------------------------
+# |
+# |  Validate.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-13 10:17:51
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Validates python data against resolved and normalized SimpleSchema elements"""
+
+import json
+import os
+
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional, TextIO, Tuple, Union
+
+import yaml
+
+from Common_Foundation.Streams.DoneManager import DoneManager
+
+from Common_FoundationEx import ExecuteTasks
+
+from ..Elements.Statements.RootStatement import RootStatement
+from ..Elements.Statements.StructureStatement import StructureStatement
+
+from ..Elements.Types.FundamentalTypes.Impl.FilesystemProbe import FilesystemProbe
+from ..Elements.Types.ReferenceType import ReferenceType
+from ..Elements.Types.StructureType import StructureType
+from ..Elements.Types.TupleType import TupleType
+from ..Elements.Types.Impl.ItemTable import ItemTable
+
+from ...Common import Errors, MultiprocessingContext
+from ...Common.SimpleSchemaException import SimpleSchemaException
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Types
+# |
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class RecordError(object):
+    """An error encountered while validating a record within a stream of records"""
+
+    record_index: int                       # 0-based
+    path: str                               # Path to the invalid item (e.g. "values[2].name"); empty when the error applies to the record itself
+    message: str
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class ValidateRecordsResult(object):
+    """Summary of the validation of a stream of records"""
+
+    num_records: int
+    num_errors: int
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Functions
+# |
+# ----------------------------------------------------------------------
+def FindStructure(
+    root: RootStatement,
+    name: str,
+) -> StructureStatement:
+    """Returns the structure with the provided name (use '.' to delimit the names of nested structures)"""
+
+    statements = root.statements
+    structure: Optional[StructureStatement] = None
+
+    for name_part in name.split("."):
+        structure = None
+
+        for statement in statements:
+            if isinstance(statement, StructureStatement):
+                potential_structure = statement
+            elif isinstance(statement, ReferenceType) and isinstance(statement.type, StructureType):
+                potential_structure = statement.type.structure
+            else:
+                continue
+
+            if potential_structure.name.value == name_part or (
+                isinstance(statement, ReferenceType) and statement.name.value == name_part
+            ):
+                structure = potential_structure
+                break
+
+        if structure is None:
+            raise Errors.ValidateInvalidStructureName.Create(root.range, name)
+
+        statements = structure.children
+
+    assert structure is not None
+    return structure
+
+
+# ----------------------------------------------------------------------
+def Validate(
+    element: Union[RootStatement, StructureStatement],
+    data: Mapping[str, Any],
+    *,
+    use_compiled_validators: bool=True,
+    from_document: bool=False,
+) -> dict[str, Any]:
+    """\
+    Validates the data against the items defined within the root or structure and returns a
+    dictionary of python values (where defaults have been applied).
+
+    Compiled validators produce the same results (and the same exceptions) as the interpreted
+    `ReferenceType.ToPython` path.
+
+    Set `from_document` when the data was read from a JSON or YAML document, where tuples are
+    represented as lists.
+
+    File system checks (for Filename and Directory types) are cached for the duration of the call.
+    """
+
+    if not isinstance(data, Mapping):
+        raise Errors.ValidateInvalidDocument.Create(element.range, type(data).__name__)
+
+    item_table = element.GetItemTable()
+
+    try:
+        if from_document:
+            data = item_table.FromDocument(data)
+
+        with FilesystemProbe.Activate():
+            return item_table.ToPython(
+                data,
+                use_compiled_validators=use_compiled_validators,
+            )
+
+    except SimpleSchemaException:
+        raise
+
+    except Exception as ex:
+        raise SimpleSchemaException(element.range, str(ex)) from ex
+
+
+# ----------------------------------------------------------------------
+def ValidateJson(
+    element: Union[RootStatement, StructureStatement],
+    content: str,
+    *,
+    use_compiled_validators: bool=True,
+) -> dict[str, Any]:
+    """Validates JSON content; see `Validate` for more information"""
+
+    return Validate(
+        element,
+        json.loads(content),
+        use_compiled_validators=use_compiled_validators,
+        from_document=True,
+    )
+
+
+# ----------------------------------------------------------------------
+def ValidateYaml(
+    element: Union[RootStatement, StructureStatement],
+    content: str,
+    *,
+    use_compiled_validators: bool=True,
+) -> dict[str, Any]:
+    """Validates YAML content; see `Validate` for more information"""
+
+    return Validate(
+        element,
+        yaml.load(content, Loader=_yaml_loader),
+        use_compiled_validators=use_compiled_validators,
+        from_document=True,
+    )
+
+
+# ----------------------------------------------------------------------
+def ValidateRecords(
+    structure: StructureStatement,
+    records: Iterable[Any],
+    on_error_func: Callable[[RecordError], None],
+    *,
+    use_compiled_validators: bool=True,
+    from_document: bool=False,
+) -> ValidateRecordsResult:
+    """\
+    Validates each record against the structure, invoking `on_error_func` for each invalid record.
+
+    Records are processed one at a time and the validated values are not retained, so memory usage
+    does not depend on the number of records. File system checks (for Filename and Directory types)
+    are cached until all of the records have been processed. See `Validate` for information about
+    `from_document`.
+    """
+
+    with FilesystemProbe.Activate():
+        return _ValidateRecordsImpl(
+            structure.GetItemTable(),
+            records,
+            on_error_func,
+            use_compiled_validators=use_compiled_validators,
+            from_document=from_document,
+        )
+
+
+# ----------------------------------------------------------------------
+def ValidateJsonLines(
+    structure: StructureStatement,
+    stream: Union[TextIO, Iterable[str]],
+    on_error_func: Callable[[RecordError], None],
+    *,
+    use_compiled_validators: bool=True,
+) -> ValidateRecordsResult:
+    """Validates JSON Lines content (one record per line); see `ValidateRecords` for more information"""
+
+    # ----------------------------------------------------------------------
+    def EnumRecords() -> Iterator[Any]:
+        for line in stream:
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as ex:
+                yield _InvalidRecord(str(ex))
+
+    # ----------------------------------------------------------------------
+
+    return ValidateRecords(
+        structure,
+        EnumRecords(),
+        on_error_func,
+        use_compiled_validators=use_compiled_validators,
+        from_document=True,
+    )
+
+
+# ----------------------------------------------------------------------
+def ValidateYamlDocuments(
+    structure: StructureStatement,
+    stream: Union[TextIO, str],
+    on_error_func: Callable[[RecordError], None],
+    *,
+    use_compiled_validators: bool=True,
+) -> ValidateRecordsResult:
+    """Validates multi-document YAML content (one record per document); see `ValidateRecords` for more information"""
+
+    # ----------------------------------------------------------------------
+    def EnumRecords() -> Iterator[Any]:
+        try:
+            yield from yaml.load_all(stream, Loader=_yaml_loader)
+        except yaml.YAMLError as ex:
+            # It isn't possible to continue after a YAML error
+            yield _InvalidRecord(str(ex))
+
+    # ----------------------------------------------------------------------
+
+    return ValidateRecords(
+        structure,
+        EnumRecords(),
+        on_error_func,
+        use_compiled_validators=use_compiled_validators,
+        from_document=True,
+    )
+
+
+# ----------------------------------------------------------------------
+def ValidateJsonLinesInParallel(
+    dm: DoneManager,
+    structure: StructureStatement,
+    filename: Path,
+    on_error_func: Callable[[RecordError], None],
+    *,
+    chunk_size: int=16 * 1024 * 1024,       # Approximate number of bytes validated by a process at a time
+    max_num_processes: Optional[int]=None,
+    use_compiled_validators: bool=True,
+    quiet: bool=False,
+) -> ValidateRecordsResult:
+    """\
+    Validates JSON Lines content in a file using multiple processes; see `ValidateRecords` for more
+    information.
+
+    The file is divided into chunks that begin and end on line boundaries, and each process reads
+    and validates the chunks that it is assigned. The structure is sent to each process once (rather
+    than with each chunk), and errors are passed to `on_error_func` in the order in which they
+    appear in the file.
+    """
+
+    if chunk_size <= 0:
+        raise ValueError("chunk_size")
+
+    if max_num_processes is None:
+        max_num_processes = os.cpu_count() or 1
+    elif max_num_processes <= 0:
+        raise ValueError("max_num_processes")
+
+    # Calculate the chunks
+    chunks: list[Tuple[int, int]] = []
+
+    with filename.open("rb") as f:
+        num_bytes = os.fstat(f.fileno()).st_size
+        chunk_begin = 0
+
+        while chunk_begin < num_bytes:
+            f.seek(min(chunk_begin + chunk_size, num_bytes))
+            f.readline()
+
+            chunk_end = min(f.tell(), num_bytes)
+
+            chunks.append((chunk_begin, chunk_end))
+            chunk_begin = chunk_end
+
+    # Validate the chunks
+    with ProcessPoolExecutor(
+        max_workers=min(max_num_processes, max(len(chunks), 1)),
+        mp_context=MultiprocessingContext.Get(),
+        initializer=_InitializeValidateProcess,
+        initargs=(structure, ),
+    ) as executor:
+        # ----------------------------------------------------------------------
+        def Prepare(
+            context: Tuple[int, int],
+            on_simple_status_func: Callable[[str], None],  # pylint: disable=unused-argument
+        ) -> Tuple[
+            Optional[int],
+            ExecuteTasks.TransformStep2FuncType[Tuple[int, list[RecordError]]],
+        ]:
+            # ----------------------------------------------------------------------
+            def Execute(
+                status: ExecuteTasks.Status,  # pylint: disable=unused-argument
+            ) -> Tuple[Tuple[int, list[RecordError]], Optional[str]]:
+                num_records, errors = executor.submit(
+                    _ValidateJsonLinesChunk,
+                    filename,
+                    context[0],
+                    context[1],
+                    use_compiled_validators,
+                ).result()
+
+                return (num_records, errors), "{} records, {} errors".format(num_records, len(errors))
+
+            # ----------------------------------------------------------------------
+
+            return None, Execute
+
+        # ----------------------------------------------------------------------
+
+        chunk_results = ExecuteTasks.Transform(
+            dm,
+            "Validating...",
+            [
+                ExecuteTasks.TaskData("Bytes {}-{}".format(chunk_begin, chunk_end), (chunk_begin, chunk_end))
+                for chunk_begin, chunk_end in chunks
+            ],
+            Prepare,
+            quiet=quiet,
+            max_num_threads=max_num_processes,
+        )
+
+    # Merge the results; record indexes within each chunk are relative to the beginning of the chunk
+    num_records = 0
+    num_errors = 0
+
+    for chunk_num_records, chunk_errors in chunk_results:
+        for error in chunk_errors:
+            on_error_func(RecordError(num_records + error.record_index, error.path, error.message))
+
+        num_records += chunk_num_records
+        num_errors += len(chunk_errors)
+
+    return ValidateRecordsResult(num_records, num_errors)
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+_yaml_loader                                = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class _InvalidRecord(object):
+    """A record that could not be parsed"""
+
+    message: str
+
+
+# ----------------------------------------------------------------------
+def _GetMessage(
+    exception: Exception,
+) -> str:
+    if isinstance(exception, SimpleSchemaException):
+        # The ranges associated with the exception refer to the schema rather than the data
+        return exception.message
+
+    return str(exception)
+
+
+# ----------------------------------------------------------------------
+# The following functions are only invoked once a record is known to be invalid; they find the
+# innermost item associated with the error so that it can be reported with a path.
+
+# ----------------------------------------------------------------------
+def _DiagnoseItemTable(
+    item_table: ItemTable,
+    value: Mapping[str, Any],
+    path: str,
+    exception: Exception,
+) -> Tuple[str, Exception]:
+    for item in item_table.items:
+        item_path = "{}.{}".format(path, item.name) if path else item.name
+
+        if item.name not in value:
+            if item.is_required:
+                return item_path, Exception(Errors.structure_type_missing_item.format(name=item.name))
+
+            continue
+
+        item_value = value[item.name]
+
+        try:
+            item.reference.ToPython(item_value)
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            return _DiagnoseReference(item.reference, item_value, item_path, ex)
+
+    for key in value:
+        if key not in item_table.names:
+            return (
+                "{}.{}".format(path, key) if path else str(key),
+                Exception(Errors.structure_type_unexpected_item.format(name=key)),
+            )
+
+    return path, exception
+
+
+# ----------------------------------------------------------------------
+def _DiagnoseReference(
+    reference: ReferenceType,
+    value: Any,
+    path: str,
+    exception: Exception,
+) -> Tuple[str, Exception]:
+    if reference.cardinality.is_single or not isinstance(value, list):
+        return _DiagnoseType(reference.type, value, path, exception)
+
+    if not reference.cardinality.is_optional:
+        try:
+            reference.cardinality.Validate(value)
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            return path, ex
+
+    for index, item_value in enumerate(value):
+        try:
+            reference.type.ToPython(item_value)
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            return _DiagnoseType(reference.type, item_value, "{}[{}]".format(path, index), ex)
+
+    return path, exception
+
+
+# ----------------------------------------------------------------------
+def _DiagnoseType(
+    the_type: Any,
+    value: Any,
+    path: str,
+    exception: Exception,
+) -> Tuple[str, Exception]:
+    if isinstance(the_type, ReferenceType):
+        return _DiagnoseReference(the_type, value, path, exception)
+
+    if isinstance(the_type, StructureType) and isinstance(value, Mapping):
+        return _DiagnoseItemTable(the_type.structure.GetItemTable(), value, path, exception)
+
+    if isinstance(the_type, TupleType) and isinstance(value, tuple) and len(value) == len(the_type.types):
+        for index, (child_type, child_value) in enumerate(zip(the_type.types, value)):
+            try:
+                child_type.ToPython(child_value)
+            except Exception as ex:  # pylint: disable=broad-exception-caught
+                return _DiagnoseType(child_type, child_value, "{}[{}]".format(path, index), ex)
+
+    # Variants (and everything else) are reported at the current path
+    return path, exception
+
+
+# ----------------------------------------------------------------------
+# Set in each process created by `ValidateJsonLinesInParallel`
+_process_structure: Optional[StructureStatement]    = None
+
+
+# ----------------------------------------------------------------------
+def _ValidateRecordsImpl(
+    item_table: ItemTable,
+    records: Iterable[Any],
+    on_error_func: Callable[[RecordError], None],
+    *,
+    use_compiled_validators: bool,
+    from_document: bool,
+) -> ValidateRecordsResult:
+    num_records = 0
+    num_errors = 0
+
+    for record_index, record in enumerate(records):
+        num_records += 1
+
+        if isinstance(record, _InvalidRecord):
+            error = RecordError(record_index, "", record.message)
+        elif not isinstance(record, Mapping):
+            error = RecordError(
+                record_index,
+                "",
+                Errors.validate_invalid_record.format(python_type=type(record).__name__),
+            )
+        else:
+            if from_document:
+                record = item_table.FromDocument(record)
+
+            try:
+                item_table.ToPython(record, use_compiled_validators=use_compiled_validators)
+                continue
+
+            except Exception as ex:  # pylint: disable=broad-exception-caught
+                path, exception = _DiagnoseItemTable(item_table, record, "", ex)
+
+            error = RecordError(record_index, path, _GetMessage(exception))
+
+        num_errors += 1
+        on_error_func(error)
+
+    return ValidateRecordsResult(num_records, num_errors)
+
+
+# ----------------------------------------------------------------------
+def _InitializeValidateProcess(
+    structure: StructureStatement,
+) -> None:
+    global _process_structure  # pylint: disable=global-statement
+    _process_structure = structure
+
+
+# ----------------------------------------------------------------------
+def _ValidateJsonLinesChunk(
+    filename: Path,
+    chunk_begin: int,
+    chunk_end: int,
+    use_compiled_validators: bool,
+) -> Tuple[int, list[RecordError]]:
+    assert _process_structure is not None
+
+    # ----------------------------------------------------------------------
+    def EnumLines() -> Iterator[str]:
+        with filename.open("rb") as f:
+            f.seek(chunk_begin)
+
+            offset = chunk_begin
+
+            while offset < chunk_end:
+                line = f.readline()
+                if not line:
+                    break
+
+                offset += len(line)
+                yield line.decode("utf-8")
+
+    # ----------------------------------------------------------------------
+
+    errors: list[RecordError] = []
+
+    result = ValidateJsonLines(
+        _process_structure,
+        EnumLines(),
+        errors.append,
+        use_compiled_validators=use_compiled_validators,
+    )
+
+    return result.num_records, errors
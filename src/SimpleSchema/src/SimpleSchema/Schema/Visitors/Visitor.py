@@ -19,7 +19,7 @@ import re
 
 from abc import ABC
 from contextlib import contextmanager
-from typing import Iterator, Optional, Union
+from typing import Any, Callable, ClassVar, Iterator, Optional, Union
 from weakref import ReferenceType as WeakReferenceType
 
 from Common_Foundation.ContextlibEx import ExitStack
@@ -73,6 +73,11 @@ class Visitor(ABC):
     METHOD_REGEX                            = re.compile("^On(?P<object_name>.+)$")
     DETAILS_REGEX                           = re.compile("^On(?P<object_name>.+?)__(?P<member_name>.+)$")
 
+    # Set to True in derived classes to visit elements using an explicit stack rather than recursion;
+    # this is slightly slower, but supports elements whose depth exceeds the interpreter's recursion
+    # limit.
+    ITERATIVE_ACCEPT: ClassVar[bool]        = False
+
     # ----------------------------------------------------------------------
     def __init__(self):
         self._processing_reference_element_ctr          = 0
@@ -84,14 +89,68 @@ class Visitor(ABC):
     def is_processing_reference_element(self) -> bool:
         return self._processing_reference_element_ctr != 0
 
+    # ----------------------------------------------------------------------
+    @classmethod
+    def CreateDefaultMethod(
+        cls,
+        name: str,
+    ) -> Optional[Callable[..., Any]]:
+        """\
+        Returns an unbound function that implements the method when it isn't explicitly defined by
+        the visitor (or None if a default isn't available).
+
+        This method is invoked by `Element.Accept` once for each method name, so that the function
+        can be reused across visits.
+        """
+
+        match = cls.DETAILS_REGEX.match(name)
+        if match:
+            member_name = match.group("member_name")
+
+            # ----------------------------------------------------------------------
+            def DefaultDetailMethod(self, *args, **kwargs):
+                return self._DefaultDetailMethod(member_name, *args, **kwargs)  # pylint: disable=protected-access
+
+            # ----------------------------------------------------------------------
+
+            return DefaultDetailMethod
+
+        return None
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def CreateDefaultGenerator(
+        cls,
+        name: str,
+    ) -> Optional[Callable[..., Element.AcceptGeneratorType]]:
+        """\
+        Returns an unbound generator function that is equivalent to the function returned by
+        `CreateDefaultMethod`, for use when visiting elements iteratively (or None if a default
+        isn't available).
+        """
+
+        match = cls.DETAILS_REGEX.match(name)
+        if match:
+            member_name = match.group("member_name")
+
+            # ----------------------------------------------------------------------
+            def DefaultDetailGenerator(self, *args, **kwargs):
+                return self._EnumDefaultDetailMethod(member_name, *args, **kwargs)  # pylint: disable=protected-access
+
+            # ----------------------------------------------------------------------
+
+            return DefaultDetailGenerator
+
+        return None
+
     # ----------------------------------------------------------------------
     def __getattr__(
         self,
         name: str,
     ):
-        match = self.DETAILS_REGEX.match(name)
-        if match:
-            return lambda *args, **kwargs: self._DefaultDetailMethod(match.group("member_name"), *args, **kwargs)
+        method = self.__class__.CreateDefaultMethod(name)
+        if method is not None:
+            return method.__get__(self)
 
         raise AttributeError(name)
 
@@ -391,3 +450,60 @@ class Visitor(ABC):
                             return visit_result
 
         return VisitResult.Continue
+
+    # ----------------------------------------------------------------------
+    def _EnumDefaultDetailMethod(
+        self,
+        member_name: str,
+        element_or_elements: Element.GenerateAcceptDetailsGeneratorItemsType,
+        *,
+        include_disabled: bool,
+    ) -> Element.AcceptGeneratorType:
+        # Generator equivalent of `_DefaultDetailMethod` (any changes made there must be reflected
+        # here as well).
+        with self.OnElementDetailsItem(member_name, element_or_elements) as visit_result:
+            if visit_result == VisitResult.Terminate:
+                return visit_result
+
+            if visit_result and (visit_result & VisitResult.SkipAll):
+                return VisitResult.Continue
+
+            elements: Optional[
+                Union[
+                    list[Element],
+                    list[WeakReferenceType[Element]],
+                ],
+            ] = None
+
+            if isinstance(element_or_elements, list):
+                elements = element_or_elements
+            else:
+                elements = [element_or_elements, ]  # type: ignore
+
+            assert elements is not None
+
+            for element in elements:
+                if isinstance(element, Element):
+                    visit_result = yield element
+                    if visit_result == VisitResult.Terminate:
+                        return visit_result
+
+                else:
+                    element = element()
+                    assert element is not None
+
+                    self._processing_reference_element_ctr += 1
+
+                    # ----------------------------------------------------------------------
+                    def OnExit():
+                        assert self._processing_reference_element_ctr != 0
+                        self._processing_reference_element_ctr -= 1
+
+                    # ----------------------------------------------------------------------
+
+                    with ExitStack(OnExit):
+                        visit_result = yield element
+                        if visit_result == VisitResult.Terminate:
+                            return visit_result
+
+        return VisitResult.Continue
@@ -0,0 +1,505 @@
+# ----------------------------------------------------------------------
+# |
+# |  Daemon_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-26 11:12:48
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for Daemon.py"""
+
+import os
+import re
+import socket
+import sys
+import threading
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+import pytest
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from SimpleSchema import Daemon
+    from SimpleSchema.Daemon import CreateInstanceId, ExecuteInDaemon, FileRecorder, GetSocketFilename, ModelCache, Server, SOCKET_ENVIRONMENT_VARIABLE_NAME
+
+
+# ----------------------------------------------------------------------
+pytestmark = pytest.mark.skipif(not Server.IsSupported(), reason="Daemons are not supported on this platform")
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Server and ExecuteInDaemon
+# |
+# ----------------------------------------------------------------------
+def test_Execute(tmp_path):
+    received: list[tuple[list[str], Path]] = []
+
+    # ----------------------------------------------------------------------
+    def Execute(
+        args: list[str],
+    ) -> int:
+        received.append((args, Path.cwd()))
+
+        os.write(1, b"stdout content\n")
+        os.write(2, b"stderr content\n")
+
+        return 3
+
+    # ----------------------------------------------------------------------
+
+    original_working_dir = Path.cwd()
+
+    with _YieldServer(tmp_path, Execute) as socket_filename:
+        stdout, stderr, result = _ExecuteInDaemon(["Generate", "one", "two"], "instance", socket_filename)
+
+    assert result == 3
+    assert stdout == "stdout content\n"
+    assert stderr == "stderr content\n"
+
+    assert received == [(["Generate", "one", "two"], original_working_dir)]
+
+    # The server's state is restored
+    assert Path.cwd() == original_working_dir
+    assert not socket_filename.exists()
+
+
+# ----------------------------------------------------------------------
+def test_Environment(tmp_path):
+    # ----------------------------------------------------------------------
+    def Execute(
+        args: list[str],  # pylint: disable=unused-argument
+    ) -> int:
+        os.write(1, "{}\n".format(len(os.environ["_DAEMON_UNIT_TEST_VALUE"])).encode("utf-8"))
+        return 0
+
+    # ----------------------------------------------------------------------
+
+    original_environment = dict(os.environ)
+
+    with _YieldServer(tmp_path, Execute) as socket_filename:
+        # The value is large enough that the request can't be sent at once
+        stdout, stderr, result = _ExecuteInDaemon(
+            [],
+            "instance",
+            socket_filename,
+            environment={"_DAEMON_UNIT_TEST_VALUE": "a" * 1000000},
+        )
+
+    assert result == 0
+    assert stdout == "1000000\n"
+    assert stderr == ""
+
+    # The server's state is restored
+    assert dict(os.environ) == original_environment
+
+
+# ----------------------------------------------------------------------
+def test_MultipleRequests(tmp_path):
+    num_requests = 0
+
+    # ----------------------------------------------------------------------
+    def Execute(
+        args: list[str],
+    ) -> int:
+        nonlocal num_requests
+        num_requests += 1
+
+        os.write(1, "{}\n".format(args[0]).encode("utf-8"))
+        return 0
+
+    # ----------------------------------------------------------------------
+
+    with _YieldServer(tmp_path, Execute) as socket_filename:
+        for index in range(3):
+            stdout, stderr, result = _ExecuteInDaemon([str(index)], "instance", socket_filename)
+
+            assert result == 0
+            assert stdout == "{}\n".format(index)
+            assert stderr == ""
+
+    assert num_requests == 3
+
+
+# ----------------------------------------------------------------------
+def test_Exception(tmp_path):
+    # ----------------------------------------------------------------------
+    def Execute(
+        args: list[str],  # pylint: disable=unused-argument
+    ) -> int:
+        raise Exception("This is the exception")
+
+    # ----------------------------------------------------------------------
+
+    with _YieldServer(tmp_path, Execute) as socket_filename:
+        stdout, stderr, result = _ExecuteInDaemon([], "instance", socket_filename)
+
+    assert result == -1
+    assert stdout == ""
+    assert "Exception: This is the exception" in stderr
+
+
+# ----------------------------------------------------------------------
+def test_InstanceMismatch(tmp_path):
+    with _YieldServer(tmp_path, lambda args: 0) as socket_filename:
+        # The command line isn't executed by a daemon associated with a different instance
+        assert _ExecuteInDaemon([], "other instance", socket_filename) == ("", "", None)
+
+
+# ----------------------------------------------------------------------
+def test_NoDaemon(tmp_path):
+    socket_filename = tmp_path / "Daemon" / "Daemon.sock"
+
+    assert ExecuteInDaemon([], "instance", socket_filename=socket_filename) is None
+
+    # A file left behind by a daemon that is no longer running
+    socket_filename.parent.mkdir(mode=0o700)
+    socket_filename.touch()
+
+    assert ExecuteInDaemon([], "instance", socket_filename=socket_filename) is None
+
+
+# ----------------------------------------------------------------------
+def test_StaleSocket(tmp_path):
+    socket_filename = tmp_path / "Daemon" / "Daemon.sock"
+
+    socket_filename.parent.mkdir(mode=0o700)
+    socket_filename.touch()
+
+    with _YieldServer(tmp_path, lambda args: 5) as socket_filename:
+        assert _ExecuteInDaemon([], "instance", socket_filename)[2] == 5
+
+
+# ----------------------------------------------------------------------
+def test_MultipleDaemons(tmp_path):
+    with _YieldServer(tmp_path, lambda args: 0) as socket_filename:
+        with pytest.raises(
+            Exception,
+            match=re.escape("A daemon is already listening on '{}'.".format(socket_filename)),
+        ):
+            Server(socket_filename, "instance", lambda args: 0)
+
+
+# ----------------------------------------------------------------------
+def test_PublicDirectory(tmp_path):
+    socket_filename = tmp_path / "Public" / "Daemon.sock"
+
+    socket_filename.parent.mkdir()
+    socket_filename.parent.chmod(0o755)
+
+    with pytest.raises(
+        Exception,
+        match=re.escape(
+            "The directory '{}' must be owned by the current user and only accessible by the current user.".format(
+                socket_filename.parent,
+            ),
+        ),
+    ):
+        Server(socket_filename, "instance", lambda args: 0)
+
+    # Clients don't use sockets in directories that can be modified by other users
+    with _YieldServer(tmp_path, lambda args: 0) as private_socket_filename:
+        socket_filename.parent.rmdir()
+        socket_filename.parent.symlink_to(private_socket_filename.parent)
+
+        assert ExecuteInDaemon([], "instance", socket_filename=socket_filename) is None
+        assert _ExecuteInDaemon([], "instance", private_socket_filename)[2] == 0
+
+        private_socket_filename.parent.chmod(0o755)
+
+        assert ExecuteInDaemon([], "instance", socket_filename=private_socket_filename) is None
+
+
+# ----------------------------------------------------------------------
+def test_ClientRunByAnotherUser(monkeypatch, tmp_path):
+    original_get_peer_uid = Daemon._GetPeerUid  # pylint: disable=protected-access
+
+    # ----------------------------------------------------------------------
+    def GetPeerUid(
+        connection: socket.socket,
+    ) -> int:
+        uid = original_get_peer_uid(connection)
+
+        # The server runs in a different thread
+        if threading.current_thread() is not threading.main_thread():
+            uid += 1
+
+        return uid
+
+    # ----------------------------------------------------------------------
+
+    monkeypatch.setattr(Daemon, "_GetPeerUid", GetPeerUid)
+
+    num_requests = 0
+
+    # ----------------------------------------------------------------------
+    def Execute(
+        args: list[str],  # pylint: disable=unused-argument
+    ) -> int:
+        nonlocal num_requests
+        num_requests += 1
+
+        return 0
+
+    # ----------------------------------------------------------------------
+
+    with _YieldServer(tmp_path, Execute) as socket_filename:
+        assert _ExecuteInDaemon([], "instance", socket_filename) == ("", "", None)
+
+    assert num_requests == 0
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.skipif(os.getuid() != 0, reason="The ownership of the socket can only be changed by root")
+def test_SocketOwnedByAnotherUser(tmp_path):
+    socket_filename = tmp_path / "Daemon" / "Daemon.sock"
+    socket_filename.parent.mkdir(mode=0o700)
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+        listener.bind(str(socket_filename))
+        listener.listen()
+
+        os.chown(socket_filename, 12345, -1)
+
+        assert ExecuteInDaemon([], "instance", socket_filename=socket_filename) is None
+
+
+# ----------------------------------------------------------------------
+def test_GetSocketFilename(monkeypatch, tmp_path):
+    monkeypatch.delenv(SOCKET_ENVIRONMENT_VARIABLE_NAME, raising=False)
+
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    assert GetSocketFilename().name == "Daemon.sock"
+
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    assert GetSocketFilename().parent.parent == tmp_path
+
+    monkeypatch.setenv(SOCKET_ENVIRONMENT_VARIABLE_NAME, "/foo/bar.sock")
+    assert GetSocketFilename() == Path("/foo/bar.sock")
+
+
+# ----------------------------------------------------------------------
+def test_CreateInstanceId(monkeypatch, tmp_path):
+    instance_id = CreateInstanceId(tmp_path)
+
+    assert CreateInstanceId(tmp_path) == instance_id
+    assert CreateInstanceId(tmp_path / "Other") != instance_id
+
+    # The socket doesn't impact the instance
+    monkeypatch.setenv(SOCKET_ENVIRONMENT_VARIABLE_NAME, "/foo/bar.sock")
+    assert CreateInstanceId(tmp_path) == instance_id
+
+    # Other SimpleSchema environment variables (which may impact the available plugins) do
+    monkeypatch.setenv("SIMPLE_SCHEMA_DYNAMIC_PLUGINS", "foo")
+    assert CreateInstanceId(tmp_path) != instance_id
+
+
+# ----------------------------------------------------------------------
+# |
+# |  ModelCache
+# |
+# ----------------------------------------------------------------------
+def test_ModelCache(tmp_path):
+    filename1 = tmp_path / "File1.SimpleSchema"
+    filename2 = tmp_path / "File2.SimpleSchema"
+
+    filename1.write_text("one")
+    filename2.write_text("two")
+
+    cache = ModelCache()
+
+    assert cache.Get("key") is None
+
+    value = object()
+
+    cache.Set("key", [filename1, filename2], value)
+
+    assert cache.Get("key") is value
+    assert cache.Get("other key") is None
+
+    # Modification time changes aren't changes
+    stat = filename1.stat()
+    os.utime(filename1, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+
+    assert cache.Get("key") is value
+
+    # Content changes are
+    filename2.write_text("TWO")
+
+    assert cache.Get("key") is None
+    assert len(cache) == 0
+
+
+# ----------------------------------------------------------------------
+def test_ModelCacheRemovedFile(tmp_path):
+    filename = tmp_path / "File.SimpleSchema"
+    filename.write_text("content")
+
+    cache = ModelCache()
+
+    cache.Set("key", [filename], 10)
+    assert cache.Get("key") == 10
+
+    filename.unlink()
+
+    assert cache.Get("key") is None
+
+
+# ----------------------------------------------------------------------
+def test_ModelCacheMaxNumItems(tmp_path):
+    filename = tmp_path / "File.SimpleSchema"
+    filename.write_text("content")
+
+    cache = ModelCache(2)
+
+    cache.Set("one", [filename], 1)
+    cache.Set("two", [filename], 2)
+
+    # Make "one" the most recently used item
+    assert cache.Get("one") == 1
+
+    cache.Set("three", [filename], 3)
+
+    assert len(cache) == 2
+    assert cache.Get("one") == 1
+    assert cache.Get("two") is None
+    assert cache.Get("three") == 3
+
+
+# ----------------------------------------------------------------------
+def test_ModelCacheReleasedFiles(tmp_path):
+    filename1 = tmp_path / "File1.SimpleSchema"
+    filename2 = tmp_path / "File2.SimpleSchema"
+    filename3 = tmp_path / "File3.SimpleSchema"
+
+    for filename in [filename1, filename2, filename3]:
+        filename.write_text(filename.stem)
+
+    released: list[list[Path]] = []
+
+    cache = ModelCache(2, released.append)
+
+    cache.Set("one", [filename1, filename2], 1)
+    cache.Set("two", [filename2], 2)
+
+    # Replaced values don't release the files that are still in use
+    cache.Set("two", [filename2], 2)
+    assert released == []
+
+    # Evicted values release the files that are no longer in use
+    cache.Set("three", [filename3], 3)
+    assert released == [[filename1]]
+
+    # As do stale values
+    filename2.write_text("changed")
+
+    assert cache.Get("two") is None
+    assert released == [[filename1], [filename2]]
+
+    assert cache.Get("three") == 3
+    assert len(released) == 2
+
+
+# ----------------------------------------------------------------------
+def test_ModelCacheFileRecorder(tmp_path):
+    filename1 = tmp_path / "File1.SimpleSchema"
+    filename2 = tmp_path / "File2.SimpleSchema"
+
+    filename1.write_bytes(b"one\r\ntwo")
+    filename2.write_text("content")
+
+    recorder = FileRecorder()
+
+    # The content is decoded in the same way as a file opened in text mode
+    assert recorder.Read(filename1, encoding="utf-8") == "one\ntwo"
+    assert recorder.Read(filename2) == "content"
+
+    assert recorder.filenames == [filename1, filename2]
+
+    cache = ModelCache()
+
+    cache.Set("key", recorder.filenames, 1, recorder=recorder)
+    assert cache.Get("key") == 1
+
+    # A file modified after it was read (for example, while the value was being created) is changed
+    recorder.Read(filename2)
+    filename2.write_text("changed content")
+
+    cache.Set("key", recorder.filenames, 2, recorder=recorder)
+    assert cache.Get("key") is None
+
+
+# ----------------------------------------------------------------------
+def test_ModelCacheInvalidMaxNumItems():
+    with pytest.raises(ValueError, match="max_num_items"):
+        ModelCache(0)
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+@contextmanager
+def _YieldServer(
+    tmp_path: Path,
+    execute_func: Callable[[list[str]], int],
+) -> Iterator[Path]:
+    # The server creates the directory
+    socket_filename = tmp_path / "Daemon" / "Daemon.sock"
+
+    server = Server(socket_filename, "instance", execute_func)
+
+    thread = threading.Thread(target=server.Serve)
+    thread.start()
+
+    try:
+        yield socket_filename
+    finally:
+        server.Shutdown()
+        thread.join()
+
+
+# ----------------------------------------------------------------------
+def _ExecuteInDaemon(
+    args: list[str],
+    instance_id: str,
+    socket_filename: Path,
+    environment: Optional[dict[str, str]]=None,
+) -> tuple[str, str, object]:
+    stdout_read_fd, stdout_write_fd = os.pipe()
+    stderr_read_fd, stderr_write_fd = os.pipe()
+
+    try:
+        result = ExecuteInDaemon(
+            args,
+            instance_id,
+            socket_filename=socket_filename,
+            stdout_fd=stdout_write_fd,
+            stderr_fd=stderr_write_fd,
+            environment=environment,
+        )
+    finally:
+        os.close(stdout_write_fd)
+        os.close(stderr_write_fd)
+
+    with os.fdopen(stdout_read_fd) as f:
+        stdout = f.read()
+
+    with os.fdopen(stderr_read_fd) as f:
+        stderr = f.read()
+
+    return stdout, stderr, result
@@ -0,0 +1,140 @@
+# ----------------------------------------------------------------------
+# |
+# |  PluginManifest_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-24 09:14:07
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for PluginManifest.py"""
+
+import json
+import re
+import sys
+import textwrap
+
+from pathlib import Path
+
+import pytest
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from SimpleSchema.PluginManifest import PluginManifest, PluginManifestItem
+
+
+# ----------------------------------------------------------------------
+def test_Load(tmp_path):
+    _WritePlugin(tmp_path / "PluginManifest_UnitTest_Load.py", "Load")
+    _WriteManifest(tmp_path, {"Load": "PluginManifest_UnitTest_Load.py"})
+
+    manifest = PluginManifest.Load(tmp_path)
+    assert manifest is not None
+
+    assert manifest.items == [
+        PluginManifestItem("Load", "The Load plugin", tmp_path / "PluginManifest_UnitTest_Load.py"),
+    ]
+
+    assert manifest.GetItem("Load") is manifest.items[0]
+    assert manifest.GetItem("Missing") is None
+
+    # The plugin isn't imported until it is created
+    assert "PluginManifest_UnitTest_Load" not in sys.modules
+
+    plugin = manifest.items[0].CreatePlugin()
+
+    assert plugin.name == "Load"
+    assert "PluginManifest_UnitTest_Load" in sys.modules
+
+
+# ----------------------------------------------------------------------
+def test_NoManifest(tmp_path):
+    _WritePlugin(tmp_path / "PluginManifest_UnitTest_NoManifest.py", "NoManifest")
+
+    assert PluginManifest.Load(tmp_path) is None
+
+
+# ----------------------------------------------------------------------
+def test_UnlistedPlugin(tmp_path):
+    _WritePlugin(tmp_path / "PluginManifest_UnitTest_Listed.py", "Listed")
+    _WritePlugin(tmp_path / "PluginManifest_UnitTest_Unlisted.py", "Unlisted")
+    _WriteManifest(tmp_path, {"Listed": "PluginManifest_UnitTest_Listed.py"})
+
+    # The manifest isn't used, as it would hide the unlisted plugin
+    assert PluginManifest.Load(tmp_path) is None
+
+
+# ----------------------------------------------------------------------
+def test_NameMismatch(tmp_path):
+    _WritePlugin(tmp_path / "PluginManifest_UnitTest_Mismatch.py", "Other")
+    _WriteManifest(tmp_path, {"Mismatch": "PluginManifest_UnitTest_Mismatch.py"})
+
+    manifest = PluginManifest.Load(tmp_path)
+    assert manifest is not None
+
+    with pytest.raises(
+        Exception,
+        match=re.escape("The plugin name 'Other' does not match the name in the manifest ('Mismatch')."),
+    ):
+        manifest.items[0].CreatePlugin()
+
+
+# ----------------------------------------------------------------------
+def test_Plugins():
+    # The manifest must be kept in sync with the plugins
+    manifest = PluginManifest.Load(PathEx.EnsureDir(Path(__file__).parent.parent.parent / "Plugins"))
+    assert manifest is not None
+
+    assert manifest.items
+
+    for item in manifest.items:
+        plugin = item.CreatePlugin()
+
+        assert plugin.name == item.name
+        assert plugin.description == item.description
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _WritePlugin(
+    filename: Path,
+    name: str,
+) -> None:
+    filename.write_text(
+        textwrap.dedent(
+            """\
+            class Plugin(object):
+                name = "{}"
+            """,
+        ).format(name),
+    )
+
+
+# ----------------------------------------------------------------------
+def _WriteManifest(
+    plugin_dir: Path,
+    filenames: dict[str, str],
+) -> None:
+    with (plugin_dir / PluginManifest.FILENAME).open("w") as f:
+        json.dump(
+            {
+                name: {
+                    "description": "The {} plugin".format(name),
+                    "filename": filename,
+                }
+                for name, filename in filenames.items()
+            },
+            f,
+        )
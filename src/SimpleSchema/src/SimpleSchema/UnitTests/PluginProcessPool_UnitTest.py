@@ -0,0 +1,163 @@
+# ----------------------------------------------------------------------
+# |
+# |  PluginProcessPool_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-22 09:27:51
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for PluginProcessPool.py"""
+
+import os
+import pickle
+import re
+import sys
+
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+from Common_Foundation.Types import overridemethod
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from SimpleSchema.Plugin import Plugin
+    from SimpleSchema.PluginProcessPool import PluginProcessPool
+    from SimpleSchema.Schema.Elements.Statements.RootStatement import RootStatement
+    from SimpleSchema.Schema.Elements.TestHelpers import CreateSyntheticRoot
+
+
+# ----------------------------------------------------------------------
+def test_PicklePlugin():
+    plugin = _Plugin()
+
+    unpickled = pickle.loads(pickle.dumps(plugin))
+
+    assert unpickled is not plugin
+    assert isinstance(unpickled, _Plugin)
+    assert unpickled.GetOutputCounts() == Plugin.OutputCounts(0, 0)
+
+
+# ----------------------------------------------------------------------
+def test_PickleRoot():
+    root = CreateSyntheticRoot(10, 5)
+
+    unpickled = pickle.loads(pickle.dumps(root, pickle.HIGHEST_PROTOCOL))
+
+    assert unpickled is not root
+    assert unpickled.range == root.range
+    assert unpickled.fingerprint == root.fingerprint
+
+
+# ----------------------------------------------------------------------
+def test_Generate(tmp_path):
+    plugin = _Plugin()
+
+    roots = {
+        Path("One.SimpleSchema"): CreateSyntheticRoot(1, 2),
+        Path("Two.SimpleSchema"): CreateSyntheticRoot(2, 2),
+    }
+
+    with PluginProcessPool(plugin, roots, 2) as pool:
+        for filename in roots:
+            pool.Validate(filename)
+            pool.Generate({"prefix": "Generated", "pid": os.getpid()}, filename, [tmp_path / filename.with_suffix(".txt")])
+
+        assert (tmp_path / "One.txt").read_text() == "Generated: 1 statement(s) (other process: True)\n"
+        assert (tmp_path / "Two.txt").read_text() == "Generated: 2 statement(s) (other process: True)\n"
+
+        # Files written in the other processes are reported by the original plugin
+        assert plugin.GetOutputCounts() == Plugin.OutputCounts(2, 0)
+
+        for filename in roots:
+            pool.Generate({"prefix": "Generated", "pid": os.getpid()}, filename, [tmp_path / filename.with_suffix(".txt")])
+
+        assert plugin.GetOutputCounts() == Plugin.OutputCounts(2, 2)
+
+
+# ----------------------------------------------------------------------
+def test_Errors(tmp_path):
+    roots = {
+        Path("Invalid.SimpleSchema"): CreateSyntheticRoot(_MAX_NUM_STATEMENTS + 1, 1),
+    }
+
+    with PluginProcessPool(_Plugin(), roots, 1) as pool:
+        with pytest.raises(Exception, match=re.escape("Too many statements.")):
+            pool.Validate(Path("Invalid.SimpleSchema"))
+
+        with pytest.raises(KeyError):
+            pool.Generate({"prefix": "Generated", "pid": os.getpid()}, Path("Missing.SimpleSchema"), [tmp_path / "Missing.txt"])
+
+    assert list(tmp_path.iterdir()) == []
+
+
+# ----------------------------------------------------------------------
+def test_InvalidNumProcesses():
+    with pytest.raises(ValueError, match=re.escape("max_num_processes")):
+        PluginProcessPool(_Plugin(), {}, 0)
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+_MAX_NUM_STATEMENTS                         = 2
+
+
+# ----------------------------------------------------------------------
+class _Plugin(Plugin):
+    # ----------------------------------------------------------------------
+    def __init__(self):
+        super(_Plugin, self).__init__(Plugin.Flag(0), None, None)
+
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def IsProcessSafe(
+        self,
+        command_line_args: dict[str, Any],
+    ) -> bool:
+        return True
+
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def Validate(
+        self,
+        root: RootStatement,
+    ) -> None:
+        if len(root.statements) > _MAX_NUM_STATEMENTS:
+            raise Exception("Too many statements.")
+
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def Generate(
+        self,
+        command_line_args: dict[str, Any],
+        root: RootStatement,
+        output_filenames: list[Path],
+        on_status_update_func: Callable[[str], None],
+    ) -> None:
+        assert len(output_filenames) == 1
+
+        with self._YieldOutputFile(output_filenames[0]) as f:
+            f.write(
+                "{}: {} statement(s) (other process: {})\n".format(
+                    command_line_args["prefix"],
+                    len(root.statements),
+                    os.getpid() != command_line_args["pid"],
+                ),
+            )
+
+
+# The tests only use the functionality implemented by the base class (and above)
+_Plugin.__abstractmethods__ = frozenset()
@@ -0,0 +1,188 @@
+# ----------------------------------------------------------------------
+# |
+# |  Plugin_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-05-19 15:41:08
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for Plugin.py"""
+
+import os
+import re
+import stat
+import sys
+
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+from Common_Foundation.Types import overridemethod
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from SimpleSchema.Plugin import Plugin
+    from SimpleSchema.Schema.Elements.Statements.RootStatement import RootStatement
+    from SimpleSchema.Schema.Elements.TestHelpers import CreateSyntheticRoot
+
+
+# ----------------------------------------------------------------------
+def test_UsesGenerateAll():
+    # By default, `Generate` is invoked for each root so that the roots can be generated in parallel
+    assert _GeneratePlugin(Plugin.Flag(0), None, None).UsesGenerateAll({"value": 10}) is False
+
+
+# ----------------------------------------------------------------------
+def test_GenerateAll():
+    # By default, `Generate` is invoked for each root
+    plugin = _GeneratePlugin(Plugin.Flag(0), None, None)
+
+    roots = {
+        Path("One.SimpleSchema"): CreateSyntheticRoot(1, 1),
+        Path("Two.SimpleSchema"): CreateSyntheticRoot(2, 1),
+    }
+
+    statuses: list[str] = []
+
+    plugin.GenerateAll(
+        {"value": 10},
+        roots,
+        {
+            Path("One.SimpleSchema"): [Path("One.txt")],
+            Path("Two.SimpleSchema"): [Path("Two.txt"), Path("Two.extra.txt")],
+        },
+        statuses.append,
+    )
+
+    assert plugin.invocations == [
+        ({"value": 10}, roots[Path("One.SimpleSchema")], [Path("One.txt")]),
+        ({"value": 10}, roots[Path("Two.SimpleSchema")], [Path("Two.txt"), Path("Two.extra.txt")]),
+    ]
+
+    assert statuses == ["One.txt", "Two.txt"]
+
+
+# ----------------------------------------------------------------------
+class TestYieldOutputFile(object):
+    # ----------------------------------------------------------------------
+    def test_New(self, tmp_path):
+        plugin = _CreatePlugin()
+        filename = tmp_path / "Nested" / "Output.txt"
+
+        with plugin._YieldOutputFile(filename) as f:  # pylint: disable=protected-access
+            f.write("content\n")
+
+        assert filename.read_text() == "content\n"
+        assert plugin.GetOutputCounts() == Plugin.OutputCounts(1, 0)
+        assert list(filename.parent.iterdir()) == [filename]
+
+    # ----------------------------------------------------------------------
+    def test_Unchanged(self, tmp_path):
+        plugin = _CreatePlugin()
+        filename = tmp_path / "Output.txt"
+
+        filename.write_text("content\n")
+        os.utime(filename, ns=(0, 0))
+
+        with plugin._YieldOutputFile(filename) as f:  # pylint: disable=protected-access
+            f.write("content\n")
+
+        assert filename.stat().st_mtime_ns == 0
+        assert plugin.GetOutputCounts() == Plugin.OutputCounts(0, 1)
+        assert list(tmp_path.iterdir()) == [filename]
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.parametrize("new_content", ["CONTENT\n", "different content\n"])
+    def test_Changed(self, tmp_path, new_content):
+        plugin = _CreatePlugin()
+        filename = tmp_path / "Output.txt"
+
+        filename.write_text("content\n")
+        os.utime(filename, ns=(0, 0))
+
+        with plugin._YieldOutputFile(filename) as f:  # pylint: disable=protected-access
+            f.write(new_content)
+
+        assert filename.read_text() == new_content
+        assert filename.stat().st_mtime_ns != 0
+        assert plugin.GetOutputCounts() == Plugin.OutputCounts(1, 0)
+        assert list(tmp_path.iterdir()) == [filename]
+
+    # ----------------------------------------------------------------------
+    def test_ChangedPreservesMode(self, tmp_path):
+        plugin = _CreatePlugin()
+        filename = tmp_path / "Output.sh"
+
+        filename.write_text("content\n")
+        filename.chmod(0o750)
+
+        with plugin._YieldOutputFile(filename) as f:  # pylint: disable=protected-access
+            f.write("different content\n")
+
+        assert filename.read_text() == "different content\n"
+        assert stat.S_IMODE(filename.stat().st_mode) == 0o750
+
+    # ----------------------------------------------------------------------
+    def test_Error(self, tmp_path):
+        plugin = _CreatePlugin()
+        filename = tmp_path / "Output.txt"
+
+        filename.write_text("content\n")
+
+        with pytest.raises(Exception, match=re.escape("Generation failed")):
+            with plugin._YieldOutputFile(filename) as f:  # pylint: disable=protected-access
+                f.write("partial content")
+                raise Exception("Generation failed")
+
+        assert filename.read_text() == "content\n"
+        assert plugin.GetOutputCounts() == Plugin.OutputCounts(0, 0)
+        assert list(tmp_path.iterdir()) == [filename]
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+class _Plugin(Plugin):
+    pass
+
+
+# The tests only use the functionality implemented by the base class
+_Plugin.__abstractmethods__ = frozenset()
+
+
+# ----------------------------------------------------------------------
+class _GeneratePlugin(_Plugin):
+    # ----------------------------------------------------------------------
+    def __init__(self, *args, **kwargs):
+        super(_GeneratePlugin, self).__init__(*args, **kwargs)
+
+        self.invocations: list[tuple[dict[str, Any], RootStatement, list[Path]]] = []
+
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def Generate(
+        self,
+        command_line_args: dict[str, Any],
+        root: RootStatement,
+        output_filenames: list[Path],
+        on_status_update_func: Callable[[str], None],
+    ) -> None:
+        self.invocations.append((command_line_args, root, output_filenames))
+        on_status_update_func(output_filenames[0].name)
+
+
+# ----------------------------------------------------------------------
+def _CreatePlugin() -> Plugin:
+    return _Plugin(Plugin.Flag(0), None, None)